@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+쉐이더 맵 일괄 익스포트(batch_export_shader_maps) 벤치마크입니다.
+
+에셋 라이브러리 구조('<임시 폴더>/assets/<타입>/<에셋>/lookdev/pub/maya/<에셋>_lookdev_v###.ma')의 씬 목록을
+한 프로세스에서 차례로 처리할 때(serial)와 작업 프로세스 풀에서 처리할 때(pool)의 실행 시간을 비교하고,
+다시 실행할 때 최신 쉐이더 맵을 건너뛰는지(up-to-date), 일부 씬만 바뀌었을 때 그 씬만 다시 익스포트하는지(touched) 확인합니다.
+
+작업 프로세스는 mock_maya를 설치하고 --startup만큼 기다려 maya.standalone 초기화를 흉내 내며,
+씬을 열 때마다 --open만큼 기다린 뒤 씬 경로로 정해지는 합성 룩뎁 씬을 만듭니다. 추출/저장은 실제 툴 코드를 사용합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_batch_shader_export.py
+    python benchmarks/bench_batch_shader_export.py --assets 40 --workers 4 --startup 1.0 --open 0.3
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zlib
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "export_shader_map_to_json")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import batch_export_shader_maps as batch  # noqa: E402
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Batch shader map export benchmark (mock maya.standalone)")
+    parser.add_argument("--assets", type=int, default=24, help="Number of lookdev scenes")
+    parser.add_argument("--shapes", type=int, default=200, help="Meshes per scene")
+    parser.add_argument("--sgs", type=int, default=20, help="Shading groups per scene")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes for the pool mode")
+    parser.add_argument("--startup", type=float, default=0.5, help="Simulated maya.standalone startup (s)")
+    parser.add_argument("--open", type=float, default=0.2, help="Simulated scene open time (s)")
+    parser.add_argument("--touch_ratio", type=float, default=0.25, help="Ratio of scenes re-published")
+    return parser.parse_args(args)
+
+
+def init_mock_worker(startup, open_time, shapes, sgs):
+    """작업 프로세스 초기화: mock_maya를 설치하고, 씬 열기를 합성 씬 생성으로 대신합니다."""
+    import mock_maya
+    import scene_builders
+
+    def load_scene(path, options):
+        time.sleep(open_time)
+        return scene_builders.build_shader_scene(shapes, sgs, seed=zlib.crc32(path.encode("utf-8")))
+
+    fake_cmds = mock_maya.install()
+    fake_cmds.scene_loader = load_scene
+    time.sleep(startup)
+
+
+def build_library(opts, work_dir):
+    """에셋마다 룩뎁 씬 두 버전(v001, v002)을 만듭니다."""
+    for i in range(opts.assets):
+        asset_type = ("char", "prop", "set")[i % 3]
+        asset_name = f"asset{i:03d}"
+        scene_dir = os.path.join(work_dir, "assets", asset_type, asset_name, "lookdev", "pub", "maya")
+        os.makedirs(scene_dir)
+        for version in (1, 2):
+            path = os.path.join(scene_dir, f"{asset_name}_lookdev_v{version:03d}.ma")
+            open(path, "w").close()
+
+
+def run(opts, scenes, output_root, workers):
+    """작업 목록을 만들고 익스포트하여 (시간, 익스포트 수, 최신으로 건너뛴 수, 실패 수)를 반환합니다."""
+    started = time.perf_counter()
+    jobs = batch.plan_exports(scenes, output_root)
+    pending = [job for job in jobs if not job["up_to_date"]]
+    results = list(batch.export_shader_maps(pending, workers, initializer=init_mock_worker,
+                                            initargs=(opts.startup, opts.open, opts.shapes, opts.sgs)))
+    elapsed = time.perf_counter() - started
+    failed = [r for r in results if r["status"] != batch.STATUS_EXPORTED]
+    for result in failed:
+        print(f"[ERROR] {result['scene']}: {result['status']} {result['error']}")
+    return elapsed, len(results), len(jobs) - len(pending), len(failed)
+
+
+def digest(output_root):
+    """출력 폴더의 모든 쉐이더 맵 내용 해시 (serial과 pool 결과 비교용)"""
+    h = hashlib.sha1()
+    for root, _dirs, names in sorted(os.walk(output_root)):
+        for name in sorted(names):
+            with open(os.path.join(root, name), "rb") as f:
+                h.update(name.encode("utf-8") + f.read())
+    return h.hexdigest()
+
+
+def main(args):
+    opts = parse_args(args)
+    work_dir = tempfile.mkdtemp(prefix="bench_batch_export_")
+    try:
+        build_library(opts, work_dir)
+        all_scenes = batch.find_scene_files([os.path.join(work_dir, "assets")])
+        scenes = batch.filter_scenes(all_scenes, task="lookdev", status="pub", latest_only=True)
+        sample = batch.build_output_path(scenes[0], "<root>")
+        if not sample.startswith(os.path.join("<root>", "char", "asset000")):
+            print(f"[ERROR] PathParser가 에셋 경로로 인식하지 못했습니다: {scenes[0]} -> {sample}")
+            return 1
+        print(f"[INFO] {len(all_scenes)} scenes found, {len(scenes)} latest lookdev scenes, "
+              f"startup {opts.startup}s, open {opts.open}s, {opts.shapes} meshes")
+        print(f"{'Mode':<12} {'Workers':>7} {'Time(s)':>9} {'Exported':>9} {'Skipped':>8}")
+
+        serial_root = os.path.join(work_dir, "maps_serial")
+        output_root = os.path.join(work_dir, "maps")
+        touched = scenes[:max(1, int(len(scenes) * opts.touch_ratio))]
+        modes = (
+            ("serial", serial_root, 1),
+            ("pool", output_root, opts.workers),
+            ("up-to-date", output_root, opts.workers),
+            ("touched", output_root, opts.workers),
+        )
+        for mode, root, workers in modes:
+            if mode == "touched":
+                # 일부 씬을 다시 퍼블리시한 것처럼 수정 시간을 쉐이더 맵보다 늦게 바꿉니다.
+                future = time.time() + 10
+                for path in touched:
+                    os.utime(path, (future, future))
+            elapsed, exported, skipped, failed = run(opts, scenes, root, workers)
+            print(f"{mode:<12} {workers:>7} {elapsed:>9.3f} {exported:>9} {skipped:>8}")
+            if failed:
+                return 1
+            expected = {"up-to-date": 0, "touched": len(touched)}.get(mode, len(scenes))
+            if exported != expected:
+                print(f"[ERROR] {mode}: {expected}개를 익스포트해야 하지만 {exported}개를 익스포트했습니다.")
+                return 1
+
+        if digest(serial_root) != digest(output_root):
+            print("[ERROR] serial과 pool의 쉐이더 맵 내용이 다릅니다.")
+            return 1
+        print("[OK] pool 결과가 serial 결과와 같습니다.")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
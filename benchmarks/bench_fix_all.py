@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+씬 검수 툴 Fix-All 벤치마크입니다.
+
+기존 방식(수정 함수별 개별 호출)과 FixPlan(일괄 수정 계획) 방식을 같은 합성 씬에서 실행하고,
+실행 시간, cmds 호출 횟수, Undo 청크 개수, 수정 후 재검사에서 남은 문제 개수를 비교합니다.
+씬의 일부 메쉬는 다른 메쉬 트랜스폼 아래에 중첩되어 있어, 부모 이름이 먼저 바뀌는 경우의 문제도 드러납니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_fix_all.py
+    python benchmarks/bench_fix_all.py --sizes 1000 10000 --nested_ratio 0.5
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+for path in (BENCH_DIR, REPO_ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+import scene_builders  # noqa: E402
+
+fake_cmds = mock_maya.install()
+
+from tools.scene_validation_tool import scene_validation_tool  # noqa: E402
+
+FIXABLE_CHECKS = ["unknown_nodes", "naming", "history", "freeze_transforms", "multi_uvsets"]
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Scene validator Fix-All benchmark (mock maya.cmds)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000],
+                        help="Number of broken meshes per synthetic scene")
+    parser.add_argument("--nested_ratio", type=float, default=0.3,
+                        help="Probability that a mesh transform is parented under the previous mesh transform")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(args)
+
+
+def collect_issues(validator):
+    """수정 가능한 검사를 실행하여 {검사 이름: 결과 항목 리스트}를 반환합니다."""
+    results = validator.run_validation(names=FIXABLE_CHECKS)
+    return {r.check.name: r.items for r in results if r.items}
+
+
+def fix_legacy(validator, issues):
+    """기존 UI의 Fix-All과 같은 순서로 수정 함수를 하나씩 호출합니다."""
+    fix_map = {
+        "naming": validator.fix_naming_conventions,
+        "history": validator.fix_history_and_transforms,
+        "freeze_transforms": validator.fix_history_and_transforms,
+        "multi_uvsets": validator.cleanup_uvsets,
+    }
+    if "unknown_nodes" in issues:
+        validator.cleanup_unknown_nodes()
+    fixes_to_run = {}
+    for check_name, items in issues.items():
+        function = fix_map.get(check_name)
+        if function:
+            fixes_to_run.setdefault(function, []).extend(items)
+    for function, nodes in fixes_to_run.items():
+        clean_nodes = [n.split('(')[0].strip() for n in nodes]
+        function(list(set(clean_nodes)))
+
+
+def fix_planned(validator, issues):
+    """FixPlan으로 모든 수정을 하나의 트랜잭션으로 적용합니다."""
+    validator.plan_fixes(issues).apply()
+
+
+def run_case(validator, fix_function, num_meshes, nested_ratio, seed):
+    scene = scene_builders.build_fix_scene(num_meshes, nested_ratio=nested_ratio, seed=seed)
+    mock_maya.set_scene(scene)
+    issues = collect_issues(validator)
+    before = sum(len(items) for items in issues.values())
+
+    profiler = validator.create_profiler()
+    with profiler.instrument() as profile:
+        fix_function(validator, issues)
+    undo_chunks = fake_cmds.undo_chunks
+
+    remaining = collect_issues(validator)
+    return {
+        "time": profile.elapsed,
+        "calls": profile.total_calls,
+        "undo_chunks": undo_chunks,
+        "before": before,
+        "after": sum(len(items) for items in remaining.values()),
+    }
+
+
+def main(args):
+    opts = parse_args(args)
+    validator = scene_validation_tool.SceneValidatorCore()
+    # 수정 함수가 노드마다 남기는 로그가 측정을 방해하지 않도록 로그 출력은 에러만 남깁니다.
+    for handler in validator.log.handlers:
+        handler.setLevel("ERROR")
+
+    print(f"{'Meshes':>8} {'Mode':<8} {'Time(s)':>9} {'cmds':>10} {'Undo':>6} {'Issues':>8} {'Left':>7}")
+    for num_meshes in opts.sizes:
+        for mode, fix_function in (("legacy", fix_legacy), ("plan", fix_planned)):
+            m = run_case(validator, fix_function, num_meshes, opts.nested_ratio, opts.seed)
+            print(f"{num_meshes:>8} {mode:<8} {m['time']:>9.3f} {m['calls']:>10,} "
+                  f"{m['undo_chunks']:>6} {m['before']:>8,} {m['after']:>7,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
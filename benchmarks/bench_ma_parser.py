@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Maya 없이 .ma 파일을 읽는 스트리밍 파서(core.ma_parser)와 오프라인 검사(offline_validation) 벤치마크입니다.
+
+합성 .ma 파일을 임시 폴더에 작성한 뒤,
+1) 파일 하나를 scan_scene으로 읽는 처리량(MB/s)과 최대 메모리 사용량,
+2) 여러 파일을 프로세스 풀로 검사할 때의 전체 처리량
+을 측정합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_ma_parser.py
+    python benchmarks/bench_ma_parser.py --meshes 20000 --faces 384 --files 8 --workers 1 4 8
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+for path in (BENCH_DIR, REPO_ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import scene_builders  # noqa: E402
+from core import ma_parser  # noqa: E402
+from tools.scene_validation_tool import offline_validation  # noqa: E402
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Streaming .ma parser / offline validation benchmark")
+    parser.add_argument("--meshes", type=int, default=5000, help="Meshes per synthetic .ma file")
+    parser.add_argument("--faces", type=int, default=96, help="Faces per mesh")
+    parser.add_argument("--files", type=int, default=4, help="Number of files for the process pool run")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4], help="Worker counts to compare")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated files")
+    return parser.parse_args(args)
+
+
+def main(args):
+    opts = parse_args(args)
+    work_dir = tempfile.mkdtemp(prefix="bench_ma_")
+    try:
+        paths = []
+        for i in range(opts.files):
+            path = os.path.join(work_dir, f"scene_{i:02d}.ma")
+            scene_builders.write_ma_scene(path, opts.meshes, faces=opts.faces, seed=i)
+            paths.append(path)
+        size = os.path.getsize(paths[0])
+        total_size = sum(os.path.getsize(p) for p in paths)
+        print(f"[INFO] {opts.files} files, {size / 1e6:.1f} MB each ({opts.meshes} meshes x {opts.faces} faces)")
+
+        started = time.perf_counter()
+        scene = ma_parser.scan_scene(paths[0])
+        elapsed = time.perf_counter() - started
+        print(f"scan_scene            {elapsed:>8.3f}s {size / 1e6 / elapsed:>8.1f} MB/s "
+              f"({len(scene.nodes)} nodes, {scene.connection_count} connections)")
+
+        tracemalloc.start()
+        for _ in ma_parser.iter_statements(paths[0], commands={"requires"}):
+            pass
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"iter_statements peak memory: {peak / 1e6:.1f} MB (file {size / 1e6:.1f} MB)")
+
+        for workers in opts.workers:
+            started = time.perf_counter()
+            reports = list(offline_validation.validate_files(paths, workers=workers))
+            elapsed = time.perf_counter() - started
+            failed = sum(1 for r in reports if not r["passed"])
+            print(f"validate_files w={workers:<3} {elapsed:>8.3f}s {total_size / 1e6 / elapsed:>8.1f} MB/s "
+                  f"({failed}/{len(reports)} files failed)")
+    finally:
+        if opts.keep:
+            print(f"[INFO] Files kept in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Maya 없이 .ma 파일에서 쉐이더 맵을 추출하는 오프라인 익스포트(offline_export_shader_maps) 벤치마크입니다.
+
+쉐이더가 할당된 합성 .ma 파일을 에셋 라이브러리 구조로 작성한 뒤,
+1) 오프라인 추출 결과가 같은 시드의 가짜 씬에서 익스포터(collect_shader_map)로 추출한 결과와 같은지 확인하고,
+2) 파일 하나의 추출 처리량(MB/s)과, 여러 파일을 프로세스 풀로 추출할 때의 전체 처리량을 측정합니다.
+레퍼런스 플레이스홀더로 할당된 파일 하나를 섞어, Maya가 필요한 씬(needs_maya)으로 분류되는지도 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_offline_shader_map.py
+    python benchmarks/bench_offline_shader_map.py --files 16 --shapes 5000 --faces 384 --workers 1 4 8
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "export_shader_map_to_json")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+import scene_builders  # noqa: E402
+
+mock_maya.install()
+
+import batch_export_shader_maps as batch  # noqa: E402
+import export_shader_map_to_json as exporter  # noqa: E402
+import offline_export_shader_maps as offline  # noqa: E402
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Offline .ma shader map extraction benchmark")
+    parser.add_argument("--files", type=int, default=8, help="Number of .ma files")
+    parser.add_argument("--shapes", type=int, default=2000, help="Meshes per file")
+    parser.add_argument("--faces", type=int, default=96, help="Faces per mesh")
+    parser.add_argument("--sgs", type=int, default=50, help="Shading groups per file")
+    parser.add_argument("--face_ratio", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4], help="Worker counts to compare")
+    return parser.parse_args(args)
+
+
+def write_library(opts, work_dir):
+    """에셋마다 룩뎁 .ma 파일을 작성하고 경로 리스트를 반환합니다. 마지막 파일은 레퍼런스 플레이스홀더 할당을 포함합니다."""
+    paths = []
+    for i in range(opts.files + 1):
+        scene_dir = os.path.join(work_dir, "assets", "prop", f"asset{i:03d}", "lookdev", "pub", "maya")
+        os.makedirs(scene_dir)
+        path = os.path.join(scene_dir, f"asset{i:03d}_lookdev_v001.ma")
+        scene_builders.write_shaded_ma_scene(path, opts.shapes, opts.sgs, opts.faces, opts.face_ratio, seed=i,
+                                             placeholder_assignments=3 if i == opts.files else 0)
+        paths.append(path)
+    return paths
+
+
+def main(args):
+    opts = parse_args(args)
+    work_dir = tempfile.mkdtemp(prefix="bench_offline_shader_map_")
+    try:
+        paths = write_library(opts, work_dir)
+        size = os.path.getsize(paths[0])
+        total_size = sum(os.path.getsize(p) for p in paths)
+        print(f"[INFO] {len(paths)} files, {size / 1e6:.1f} MB each ({opts.shapes} meshes x {opts.faces} faces)")
+
+        # 1) 같은 시드의 가짜 씬에서 익스포터로 추출한 결과와 비교합니다.
+        mock_maya.set_scene(scene_builders.build_shader_scene(opts.shapes, opts.sgs, opts.faces, opts.face_ratio,
+                                                              seed=0))
+        expected = exporter.collect_shader_map(exporter.get_target_shapes(exporter.SCOPE_SCENE))
+        started = time.perf_counter()
+        shader_map, unresolved, _warnings = offline.extract_shader_map(paths[0])
+        elapsed = time.perf_counter() - started
+        print(f"extract_shader_map    {elapsed:>8.3f}s {size / 1e6 / elapsed:>8.1f} MB/s "
+              f"({len(shader_map)} objects)")
+        if shader_map != expected or list(shader_map) != list(expected) or unresolved:
+            print("[ERROR] 오프라인 추출 결과가 익스포터 결과와 다릅니다.")
+            return 1
+        print("[OK] 오프라인 추출 결과가 익스포터(collect_shader_map) 결과와 같습니다.")
+
+        # 2) 프로세스 풀로 모든 파일을 추출합니다.
+        for workers in opts.workers:
+            output_root = os.path.join(work_dir, f"maps_w{workers}")
+            jobs = batch.plan_exports(paths, output_root)
+            started = time.perf_counter()
+            results = list(offline.extract_scenes(jobs, workers))
+            elapsed = time.perf_counter() - started
+            counts = {}
+            for result in results:
+                counts[result["status"]] = counts.get(result["status"], 0) + 1
+            print(f"extract_scenes w={workers:<3} {elapsed:>8.3f}s {total_size / 1e6 / elapsed:>8.1f} MB/s "
+                  f"({', '.join(f'{k} {v}' for k, v in sorted(counts.items()))})")
+            if counts.get(batch.STATUS_EXPORTED) != opts.files or counts.get(offline.STATUS_NEEDS_MAYA) != 1:
+                print("[ERROR] 추출 결과 상태가 예상과 다릅니다.")
+                return 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
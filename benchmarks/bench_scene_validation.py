@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+씬 검수 툴(SceneValidatorCore) 검사 항목별 성능 벤치마크입니다.
+
+Maya 없이 mock_maya의 가짜 씬 위에서 검사를 실행하고, 검사별 실행 시간과 cmds 호출 횟수를 측정합니다.
+기준(baseline) 파일과 비교하여 성능 회귀가 있으면 종료 코드 1을 반환하므로 CI에서 사용할 수 있습니다.
+검사 전 사용자 선택(메쉬 하나와 페이스 하나)을 만들어 두고, UI처럼 청크 단위로 검사한 뒤에도 선택이 그대로인지 확인합니다.
+UI처럼 제너레이터를 만든 직후(첫 틱 전)에 취소하면 검사가 하나도 실행되지 않는지도 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_scene_validation.py
+    python benchmarks/bench_scene_validation.py --sizes 1000 10000 100000 --faces 6 96 384
+    python benchmarks/bench_scene_validation.py --save-baseline benchmarks/baseline_scene_validation.json
+    python benchmarks/bench_scene_validation.py --baseline benchmarks/baseline_scene_validation.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+for path in (BENCH_DIR, REPO_ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+import scene_builders  # noqa: E402
+
+mock_maya.install()
+
+from tools.scene_validation_tool import check_registry, scene_validation_tool  # noqa: E402
+
+# UI(scene_valiation_tool_ui.VALIDATION_CHUNK_SIZE)처럼 노드를 나누어 검사합니다.
+CHUNK_SIZE = 200
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="SceneValidatorCore benchmark (mock maya.cmds)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Number of meshes per synthetic scene")
+    parser.add_argument("--faces", type=int, nargs="+", default=[6, 96],
+                        help="Faces per mesh")
+    parser.add_argument("--checks", nargs="+", default=None,
+                        help="Check names to run (default: all registered checks)")
+    parser.add_argument("--error_ratio", type=float, default=0.05,
+                        help="Probability of each issue per mesh")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", dest="save_baseline", help="Write results as a new baseline JSON")
+    parser.add_argument("--time_tolerance", type=float, default=0.5,
+                        help="Allowed relative slowdown before a check is reported as a regression")
+    parser.add_argument("--calls_tolerance", type=float, default=0.0,
+                        help="Allowed relative increase of cmds calls")
+    parser.add_argument("--min_time", type=float, default=0.05,
+                        help="Checks faster than this (s) are not compared by time")
+    return parser.parse_args(args)
+
+
+def run_case(validator, num_meshes, faces, checks, error_ratio, seed):
+    """
+    합성 씬 하나를 만들어 검사를 실행하고 ({검사 이름: 측정값} 딕셔너리, 사용자 선택 유지 여부)를 반환합니다.
+    """
+    scene = scene_builders.build_validation_scene(num_meshes, faces, error_ratio=error_ratio, seed=seed)
+    mock_maya.set_scene(scene)
+
+    measurements = {}
+    profiler = validator.create_profiler()
+    with profiler.instrument() as profile:
+        targets = validator.get_all_mesh_transforms()
+    measurements["collect_targets"] = {"time": profile.elapsed, "calls": profile.total_calls, "items": 0}
+
+    user_selection = [targets[0], f"{targets[-1]}.f[0]"] if targets else []
+    scene.selection = list(user_selection)
+    results = validator.run_validation(names=checks, profile=True, chunk_size=CHUNK_SIZE)
+    for result in results:
+        measurements[result.check.name] = {
+            "time": result.elapsed,
+            "calls": result.total_cmds_calls or 0,
+            "items": len(result.items),
+        }
+    return measurements, scene.selection == user_selection
+
+
+def cancel_before_start(validator):
+    """
+    UI처럼 iter_run 제너레이터를 보관해 둔 뒤 첫 틱 전에 취소하고, 실행된 검사 이름 리스트를 반환합니다.
+    """
+    scene = scene_builders.build_validation_scene(50, 6, seed=0)
+    mock_maya.set_scene(scene)
+    targets = validator.get_all_mesh_transforms()
+
+    engine = check_registry.ValidationEngine(validator.build_check_registry())
+    events = engine.iter_run(targets, chunk_size=CHUNK_SIZE)
+    engine.cancel()
+    return [event.result.check.name for event in events
+            if event.result is not None and event.result.status != check_registry.STATUS_NOT_RUN]
+
+
+def compare(results, baseline, opts):
+    """기준 결과와 비교하여 회귀 항목 메시지 리스트를 반환합니다."""
+    regressions = []
+    for case, checks in results.items():
+        for name, current in checks.items():
+            base = baseline.get(case, {}).get(name)
+            if not base:
+                continue
+            if current["calls"] > base["calls"] * (1.0 + opts.calls_tolerance):
+                regressions.append(f"{case} {name}: cmds calls {base['calls']} -> {current['calls']}")
+            if (current["time"] > opts.min_time
+                    and current["time"] > base["time"] * (1.0 + opts.time_tolerance)):
+                regressions.append(f"{case} {name}: time {base['time']:.3f}s -> {current['time']:.3f}s")
+    return regressions
+
+
+def main(args):
+    opts = parse_args(args)
+    validator = scene_validation_tool.SceneValidatorCore()
+    # 벤치마크 중에는 검사별 로그가 콘솔을 덮지 않도록 스트림 출력은 경고 이상만 표시합니다.
+    for handler in validator.log.handlers:
+        if not hasattr(handler, "baseFilename"):
+            handler.setLevel("ERROR")
+
+    results = {}
+    print(f"{'Case':<24} {'Check':<20} {'Time(s)':>9} {'cmds':>11} {'Items':>7}")
+    for num_meshes in opts.sizes:
+        for faces in opts.faces:
+            case = f"meshes={num_meshes},faces={faces}"
+            started = time.perf_counter()
+            measurements, selection_kept = run_case(validator, num_meshes, faces, opts.checks, opts.error_ratio,
+                                                    opts.seed)
+            if not selection_kept:
+                print(f"[ERROR] {case}: 검사 후 사용자의 선택이 바뀌었습니다.")
+                return 1
+            results[case] = measurements
+            for name, m in measurements.items():
+                print(f"{case:<24} {name:<20} {m['time']:>9.3f} {m['calls']:>11,} {m['items']:>7}")
+            print(f"{case:<24} {'(total)':<20} {time.perf_counter() - started:>9.3f}")
+
+    executed = cancel_before_start(validator)
+    if executed:
+        print(f"[ERROR] 첫 틱 전에 취소했는데도 검사가 실행되었습니다: {', '.join(executed)}")
+        return 1
+
+    if opts.save_baseline:
+        with open(opts.save_baseline, "w") as f:
+            json.dump(results, f, indent=4, sort_keys=True)
+        print(f"[SAVED] Baseline written: {opts.save_baseline}")
+
+    if opts.baseline:
+        with open(opts.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, opts)
+        if regressions:
+            print("[REGRESSION] Performance regressions detected:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("[OK] No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+쉐이더 맵 임포터(import_shaders_from_json) 벤치마크입니다.
+
+레퍼런스 에셋이 많은 샷 씬에서 기존 방식(멤버마다 cmds.objExists + cmds.sets)과
+SG별 일괄 할당 방식의 실행 시간과 cmds 호출 횟수를 비교합니다.
+일괄 할당은 쉐이더 맵 캐시가 빈 상태에서 파일을 차례로 읽는 경우(serial)와 스레드 풀에서 미리 읽는 경우(prefetch),
+이전 실행의 캐시가 남은 상태(warm)를 각각 측정합니다.
+--latency를 지정하면 파일 stat/open마다 네트워크 파일 시스템(NFS) 지연을 흉내 냅니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_shader_import.py
+    python benchmarks/bench_shader_import.py --assets 30 --instances 10 --shapes 100
+    python benchmarks/bench_shader_import.py --assets 2 --instances 40 --shapes 2000   # 군중(crowd) 소품
+    python benchmarks/bench_shader_import.py --assets 100 --instances 2 --shapes 50 --latency 20 --workers 8
+"""
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "export_shader_map_to_json")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+import scene_builders  # noqa: E402
+
+mock_maya.install()
+
+import maya.cmds as cmds  # noqa: E402
+import export_shader_map_to_json as exporter  # noqa: E402
+import import_shader_map_from_json as importer  # noqa: E402
+from tools.scene_validation_tool import check_profiler  # noqa: E402
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Shader map import benchmark (mock maya.cmds)")
+    parser.add_argument("--assets", type=int, default=30, help="Number of unique assets")
+    parser.add_argument("--instances", type=int, default=10, help="References per asset")
+    parser.add_argument("--shapes", type=int, default=100, help="Meshes per asset")
+    parser.add_argument("--sgs", type=int, default=20, help="Shading groups per asset")
+    parser.add_argument("--face_ratio", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated latency per file stat/open (ms)")
+    parser.add_argument("--workers", type=int, default=importer.DEFAULT_PREFETCH_WORKERS,
+                        help="Prefetch threads for the prefetch/warm modes")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(args)
+
+
+@contextlib.contextmanager
+def simulated_latency(seconds):
+    """os.stat과 open 호출마다 seconds만큼 기다리도록 바꿉니다. (time.sleep은 GIL을 놓으므로 스레드 간 지연이 겹칩니다.)"""
+    if seconds <= 0:
+        yield
+        return
+
+    original_stat, original_open = os.stat, builtins.open
+
+    def slow_stat(*args, **kwargs):
+        time.sleep(seconds)
+        return original_stat(*args, **kwargs)
+
+    def slow_open(*args, **kwargs):
+        time.sleep(seconds)
+        return original_open(*args, **kwargs)
+
+    os.stat, builtins.open = slow_stat, slow_open
+    try:
+        yield
+    finally:
+        os.stat, builtins.open = original_stat, original_open
+
+
+def legacy_import(map_root_directory):
+    """기존 import_shaders_from_json의 할당 루프 (비교용)"""
+    for ref_node in cmds.ls(type='reference'):
+        ref_path = cmds.referenceQuery(ref_node, filename=True, withoutCopyNumber=True)
+        ref_ns = cmds.referenceQuery(ref_node, namespace=True)[1:]
+        asset_base_name = os.path.splitext(os.path.basename(ref_path))[0]
+        json_path = os.path.join(map_root_directory, "{}.json".format(asset_base_name))
+        if not os.path.exists(json_path):
+            continue
+        with open(json_path, 'r') as f:
+            shader_map = json.load(f)
+        for info_list in shader_map.values():
+            ns_prefix = "{}:".format(ref_ns)
+            for info in info_list:
+                full_sg = "{}{}".format(ns_prefix, info['sg_name'])
+                if not cmds.objExists(full_sg):
+                    continue
+                for member in info['members']:
+                    full_member_path = "{}{}".format(ns_prefix, member)
+                    if cmds.objExists(full_member_path):
+                        cmds.sets(full_member_path, edit=True, forceElement=full_sg)
+
+
+def write_shader_maps(opts, asset_names, out_dir):
+    """에셋별 원본 씬을 만들어 쉐이더 맵 JSON을 저장합니다."""
+    for asset_index, asset_name in enumerate(asset_names):
+        scene = scene_builders.build_shader_scene(opts.shapes, opts.sgs, face_assign_ratio=opts.face_ratio,
+                                                  seed=opts.seed + asset_index)
+        mock_maya.set_scene(scene)
+        shader_map = exporter.collect_shader_map(exporter.get_target_shapes("scene"))
+        with open(os.path.join(out_dir, f"{asset_name}.json"), "w") as f:
+            json.dump(shader_map, f)
+
+
+def main(args):
+    opts = parse_args(args)
+    asset_names = [f"asset{i:03d}" for i in range(opts.assets)]
+    map_dir = tempfile.mkdtemp(prefix="bench_shader_maps_")
+    index_dir = tempfile.mkdtemp(prefix="bench_shader_map_index_")
+    index_path = os.path.join(index_dir, "index.json")
+    try:
+        write_shader_maps(opts, asset_names, map_dir)
+        print(f"[INFO] {opts.assets} assets x {opts.instances} references x {opts.shapes} meshes "
+              f"= {opts.assets * opts.instances * opts.shapes:,} meshes")
+        print(f"{'Mode':<9} {'Time(s)':>9} {'cmds':>10} {'sets':>9} {'Shaded':>8}")
+        modes = (("legacy", legacy_import),
+                 ("serial", lambda root: importer.import_shaders_from_json(root, 0, index_path=index_path)),
+                 ("prefetch", lambda root: importer.import_shaders_from_json(root, opts.workers, index_path=index_path)),
+                 ("warm", lambda root: importer.import_shaders_from_json(root, opts.workers, index_path=index_path)))
+        for mode, func in modes:
+            if mode != "warm":
+                importer.clear_shader_map_cache()
+            scene = scene_builders.build_shot_scene(asset_names, opts.instances, opts.shapes, opts.sgs,
+                                                    face_assign_ratio=opts.face_ratio, seed=opts.seed)
+            mock_maya.set_scene(scene)
+            profiler = check_profiler.CheckProfiler([sys.modules[__name__], importer])
+            started = time.perf_counter()
+            with profiler.instrument() as profile, contextlib.redirect_stdout(io.StringIO()), \
+                    simulated_latency(opts.latency / 1000.0):
+                func(map_dir)
+            elapsed = time.perf_counter() - started
+            shaded = sum(1 for n in scene.nodes if n.type == "mesh" and n.attrs.get("sgs"))
+            print(f"{mode:<9} {elapsed:>9.3f} {profile.total_calls:>10,} {profile.cmds_calls.get('sets', 0):>9,} "
+                  f"{shaded:>8,}")
+    finally:
+        shutil.rmtree(map_dir, ignore_errors=True)
+        shutil.rmtree(index_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
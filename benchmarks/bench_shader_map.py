@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+쉐이더 맵 익스포터(export_shader_map_to_json) 벤치마크입니다.
+
+기존 방식(쉐이프마다 연결된 SG의 전체 멤버를 cmds.sets로 다시 조회하고 필터링)과
+SG 멤버 역색인(build_sg_membership_index) 방식을 같은 합성 씬에서 비교합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_shader_map.py
+    python benchmarks/bench_shader_map.py --shapes 5000 20000 --sgs 200 --namespace "bag01:"
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "export_shader_map_to_json")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+import scene_builders  # noqa: E402
+
+mock_maya.install()
+
+import maya.cmds as cmds  # noqa: E402
+import export_shader_map_to_json as exporter  # noqa: E402
+from tools.scene_validation_tool import check_profiler  # noqa: E402
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Shader map export benchmark (mock maya.cmds)")
+    parser.add_argument("--shapes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--sgs", type=int, default=200)
+    parser.add_argument("--face_ratio", type=float, default=0.2,
+                        help="Ratio of meshes with per-face assignments")
+    parser.add_argument("--namespace", default="")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip_legacy", action="store_true", help="Skip the legacy per-shape path")
+    return parser.parse_args(args)
+
+
+def legacy_collect(selection):
+    """기존 export_shader_map_to_json의 추출 루프 (비교용)"""
+    shader_mapping_dict = {}
+    for node_path in selection:
+        object_key = node_path.split('|')[-1].split(':')[-1]
+        shader_info_list = []
+        all_shapes = cmds.listRelatives(node_path, shapes=True, fullPath=True) or []
+        shapes = [s for s in all_shapes if not cmds.getAttr("{}.intermediateObject".format(s))]
+        for shape_node in shapes:
+            short_shape_name = shape_node.split('|')[-1].split(':')[-1]
+            connected_sgs = cmds.listConnections(shape_node, type='shadingEngine', destination=True, source=False)
+            if not connected_sgs:
+                continue
+            for full_sg_name in sorted(set(connected_sgs)):
+                sg_members = cmds.sets(full_sg_name, query=True)
+                if not sg_members:
+                    continue
+                filtered_members = []
+                for member in sg_members:
+                    base_member_name = member.split('|')[-1].split(':')[-1]
+                    if '.' in base_member_name:
+                        component_base = base_member_name.split('.')[0]
+                        if component_base == object_key or component_base == short_shape_name:
+                            filtered_members.append("{}.{}".format(short_shape_name, base_member_name.split('.', 1)[1]))
+                    elif base_member_name == object_key or base_member_name == short_shape_name:
+                        filtered_members.append(short_shape_name)
+                if filtered_members:
+                    shader_info_list.append({"sg_name": full_sg_name.split(':')[-1],
+                                             "members": sorted(set(filtered_members))})
+        if shader_info_list:
+            shader_mapping_dict[object_key] = shader_info_list
+    return shader_mapping_dict
+
+
+def measure(func, *args):
+    profiler = check_profiler.CheckProfiler([sys.modules[__name__], exporter])
+    with profiler.instrument() as profile:
+        result = func(*args)
+    return result, profile
+
+
+def count_members(shader_map):
+    return sum(len(info["members"]) for infos in shader_map.values() for info in infos)
+
+
+def main(args):
+    opts = parse_args(args)
+    print(f"{'Shapes':>7} {'SGs':>5} {'Mode':<16} {'Time(s)':>9} {'cmds':>9} {'Objects':>8} {'Members':>8}")
+    for num_shapes in opts.shapes:
+        scene = scene_builders.build_shader_scene(num_shapes, opts.sgs, face_assign_ratio=opts.face_ratio,
+                                                  namespace=opts.namespace, seed=opts.seed)
+        mock_maya.set_scene(scene)
+        transforms = [n.long_name() for n in scene.nodes
+                      if n.type == "transform" and scene.shapes(n)]
+        scene.selection = list(transforms)
+
+        modes = [
+            ("index/selection", lambda: exporter.collect_shader_map(exporter.get_target_shapes("selection"))),
+            ("index/scene", lambda: exporter.collect_shader_map(exporter.get_target_shapes("scene"))),
+        ]
+        if not opts.skip_legacy:
+            modes.insert(0, ("legacy", lambda: legacy_collect(transforms)))
+
+        results = {}
+        for mode, func in modes:
+            started = time.perf_counter()
+            shader_map, profile = measure(func)
+            elapsed = time.perf_counter() - started
+            results[mode] = shader_map
+            print(f"{num_shapes:>7} {opts.sgs:>5} {mode:<16} {elapsed:>9.3f} {profile.total_calls:>9,} "
+                  f"{len(shader_map):>8} {count_members(shader_map):>8}")
+
+        if results.get("index/selection") != results.get("index/scene"):
+            print("[WARNING] selection and scene scope results differ")
+        if "legacy" in results:
+            # 기존 방식은 네임스페이스를 제거할 때 'f[0:9]'의 ':'에서도 잘라 페이스 범위 할당을 놓칩니다.
+            # 오브젝트 단위 할당만 있는 오브젝트는 결과가 같아야 합니다.
+            new = results["index/selection"]
+            diff = [key for key, infos in results["legacy"].items()
+                    if all('.' not in m for info in new.get(key, []) for m in info["members"])
+                    and new.get(key) != infos]
+            if diff:
+                print(f"[WARNING] {len(diff)} objects differ from legacy output (e.g. {diff[:3]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
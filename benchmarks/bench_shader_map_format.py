@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+쉐이더 맵 파일 포맷(v1 / v2) 벤치마크입니다.
+
+페이스 단위 할당이 많은 에셋의 쉐이더 맵을 합성하여, 포맷별 파일 크기, 저장 시간,
+임포터 템플릿(AssignmentTemplate)까지의 로드 시간과 최대 메모리(tracemalloc)를 비교합니다.
+v1은 페이스마다 멤버 문자열이 따로 저장된 기존 포맷(indent=4)이고, v2는 범위 병합 + 이름 사전 인코딩 포맷입니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_shader_map_format.py
+    python benchmarks/bench_shader_map_format.py --objects 2000 --faces 2000 --sgs 50
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "export_shader_map_to_json")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+
+mock_maya.install()
+
+import import_shader_map_from_json as importer  # noqa: E402
+import shader_map_format  # noqa: E402
+
+# (이름, 파일명, 버전)
+FORMATS = (
+    ("v1", "asset_v1.json", 1),
+    ("v1.gz", "asset_v1.json.gz", 1),
+    ("v2", "asset_v2.json", 2),
+    ("v2.gz", "asset_v2.json.gz", 2),
+    ("v2.xz", "asset_v2.json.xz", 2),
+)
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Shader map file format benchmark (v1 vs v2)")
+    parser.add_argument("--objects", type=int, default=1000, help="Number of objects")
+    parser.add_argument("--faces", type=int, default=1000, help="Faces per mesh")
+    parser.add_argument("--sgs", type=int, default=50, help="Number of shading groups")
+    parser.add_argument("--face_sets", type=int, default=3, help="Face-assigned shading groups per mesh")
+    parser.add_argument("--face_ratio", type=float, default=0.5, help="Ratio of meshes with face assignments")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(args)
+
+
+def build_dense_shader_map(opts):
+    """
+    페이스 단위 할당이 많은 v1 쉐이더 맵을 생성합니다.
+    face_ratio 비율의 메쉬는 face_sets개의 SG가 페이스 구간에 할당되며, 구간 안의 페이스는 하나씩 따로 기록됩니다.
+    (페이스를 하나씩 선택해 할당한 에셋을 기존 익스포터로 추출했을 때와 같은 형태)
+    """
+    rng = random.Random(opts.seed)
+    sg_names = [f"mat_{i:03d}SG" for i in range(opts.sgs)]
+    shader_map = {}
+    for i in range(opts.objects):
+        shape = f"part_{i:05d}_geoShape"
+        info_list = [{"sg_name": rng.choice(sg_names), "members": [shape]}]
+        if rng.random() < opts.face_ratio:
+            cuts = sorted(rng.sample(range(1, opts.faces), opts.face_sets * 2))
+            for j, sg in enumerate(rng.sample(sg_names, opts.face_sets)):
+                start, end = cuts[j * 2], cuts[j * 2 + 1]
+                info_list.append({"sg_name": sg,
+                                  "members": [f"{shape}.f[{face}]" for face in range(start, end)]})
+        shader_map[f"part_{i:05d}_geo"] = info_list
+    return shader_map
+
+
+def expand_template(template):
+    """템플릿을 {(SG, 쉐이프): 페이스 집합}으로 펼칩니다. 오브젝트 전체 할당은 -1로 표시합니다. (포맷 간 결과 비교용)"""
+    expanded = {}
+    for step in template.steps:
+        for sg, members in step:
+            for member in members:
+                node, _, component = member.partition('.')
+                faces = expanded.setdefault((sg, node), set())
+                if not component:
+                    faces.add(-1)
+                    continue
+                start, _, end = component[2:-1].partition(':')
+                faces.update(range(int(start), int(end or start) + 1))
+    return expanded
+
+
+def load_template(path):
+    """파일을 읽어 임포터 템플릿을 만들고 (템플릿, 시간, 최대 메모리)를 반환합니다."""
+    importer.clear_shader_map_cache()
+    tracemalloc.start()
+    started = time.perf_counter()
+    template, _ = importer.load_assignment_template(path)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return template, elapsed, peak
+
+
+def main(args):
+    opts = parse_args(args)
+    shader_map = build_dense_shader_map(opts)
+    num_members = sum(len(info["members"]) for infos in shader_map.values() for info in infos)
+    print(f"[INFO] {opts.objects:,} objects x {opts.faces:,} faces, {num_members:,} v1 members")
+    print(f"{'Format':<7} {'Size(MB)':>9} {'Ratio':>7} {'Write(s)':>9} {'Load(s)':>8} {'Peak(MB)':>9} "
+          f"{'Members':>9}")
+
+    out_dir = tempfile.mkdtemp(prefix="bench_shader_map_format_")
+    try:
+        baseline_size = None
+        reference = None
+        for name, file_name, version in FORMATS:
+            path = os.path.join(out_dir, file_name)
+            started = time.perf_counter()
+            shader_map_format.write_shader_map(path, shader_map, version)
+            write_time = time.perf_counter() - started
+            size = os.path.getsize(path)
+            baseline_size = baseline_size or size
+
+            template, load_time, peak = load_template(path)
+            members = sum(len(members) for step in template.steps for _, members in step)
+            expanded = expand_template(template)
+            if reference is None:
+                reference = expanded
+            elif expanded != reference:
+                print(f"[ERROR] {name}: 할당 결과가 v1과 다릅니다.")
+                return 1
+            print(f"{name:<7} {size / 1e6:>9.2f} {baseline_size / size:>6.1f}x {write_time:>9.3f} "
+                  f"{load_time:>8.3f} {peak / 1e6:>9.1f} {members:>9,}")
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
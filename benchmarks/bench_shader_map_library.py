@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+쉐이더 맵 라이브러리 인덱스(shader_map_library) 벤치마크입니다.
+
+레퍼런스가 수백 개인 샷에서 쉐이더 맵 경로를 찾을 때, 기존 방식(레퍼런스마다 '<폴더>/<에셋>.json'을 stat)과
+인덱스 방식(처음 생성 / 변경 없음 / 폴더 하나 변경)의 실행 시간과 파일 시스템 호출 횟수(os.stat, os.scandir)를 비교합니다.
+--latency로 파일 시스템 호출마다 네트워크 파일 시스템(NFS) 지연을 흉내 냅니다.
+마지막에 버전을 지정한 레퍼런스가 없는 버전일 때 가장 높은 버전으로 대신하지 않는지 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_shader_map_library.py
+    python benchmarks/bench_shader_map_library.py --types 5 --assets 200 --versions 3 --refs 500 --latency 2
+    python benchmarks/bench_shader_map_library.py --per_asset_dirs     # 에셋마다 폴더가 있는 구조 (폴더 1,006개)
+"""
+import argparse
+import contextlib
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "export_shader_map_to_json")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import shader_map_format  # noqa: E402
+import shader_map_library  # noqa: E402
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Shader map library index benchmark")
+    parser.add_argument("--types", type=int, default=5, help="Asset type folders (char, prop, ...)")
+    parser.add_argument("--assets", type=int, default=200, help="Assets per type")
+    parser.add_argument("--versions", type=int, default=3, help="Shader map versions per asset")
+    parser.add_argument("--refs", type=int, default=500, help="References in the shot")
+    parser.add_argument("--per_asset_dirs", action="store_true",
+                        help="Use '<type>/<asset>/<asset>_v###.json' instead of '<type>/<asset>_v###.json'")
+    parser.add_argument("--latency", type=float, default=2.0, help="Simulated latency per stat/scandir (ms)")
+    parser.add_argument("--workers", type=int, default=shader_map_library.DEFAULT_SCAN_WORKERS,
+                        help="Index scan threads")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(args)
+
+
+@contextlib.contextmanager
+def counted_fs_calls(seconds):
+    """os.stat과 os.scandir 호출 횟수를 세고, 호출마다 seconds만큼 기다리도록 바꿉니다."""
+    counts = {"stat": 0, "scandir": 0}
+    original_stat, original_scandir = os.stat, os.scandir
+
+    def slow_stat(*args, **kwargs):
+        counts["stat"] += 1
+        if seconds > 0:
+            time.sleep(seconds)
+        return original_stat(*args, **kwargs)
+
+    def slow_scandir(*args, **kwargs):
+        counts["scandir"] += 1
+        if seconds > 0:
+            time.sleep(seconds)
+        return original_scandir(*args, **kwargs)
+
+    os.stat, os.scandir = slow_stat, slow_scandir
+    try:
+        yield counts
+    finally:
+        os.stat, os.scandir = original_stat, original_scandir
+
+
+def build_library(opts, library_root, flat_root):
+    """
+    '<타입>/<에셋>_v###.json' (또는 '<타입>/<에셋>/<에셋>_v###.json') 구조의 라이브러리와,
+    기존 방식용 '<에셋>.json' 평면 폴더를 만듭니다.
+
+    :return: 에셋 이름 리스트
+    """
+    asset_names = []
+    for t in range(opts.types):
+        for a in range(opts.assets):
+            asset_name = f"type{t:02d}_asset{a:04d}"
+            asset_dir = os.path.join(library_root, f"type{t:02d}")
+            if opts.per_asset_dirs:
+                asset_dir = os.path.join(asset_dir, asset_name)
+            os.makedirs(asset_dir, exist_ok=True)
+            for v in range(1, opts.versions + 1):
+                open(os.path.join(asset_dir, f"{asset_name}_v{v:03d}.json"), "w").close()
+            open(os.path.join(flat_root, f"{asset_name}.json"), "w").close()
+            asset_names.append(asset_name)
+    return asset_names
+
+
+def legacy_lookup(flat_root, ref_names):
+    """기존 임포터처럼 레퍼런스마다 확장자별 쉐이더 맵 경로를 조합하여 존재 여부를 확인합니다."""
+    found = {}
+    for name in ref_names:
+        found[name] = None
+        for extension in shader_map_format.SHADER_MAP_EXTENSIONS:
+            path = os.path.join(flat_root, name + extension)
+            if os.path.exists(path):
+                found[name] = path
+                break
+    return found
+
+
+def index_lookup(library_root, index_path, ref_names, workers):
+    """인덱스를 갱신하고 모든 레퍼런스의 쉐이더 맵 경로를 찾습니다."""
+    library = shader_map_library.ShaderMapLibrary(library_root, index_path, workers)
+    stats = library.refresh()
+    return {name: library.find(name) for name in ref_names}, stats
+
+
+def main(args):
+    opts = parse_args(args)
+    rng = random.Random(opts.seed)
+    work_dir = tempfile.mkdtemp(prefix="bench_shader_map_library_")
+    library_root = os.path.join(work_dir, "library")
+    flat_root = os.path.join(work_dir, "flat")
+    index_path = os.path.join(work_dir, "index.json")
+    os.makedirs(flat_root)
+    try:
+        asset_names = build_library(opts, library_root, flat_root)
+        ref_names = [rng.choice(asset_names) for _ in range(opts.refs)]
+        print(f"[INFO] {len(asset_names):,} assets x {opts.versions} versions, {opts.refs} references, "
+              f"latency {opts.latency} ms")
+        print(f"{'Mode':<10} {'Time(s)':>9} {'stat':>7} {'scandir':>8} {'Scanned':>8} {'Found':>6}")
+
+        changed_dir = os.path.join(library_root, "type00")
+        if opts.per_asset_dirs:
+            changed_dir = os.path.join(changed_dir, asset_names[0])
+        latest = f"{asset_names[0]}_v{opts.versions + 1:03d}.json"
+        modes = ("legacy", "cold", "warm", "changed")
+        for mode in modes:
+            if mode == "changed":
+                # 에셋 하나에 새 버전을 추가합니다. (해당 폴더의 수정 시간만 바뀝니다.)
+                open(os.path.join(changed_dir, latest), "w").close()
+
+            scanned = "-"
+            with counted_fs_calls(opts.latency / 1000.0) as counts:
+                started = time.perf_counter()
+                if mode == "legacy":
+                    found = legacy_lookup(flat_root, ref_names)
+                else:
+                    found, stats = index_lookup(library_root, index_path, ref_names, opts.workers)
+                    scanned = stats["dirs_scanned"]
+                elapsed = time.perf_counter() - started
+
+            resolved = sum(1 for path in found.values() if path)
+            print(f"{mode:<10} {elapsed:>9.3f} {counts['stat']:>7,} {counts['scandir']:>8,} {scanned!s:>8} "
+                  f"{resolved:>6}")
+            if resolved != len(set(ref_names)):
+                print(f"[ERROR] {mode}: 찾지 못한 레퍼런스가 있습니다.")
+                return 1
+            if mode == "changed" and asset_names[0] in found and not found[asset_names[0]].endswith(latest):
+                print("[ERROR] 새 버전이 인덱스에 반영되지 않았습니다.")
+                return 1
+
+        # 버전을 지정한 레퍼런스는 그 버전만 찾고, 없는 버전은 가장 높은 버전으로 대신하지 않습니다.
+        library = shader_map_library.ShaderMapLibrary(library_root, index_path, opts.workers)
+        library.refresh()
+        pinned = f"{asset_names[0]}_v{opts.versions + 2:03d}"
+        checks = {
+            f"{asset_names[0]}_v1": f"{asset_names[0]}_v001.json",
+            pinned: None,
+            asset_names[0]: latest,
+        }
+        wrong = {name: path for name, path in ((n, library.find(n)) for n in checks)
+                 if (path and os.path.basename(path)) != checks[name]}
+        if wrong:
+            print(f"[ERROR] 버전을 지정한 레퍼런스를 잘못 찾았습니다: {wrong}")
+            return 1
+        print(f"[OK] 없는 버전({pinned})은 찾지 않고, 버전이 없는 이름만 가장 높은 버전({latest})을 사용했습니다.")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
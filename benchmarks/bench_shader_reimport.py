@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+쉐이더 맵 재적용(re-import) 벤치마크입니다.
+
+쉐이더 맵으로 한 번 할당된 샷 씬에, 일부 오브젝트만 바뀐 룩뎁 업데이트 맵을 다시 적용할 때
+전체 재할당(full)과 변경분만 할당(incremental), 드라이 런(dry-run)의 실행 시간, cmds 호출 횟수,
+실제로 forceElement로 다시 할당된 멤버 수를 비교합니다.
+가짜 씬은 SG 멤버 목록을 실제 Maya처럼 갱신하며(track_membership), 실행 후
+full과 incremental의 최종 할당 상태가 같은지 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_shader_reimport.py
+    python benchmarks/bench_shader_reimport.py --assets 10 --instances 5 --shapes 500 --change_ratio 0.01
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "export_shader_map_to_json")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+import scene_builders  # noqa: E402
+
+fake_cmds = mock_maya.install()
+
+import export_shader_map_to_json as exporter  # noqa: E402
+import import_shader_map_from_json as importer  # noqa: E402
+import shader_map_format  # noqa: E402
+from tools.scene_validation_tool import check_profiler  # noqa: E402
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Incremental shader map re-import benchmark (mock maya.cmds)")
+    parser.add_argument("--assets", type=int, default=10, help="Number of unique assets")
+    parser.add_argument("--instances", type=int, default=5, help="References per asset")
+    parser.add_argument("--shapes", type=int, default=200, help="Meshes per asset")
+    parser.add_argument("--sgs", type=int, default=20, help="Shading groups per asset")
+    parser.add_argument("--face_ratio", type=float, default=0.2)
+    parser.add_argument("--change_ratio", type=float, default=0.01, help="Ratio of objects changed by the update")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(args)
+
+
+def write_maps(opts, asset_names, original_dir, updated_dir):
+    """에셋별 원본 쉐이더 맵과, change_ratio 비율의 오브젝트만 SG를 바꾼 업데이트 맵을 저장합니다."""
+    rng = random.Random(opts.seed)
+    changed = 0
+    for asset_index, asset_name in enumerate(asset_names):
+        scene = scene_builders.build_shader_scene(opts.shapes, opts.sgs, face_assign_ratio=opts.face_ratio,
+                                                  seed=opts.seed + asset_index)
+        mock_maya.set_scene(scene)
+        shader_map = exporter.collect_shader_map(exporter.get_target_shapes("scene"))
+        shader_map_format.write_shader_map(os.path.join(original_dir, f"{asset_name}.json"), shader_map)
+
+        sg_names = sorted({info["sg_name"] for infos in shader_map.values() for info in infos})
+        for object_key in rng.sample(sorted(shader_map), max(1, int(len(shader_map) * opts.change_ratio))):
+            info = rng.choice(shader_map[object_key])
+            info["sg_name"] = rng.choice([sg for sg in sg_names if sg != info["sg_name"]])
+            changed += 1
+        shader_map_format.write_shader_map(os.path.join(updated_dir, f"{asset_name}.json"), shader_map)
+    return changed
+
+
+def build_imported_scene(opts, asset_names, original_dir, index_path):
+    """샷 씬을 만들고 원본 쉐이더 맵을 적용한 상태로 반환합니다."""
+    scene = scene_builders.build_shot_scene(asset_names, opts.instances, opts.shapes, opts.sgs,
+                                            face_assign_ratio=opts.face_ratio, seed=opts.seed)
+    scene.track_membership = True
+    mock_maya.set_scene(scene)
+    with contextlib.redirect_stdout(io.StringIO()):
+        importer.import_shaders_from_json(original_dir, index_path=index_path)
+    return scene
+
+
+def membership(scene):
+    """{SG 이름: 정렬된 멤버 튜플} (최종 할당 상태 비교용)"""
+    return {n.name: tuple(sorted(n.attrs.get("members", []))) for n in scene.nodes if n.type == "shadingEngine"}
+
+
+def main(args):
+    opts = parse_args(args)
+    asset_names = [f"asset{i:03d}" for i in range(opts.assets)]
+    original_dir = tempfile.mkdtemp(prefix="bench_shader_maps_")
+    updated_dir = tempfile.mkdtemp(prefix="bench_shader_maps_updated_")
+    index_dir = tempfile.mkdtemp(prefix="bench_shader_map_index_")
+    index_paths = {original_dir: os.path.join(index_dir, "original.json"),
+                   updated_dir: os.path.join(index_dir, "updated.json")}
+    try:
+        changed = write_maps(opts, asset_names, original_dir, updated_dir)
+        print(f"[INFO] {opts.assets} assets x {opts.instances} references x {opts.shapes} meshes, "
+              f"{changed} changed map entries")
+        print(f"{'Mode':<12} {'Time(s)':>9} {'cmds':>9} {'sets':>8} {'Assigned':>9} {'Planned':>8} {'Unchanged':>10}")
+
+        modes = (
+            ("full", updated_dir, {}),
+            ("incremental", updated_dir, {"incremental": True}),
+            ("dry-run", updated_dir, {"dry_run": True}),
+            ("noop", original_dir, {"incremental": True}),
+        )
+        states = {}
+        for mode, map_dir, kwargs in modes:
+            scene = build_imported_scene(opts, asset_names, original_dir, index_paths[original_dir])
+            before = membership(scene)
+            fake_cmds.assigned_members = 0
+            profiler = check_profiler.CheckProfiler([importer])
+            started = time.perf_counter()
+            with profiler.instrument() as profile, contextlib.redirect_stdout(io.StringIO()):
+                report = importer.import_shaders_from_json(map_dir, index_path=index_paths[map_dir], **kwargs)
+            elapsed = time.perf_counter() - started
+
+            planned = unchanged = "-"
+            if report is not None:
+                planned = sum(len(m) for r in report.values() for m in r["changes"].values())
+                unchanged = sum(r["unchanged"] for r in report.values())
+            states[mode] = membership(scene)
+            print(f"{mode:<12} {elapsed:>9.3f} {profile.total_calls:>9,} {profile.cmds_calls.get('sets', 0):>8,} "
+                  f"{fake_cmds.assigned_members:>9,} {planned!s:>8} {unchanged!s:>10}")
+            if mode == "dry-run" and states[mode] != before:
+                print("[ERROR] dry-run이 씬을 변경했습니다.")
+                return 1
+
+        if states["incremental"] != states["full"]:
+            print("[ERROR] incremental과 full의 최종 할당 상태가 다릅니다.")
+            return 1
+        print("[OK] incremental 결과가 full 재할당 결과와 같습니다.")
+    finally:
+        shutil.rmtree(original_dir, ignore_errors=True)
+        shutil.rmtree(updated_dir, ignore_errors=True)
+        shutil.rmtree(index_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Yeti 캐시 일괄 추출(yeti_batch_export, standalone 세션 하나) 벤치마크입니다.
+
+씬마다 yeti_standalone_export.py 프로세스를 하나씩 실행할 때(per_scene)와 yeti_batch_export.py 프로세스 하나가
+모든 씬을 차례로 추출할 때(batch)의 전체 시간을 비교합니다. 두 경우 모두 이 파일을 하위 프로세스로 실행하여
+mock_maya를 설치한 뒤 실제 스크립트를 __main__으로 실행합니다.
+가짜 maya.standalone.initialize는 --startup만큼, Yeti 플러그인 불러오기는 --plugin만큼, 씬 열기는 --open만큼 기다립니다.
+
+마지막 씬은 Yeti 노드가 없는 씬이라 실패해야 하며, 일괄 추출이 그 씬만 실패로 보고하고 나머지 씬은 모두 추출하는지,
+씬마다 새 씬으로 비워 이전 씬의 노드가 남지 않는지(씬별 추출 노드 수) 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_yeti_batch_session.py
+    python benchmarks/bench_yeti_batch_session.py --scenes 24 --startup 30 --plugin 10
+"""
+import argparse
+import json
+import os
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "yeti_standalone_export")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+START_FRAME = 1001
+EMPTY_SCENE = "shot999_fx_v001.ma"
+# 하위 프로세스에 설정을 전달하는 환경 변수
+ENV_CONFIG = "BENCH_YETI_BATCH_CONFIG"
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Yeti batch session benchmark (mock maya subprocesses)")
+    parser.add_argument("--scenes", type=int, default=8, help="Scenes to export (the last one has no Yeti nodes)")
+    parser.add_argument("--nodes", type=int, default=3, help="Yeti nodes per scene")
+    parser.add_argument("--frames", type=int, default=5, help="Frames without handles")
+    parser.add_argument("--startup", type=float, default=0.5, help="Simulated maya.standalone.initialize (s)")
+    parser.add_argument("--plugin", type=float, default=0.3, help="Simulated Yeti plugin load (s)")
+    parser.add_argument("--open", type=float, default=0.05, help="Simulated scene open (s)")
+    return parser.parse_args(args)
+
+
+def stub_main(script, args):
+    """하위 프로세스: mock_maya를 설치하고 script를 __main__으로 실행합니다."""
+    import mock_maya
+
+    config = json.loads(os.environ[ENV_CONFIG])
+    fake_cmds = mock_maya.install()
+    sys.modules["maya.standalone"].initialize = lambda *a, **kw: time.sleep(config["startup"])
+    fake_cmds.plugin_loader = lambda name: time.sleep(config["plugin"])
+
+    def load_scene(path, options):
+        time.sleep(config["open"])
+        scene = mock_maya.FakeScene()
+        scene.playback_range = (START_FRAME, START_FRAME + config["frames"] - 1)
+        if os.path.basename(path) != EMPTY_SCENE:
+            shot = os.path.basename(path).split("_")[0]
+            for i in range(config["nodes"]):
+                transform = scene.create_node("transform", f"{shot}{i:02d}_fur")
+                scene.create_node("pgYetiMaya", f"{shot}{i:02d}_fur_yetiShape", parent=transform)
+        return scene
+
+    def pg_yeti_command(node, writeCache=None, range=None, samples=None):
+        for frame in _frames(range[0], range[1]):
+            with open(writeCache % frame, "w") as f:
+                f.write(node)
+
+    fake_cmds.scene_loader = load_scene
+    setattr(sys.modules["maya.cmds"], "pgYetiCommand", pg_yeti_command)
+    sys.argv = [script] + args
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        return e.code or 0
+    return 0
+
+
+def _frames(start, end):
+    return list(range(start, end + 1))
+
+
+def build_scenes(work_dir, count):
+    """shotNNN/fx/pub/maya/shotNNN_fx_v001.ma 씬 파일 목록 (마지막은 Yeti 노드가 없는 씬)"""
+    scenes = []
+    for i in range(count):
+        name = EMPTY_SCENE if i == count - 1 else f"shot{i:03d}_fx_v001.ma"
+        scene_dir = os.path.join(work_dir, name.split("_")[0], "fx", "pub", "maya")
+        os.makedirs(scene_dir)
+        scene_file = os.path.join(scene_dir, name)
+        with open(scene_file, "w") as f:
+            f.write("//Maya ASCII 2024 scene\n")
+        scenes.append(scene_file)
+    return scenes
+
+
+def run_stub(script, args):
+    """이 파일을 하위 프로세스로 실행하여 script를 실행합니다. (종료 코드, 출력)"""
+    process = subprocess.run([sys.executable, os.path.abspath(__file__), "--stub", script] + args,
+                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+    return process.returncode, process.stdout
+
+
+def main(args):
+    opts = parse_args(args)
+    work_dir = tempfile.mkdtemp(prefix="bench_yeti_batch_")
+    os.environ[ENV_CONFIG] = json.dumps({"startup": opts.startup, "plugin": opts.plugin, "open": opts.open,
+                                         "frames": opts.frames, "nodes": opts.nodes})
+    try:
+        scenes = build_scenes(work_dir, opts.scenes)
+        print(f"[INFO] {len(scenes)} scenes x {opts.nodes} Yeti nodes, startup {opts.startup}s, "
+              f"plugin {opts.plugin}s, open {opts.open}s")
+        print(f"{'Mode':<10} {'Processes':>9} {'Time(s)':>9} {'Failed':>7}")
+
+        # 1) 씬마다 프로세스 하나 (기존 방식)
+        started = time.perf_counter()
+        failed = 0
+        for scene_file in scenes:
+            code, _ = run_stub(os.path.join(TOOL_DIR, "yeti_standalone_export.py"),
+                               ["--scenefile", scene_file, "--samples", "3", "--force"])
+            failed += code != 0
+        per_scene = time.perf_counter() - started
+        print(f"{'per_scene':<10} {len(scenes):>9} {per_scene:>9.3f} {failed:>7}")
+
+        # 2) standalone 세션 하나로 모든 씬 추출
+        scene_list = os.path.join(work_dir, "scenes.txt")
+        with open(scene_list, "w") as f:
+            f.write("# Yeti batch benchmark\n" + "\n".join(scenes) + "\n")
+        batch_report = os.path.join(work_dir, "batch.json")
+        started = time.perf_counter()
+        code, output = run_stub(os.path.join(TOOL_DIR, "yeti_batch_export.py"),
+                                [scene_list, "--samples", "3", "--force", "--batch_report", batch_report])
+        batch_time = time.perf_counter() - started
+        if not os.path.exists(batch_report):
+            print(f"[ERROR] 일괄 추출 결과가 없습니다. (exit {code})\n{output}")
+            return 1
+        with open(batch_report, "r") as f:
+            batch = json.load(f)
+        failed_scenes = [result["scene"] for result in batch["scenes"] if result["status"] != "exported"]
+        print(f"{'batch':<10} {1:>9} {batch_time:>9.3f} {len(failed_scenes):>7}")
+
+        if code != 1 or [os.path.basename(scene) for scene in failed_scenes] != [EMPTY_SCENE]:
+            print(f"[ERROR] Yeti 노드가 없는 씬만 실패해야 합니다: exit {code}, {failed_scenes}")
+            return 1
+        counts = [result["exported"] for result in batch["scenes"][:-1]]
+        if counts != [opts.nodes] * (len(scenes) - 1):
+            print(f"[ERROR] 씬별 추출 노드 수가 다릅니다. (이전 씬 상태가 남았을 수 있음) {counts}")
+            return 1
+        print(f"[OK] 세션 하나(초기화 {batch['startup_seconds']:.2f}s)로 {len(scenes) - 1}개 씬을 추출하고, "
+              f"실패한 씬만 보고했습니다. ({per_scene:.3f}s -> {batch_time:.3f}s)")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--stub"]:
+        sys.exit(stub_main(sys.argv[2], sys.argv[3:]))
+    sys.exit(main(sys.argv[1:]))
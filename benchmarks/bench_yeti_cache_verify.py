@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+Yeti 캐시 검사(yeti_cache_verify) 벤치마크입니다.
+
+캐시 버전 폴더 구조(vNNN/에셋/파트/name.####.fur)에 노드마다 프레임 시퀀스를 만들고, 일부 노드에 빠진 프레임,
+0바이트 프레임, 잘린(크기가 튀는) 프레임, 헤더가 0으로 채워진 프레임을 넣습니다.
+네트워크 저장소를 흉내 내어 os.stat / os.scandir 호출과 헤더 읽기마다 --latency만큼 기다립니다.
+
+1) 기존 방식(프레임마다 os.stat, 한 번에 하나씩)과 폴더 단위 os.scandir(작업 스레드 1개 / --workers개),
+   헤더 검사(--headers)의 시간을 비교하고, 모든 방식이 넣은 문제를 정확히 찾는지 확인합니다.
+2) Maya 기본 재생 범위(1-120)에 핸들 5를 붙인 음수 프레임(-4..125) 시퀀스를 디스크에서 찾아 검사하여,
+   패딩을 올바르게 정하고('%04d' % -4 -> '-004') 넣은 빠진 프레임만 찾는지 확인합니다.
+3) --scratch_dir로 공개한 구조(노드 폴더가 숨김 시퀀스 폴더를 가리키는 심볼릭 링크)를 swap_directory로 만들고,
+   링크를 따라 들어가 시퀀스를 찾는지, 숨김 시퀀스 폴더를 따로 세지 않는지, 순환 링크에서 멈추는지 확인합니다.
+4) mock_maya 위에서 실제 YetiCacheExporter를 --verify로 실행하여, 0바이트 프레임을 쓴 노드만 실패로 옮기고
+   헤더가 깨진 프레임은 추출 기록에서 지워 다음 실행에서 다시 추출하는지 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_yeti_cache_verify.py
+    python benchmarks/bench_yeti_cache_verify.py --nodes 40 --frames 250 --latency 0.002 --workers 32
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "yeti_standalone_export")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+
+fake_cmds = mock_maya.install()
+
+import yeti_cache_staging  # noqa: E402
+import yeti_cache_verify  # noqa: E402
+from yeti_standalone_export import HANDLES, YetiCacheExporter  # noqa: E402
+
+START_FRAME = 1001
+MAGIC = b"FUR\x03"
+FRAME_BYTES = 4096
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Yeti cache verification benchmark")
+    parser.add_argument("--nodes", type=int, default=20, help="Cache sequences in the version folder")
+    parser.add_argument("--frames", type=int, default=240, help="Frames without handles")
+    parser.add_argument("--latency", type=float, default=0.0005, help="Simulated latency per stat/scandir/read (s)")
+    parser.add_argument("--workers", type=int, default=yeti_cache_verify.DEFAULT_WORKERS, help="Scan threads")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    return parser.parse_args(args)
+
+
+def frame_payload(rng, header=MAGIC):
+    """헤더 + 중앙값 근처(±10%) 크기의 내용"""
+    return header + os.urandom(int(FRAME_BYTES * rng.uniform(0.9, 1.1)) - len(header))
+
+
+def build_tree(version_dir, opts, rng):
+    """
+    노드마다 name.####.fur 시퀀스를 만들고 문제를 넣습니다.
+
+    :return: ({캐시 경로: (첫 프레임, 마지막 프레임)}, {캐시 경로: {"missing", "zero", "header_errors", "outliers"}})
+    """
+    start, end = START_FRAME - HANDLES, START_FRAME + opts.frames - 1 + HANDLES
+    ranges, expected = {}, {}
+    for i in range(opts.nodes):
+        cache_dir = os.path.join(version_dir, f"char{i:02d}", "fur")
+        os.makedirs(cache_dir)
+        cache_path = os.path.join(cache_dir, f"char{i:02d}_fur.%04d.fur")
+        problems = {"missing": [], "zero": [], "header_errors": [], "outliers": []}
+        # 문제는 노드 네 개 중 하나에 한 종류씩 넣습니다.
+        kind = ("missing", "zero", "header_errors", "outliers")[i // 4 % 4] if i % 4 == 0 else None
+        bad_frame = rng.randint(start, end) if kind else None
+        for frame in range(start, end + 1):
+            if frame == bad_frame:
+                problems[kind].append(frame)
+                if kind == "missing":
+                    continue
+            with open(cache_path % frame, "wb") as f:
+                if frame != bad_frame or kind == "missing":
+                    f.write(frame_payload(rng))
+                elif kind == "header_errors":
+                    f.write(frame_payload(rng, header=bytes(yeti_cache_verify.HEADER_BYTES)))
+                elif kind == "outliers":
+                    # 쓰다가 잘린 프레임
+                    f.write(frame_payload(rng)[:FRAME_BYTES // 20])
+        ranges[cache_path] = (start, end)
+        expected[cache_path] = problems
+    return ranges, expected
+
+
+def naive_verify(ranges):
+    """기존 방식: 프레임마다 os.stat (한 번에 하나씩)"""
+    results = {}
+    for cache_path, (start, end) in ranges.items():
+        missing, zero = [], []
+        for frame in range(start, end + 1):
+            try:
+                if os.stat(cache_path % frame).st_size == 0:
+                    zero.append(frame)
+            except OSError:
+                missing.append(frame)
+        results[cache_path] = {"missing": missing, "zero": zero}
+    return results
+
+
+@contextlib.contextmanager
+def network_latency(latency, counts):
+    """os.stat / os.scandir / 헤더 읽기마다 latency만큼 기다립니다."""
+    originals = (os.stat, os.scandir, yeti_cache_verify._read_header)
+
+    def delayed(name, function):
+        def wrapper(*args, **kwargs):
+            counts[name] = counts.get(name, 0) + 1
+            time.sleep(latency)
+            return function(*args, **kwargs)
+        return wrapper
+
+    os.stat = delayed("stat", originals[0])
+    os.scandir = delayed("scandir", originals[1])
+    yeti_cache_verify._read_header = delayed("header", originals[2])
+    try:
+        yield
+    finally:
+        os.stat, os.scandir, yeti_cache_verify._read_header = originals
+
+
+def compare(results, expected, keys):
+    """찾은 문제가 넣은 문제와 다른 캐시 경로 리스트"""
+    return [path for path, problems in expected.items()
+            if any(results[path][key] != problems[key] for key in keys)]
+
+
+def run_scan_modes(work_dir, opts):
+    rng = random.Random(opts.seed)
+    ranges, expected = build_tree(os.path.join(work_dir, "v003"), opts, rng)
+    frames = sum(end - start + 1 for start, end in ranges.values())
+    print(f"[INFO] {len(ranges)} sequences, {frames} frames, latency {opts.latency * 1000:.1f} ms per call")
+    print(f"{'Mode':<18} {'Time(s)':>9} {'stat':>7} {'scandir':>8} {'header':>7}")
+
+    modes = [("naive_stat", None, False), ("scandir_x1", 1, False),
+             (f"scandir_x{opts.workers}", opts.workers, False), (f"headers_x{opts.workers}", opts.workers, True)]
+    times = {}
+    for name, workers, headers in modes:
+        counts = {}
+        started = time.perf_counter()
+        with network_latency(opts.latency, counts):
+            if workers is None:
+                results = naive_verify(ranges)
+            else:
+                results = yeti_cache_verify.verify_sequences(ranges, workers, read_headers=headers)
+        times[name] = time.perf_counter() - started
+        print(f"{name:<18} {times[name]:>9.3f} {counts.get('stat', 0):>7} {counts.get('scandir', 0):>8} "
+              f"{counts.get('header', 0):>7}")
+        keys = ["missing", "zero"] if workers is None else ["missing", "zero", "outliers"]
+        if headers:
+            keys.append("header_errors")
+        wrong = compare(results, expected, keys)
+        if wrong:
+            print(f"[ERROR] {name}: 넣은 문제와 찾은 문제가 다릅니다: {wrong[:3]}")
+            return 1
+
+    # 디스크에서 찾은 시퀀스와 범위로도 같은 결과가 나와야 합니다. (명령줄 도구의 경로)
+    results = yeti_cache_verify.verify_tree(os.path.join(work_dir, "v003"), START_FRAME - HANDLES,
+                                            START_FRAME + opts.frames - 1 + HANDLES, opts.workers, True)
+    if set(results) != set(ranges) or compare(results, expected, ["missing", "zero", "header_errors", "outliers"]):
+        print(f"[ERROR] verify_tree 결과가 다릅니다: {sorted(set(results) ^ set(ranges))[:3]}")
+        return 1
+    print(f"[OK] 모든 방식이 빠진/0바이트/잘린/헤더가 깨진 프레임을 정확히 찾았습니다. "
+          f"({times['naive_stat']:.3f}s -> {times[f'scandir_x{opts.workers}']:.3f}s)")
+    return 0
+
+
+def run_negative_frames(work_dir, opts):
+    """음수 프레임이 들어 있는 시퀀스 (Maya 기본 범위 1-120 + 핸들 5 -> -4..125)"""
+    rng = random.Random(opts.seed)
+    start, end = 1 - HANDLES, 120 + HANDLES
+    version_dir = os.path.join(work_dir, "negative", "v001")
+    cache_dir = os.path.join(version_dir, "char", "fur")
+    os.makedirs(cache_dir)
+    cache_path = os.path.join(cache_dir, "char_fur.%04d.fur")
+    missing = [-2, 60]
+    for frame in range(start, end + 1):
+        if frame not in missing:
+            with open(cache_path % frame, "wb") as f:
+                f.write(frame_payload(rng))
+    results = yeti_cache_verify.verify_tree(version_dir, start, end, opts.workers, True)
+    if list(results) != [cache_path] or results[cache_path]["missing"] != missing:
+        found = {path: result["missing"] for path, result in results.items()}
+        print(f"[ERROR] 음수 프레임 시퀀스의 빠진 프레임이 다릅니다: {found}")
+        return 1
+    print(f"[OK] 음수 프레임 시퀀스({start}..{end})의 패딩을 올바르게 찾고, 빠진 프레임 {missing}만 보고했습니다.")
+    return 0
+
+
+def run_exporter(work_dir):
+    """--verify: 0바이트 프레임을 쓴 노드는 실패, 헤더가 깨진 프레임은 추출 기록에서 지웁니다."""
+    zero_node = ["char01_fur_yetiShape"]
+    written = []
+    rng = random.Random(0)
+
+    def pg_yeti_command(node, writeCache=None, range=None, samples=None):
+        for frame in _frames(range[0], range[1]):
+            written.append((node, frame))
+            with open(writeCache % frame, "wb") as f:
+                if node not in zero_node or frame != START_FRAME:
+                    f.write(frame_payload(rng))
+
+    def load_scene(path, options):
+        scene = mock_maya.FakeScene()
+        for i in range(3):
+            transform = scene.create_node("transform", f"char{i:02d}_fur")
+            scene.create_node("pgYetiMaya", f"char{i:02d}_fur_yetiShape", parent=transform)
+        scene.playback_range = (START_FRAME, START_FRAME + 9)
+        return scene
+
+    setattr(sys.modules["maya.cmds"], "pgYetiCommand", pg_yeti_command)
+    fake_cmds.scene_loader = load_scene
+    scene_dir = os.path.join(work_dir, "shot010", "fx", "pub", "maya")
+    os.makedirs(scene_dir)
+    scene_file = os.path.join(scene_dir, "shot010_fx_v003.ma")
+    open(scene_file, "w").close()
+
+    exporter = YetiCacheExporter(scene_file, samples=3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        exporter.export()
+        exporter.verify_exports(read_headers=True)
+    verification = exporter.report.data["verification"]
+    if list(exporter.failed) != ["char01_fur_yetiShape"] or len(verification) != 3:
+        print(f"[ERROR] 0바이트 프레임을 쓴 노드만 실패해야 합니다: {exporter.failed}")
+        return 1
+
+    # 크기는 그대로 두고 헤더만 깨뜨리면, 추출 기록만으로는 찾을 수 없고 --verify_headers가 찾아 기록에서 지웁니다.
+    cache_path = exporter.exported["char02_fur_yetiShape"]
+    with open(cache_path % START_FRAME, "r+b") as f:
+        f.write(bytes(len(MAGIC)))
+    del zero_node[:]
+    del written[:]
+    exporter = YetiCacheExporter(scene_file, samples=3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        exporter.export()
+        exporter.verify_exports(read_headers=True)
+    # char01의 0바이트 프레임만 다시 추출되고, char02의 헤더 오류는 이번 검사에서 찾습니다.
+    if written != [("char01_fur_yetiShape", START_FRAME)] or list(exporter.failed) != ["char02_fur_yetiShape"]:
+        print(f"[ERROR] 다시 추출한 프레임 {written}, 실패 {exporter.failed}")
+        return 1
+    del written[:]
+    exporter = YetiCacheExporter(scene_file, samples=3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        exporter.export()
+        exporter.verify_exports(read_headers=True)
+    if written != [("char02_fur_yetiShape", START_FRAME)] or exporter.failed:
+        print(f"[ERROR] 헤더가 깨진 프레임만 다시 추출해야 합니다: {written}, 실패 {exporter.failed}")
+        return 1
+    print("[OK] --verify가 0바이트/헤더가 깨진 프레임의 노드를 실패로 옮기고, 다음 실행에서 그 프레임만 다시 추출했습니다.")
+    return 0
+
+
+def run_staged_tree(work_dir, opts):
+    """스테이징으로 공개한 노드 폴더 (심볼릭 링크 -> .fur.PID.시각)"""
+    rng = random.Random(opts.seed)
+    start, end = START_FRAME, START_FRAME + 9
+    version_dir = os.path.join(work_dir, "staged", "v003")
+    expected = {}
+    for asset, missing in (("charA", []), ("charB", [START_FRAME + 4])):
+        final_dir = os.path.join(version_dir, asset, "fur")
+        os.makedirs(os.path.dirname(final_dir))
+        # 두 번 공개하여 링크를 교체하는 경우도 확인합니다.
+        for _ in range(2):
+            staging_dir = os.path.join(os.path.dirname(final_dir), ".fur.staging.{}".format(os.getpid()))
+            os.makedirs(staging_dir)
+            for frame in range(start, end + 1):
+                if frame not in missing:
+                    with open(os.path.join(staging_dir, f"{asset}_fur.{frame:04d}.fur"), "wb") as f:
+                        f.write(frame_payload(rng))
+            yeti_cache_staging.swap_directory(staging_dir, final_dir)
+        expected[os.path.join(final_dir, f"{asset}_fur.%04d.fur")] = missing
+    # 버전 폴더를 가리키는 순환 링크
+    os.symlink("..", os.path.join(version_dir, "charA", "loop"))
+
+    results = yeti_cache_verify.verify_tree(version_dir, start, end, opts.workers, True)
+    found = {path: result["missing"] for path, result in results.items()}
+    if found != expected or not all(os.path.islink(os.path.dirname(path)) for path in expected):
+        print(f"[ERROR] 스테이징으로 공개한 시퀀스를 찾지 못했습니다: {found}")
+        return 1
+    print(f"[OK] 심볼릭 링크로 공개한 노드 폴더 {len(found)}개를 찾아 검사하고, 순환 링크에서 멈췄습니다.")
+    return 0
+
+
+def _frames(start, end):
+    return list(range(start, end + 1))
+
+
+def main(args):
+    opts = parse_args(args)
+    work_dir = tempfile.mkdtemp(prefix="bench_yeti_verify_")
+    try:
+        return (run_scan_modes(work_dir, opts) or run_negative_frames(work_dir, opts)
+                or run_staged_tree(work_dir, opts) or run_exporter(work_dir))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
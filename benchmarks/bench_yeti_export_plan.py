@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Yeti 캐시 추출 계획(yeti_export_plan, 드라이 런) 벤치마크입니다.
+
+캐릭터 참조(털 참조가 하위 참조로 들어 있는 캐릭터 포함), Yeti가 없는 큰 세트 참조, 씬에 직접 있는 Yeti 노드,
+재생 범위(sceneConfigurationScriptNode)가 있는 합성 샷(.ma)을 만듭니다.
+
+1) Maya 없이 계획을 만드는 시간을 재고, 찾은 Yeti 노드와 재생 범위가 씬과 같은지, 폴더를 하나도 만들지 않았는지 확인합니다.
+   Yeti가 없는 세트 참조는 헤더만 읽으므로 세트 크기와 관계없이 빨라야 합니다.
+2) mock_maya 위에서 실제 YetiCacheExporter로 같은 노드를 추출하여, 계획의 캐시 경로가 실제 경로와 같은지 확인합니다.
+3) 프레임 하나를 지운 뒤 다시 계획하면 그 노드의 그 프레임만 추출할 프레임으로 나오고,
+   예상 시간이 추출 리포트의 측정값(샘플 값 비율로 보정)을 사용하는지 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_yeti_export_plan.py
+    python benchmarks/bench_yeti_export_plan.py --characters 20 --set_mb 500
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "yeti_standalone_export")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+
+fake_cmds = mock_maya.install()
+
+import yeti_export_plan  # noqa: E402
+from yeti_standalone_export import HANDLES, YetiCacheExporter  # noqa: E402
+
+START_FRAME = 1001
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Yeti export plan (dry run) benchmark")
+    parser.add_argument("--characters", type=int, default=6, help="Character references with Yeti grooms")
+    parser.add_argument("--set_mb", type=float, default=50, help="Size of the set reference without Yeti (MB)")
+    parser.add_argument("--frames", type=int, default=48, help="Playback frames")
+    return parser.parse_args(args)
+
+
+def write_ma(path, requires=(), references=(), body="", size_mb=0):
+    """참조 -> requires -> 노드 순서의 .ma 파일을 씁니다. size_mb만큼 메쉬 노드를 채웁니다."""
+    with open(path, "w") as f:
+        f.write("//Maya ASCII 2024 scene\n")
+        for namespace, ref_node, ref_path in references:
+            f.write(f'file -rdi 1 -ns "{namespace}" -rfn "{ref_node}" -typ "mayaAscii" "{ref_path}";\n')
+        for namespace, ref_node, ref_path in references:
+            f.write(f'file -r -ns "{namespace}" -dr 1 -rfn "{ref_node}" -typ "mayaAscii" "{ref_path}";\n')
+        f.write('requires maya "2024";\n')
+        for plugin in requires:
+            f.write(f'requires -nodeType "{plugin}" "{plugin}" "1.0";\n')
+        f.write(body)
+        block = 'createNode mesh -n "geoShape{0}" -p "geo{0}";\n\tsetAttr -s 4 ".vt[0:3]" ' + "0 0 0 " * 400 + ";\n"
+        written, index = 0, 0
+        while written < size_mb * 1e6:
+            text = block.format(index)
+            f.write(text)
+            written += len(text)
+            index += 1
+
+
+def _groom(*names):
+    return "".join(f'createNode transform -n "{name}";\ncreateNode pgYetiMaya -n "{name}_yetiShape" -p "{name}";\n'
+                   for name in names)
+
+
+def build_shot(work_dir, opts):
+    """
+    합성 샷과 참조 파일을 만듭니다.
+
+    :return: (샷 파일 경로, 씬의 Yeti 셰이프 이름 리스트)
+    """
+    ref_dir = os.path.join(work_dir, "assets")
+    os.makedirs(ref_dir)
+    write_ma(os.path.join(ref_dir, "set.ma"), requires=("mtoa",), size_mb=opts.set_mb)
+    references = [("set", "setRN", os.path.join(ref_dir, "set.ma"))]
+    expected = []
+    for i in range(opts.characters):
+        name = f"char{i:02d}"
+        if i % 2:
+            # 털이 캐릭터의 하위 참조에 들어 있는 경우 ('char01:fur:char01_body_yetiShape')
+            fur_path = os.path.join(ref_dir, f"{name}_fur.ma")
+            write_ma(fur_path, requires=("pgYetiMaya",), body=_groom(f"{name}_body", f"{name}_hair"))
+            write_ma(os.path.join(ref_dir, f"{name}.ma"), references=[("fur", "furRN", fur_path)],
+                     body=f'createNode transform -n "{name}_rig";\n')
+            expected += [f"{name}:fur:{name}_body_yetiShape", f"{name}:fur:{name}_hair_yetiShape"]
+        else:
+            write_ma(os.path.join(ref_dir, f"{name}.ma"), requires=("pgYetiMaya",),
+                     body=_groom(f"{name}_fur", f"{name}_brows_yeti"))
+            expected += [f"{name}:{name}_fur_yetiShape", f"{name}:{name}_brows_yeti_yetiShape"]
+        references.append((name, f"{name}RN", os.path.join(ref_dir, f"{name}.ma")))
+
+    body = _groom("grass_fur")
+    expected.append("grass_fur_yetiShape")
+    end = START_FRAME + opts.frames - 1
+    body += ('createNode script -n "sceneConfigurationScriptNode";\n'
+             f'\tsetAttr ".b" -type "string" "playbackOptions -min {START_FRAME} -max {end} '
+             f'-ast {START_FRAME - 10} -aet {end + 10} ";\n\tsetAttr ".st" 6;\n')
+    scene_dir = os.path.join(work_dir, "shot010", "fx", "pub", "maya")
+    os.makedirs(scene_dir)
+    scene_file = os.path.join(scene_dir, "shot010_fx_v003.ma")
+    write_ma(scene_file, requires=("pgYetiMaya",), references=references, body=body)
+    return scene_file, expected
+
+
+def main(args):
+    opts = parse_args(args)
+    work_dir = tempfile.mkdtemp(prefix="bench_yeti_plan_")
+    try:
+        scene_file, expected = build_shot(work_dir, opts)
+        output_root = os.path.join(work_dir, "shot010", "fx", "pub", "caches")
+        print(f"[INFO] {opts.characters} character references, {len(expected)} Yeti nodes, "
+              f"{opts.set_mb:.0f} MB set reference, {opts.frames} frames")
+
+        # 1) Maya 없이 계획
+        started = time.perf_counter()
+        plan = yeti_export_plan.plan_export(scene_file, samples=3, workers=4)
+        plan_time = time.perf_counter() - started
+        print(f"{'Step':<14} {'Time(s)':>9} {'Nodes':>6} {'Export frames':>14} {'Est(s)':>8}")
+        print(f"{'plan':<14} {plan_time:>9.3f} {len(plan['nodes']):>6} "
+              f"{sum(n['export_frames'] for n in plan['nodes']):>14} {plan['estimated_seconds']:>8.1f}")
+        found = sorted(node["node"] for node in plan["nodes"])
+        if found != sorted(expected):
+            print(f"[ERROR] 찾은 Yeti 노드가 씬과 다릅니다: {sorted(set(found) ^ set(expected))}")
+            return 1
+        if (plan["start"], plan["end"]) != (START_FRAME, START_FRAME + opts.frames - 1):
+            print(f"[ERROR] 재생 범위가 다릅니다: {plan['start']}-{plan['end']}")
+            return 1
+        if os.path.exists(output_root):
+            print(f"[ERROR] 계획만 만들어야 하는데 폴더가 생겼습니다: {output_root}")
+            return 1
+        print(f"[OK] Maya 없이 {len(found)}개 Yeti 노드(하위 참조 포함)와 재생 범위를 찾았고, 폴더를 만들지 않았습니다.")
+
+        # 2) 같은 노드를 실제 익스포터로 추출하여 캐시 경로 비교
+        def load_scene(path, options):
+            scene = mock_maya.FakeScene()
+            for shape in expected:
+                transform = scene.create_node("transform", shape.replace("_yetiShape", ""))
+                scene.create_node("pgYetiMaya", shape, parent=transform)
+            scene.playback_range = (START_FRAME, START_FRAME + opts.frames - 1)
+            return scene
+
+        def pg_yeti_command(node, writeCache=None, range=None, samples=None):
+            for frame in _frames(range[0], range[1]):
+                time.sleep(0.0005 * samples)
+                with open(writeCache % frame, "w") as f:
+                    f.write(node)
+
+        fake_cmds.scene_loader = load_scene
+        setattr(sys.modules["maya.cmds"], "pgYetiCommand", pg_yeti_command)
+        exporter = YetiCacheExporter(scene_file, samples=2)
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            exporter.export()
+            exporter.save_report()
+        export_time = time.perf_counter() - started
+        print(f"{'export':<14} {export_time:>9.3f} {len(exporter.exported):>6} "
+              f"{len(exporter.exported) * (opts.frames + 2 * HANDLES):>14}")
+        planned_paths = {node["node"]: node["cache_path"] for node in plan["nodes"]}
+        wrong = [node for node, path in exporter.exported.items() if planned_paths.get(node) != path]
+        if wrong or len(exporter.exported) != len(expected):
+            print(f"[ERROR] 계획의 캐시 경로가 실제 경로와 다릅니다: {wrong}")
+            return 1
+        print("[OK] 계획의 캐시 경로가 YetiCacheExporter가 쓴 경로와 같습니다.")
+
+        # 3) 프레임 하나를 지운 뒤 다시 계획 (같은 샘플 값 -> 추출 기록 사용, 예상 시간은 리포트 측정값)
+        node = expected[0]
+        os.remove(planned_paths[node] % START_FRAME)
+        started = time.perf_counter()
+        plan = yeti_export_plan.plan_export(scene_file, samples=2, workers=4)
+        replan_time = time.perf_counter() - started
+        export_frames = {n["node"]: n["export_frames"] for n in plan["nodes"] if n["export_frames"]}
+        print(f"{'replan':<14} {replan_time:>9.3f} {len(plan['nodes']):>6} "
+              f"{sum(export_frames.values()):>14} {plan['estimated_seconds']:>8.3f}")
+        if export_frames != {node: 1}:
+            print(f"[ERROR] 지운 프레임 하나만 추출할 프레임이어야 합니다: {export_frames}")
+            return 1
+        if any(n["estimate"] != "report" for n in plan["nodes"]):
+            print("[ERROR] 예상 시간이 추출 리포트의 측정값을 사용해야 합니다.")
+            return 1
+        # 샘플 값을 두 배로 하면 추출 기록을 쓰지 않고, 프레임당 시간은 두 배로 보정됩니다. (계획은 소수점 6자리로 반올림)
+        doubled = yeti_export_plan.plan_export(scene_file, samples=4, workers=4)
+        ratio = doubled["nodes"][0]["frame_seconds"] / plan["nodes"][0]["frame_seconds"]
+        if abs(ratio - 2.0) > 1e-3 or doubled["nodes"][0]["export_frames"] != opts.frames + 2 * HANDLES:
+            print(f"[ERROR] 샘플 값이 바뀌면 모든 프레임을 다시 추출하고 시간을 보정해야 합니다: {ratio:.2f}")
+            return 1
+        print(f"[OK] 다시 계획하면 지운 프레임 1개만 추출하고, 리포트 측정값으로 예상 시간을 계산했습니다. "
+              f"(계획 {plan_time:.3f}s, 추출 {export_time:.3f}s)")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+def _frames(start, end):
+    return list(range(start, end + 1))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
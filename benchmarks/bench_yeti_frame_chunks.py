@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+무거운 Yeti 노드 하나의 프레임 범위를 청크로 나누어 추출하는 코디네이터(run_chunked_export) 벤치마크입니다.
+
+코디네이터의 기본 작업자(MayapyWorker.export_chunk)가 yeti_standalone_export.py 대신 이 파일을 작업자 스크립트로 실행합니다.
+가짜 작업자 프로세스는 --startup + --open만큼 기다린 뒤, 프레임마다 --frame_time만큼 기다리며 '%04d.fur' 파일을 씁니다.
+
+1) 전체 범위를 작업자 하나로 추출할 때(single)와 작업자 N개가 청크로 나누어 추출할 때의 시간, 청크 수, 청크 크기를 비교합니다.
+   청크 크기는 --chunk_seconds와 측정된 프레임당 시간으로 정해집니다.
+2) 청크 하나가 첫 실행에서 비정상 종료해도 다시 실행되어 시퀀스가 완성되는지,
+   항상 실패하는 프레임이 있으면 완성도 검사(빠진 프레임)로 실패가 보고되는지 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_yeti_frame_chunks.py
+    python benchmarks/bench_yeti_frame_chunks.py --frames 240 --frame_time 0.1 --chunk_seconds 4 --workers 2 4 8
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "yeti_standalone_export")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import yeti_export_coordinator as coordinator  # noqa: E402
+
+NODE = "hero_fur_yetiShape"
+START_FRAME = 1001
+# 가짜 작업자에게 설정을 전달하는 환경 변수
+ENV_CONFIG = "BENCH_YETI_CHUNK_CONFIG"
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Frame-chunked Yeti export benchmark (stub mayapy workers)")
+    parser.add_argument("--frames", type=int, default=120, help="Frames including handles")
+    parser.add_argument("--frame_time", type=float, default=0.05, help="Simulated pgYetiCommand time per frame (s)")
+    parser.add_argument("--startup", type=float, default=0.2, help="Simulated maya.standalone startup (s)")
+    parser.add_argument("--open", type=float, default=0.1, help="Simulated scene open time (s)")
+    parser.add_argument("--chunk_seconds", type=float, default=1.0, help="Target export time of one chunk (s)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4], help="Worker counts to compare")
+    return parser.parse_args(args)
+
+
+def stub_worker_main(args):
+    """가짜 작업자: 작업자 명령줄을 받아 청크 범위의 '%04d.fur' 파일과 결과 JSON을 씁니다."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenefile")
+    parser.add_argument("--start_frame", type=int)
+    parser.add_argument("--end_frame", type=int)
+    parser.add_argument("--samples", type=int)
+    parser.add_argument("--result_json")
+    parser.add_argument("--handles", type=int, default=5)
+    parser.add_argument("--nodes", nargs="+")
+    opts = parser.parse_args(args)
+
+    config = json.loads(os.environ[ENV_CONFIG])
+    time.sleep(config["startup"] + config["open"])
+    start, end = opts.start_frame - opts.handles, opts.end_frame + opts.handles
+
+    # crash_frame이 들어 있는 청크는 첫 실행에서 결과 없이 종료하고, fail_frame이 들어 있는 청크는 항상 실패합니다.
+    crash_frame, fail_frame = config.get("crash_frame"), config.get("fail_frame")
+    marker = os.path.join(config["cache_dir"], ".crashed")
+    if crash_frame is not None and start <= crash_frame <= end and not os.path.exists(marker):
+        open(marker, "w").close()
+        return 3
+    node = opts.nodes[0]
+    if fail_frame is not None and start <= fail_frame <= end:
+        with open(opts.result_json, "w") as f:
+            json.dump({"exported": {}, "failed": {node: "simulated pgYetiCommand error"}}, f)
+        return 1
+
+    cache_path = os.path.join(config["cache_dir"], "hero_fur.%04d.fur")
+    started = time.perf_counter()
+    for frame in range(start, end + 1):
+        time.sleep(config["frame_time"])
+        with open(cache_path % frame, "w") as f:
+            f.write(str(frame))
+    frame_time = (time.perf_counter() - started) / (end - start + 1)
+    with open(opts.result_json, "w") as f:
+        json.dump({"exported": {node: cache_path}, "failed": {}, "frame_times": {node: frame_time}}, f)
+    return 0
+
+
+def run(opts, work_dir, name, workers, crash_frame=None, fail_frame=None):
+    """청크 추출을 실행하고 요약을 반환합니다."""
+    cache_dir = os.path.join(work_dir, name)
+    os.makedirs(cache_dir)
+    os.environ[ENV_CONFIG] = json.dumps({"startup": opts.startup, "open": opts.open, "frame_time": opts.frame_time,
+                                         "cache_dir": cache_dir, "crash_frame": crash_frame,
+                                         "fail_frame": fail_frame})
+    end = START_FRAME + opts.frames - 1
+    worker = coordinator.MayapyWorker("/proj/shot/ani/pub/maya/shot_ani_v003.ma", START_FRAME, end, 5,
+                                      script_path=os.path.abspath(__file__))
+    return coordinator.run_chunked_export(NODE, START_FRAME, end, workers, worker.export_chunk,
+                                          target_seconds=opts.chunk_seconds, log=lambda message: None)
+
+
+def main(args):
+    opts = parse_args(args)
+    work_dir = tempfile.mkdtemp(prefix="bench_yeti_chunks_")
+    try:
+        end = START_FRAME + opts.frames - 1
+        print(f"[INFO] {NODE} frames {START_FRAME}-{end}, {opts.frame_time}s per frame, "
+              f"startup {opts.startup + opts.open:.2f}s, target {opts.chunk_seconds}s per chunk")
+        print(f"{'Mode':<10} {'Workers':>7} {'Chunks':>6} {'Time(s)':>9}  Chunk sizes")
+
+        # 1) 작업자 하나가 전체 범위를 한 번에 추출합니다.
+        os.makedirs(os.path.join(work_dir, "single"))
+        os.environ[ENV_CONFIG] = json.dumps({"startup": opts.startup, "open": opts.open,
+                                             "frame_time": opts.frame_time,
+                                             "cache_dir": os.path.join(work_dir, "single")})
+        worker = coordinator.MayapyWorker("/proj/shot/ani/pub/maya/shot_ani_v003.ma", START_FRAME, end, 5,
+                                          script_path=os.path.abspath(__file__))
+        started = time.perf_counter()
+        worker.export_chunk(NODE, START_FRAME, end, 0, 0)
+        print(f"{'single':<10} {1:>7} {1:>6} {time.perf_counter() - started:>9.3f}  [{opts.frames}]")
+
+        for workers in opts.workers:
+            summary = run(opts, work_dir, f"chunked_w{workers}", workers)
+            sizes = [chunk_end - chunk_start + 1 for chunk_start, chunk_end in summary["chunks"]]
+            print(f"{'chunked':<10} {workers:>7} {len(sizes):>6} {summary['elapsed']:>9.3f}  {sizes}")
+            if not summary["complete"]:
+                print(f"[ERROR] workers={workers}: 시퀀스가 완성되지 않았습니다. {summary}")
+                return 1
+
+        # 2) 실패 상황: 한 번 비정상 종료하는 청크는 다시 실행되어 시퀀스가 완성되어야 합니다.
+        workers = max(opts.workers)
+        summary = run(opts, work_dir, "crash", workers, crash_frame=START_FRAME + opts.frames // 2)
+        if not summary["complete"] or summary["attempts"] != len(summary["chunks"]) + 1:
+            print(f"[ERROR] 비정상 종료한 청크가 다시 실행되지 않았습니다. {summary}")
+            return 1
+        print(f"[OK] 비정상 종료한 청크를 다시 실행하여 시퀀스를 완성했습니다. (attempts {summary['attempts']})")
+
+        fail_frame = START_FRAME + opts.frames // 3
+        summary = run(opts, work_dir, "broken", workers, fail_frame=fail_frame)
+        if summary["complete"] or fail_frame not in summary["missing"] or not summary["failed"]:
+            print(f"[ERROR] 실패한 청크가 완성도 검사에서 보고되지 않았습니다. {summary}")
+            return 1
+        print(f"[OK] 항상 실패하는 청크 {list(summary['failed'])}의 프레임 {len(summary['missing'])}개가 "
+              f"빠진 프레임으로 보고되었습니다.")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    if "--result_json" in sys.argv:
+        sys.exit(stub_worker_main(sys.argv[1:]))
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""
+Yeti 캐시 추출 작업 큐(yeti_job_queue) 벤치마크입니다.
+
+작업 큐의 기본 작업자(MayapyWorker)가 yeti_standalone_export.py 대신 이 파일을 작업자 스크립트로 실행합니다.
+가짜 작업자 프로세스는 작업자 명령줄(--scenefile, --nodes, --result_json ...)을 그대로 받아 --startup만큼 기다려
+mayapy 초기화와 씬 열기를 흉내 내고, 노드마다 --node_time만큼 기다리며 실제 '%04d.fur' 파일과 결과 JSON을 씁니다.
+(씬 파일에는 한 줄에 Yeti 노드 이름 하나를 적어 둡니다.)
+
+1) 동시에 실행되면 서로의 캐시를 망가뜨리는 작업 명세(핸들을 붙인 프레임 청크, --scratch_dir과 같은 노드를 쓰는 작업)를
+   load_tasks가 큐를 시작하기 전에 거부하는지 확인합니다.
+2) 같은 샷 목록(무거운 노드 하나를 프레임 청크 두 개로 나눈 작업 포함)을 동시 실행 1개 / --max_parallel개로 실행하여
+   전체 시간과 동시에 실행된 작업자 수를 비교하고, 큐가 남긴 추출 기록(manifest.json)에 모든 노드의 모든 프레임이 있는지,
+   추출 리포트(export_report.json)에 모든 노드의 측정값(프레임 청크는 합친 값)이 있는지 확인합니다.
+3) 첫 실행에서 비정상 종료하는 작업은 기다린 뒤 다시 실행되어 성공하고, 노드 하나가 항상 실패하는 작업은
+   그 노드만 --retries번 다시 실행한 뒤 실패로 보고되는지 확인합니다. 실패하는 노드는 앞쪽 절반 프레임만 쓰고 실패하며,
+   이전 실행에서 쓴 파일이 남아 있어도 추출 기록에는 작업자가 실제로 쓴 프레임만 남는지 확인합니다.
+4) 큐를 하위 프로세스로 실행하다가 작업 몇 개가 끝난 시점에 강제로 종료한 뒤 같은 상태 파일로 다시 실행하여,
+   끝난 작업은 다시 실행하지 않고 나머지 작업만 실행하는지, 종료 전에 끝난 작업의 측정값이 리포트에 남는지 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_yeti_job_queue.py
+    python benchmarks/bench_yeti_job_queue.py --shots 16 --startup 1.0 --node_time 0.5 --max_parallel 8
+"""
+import argparse
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "yeti_standalone_export")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import yeti_cache_paths  # noqa: E402
+import yeti_job_queue  # noqa: E402
+from yeti_cache_manifest import CacheManifest  # noqa: E402
+from yeti_export_report import ExportReport, load_report  # noqa: E402
+
+START_FRAME = 1001
+END_FRAME = 1010
+BROKEN_NODE = "broken_yetiShape"
+# 가짜 작업자에게 시간 설정과 실행 기록 폴더를 전달하는 환경 변수
+ENV_TIMING = "BENCH_YETI_QUEUE_TIMING"
+ENV_LOG_DIR = "BENCH_YETI_QUEUE_LOG_DIR"
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Yeti export job queue benchmark (stub mayapy workers)")
+    parser.add_argument("--shots", type=int, default=8, help="Shots in the task list")
+    parser.add_argument("--startup", type=float, default=0.3, help="Simulated mayapy startup + scene open (s)")
+    parser.add_argument("--node_time", type=float, default=0.1, help="Simulated pgYetiCommand time per node (s)")
+    parser.add_argument("--max_parallel", type=int, default=4, help="Tasks to run at the same time")
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--backoff", type=float, default=0.2, help="Seconds before the first retry")
+    return parser.parse_args(args)
+
+
+def stub_worker_main(args):
+    """가짜 작업자: yeti_standalone_export.py의 작업자 명령줄을 받아 캐시 파일과 결과 JSON을 씁니다."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenefile")
+    parser.add_argument("--start_frame", type=int, default=START_FRAME)
+    parser.add_argument("--end_frame", type=int, default=END_FRAME)
+    parser.add_argument("--handles", type=int, default=0)
+    parser.add_argument("--samples", type=int)
+    parser.add_argument("--result_json")
+    parser.add_argument("--nodes", nargs="+")
+    opts, _ = parser.parse_known_args(args)
+
+    startup, node_time = json.loads(os.environ[ENV_TIMING])
+    log_dir = os.environ[ENV_LOG_DIR]
+    started = time.time()
+    time.sleep(startup)
+    with open(opts.scenefile, "r") as f:
+        nodes = opts.nodes or [line.strip() for line in f if line.strip()]
+
+    marker = os.path.join(log_dir, os.path.basename(opts.scenefile) + ".crashed")
+    if "flaky" in opts.scenefile and not os.path.exists(marker):
+        # 첫 실행만 결과를 쓰지 못하고 비정상 종료합니다. (라이선스/메모리 문제 등)
+        open(marker, "w").close()
+        _log_run(log_dir, opts, nodes, started)
+        print("[FATAL] simulated mayapy crash")
+        return 3
+
+    root = yeti_cache_paths.get_output_root(yeti_cache_paths.get_root_path(opts.scenefile))
+    version = yeti_cache_paths.get_scene_version(opts.scenefile)
+    first, last = opts.start_frame - opts.handles, opts.end_frame + opts.handles
+    result = {"exported": {}, "failed": {}, "frame_times": {}, "written": {}}
+    report = ExportReport(opts.scenefile, version, opts.samples)
+    for node in nodes:
+        cache_path = yeti_cache_paths.get_cache_path(root, version, node)
+        # 실패하는 노드는 앞쪽 절반 프레임만 쓰고 실패합니다.
+        written_last = (first + last) // 2 if node == BROKEN_NODE else last
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        try:
+            with report.measure_node(node, cache_path, [(first, last)]):
+                time.sleep(node_time)
+                for frame in range(first, written_last + 1):
+                    with open(cache_path % frame, "w") as f:
+                        f.write("{} {}".format(node, opts.samples))
+                if node == BROKEN_NODE:
+                    raise RuntimeError("simulated pgYetiCommand error")
+            result["exported"][node] = cache_path
+        except RuntimeError as e:
+            result["failed"][node] = str(e)
+        report.set_node_output(node, written_last - first + 1, (written_last - first + 1) * len(node))
+        result["written"][node] = [[first, written_last]]
+    result["report"] = report.finish()
+    with open(opts.result_json, "w") as f:
+        json.dump(result, f)
+    _log_run(log_dir, opts, nodes, started)
+    return 1 if result["failed"] else 0
+
+
+def _log_run(log_dir, opts, nodes, started):
+    """작업자 실행 하나를 기록합니다. (씬, 노드, 프레임, 시작/끝 시각)"""
+    record = {"scene": os.path.basename(opts.scenefile), "nodes": nodes, "start": opts.start_frame,
+              "end": opts.end_frame, "started": started, "finished": time.time()}
+    with open(os.path.join(log_dir, "{}.json".format(os.getpid())), "w") as f:
+        json.dump(record, f)
+
+
+def read_runs(log_dir):
+    runs = []
+    for name in os.listdir(log_dir):
+        if name.endswith(".json"):
+            with open(os.path.join(log_dir, name), "r") as f:
+                runs.append(json.load(f))
+    return runs
+
+
+def max_overlap(runs):
+    """동시에 실행된 작업자 수의 최대값"""
+    events = sorted([(run["started"], 1) for run in runs] + [(run["finished"], -1) for run in runs])
+    current = peak = 0
+    for _, change in events:
+        current += change
+        peak = max(peak, current)
+    return peak
+
+
+def write_scene(work_dir, shot, nodes):
+    scene_dir = os.path.join(work_dir, shot, "fx", "pub", "maya")
+    os.makedirs(scene_dir, exist_ok=True)
+    scene_file = os.path.join(scene_dir, f"{shot}_fx_v001.ma")
+    with open(scene_file, "w") as f:
+        f.write("\n".join(nodes) + "\n")
+    return scene_file
+
+
+def build_tasks(work_dir, shots):
+    """
+    샷 목록 작업 명세를 만듭니다. 첫 샷의 무거운 노드는 프레임 청크 두 개로 나눈 작업입니다.
+
+    :return: (작업 명세 파일 경로, {씬 파일: 노드 리스트})
+    """
+    scenes = {}
+    tasks = []
+    for i in range(shots):
+        shot = f"shot{i:03d}"
+        nodes = [f"char{j:02d}_fur_yetiShape" for j in range(1 + i % 3)]
+        if i == 0:
+            nodes.append("hero_fur_yetiShape")
+            scene_file = write_scene(work_dir, shot, nodes)
+            tasks.append({"id": f"{shot}_light", "scenefile": scene_file, "nodes": nodes[:-1]})
+            middle = (START_FRAME + END_FRAME) // 2
+            for start, end in ((START_FRAME, middle), (middle + 1, END_FRAME)):
+                tasks.append({"id": f"{shot}_hero_{start}", "scenefile": scene_file, "nodes": ["hero_fur_yetiShape"],
+                              "start_frame": start, "end_frame": end, "handles": 0})
+        else:
+            scene_file = write_scene(work_dir, shot, nodes)
+            tasks.append({"scenefile": scene_file, "start_frame": START_FRAME, "end_frame": END_FRAME,
+                          "handles": 0})
+        scenes[scene_file] = nodes
+    spec_path = os.path.join(work_dir, "tasks.json")
+    with open(spec_path, "w") as f:
+        json.dump({"defaults": {"samples": 3}, "tasks": tasks}, f, indent=2)
+    return spec_path, scenes
+
+
+def make_queue(spec_path, state_path, opts, max_parallel):
+    return yeti_job_queue.JobQueue(yeti_job_queue.load_tasks([spec_path]), state_path, max_parallel,
+                                   opts.retries, opts.backoff, script_path=os.path.abspath(__file__),
+                                   log=lambda message: None)
+
+
+def reset_logs(work_dir, name):
+    log_dir = os.path.join(work_dir, name)
+    os.makedirs(log_dir)
+    os.environ[ENV_LOG_DIR] = log_dir
+    return log_dir
+
+
+def check_manifests(scenes):
+    """큐가 남긴 추출 기록에 모든 노드의 모든 프레임이 있는지 확인합니다. (빠진 노드 리스트)"""
+    missing = []
+    for scene_file, nodes in scenes.items():
+        root = yeti_cache_paths.get_output_root(yeti_cache_paths.get_root_path(scene_file))
+        version = yeti_cache_paths.get_scene_version(scene_file)
+        manifest = CacheManifest(yeti_cache_paths.get_version_dir(root, version))
+        for node in nodes:
+            cache_path = yeti_cache_paths.get_cache_path(root, version, node)
+            if manifest.missing_frames(node, cache_path, START_FRAME, END_FRAME):
+                missing.append(node)
+    return missing
+
+
+def check_reports(scenes):
+    """큐가 남긴 추출 리포트에 모든 노드의 측정값(프레임 청크는 합친 값)이 있는지 확인합니다. (빠진 노드 리스트)"""
+    missing = []
+    for scene_file, nodes in scenes.items():
+        root = yeti_cache_paths.get_output_root(yeti_cache_paths.get_root_path(scene_file))
+        report = load_report(yeti_cache_paths.get_version_dir(root, yeti_cache_paths.get_scene_version(scene_file)))
+        for node in nodes:
+            stats = (report or {}).get("nodes", {}).get(node)
+            if not stats or stats["frames"] != END_FRAME - START_FRAME + 1 or not stats["seconds"]:
+                missing.append(node)
+    return missing
+
+
+def run_concurrency(work_dir, opts):
+    spec_path, scenes = build_tasks(os.path.join(work_dir, "shots"), opts.shots)
+    tasks = yeti_job_queue.load_tasks([spec_path])
+    print(f"[INFO] {opts.shots} shots, {len(tasks)} tasks, startup {opts.startup}s, {opts.node_time}s per node")
+    print(f"{'Parallel':>8} {'Time(s)':>9} {'Runs':>5} {'Peak':>5} {'Done':>5} {'Failed':>7}")
+    times = {}
+    for max_parallel in (1, opts.max_parallel):
+        log_dir = reset_logs(work_dir, f"concurrency_x{max_parallel}")
+        queue = make_queue(spec_path, os.path.join(work_dir, f"state_x{max_parallel}.json"), opts, max_parallel)
+        # 두 번째 실행이 추출 기록을 보고 건너뛰지 않도록 캐시를 지웁니다.
+        for scene_file in scenes:
+            shutil.rmtree(yeti_cache_paths.get_output_root(yeti_cache_paths.get_root_path(scene_file)),
+                          ignore_errors=True)
+        summary = queue.run()
+        runs = read_runs(log_dir)
+        peak = max_overlap(runs)
+        times[max_parallel] = summary["elapsed"]
+        print(f"{max_parallel:>8} {summary['elapsed']:>9.3f} {len(runs):>5} {peak:>5} {len(summary['done']):>5} "
+              f"{len(summary['failed']):>7}")
+        if summary["failed"] or len(summary["done"]) != len(tasks) or len(runs) != len(tasks):
+            print(f"[ERROR] 모든 작업이 한 번씩 성공해야 합니다: {summary['failed']}")
+            return 1
+        if peak != min(max_parallel, len(tasks)):
+            print(f"[ERROR] 동시에 실행된 작업자 수({peak})가 제한({max_parallel})과 다릅니다.")
+            return 1
+        missing = check_manifests(scenes)
+        if missing:
+            print(f"[ERROR] 추출 기록에 빠진 노드가 있습니다: {missing}")
+            return 1
+        missing = check_reports(scenes)
+        if missing:
+            print(f"[ERROR] 추출 리포트에 빠졌거나 잘못 합친 노드가 있습니다: {missing}")
+            return 1
+    print(f"[OK] 동시 실행 수 제한을 지키며 모든 작업을 실행했고, 프레임 청크 작업을 포함한 모든 노드가 추출 기록과 리포트에 남았습니다. "
+          f"({times[1]:.3f}s -> {times[opts.max_parallel]:.3f}s)")
+    return 0
+
+
+def run_retries(work_dir, opts):
+    shots_dir = os.path.join(work_dir, "retries")
+    flaky = write_scene(shots_dir, "flaky010", ["char00_fur_yetiShape"])
+    broken = write_scene(shots_dir, "shot020", ["char00_fur_yetiShape", BROKEN_NODE])
+    spec_path = os.path.join(shots_dir, "tasks.json")
+    with open(spec_path, "w") as f:
+        json.dump({"tasks": [{"id": "flaky", "scenefile": flaky}, {"id": "broken", "scenefile": broken}]}, f)
+    # 이전 실행(다른 샘플 값)에서 쓴 파일이 모든 프레임에 남아 있습니다. (추출 기록은 없음)
+    root = yeti_cache_paths.get_output_root(yeti_cache_paths.get_root_path(broken))
+    broken_path = yeti_cache_paths.get_cache_path(root, 1, BROKEN_NODE)
+    os.makedirs(os.path.dirname(broken_path))
+    for frame in range(START_FRAME, END_FRAME + 1):
+        with open(broken_path % frame, "w") as f:
+            f.write("stale")
+    log_dir = reset_logs(work_dir, "retries_logs")
+    state_path = os.path.join(work_dir, "state_retries.json")
+    summary = make_queue(spec_path, state_path, opts, opts.max_parallel).run()
+    runs = read_runs(log_dir)
+    state = yeti_job_queue.load_state(state_path)["tasks"]
+    broken_nodes = sorted((run["started"], run["nodes"]) for run in runs if run["scene"] == os.path.basename(broken))
+    print(f"{'retries':<8} {summary['elapsed']:>9.3f} {len(runs):>5} "
+          f"flaky attempts {state['flaky']['attempts']}, broken attempts {state['broken']['attempts']}")
+    if summary["done"] != ["flaky"] or list(summary["failed"]) != ["broken"]:
+        print(f"[ERROR] flaky 작업만 성공해야 합니다: done={summary['done']}, failed={summary['failed']}")
+        return 1
+    if state["flaky"]["attempts"] != 2 or state["broken"]["attempts"] != opts.retries + 1:
+        print("[ERROR] 작업 실행 횟수가 예상과 다릅니다.")
+        return 1
+    # 다시 실행할 때는 실패한 노드만 추출합니다.
+    if [nodes for _, nodes in broken_nodes[1:]] != [[BROKEN_NODE]] * opts.retries:
+        print(f"[ERROR] 재시도는 실패한 노드만 추출해야 합니다: {broken_nodes}")
+        return 1
+    # 실패한 노드는 작업자가 쓴 앞쪽 절반 프레임만 기록되고, 이전 실행의 파일은 기록되지 않아야 합니다.
+    manifest = CacheManifest(yeti_cache_paths.get_version_dir(root, 1))
+    recorded = sorted(int(frame) for frame in manifest.data["nodes"].get(BROKEN_NODE, {}).get("frames", {}))
+    if recorded != list(range(START_FRAME, (START_FRAME + END_FRAME) // 2 + 1)):
+        print(f"[ERROR] 실패한 노드는 작업자가 쓴 프레임만 기록해야 합니다: {recorded}")
+        return 1
+    # 재시도는 backoff만큼 기다린 뒤 시작합니다.
+    flaky_runs = sorted((run["started"], run["finished"]) for run in runs if run["scene"] == os.path.basename(flaky))
+    gap = flaky_runs[1][0] - flaky_runs[0][1]
+    if gap < opts.backoff:
+        print(f"[ERROR] 재시도 전에 {opts.backoff}s를 기다려야 합니다: {gap:.3f}s")
+        return 1
+    print(f"[OK] 비정상 종료한 작업은 {gap:.2f}s 뒤 다시 실행되어 성공했고, 항상 실패하는 노드만 {opts.retries}번 "
+          f"다시 실행한 뒤 실패로 보고되었습니다. (이전 실행의 파일은 기록하지 않음)")
+    return 0
+
+
+def queue_main(args):
+    """강제 종료 확인용: 하위 프로세스에서 큐를 실행합니다. (작업 명세, 상태 파일, 동시 실행 수)"""
+    spec_path, state_path, max_parallel = args
+    opts = parse_args([])
+    make_queue(spec_path, state_path, opts, int(max_parallel)).run()
+    return 0
+
+
+def run_resume(work_dir, opts):
+    spec_path, scenes = build_tasks(os.path.join(work_dir, "resume"), opts.shots)
+    tasks = yeti_job_queue.load_tasks([spec_path])
+    log_dir = reset_logs(work_dir, "resume_logs")
+    state_path = os.path.join(work_dir, "state_resume.json")
+
+    # 작업 몇 개가 끝나면 큐 프로세스와 작업자를 모두 강제로 종료합니다. (워크스테이션 재부팅 등)
+    process = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--queue", spec_path, state_path,
+                                str(opts.max_parallel)], start_new_session=True)
+    done_before = []
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline and process.poll() is None:
+        state = yeti_job_queue.load_state(state_path)["tasks"]
+        done_before = [task_id for task_id, entry in state.items() if entry["status"] == yeti_job_queue.STATUS_DONE]
+        if len(done_before) >= max(1, len(tasks) // 3):
+            break
+        time.sleep(0.01)
+    os.killpg(process.pid, signal.SIGKILL)
+    process.wait()
+    state = yeti_job_queue.load_state(state_path)["tasks"]
+    done_before = [task_id for task_id, entry in state.items() if entry["status"] == yeti_job_queue.STATUS_DONE]
+    interrupted = [task_id for task_id, entry in state.items() if entry["status"] == yeti_job_queue.STATUS_RUNNING]
+    runs_before = len(read_runs(log_dir))
+
+    summary = make_queue(spec_path, state_path, opts, opts.max_parallel).run()
+    runs_after = len(read_runs(log_dir)) - runs_before
+    print(f"{'resume':<8} {summary['elapsed']:>9.3f} {runs_after:>5} "
+          f"done before kill {len(done_before)}, interrupted {len(interrupted)}, skipped {len(summary['skipped'])}")
+    if not done_before or len(done_before) == len(tasks):
+        print("[ERROR] 큐를 중간에 종료하지 못했습니다.")
+        return 1
+    if sorted(summary["skipped"]) != sorted(done_before):
+        print(f"[ERROR] 끝난 작업만 건너뛰어야 합니다: {summary['skipped']} / {done_before}")
+        return 1
+    if summary["failed"] or sorted(summary["done"] + summary["skipped"]) != sorted(task["id"] for task in tasks):
+        print(f"[ERROR] 다시 실행한 뒤 모든 작업이 끝나야 합니다: {summary['failed']}")
+        return 1
+    if runs_after != len(tasks) - len(done_before):
+        print(f"[ERROR] 남은 작업만 실행해야 합니다: {runs_after}번 실행")
+        return 1
+    missing = check_manifests(scenes)
+    if missing:
+        print(f"[ERROR] 추출 기록에 빠진 노드가 있습니다: {missing}")
+        return 1
+    missing = check_reports(scenes)
+    if missing:
+        print(f"[ERROR] 추출 리포트에 빠졌거나 잘못 합친 노드가 있습니다: {missing}")
+        return 1
+    print(f"[OK] 강제로 종료한 큐를 다시 실행하면 끝난 작업 {len(done_before)}개를 건너뛰고 남은 작업만 실행했습니다.")
+    return 0
+
+
+def run_conflicts(work_dir):
+    scene_file = write_scene(os.path.join(work_dir, "conflicts"), "shot900", ["hero_fur_yetiShape", "dog_fur_yetiShape"])
+    hero = {"scenefile": scene_file, "nodes": ["hero_fur_yetiShape"]}
+    chunks = [dict(hero, start_frame=1001, end_frame=1050), dict(hero, start_frame=1051, end_frame=1100)]
+    cases = {
+        "chunks_with_handles": ({}, chunks, False),
+        "chunks": ({}, [dict(task, handles=0) for task in chunks], True),
+        "chunks_scratch": ({"scratch_dir": "/tmp/scratch"}, [dict(task, handles=0) for task in chunks], False),
+        "scene_and_node": ({}, [{"scenefile": scene_file}, dict(chunks[0], handles=0)], False),
+        "nodes_scratch": ({"scratch_dir": "/tmp/scratch"},
+                          [hero, {"scenefile": scene_file, "nodes": ["dog_fur_yetiShape"]}], True),
+    }
+    wrong = []
+    for name, (defaults, tasks, valid) in cases.items():
+        spec_path = os.path.join(work_dir, "conflicts", f"{name}.json")
+        with open(spec_path, "w") as f:
+            json.dump({"defaults": defaults, "tasks": tasks}, f)
+        try:
+            yeti_job_queue.load_tasks([spec_path])
+            accepted = True
+        except ValueError:
+            accepted = False
+        if accepted != valid:
+            wrong.append(name)
+    if wrong:
+        print(f"[ERROR] 작업 명세 검사 결과가 다릅니다: {wrong}")
+        return 1
+    print("[OK] 프레임 범위(핸들 포함)가 겹치는 작업과 --scratch_dir로 같은 노드에 쓰는 작업을 큐 시작 전에 거부했습니다.")
+    return 0
+
+
+def main(args):
+    opts = parse_args(args)
+    work_dir = tempfile.mkdtemp(prefix="bench_yeti_queue_")
+    os.environ[ENV_TIMING] = json.dumps([opts.startup, opts.node_time])
+    try:
+        return (run_conflicts(work_dir) or run_concurrency(work_dir, opts) or run_retries(work_dir, opts)
+                or run_resume(work_dir, opts))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    if "--result_json" in sys.argv:
+        sys.exit(stub_worker_main(sys.argv[1:]))
+    if sys.argv[1:2] == ["--queue"]:
+        sys.exit(queue_main(sys.argv[2:]))
+    sys.exit(main(sys.argv[1:]))
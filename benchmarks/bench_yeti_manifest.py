@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Yeti 캐시 추출 기록(manifest.json)으로 최신 프레임을 건너뛰는 재실행과 추출 리포트(export_report.json) 벤치마크입니다.
+
+mock_maya 위에서 실제 YetiCacheExporter를 실행합니다. 씬을 열면 Yeti 노드가 --nodes개인 합성 씬을 만들고,
+가짜 pgYetiCommand는 프레임마다 --frame_time만큼 기다린 뒤 '%04d.fur' 파일을 씁니다. (첫 노드는 4배 무거운 그룸입니다.)
+씬 열기는 --open만큼 기다립니다. 다음 상황에서 실제로 다시 쓴 프레임 수와 실행 시간을 비교하고,
+매번 저장한 리포트의 노드별 프레임 수가 실제로 쓴 프레임 수와 같은지 확인하고, 건너뛴 노드는 이전 실행의 측정값이
+남아 있는지 확인합니다. 마지막에 리포트의 단계별 시간과
+노드별 처리량을 출력하여, 무거운 그룸이 리포트에서 드러나는지 확인합니다.
+
+- fresh:      처음 추출하다가 중간 노드에서 실패 (그때까지 쓰인 프레임은 기록됨)
+- resume:     실패 후 다시 실행 (빠진 프레임만 추출)
+- unchanged:  변경 없이 다시 실행 (모두 건너뜀)
+- damaged:    캐시 파일 하나를 지우고 하나를 잘라낸 뒤 다시 실행 (그 두 프레임만 추출)
+- scene:      씬 파일 내용이 바뀐 뒤 다시 실행 (모두 다시 추출)
+- force:      --force (기존 방식과 같이 모두 다시 추출)
+- samples:    샘플 값을 바꿔 다시 추출하다가 중간 노드에서 실패 (이전 샘플 값으로 쓴 파일은 기록하지 않음)
+- samples_resume: 실패 후 다시 실행 (이번 샘플 값으로 쓰지 않은 프레임을 모두 추출)
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_yeti_manifest.py
+    python benchmarks/bench_yeti_manifest.py --nodes 15 --frames 240 --frame_time 0.005 --scene_mb 200
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "yeti_standalone_export")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+
+fake_cmds = mock_maya.install()
+
+from yeti_standalone_export import HANDLES, YetiCacheExporter  # noqa: E402
+
+START_FRAME = 1001
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Yeti export manifest benchmark (mock maya)")
+    parser.add_argument("--nodes", type=int, default=8, help="Yeti nodes in the scene")
+    parser.add_argument("--frames", type=int, default=100, help="Frames without handles")
+    parser.add_argument("--frame_time", type=float, default=0.002, help="Simulated pgYetiCommand time per frame (s)")
+    parser.add_argument("--scene_mb", type=float, default=50, help="Scene file size (MB) to hash")
+    parser.add_argument("--open", type=float, default=0.05, help="Simulated scene open time (s)")
+    return parser.parse_args(args)
+
+
+class FakeYeti:
+    """가짜 pgYetiCommand: 프레임마다 파일을 쓰고, fail_node는 fail_after 프레임을 쓴 뒤 실패합니다."""
+    HEAVY_FACTOR = 4
+
+    def __init__(self, frame_time, heavy_node):
+        self.frame_time = frame_time
+        self.heavy_node = heavy_node
+        self.frames_written = 0
+        self.fail_node = None
+        self.fail_after = 0
+
+    def __call__(self, node, writeCache=None, range=None, samples=None):
+        # pgYetiCommand의 range 인자가 내장 함수 range를 가리므로 _frames를 사용합니다.
+        for i, frame in enumerate(_frames(range[0], range[1])):
+            if node == self.fail_node and i == self.fail_after:
+                self.fail_node = None
+                raise RuntimeError(f"simulated pgYetiCommand error: {node}")
+            time.sleep(self.frame_time * (self.HEAVY_FACTOR if node == self.heavy_node else 1))
+            with open(writeCache % frame, "w") as f:
+                f.write(f"{node} {frame} {samples}" * 100)
+            self.frames_written += 1
+
+
+def _frames(start, end):
+    return list(range(start, end + 1))
+
+
+def build_yeti_scene(node_count, frames):
+    """Yeti 노드가 node_count개인 합성 씬"""
+    scene = mock_maya.FakeScene()
+    for i in range(node_count):
+        transform = scene.create_node("transform", f"char{i:02d}_fur")
+        scene.create_node("pgYetiMaya", f"char{i:02d}_fur_yetiShape", parent=transform)
+    scene.playback_range = (START_FRAME, START_FRAME + frames - 1)
+    return scene
+
+
+def main(args):
+    opts = parse_args(args)
+    yeti = FakeYeti(opts.frame_time, heavy_node="char00_fur_yetiShape")
+    setattr(sys.modules["maya.cmds"], "pgYetiCommand", yeti)
+
+    def load_scene(path, options):
+        time.sleep(opts.open)
+        return build_yeti_scene(opts.nodes, opts.frames)
+
+    fake_cmds.scene_loader = load_scene
+
+    work_dir = tempfile.mkdtemp(prefix="bench_yeti_manifest_")
+    try:
+        scene_dir = os.path.join(work_dir, "shot010", "fx", "pub", "maya")
+        os.makedirs(scene_dir)
+        scene_file = os.path.join(scene_dir, "shot010_fx_v003.ma")
+        with open(scene_file, "wb") as f:
+            f.write(os.urandom(int(opts.scene_mb * 1e6)))
+
+        total = opts.nodes * (opts.frames + 2 * HANDLES)
+        print(f"[INFO] {opts.nodes} Yeti nodes x {opts.frames + 2 * HANDLES} frames ({total} frames), "
+              f"{opts.frame_time}s per frame, scene {opts.scene_mb} MB")
+        print(f"{'Mode':<10} {'Time(s)':>9} {'Written':>8} {'Skipped':>8}")
+
+        fail_node = f"char{opts.nodes // 2:02d}_fur_yetiShape"
+        fail_after = (opts.frames + 2 * HANDLES) // 2
+        expected = {
+            "fresh": (opts.nodes // 2) * (opts.frames + 2 * HANDLES) + fail_after,
+            "resume": total - ((opts.nodes // 2) * (opts.frames + 2 * HANDLES) + fail_after),
+            "unchanged": 0,
+            "damaged": 2,
+            "scene": total,
+            "force": total,
+            "samples": (opts.nodes // 2) * (opts.frames + 2 * HANDLES) + fail_after,
+            "samples_resume": total - ((opts.nodes // 2) * (opts.frames + 2 * HANDLES) + fail_after),
+        }
+        for mode in ("fresh", "resume", "unchanged", "damaged", "scene", "force", "samples", "samples_resume"):
+            samples = 5 if mode.startswith("samples") else 3
+            exporter = YetiCacheExporter(scene_file, samples=samples, force=(mode == "force"))
+            if exporter.version != 3:
+                print(f"[ERROR] 임시 폴더 경로 때문에 씬 버전을 잘못 읽었습니다: {scene_file}")
+                return 1
+            cache_dir = os.path.join(exporter.output_root, "v003", "char00", "fur")
+            if mode in ("fresh", "samples"):
+                yeti.fail_node, yeti.fail_after = fail_node, fail_after
+            elif mode == "damaged":
+                os.remove(os.path.join(cache_dir, f"char00_fur.{START_FRAME:04d}.fur"))
+                with open(os.path.join(cache_dir, f"char00_fur.{START_FRAME + 10:04d}.fur"), "w") as f:
+                    f.write("x")
+            elif mode == "scene":
+                with open(scene_file, "ab") as f:
+                    f.write(b"// modified\n")
+
+            yeti.frames_written = 0
+            started = time.perf_counter()
+            try:
+                # 툴의 노드별 출력은 표를 가리므로 숨깁니다.
+                with contextlib.redirect_stdout(io.StringIO()):
+                    exporter.export()
+            except RuntimeError:
+                if mode not in ("fresh", "samples"):
+                    raise
+            elapsed = time.perf_counter() - started
+            with open(exporter.save_report(), "r") as f:
+                report = json.load(f)
+            if mode == "force":
+                force_report = report
+            print(f"{mode:<10} {elapsed:>9.3f} {yeti.frames_written:>8} {len(exporter.skipped):>8}")
+            if yeti.frames_written != expected[mode]:
+                print(f"[ERROR] {mode}: {expected[mode]}프레임을 써야 하지만 {yeti.frames_written}프레임을 썼습니다.")
+                return 1
+            if sum(stats["frames"] for stats in report["nodes"].values()
+                   if stats["status"] != "skipped") != yeti.frames_written:
+                print(f"[ERROR] {mode}: 리포트의 프레임 수가 실제로 쓴 프레임 수와 다릅니다.")
+                return 1
+            lost = [node for node, stats in report["nodes"].items()
+                    if stats["status"] == "skipped" and not (stats["seconds"] and stats.get("measured_at"))]
+            if lost:
+                print(f"[ERROR] {mode}: 건너뛴 노드의 이전 측정값이 리포트에서 지워졌습니다: {lost[:3]}")
+                return 1
+        print("[OK] 추출 기록과 비교하여 빠졌거나 바뀐 프레임만 다시 추출했습니다.")
+
+        # force 리포트: 단계별 시간과 노드별 처리량
+        report = force_report
+        print("[REPORT] " + ", ".join(f"{name} {seconds:.3f}s" for name, seconds in report["spans"].items())
+              + f", total {report['total_seconds']:.3f}s")
+        print(f"{'Node':<24} {'Frames':>6} {'Time(s)':>8} {'FPS':>8} {'MB/s':>7} {'CPU':>5}")
+        for node, stats in sorted(report["nodes"].items(), key=lambda item: item[1]["frames_per_second"]):
+            print(f"{node:<24} {stats['frames']:>6} {stats['seconds']:>8.3f} {stats['frames_per_second']:>8.1f} "
+                  f"{stats['mb_per_second']:>7.2f} {stats['cpu_utilization']:>5.0%}")
+        slowest = min(report["nodes"], key=lambda node: report["nodes"][node]["frames_per_second"])
+        if slowest != yeti.heavy_node or "scene_open" not in report["spans"]:
+            print(f"[ERROR] 리포트에서 무거운 그룸({yeti.heavy_node})이 가장 느리게 나타나지 않았습니다: {slowest}")
+            return 1
+        print(f"[OK] 리포트에서 무거운 그룸({slowest})이 가장 느린 노드로 나타났습니다.")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
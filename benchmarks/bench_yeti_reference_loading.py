@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Yeti 캐시 추출의 선택적 참조 불러오기(--references yeti) 벤치마크입니다.
+
+합성 샷(.ma)과 참조 파일(.ma)을 만들어 yeti_reference_scan으로 불러올 참조를 찾고,
+mock_maya 위에서 실제 YetiCacheExporter를 --references all / yeti로 실행하여 씬 열기 시간을 비교합니다.
+가짜 씬 열기는 불러온 참조마다 참조 비용(--set_open, --prop_open ...)만큼 기다립니다.
+
+샷 구성
+- 세트 참조 1개 (--set_mb 크기의 .ma, Yeti 없음), 프랍 참조 --props개, 군중 참조 1개 (하위 참조 포함, Yeti 없음)
+- charA_fur: Yeti 그룸 참조, charA_rig: 털의 입력 메쉬를 주는 리그 (참조 노드 placeHolderList 연결),
+  charA_anim: 리그의 입력을 주는 애니메이션 캐시 (참조 수정 기록의 connectAttr)
+- charB: 하위 참조(charB_fur)에 Yeti가 있는 캐릭터 참조
+- 털의 출력을 받는 프랍 하나 (Yeti의 입력이 아니므로 불러오지 않아야 함)
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_yeti_reference_loading.py
+    python benchmarks/bench_yeti_reference_loading.py --props 40 --set_mb 500 --set_open 20
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "yeti_standalone_export")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+
+fake_cmds = mock_maya.install()
+
+import yeti_reference_scan  # noqa: E402
+from yeti_standalone_export import REFERENCES_ALL, REFERENCES_YETI, YetiCacheExporter  # noqa: E402
+
+START_FRAME = 1001
+EXPECTED_LOAD = {"charA_furRN", "charA_rigRN", "charA_animRN", "charBRN"}
+YETI_NODES = {"charA_furRN": "charA_fur:charA_fur_yetiShape", "charBRN": "charB:charB_fur:charB_fur_yetiShape"}
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Selective reference loading benchmark (mock maya)")
+    parser.add_argument("--props", type=int, default=12, help="Prop references without Yeti")
+    parser.add_argument("--set_mb", type=float, default=30, help="Set reference .ma size (MB)")
+    parser.add_argument("--open", type=float, default=0.05, help="Simulated shot open time without references (s)")
+    parser.add_argument("--set_open", type=float, default=1.0, help="Simulated set reference load time (s)")
+    parser.add_argument("--crowd_open", type=float, default=0.5, help="Simulated crowd reference load time (s)")
+    parser.add_argument("--prop_open", type=float, default=0.05, help="Simulated prop reference load time (s)")
+    parser.add_argument("--char_open", type=float, default=0.1, help="Simulated character reference load time (s)")
+    parser.add_argument("--frames", type=int, default=10, help="Frames without handles")
+    return parser.parse_args(args)
+
+
+def _header(requires=(), references=()):
+    """.ma 헤더 (참조 -> requires 순서, Maya가 쓰는 것과 같은 순서)"""
+    lines = ["//Maya ASCII 2024 scene", "//Codeset: UTF-8"]
+    for namespace, ref_node, path in references:
+        lines.append(f'file -rdi 1 -ns "{namespace}" -rfn "{ref_node}" -op "v=0;" -typ "mayaAscii" "{path}";')
+    for namespace, ref_node, path in references:
+        lines.append(f'file -r -ns "{namespace}" -dr 1 -rfn "{ref_node}" -op "v=0;" -typ "mayaAscii" "{path}";')
+    lines.append('requires maya "2024";')
+    for plugin in requires:
+        lines.append(f'requires -nodeType "{plugin}" "{plugin}" "1.0";')
+    lines.append('currentUnit -l centimeter -a degree -t film;')
+    return "\n".join(lines) + "\n"
+
+
+def write_ma(path, requires=(), references=(), body="", size_mb=0):
+    """참조 파일을 씁니다. size_mb만큼 메쉬 노드를 채워 큰 세트 파일을 흉내 냅니다."""
+    with open(path, "w") as f:
+        f.write(_header(requires, references))
+        f.write(body)
+        block = 'createNode mesh -n "geoShape{0}" -p "geo{0}";\n\tsetAttr -s 4 ".vt[0:3]" ' + "0 0 0 " * 400 + ";\n"
+        written, index = 0, 0
+        while written < size_mb * 1e6:
+            text = block.format(index)
+            f.write(text)
+            written += len(text)
+            index += 1
+
+
+def build_shot(work_dir, opts):
+    """
+    합성 샷과 참조 파일을 만듭니다.
+
+    :return: (샷 파일 경로, {참조 노드: 불러오기 비용(초)})
+    """
+    ref_dir = os.path.join(work_dir, "assets")
+    os.makedirs(ref_dir)
+
+    def ref_path(name):
+        return os.path.join(ref_dir, name + ".ma")
+
+    write_ma(ref_path("set"), requires=("mtoa",), size_mb=opts.set_mb)
+    for i in range(opts.props):
+        write_ma(ref_path(f"prop{i:02d}"), body='createNode transform -n "prop";\n')
+    write_ma(ref_path("crowd_agent"), body='createNode transform -n "agent";\n')
+    write_ma(ref_path("crowd"), references=[("agent", "agentRN", ref_path("crowd_agent"))],
+             body='createNode transform -n "crowd";\n')
+    write_ma(ref_path("charA_fur"), requires=("pgYetiMaya",),
+             body='createNode transform -n "charA_fur";\ncreateNode pgYetiMaya -n "charA_fur_yetiShape" -p "charA_fur";\n')
+    write_ma(ref_path("charA_rig"), body='createNode transform -n "body_geo";\n')
+    write_ma(ref_path("charA_anim"), requires=("AbcImport",), body='createNode AlembicNode -n "charA_abc";\n')
+    write_ma(ref_path("charB_fur"), requires=("pgYetiMaya",),
+             body='createNode transform -n "charB_fur";\ncreateNode pgYetiMaya -n "charB_fur_yetiShape" -p "charB_fur";\n')
+    # charB는 Yeti 플러그인을 직접 쓰지 않고 하위 참조(charB_fur)에만 Yeti가 있습니다.
+    write_ma(ref_path("charB"), references=[("charB_fur", "charB_furRN", ref_path("charB_fur"))],
+             body='createNode transform -n "charB";\n')
+
+    costs = {"setRN": opts.set_open, "crowdRN": opts.crowd_open, "charA_furRN": opts.char_open,
+             "charA_rigRN": opts.char_open, "charA_animRN": opts.char_open, "charBRN": opts.char_open}
+    references = [("set", "setRN", ref_path("set")), ("crowd", "crowdRN", ref_path("crowd"))]
+    for i in range(opts.props):
+        references.append((f"prop{i:02d}", f"prop{i:02d}RN", ref_path(f"prop{i:02d}")))
+        costs[f"prop{i:02d}RN"] = opts.prop_open
+    references += [("charA_fur", "charA_furRN", ref_path("charA_fur")),
+                   ("charA_rig", "charA_rigRN", ref_path("charA_rig")),
+                   ("charA_anim", "charA_animRN", ref_path("charA_anim")),
+                   ("charB", "charBRN", ref_path("charB"))]
+
+    body = [f'createNode reference -n "{ref_node}";' for _, ref_node, _ in references]
+    body.append('createNode reference -n "sharedReferenceNode";')
+    # 리그 -> 털: 참조 노드 사이의 연결은 placeHolderList로 저장됩니다.
+    body.append('\tsetAttr ".ed" -type "dataReferenceEdits" "charA_furRN" "charA_furRN" 0 "charA_rigRN" 1 '
+                '5 3 "charA_furRN" "charA_fur:charA_fur_yetiShape.inputGeometry" "charA_furRN.placeHolderList[1]" "";')
+    body.append('\tsetAttr ".ed" -type "dataReferenceEdits" "charA_rigRN" "charA_rigRN" 0 "charA_animRN" 1 '
+                '3 "charA_anim:charA_abc.outPolyMesh[0]" "|charA_rig:body_geo|charA_rig:body_geoShape.inMesh" "";')
+    body.append('connectAttr "charA_rigRN.phl[1]" "charA_furRN.phl[1]";')
+    # 털 -> 프랍 (털의 출력이므로 프랍은 필요 없습니다.)
+    body.append('connectAttr "charA_fur:charA_fur_yetiShape.outputMesh" "prop00:prop.inMesh";')
+    body.append('connectAttr "sharedReferenceNode.sr" "setRN.sr";')
+    body.append('connectAttr ":time1.o" "charA_fur:charA_fur_yetiShape.currentTime";')
+
+    scene_dir = os.path.join(work_dir, "shot010", "fx", "pub", "maya")
+    os.makedirs(scene_dir)
+    scene_file = os.path.join(scene_dir, "shot010_fx_v003.ma")
+    write_ma(scene_file, requires=("pgYetiMaya",), references=references, body="\n".join(body) + "\n")
+    return scene_file, costs
+
+
+def main(args):
+    opts = parse_args(args)
+    work_dir = tempfile.mkdtemp(prefix="bench_yeti_refs_")
+    try:
+        scene_file, costs = build_shot(work_dir, opts)
+
+        def load_reference(scene, ref_node, options):
+            time.sleep(costs[ref_node])
+            node = YETI_NODES.get(ref_node)
+            if node:
+                transform = scene.create_node("transform", node.rsplit("_yetiShape", 1)[0])
+                scene.create_node("pgYetiMaya", node, parent=transform)
+
+        def load_scene(path, options):
+            time.sleep(opts.open)
+            scene = mock_maya.FakeScene()
+            scene.playback_range = (START_FRAME, START_FRAME + opts.frames - 1)
+            for ref_node in list(costs) + ["sharedReferenceNode"]:
+                scene.create_node("reference", ref_node)
+            if options.get("loadReferenceDepth") != "none":
+                for ref_node in costs:
+                    load_reference(scene, ref_node, options)
+            return scene
+
+        fake_cmds.scene_loader = load_scene
+        fake_cmds.reference_loader = load_reference
+        setattr(sys.modules["maya.cmds"], "pgYetiCommand", lambda node, **kwargs: None)
+
+        started = time.perf_counter()
+        plan = yeti_reference_scan.plan_references(scene_file)
+        scan_seconds = time.perf_counter() - started
+        print(f"[INFO] {len(plan['references'])} references, set {opts.set_mb} MB, scan {scan_seconds:.3f}s")
+        print(f"[INFO] load: {plan['load']}")
+        if set(plan["load"]) != EXPECTED_LOAD:
+            print(f"[ERROR] 불러올 참조가 예상과 다릅니다: {sorted(plan['load'])} != {sorted(EXPECTED_LOAD)}")
+            return 1
+
+        print(f"{'Mode':<6} {'Open(s)':>8} {'Scan(s)':>8} {'Loaded':>7} {'Nodes':>6}")
+        results = {}
+        for mode in (REFERENCES_ALL, REFERENCES_YETI):
+            exporter = YetiCacheExporter(scene_file, samples=3, force=True, references=mode)
+            with contextlib.redirect_stdout(io.StringIO()):
+                exporter.export()
+            spans = exporter.report.data["spans"]
+            open_seconds = spans["scene_open"] + spans.get("reference_load", 0.0)
+            loaded = exporter.load_references
+            print(f"{mode:<6} {open_seconds:>8.3f} {spans.get('reference_scan', 0.0):>8.3f} "
+                  f"{len(costs) if loaded is None else len(loaded):>7} {len(exporter.exported):>6}")
+            results[mode] = (open_seconds + spans.get("reference_scan", 0.0), sorted(exporter.exported))
+
+        if results[REFERENCES_ALL][1] != results[REFERENCES_YETI][1]:
+            print(f"[ERROR] 추출된 노드가 다릅니다: {results[REFERENCES_ALL][1]} != {results[REFERENCES_YETI][1]}")
+            return 1
+        print(f"[OK] 같은 Yeti 노드 {len(results[REFERENCES_YETI][1])}개를 추출하면서 씬 열기 시간이 "
+              f"{results[REFERENCES_ALL][0]:.3f}s -> {results[REFERENCES_YETI][0]:.3f}s로 줄었습니다.")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
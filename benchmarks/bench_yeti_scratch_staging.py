@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Yeti 캐시 로컬 스크래치 스테이징(--scratch_dir) 벤치마크입니다.
+
+mock_maya 위에서 실제 YetiCacheExporter를 실행합니다. 가짜 pgYetiCommand는 프레임마다 --frame_time만큼 계산한 뒤
+파일을 쓰며, 최종 위치(pub/caches/fur)에 쓸 때는 네트워크 저장소를 흉내 내어 파일마다 --latency + 크기/--bandwidth만큼
+더 기다립니다. 스테이징 모드에서는 백그라운드 복사(copy_verified)가 같은 네트워크 비용을 치릅니다.
+
+1) 최종 위치에 바로 쓸 때(direct)와 스크래치에 쓰고 백그라운드로 옮길 때(staged)의 전체 시간을 비교합니다.
+2) 추출 중 최종 폴더를 계속 확인하여, 읽는 쪽이 빈 폴더 또는 완성된 시퀀스만 보는지 확인합니다.
+3) 프레임 하나를 지운 뒤 다시 실행하면 그 프레임만 추출되고, 기존 프레임이 유지되는지 확인합니다.
+   최종 폴더가 새 시퀀스 폴더를 가리키는 링크로 바뀌고, 이전 시퀀스 폴더가 정리되었는지도 확인합니다.
+4) 중간에 실패한 노드는 최종 폴더가 바뀌지 않는지 확인합니다.
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_yeti_scratch_staging.py
+    python benchmarks/bench_yeti_scratch_staging.py --nodes 6 --frames 100 --latency 0.05 --frame_kb 2048
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "yeti_standalone_export")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_maya  # noqa: E402
+
+fake_cmds = mock_maya.install()
+
+import yeti_cache_staging  # noqa: E402
+from yeti_standalone_export import HANDLES, YetiCacheExporter  # noqa: E402
+
+START_FRAME = 1001
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Yeti scratch staging benchmark (mock maya)")
+    parser.add_argument("--nodes", type=int, default=4, help="Yeti nodes in the scene")
+    parser.add_argument("--frames", type=int, default=30, help="Frames without handles")
+    parser.add_argument("--frame_time", type=float, default=0.01, help="Simulated evaluation time per frame (s)")
+    parser.add_argument("--frame_kb", type=int, default=256, help="Cache file size per frame (KB)")
+    parser.add_argument("--latency", type=float, default=0.01, help="Simulated network latency per file (s)")
+    parser.add_argument("--bandwidth", type=float, default=200, help="Simulated network bandwidth (MB/s)")
+    return parser.parse_args(args)
+
+
+class NetworkModel:
+    """output_root 아래 경로에 쓰는 파일은 네트워크 비용만큼 기다립니다."""
+
+    def __init__(self, latency, bandwidth):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.output_root = None
+
+    def wait(self, path, size):
+        if self.output_root and os.path.abspath(path).startswith(self.output_root):
+            time.sleep(self.latency + size / (self.bandwidth * 1e6))
+
+
+class FakeYeti:
+    """가짜 pgYetiCommand: fail_node는 절반을 쓴 뒤 실패합니다."""
+
+    def __init__(self, opts, network):
+        self.frame_time = opts.frame_time
+        self.payload = os.urandom(opts.frame_kb * 1024)
+        self.network = network
+        self.fail_node = None
+        self.frames_written = 0
+
+    def __call__(self, node, writeCache=None, range=None, samples=None):
+        frames = _frames(range[0], range[1])
+        for i, frame in enumerate(frames):
+            if node == self.fail_node and i == len(frames) // 2:
+                raise RuntimeError(f"simulated pgYetiCommand error: {node}")
+            time.sleep(self.frame_time)
+            path = writeCache % frame
+            self.network.wait(path, len(self.payload))
+            with open(path, "wb") as f:
+                f.write(self.payload)
+            self.frames_written += 1
+
+
+def _frames(start, end):
+    return list(range(start, end + 1))
+
+
+class FolderWatcher:
+    """추출 중 최종 폴더의 프레임 수를 계속 기록합니다. (읽는 쪽이 보는 상태)"""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.counts = set()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.counts.add(len([n for n in os.listdir(self.folder) if n.endswith(".fur")]))
+            except OSError:
+                self.counts.add(0)
+            time.sleep(0.001)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def main(args):
+    opts = parse_args(args)
+    network = NetworkModel(opts.latency, opts.bandwidth)
+    yeti = FakeYeti(opts, network)
+    setattr(sys.modules["maya.cmds"], "pgYetiCommand", yeti)
+
+    def load_scene(path, options):
+        scene = mock_maya.FakeScene()
+        for i in range(opts.nodes):
+            transform = scene.create_node("transform", f"char{i:02d}_fur")
+            scene.create_node("pgYetiMaya", f"char{i:02d}_fur_yetiShape", parent=transform)
+        scene.playback_range = (START_FRAME, START_FRAME + opts.frames - 1)
+        return scene
+
+    fake_cmds.scene_loader = load_scene
+
+    # 백그라운드 복사도 같은 네트워크 비용을 치르도록 합니다.
+    copy_verified = yeti_cache_staging.copy_verified
+
+    def network_copy(src, dst):
+        network.wait(dst, os.path.getsize(src))
+        return copy_verified(src, dst)
+
+    yeti_cache_staging.copy_verified = network_copy
+
+    work_dir = tempfile.mkdtemp(prefix="bench_yeti_staging_")
+    try:
+        scratch_dir = os.path.join(work_dir, "scratch")
+        frame_count = opts.frames + 2 * HANDLES
+        print(f"[INFO] {opts.nodes} nodes x {frame_count} frames, {opts.frame_kb} KB per frame, "
+              f"{opts.frame_time}s eval, network {opts.latency}s + {opts.bandwidth} MB/s")
+        print(f"{'Mode':<8} {'Time(s)':>9} {'Transfer wait(s)':>17}")
+
+        times = {}
+        for mode in ("direct", "staged"):
+            scene_dir = os.path.join(work_dir, mode, "shot010", "fx", "pub", "maya")
+            os.makedirs(scene_dir)
+            scene_file = os.path.join(scene_dir, "shot010_fx_v003.ma")
+            open(scene_file, "w").close()
+            exporter = YetiCacheExporter(scene_file, samples=3,
+                                         scratch_dir=scratch_dir if mode == "staged" else None)
+            network.output_root = os.path.abspath(exporter.output_root)
+            watched = os.path.join(exporter.output_root, "v003", "char00", "fur")
+            started = time.perf_counter()
+            with FolderWatcher(watched) as watcher, contextlib.redirect_stdout(io.StringIO()):
+                exporter.export()
+            times[mode] = time.perf_counter() - started
+            print(f"{mode:<8} {times[mode]:>9.3f} {exporter.report.data['spans'].get('transfer_wait', 0.0):>17.3f}")
+            if len(exporter.exported) != opts.nodes:
+                print(f"[ERROR] {mode}: {opts.nodes}개 노드를 추출해야 합니다: {exporter.failed}")
+                return 1
+            if mode == "staged":
+                if not watcher.counts <= {0, frame_count}:
+                    print(f"[ERROR] 추출 중 최종 폴더에 완성되지 않은 시퀀스가 보였습니다: {sorted(watcher.counts)}")
+                    return 1
+                if os.path.exists(scratch_dir) and os.listdir(scratch_dir):
+                    print(f"[ERROR] 스크래치 폴더가 정리되지 않았습니다: {os.listdir(scratch_dir)}")
+                    return 1
+        print(f"[OK] 최종 폴더에는 빈 폴더 또는 완성된 시퀀스({frame_count}프레임)만 보였습니다. "
+              f"({times['direct']:.3f}s -> {times['staged']:.3f}s)")
+
+        # 3) 프레임 하나를 지운 뒤 다시 실행 -> 그 프레임만 추출하고 기존 프레임은 링크로 유지
+        os.remove(os.path.join(watched, f"char00_fur.{START_FRAME:04d}.fur"))
+        yeti.frames_written = 0
+        exporter = YetiCacheExporter(scene_file, samples=3, scratch_dir=scratch_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            exporter.export()
+        if yeti.frames_written != 1 or len(os.listdir(watched)) != frame_count:
+            print(f"[ERROR] 빠진 프레임만 추출하고 기존 프레임을 유지해야 합니다: "
+                  f"{yeti.frames_written} written, {len(os.listdir(watched))} files")
+            return 1
+        sequences = [n for n in os.listdir(os.path.dirname(watched)) if n.startswith(".fur.")]
+        if not os.path.islink(watched) or sequences != [os.readlink(watched)]:
+            print(f"[ERROR] 최종 폴더는 마지막 시퀀스 폴더를 가리키는 링크여야 합니다: {sequences}")
+            return 1
+        print("[OK] 다시 실행하면 빠진 프레임 1개만 스크래치에서 옮기고 기존 프레임은 유지했습니다.")
+
+        # 4) 실패한 노드는 최종 폴더가 바뀌지 않아야 합니다.
+        before = sorted(os.listdir(watched))
+        yeti.fail_node = "char00_fur_yetiShape"
+        exporter = YetiCacheExporter(scene_file, samples=3, force=True, scratch_dir=scratch_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            exporter.export(continue_on_error=True)
+        if "char00_fur_yetiShape" not in exporter.failed or sorted(os.listdir(watched)) != before:
+            print(f"[ERROR] 실패한 노드의 최종 폴더가 바뀌었습니다: {exporter.failed}")
+            return 1
+        print("[OK] 실패한 노드의 스크래치 캐시는 버리고 최종 폴더는 그대로 두었습니다.")
+    finally:
+        yeti_cache_staging.copy_verified = copy_verified
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
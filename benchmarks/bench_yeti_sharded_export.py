@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Yeti 캐시 노드 분할(--workers) 추출 코디네이터(yeti_export_coordinator) 벤치마크입니다.
+
+코디네이터의 기본 작업자(MayapyWorker)가 yeti_standalone_export.py 대신 이 파일을 작업자 스크립트로 실행합니다.
+가짜 작업자 프로세스는 작업자 명령줄(--scenefile, --nodes, --result_json ...)을 그대로 받아
+--startup + --open만큼 기다려 mayapy 초기화와 씬 열기를 흉내 내고, 노드마다 --node_time만큼 기다린 뒤 결과 JSON을 씁니다.
+
+작업자 수별 전체 시간을 비교하고, 다음 실패 상황에서 코디네이터가 결과를 올바르게 모으는지 확인합니다.
+- 'flaky' 노드가 들어 있는 작업자는 첫 실행에서 결과 없이 비정상 종료합니다. (다시 실행하면 성공)
+- 'broken' 노드는 항상 노드 단위로 실패합니다. (재시도 후에도 실패로 보고)
+
+[실행 방법] (저장소 루트에서)
+    python benchmarks/bench_yeti_sharded_export.py
+    python benchmarks/bench_yeti_sharded_export.py --nodes 15 --node_time 0.5 --workers 1 2 4 8
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOOL_DIR = os.path.join(REPO_ROOT, "tools", "yeti_standalone_export")
+for path in (BENCH_DIR, REPO_ROOT, TOOL_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import yeti_export_coordinator as coordinator  # noqa: E402
+
+FLAKY_NODE = "flaky_yetiShape"
+BROKEN_NODE = "broken_yetiShape"
+# 가짜 작업자에게 시간 설정과 실패 기록 파일 위치를 전달하는 환경 변수
+ENV_TIMING = "BENCH_YETI_TIMING"
+ENV_MARKER_DIR = "BENCH_YETI_MARKER_DIR"
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Sharded Yeti export coordinator benchmark (stub mayapy workers)")
+    parser.add_argument("--nodes", type=int, default=12, help="Number of Yeti nodes")
+    parser.add_argument("--node_time", type=float, default=0.3, help="Simulated pgYetiCommand time per node (s)")
+    parser.add_argument("--startup", type=float, default=0.3, help="Simulated maya.standalone startup (s)")
+    parser.add_argument("--open", type=float, default=0.2, help="Simulated scene open time (s)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to compare")
+    parser.add_argument("--retries", type=int, default=1)
+    return parser.parse_args(args)
+
+
+def stub_worker_main(args):
+    """가짜 작업자: yeti_standalone_export.py의 작업자 명령줄을 받아 결과 JSON을 씁니다."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenefile")
+    parser.add_argument("--start_frame", type=int)
+    parser.add_argument("--end_frame", type=int)
+    parser.add_argument("--samples", type=int)
+    parser.add_argument("--result_json")
+    parser.add_argument("--nodes", nargs="+")
+    opts = parser.parse_args(args)
+
+    startup, open_time, node_time = json.loads(os.environ[ENV_TIMING])
+    time.sleep(startup + open_time)
+
+    marker = os.path.join(os.environ[ENV_MARKER_DIR], FLAKY_NODE)
+    if FLAKY_NODE in opts.nodes and not os.path.exists(marker):
+        # 첫 실행만 결과를 쓰지 못하고 비정상 종료합니다. (라이선스/메모리 문제 등)
+        open(marker, "w").close()
+        print("[FATAL] simulated mayapy crash")
+        return 3
+
+    result = {"exported": {}, "failed": {}}
+    for node in opts.nodes:
+        time.sleep(node_time)
+        if node == BROKEN_NODE:
+            result["failed"][node] = "simulated pgYetiCommand error"
+        else:
+            cache = os.path.join("fur", "v001", node.replace("_yetiShape", ""), "{}.%04d.fur".format(node))
+            result["exported"][node] = cache
+    with open(opts.result_json, "w") as f:
+        json.dump(result, f)
+    return 1 if result["failed"] else 0
+
+
+def build_nodes(count):
+    """Yeti 셰이프 이름 목록 (마지막 두 개는 실패 상황용 노드)"""
+    nodes = ["char{:02d}_fur_yetiShape".format(i) for i in range(max(0, count - 2))]
+    return nodes + [FLAKY_NODE, BROKEN_NODE]
+
+
+def main(args):
+    opts = parse_args(args)
+    nodes = build_nodes(opts.nodes)
+    work_dir = tempfile.mkdtemp(prefix="bench_yeti_sharded_")
+    os.environ[ENV_TIMING] = json.dumps([opts.startup, opts.open, opts.node_time])
+    try:
+        print(f"[INFO] {len(nodes)} Yeti nodes, startup {opts.startup}s, open {opts.open}s, "
+              f"{opts.node_time}s per node, retries {opts.retries}")
+        print(f"{'Workers':>7} {'Shards':>6} {'Attempts':>8} {'Time(s)':>9} {'Exported':>9} {'Failed':>7}")
+        for workers in opts.workers:
+            marker_dir = os.path.join(work_dir, f"w{workers}")
+            os.makedirs(marker_dir)
+            os.environ[ENV_MARKER_DIR] = marker_dir
+
+            worker = coordinator.MayapyWorker("/proj/shot/ani/pub/maya/shot_ani_v003.ma", 1001, 1100, 5,
+                                              script_path=os.path.abspath(__file__))
+            summary = coordinator.run_sharded_export(nodes, workers, worker, retries=opts.retries,
+                                                     log=lambda message: None)
+            print(f"{workers:>7} {summary['shards']:>6} {summary['attempts']:>8} {summary['elapsed']:>9.3f} "
+                  f"{len(summary['exported']):>9} {len(summary['failed']):>7}")
+
+            # flaky 노드는 재시도로 추출되고, broken 노드만 실패로 남아야 합니다.
+            expected = [node for node in nodes if node != BROKEN_NODE]
+            if list(summary["exported"]) != expected or list(summary["failed"]) != [BROKEN_NODE]:
+                print(f"[ERROR] workers={workers}: 추출/실패 노드가 예상과 다릅니다. "
+                      f"failed={summary['failed']}")
+                return 1
+        print("[OK] 비정상 종료한 작업자는 다시 실행되고, 실패한 노드만 보고되었습니다.")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    if "--result_json" in sys.argv:
+        sys.exit(stub_worker_main(sys.argv[1:]))
+    sys.exit(main(sys.argv[1:]))
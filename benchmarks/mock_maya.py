@@ -0,0 +1,603 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 maya.cmds / maya.api.OpenMaya 대체(stand-in) 모듈입니다.
+
+Maya 라이선스 없이 툴의 알고리즘 복잡도와 cmds 호출 패턴을 측정하기 위해,
+메모리 상의 가짜 씬(FakeScene)과 그 위에서 동작하는 최소한의 cmds 함수를 제공합니다.
+실제 Maya의 동작을 완벽하게 재현하지는 않으며, 툴에서 사용하는 플래그 조합만 지원합니다.
+
+사용법:
+    import mock_maya
+    scene = mock_maya.FakeScene()
+    mock_maya.install(scene)        # sys.modules에 maya, maya.cmds 등을 등록
+    import maya.cmds as cmds        # 이후 툴 모듈을 임포트
+"""
+import re
+import sys
+import types
+import uuid as uuid_module
+
+_COMPONENT_RE = re.compile(r"^(?P<node>[^.]+)\.(?P<comp>\w+)\[(?P<index>[^\]]+)\]$")
+
+
+class FakeNode:
+    """가짜 씬의 노드. DAG 노드는 parent/children을 가집니다."""
+    __slots__ = ("name", "type", "parent", "children", "attrs", "uuid", "locked")
+
+    def __init__(self, name, node_type, parent=None, attrs=None):
+        self.name = name
+        self.type = node_type
+        self.parent = parent
+        self.children = []
+        self.attrs = attrs or {}
+        self.uuid = str(uuid_module.uuid4()).upper()
+        self.locked = False
+
+    def long_name(self):
+        parts = []
+        node = self
+        while node is not None:
+            parts.append(node.name)
+            node = node.parent
+        return "|" + "|".join(reversed(parts))
+
+
+class FakeScene:
+    """
+    메모리 상의 가짜 Maya 씬입니다.
+    노드 이름은 짧은 이름 기준으로 조회하며, '|'로 시작하는 전체 경로도 지원합니다.
+    """
+    DAG_TYPES = {"transform", "mesh"}
+    SHAPE_TYPES = {"mesh"}
+
+    def __init__(self):
+        self.nodes = []
+        self.selection = []
+        self._by_short = {}
+        self.scene_name = ""
+        self.workspace_dir = "/tmp"
+        self.playback_range = (1, 120)
+        # True이면 sets -forceElement가 SG 멤버 목록을 실제 Maya처럼 갱신합니다. (비용이 커서 필요한 벤치마크에서만 사용)
+        self.track_membership = False
+
+    # --- 노드 생성/조회 ---
+    def create_node(self, node_type, name, parent=None, **attrs):
+        node = FakeNode(name, node_type, parent, attrs)
+        if parent is not None:
+            parent.children.append(node)
+        self.nodes.append(node)
+        self._by_short.setdefault(name, []).append(node)
+        return node
+
+    def remove_node(self, node):
+        for child in list(node.children):
+            self.remove_node(child)
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        self.nodes.remove(node)
+        self._by_short[node.name].remove(node)
+
+    def rename_node(self, node, new_name):
+        self._by_short[node.name].remove(node)
+        node.name = new_name
+        self._by_short.setdefault(new_name, []).append(node)
+
+    def resolve(self, name):
+        """이름 또는 DAG 경로로 노드를 찾습니다. 없거나 모호하면 None을 반환합니다."""
+        if not name:
+            return None
+        if "|" in name:
+            parts = [p for p in name.split("|") if p]
+            candidates = [n for n in self._by_short.get(parts[-1], []) if n.type in self.DAG_TYPES]
+            for node in candidates:
+                if self._matches_path(node, parts, absolute=name.startswith("|")):
+                    return node
+            return None
+        candidates = self._by_short.get(name, [])
+        return candidates[0] if len(candidates) == 1 else None
+
+    @staticmethod
+    def _matches_path(node, parts, absolute):
+        current = node
+        for part in reversed(parts):
+            if current is None or current.name != part:
+                return False
+            current = current.parent
+        return current is None if absolute else True
+
+    def display_name(self, node, long=False):
+        if long and node.type in self.DAG_TYPES:
+            return node.long_name()
+        if node.type in self.DAG_TYPES and len(self._by_short.get(node.name, [])) > 1:
+            return node.long_name()
+        return node.name
+
+    def shapes(self, transform):
+        return [c for c in transform.children if c.type == "mesh"]
+
+
+class FakeCmds:
+    """
+    FakeScene 위에서 동작하는 maya.cmds 대체 구현입니다.
+    scene 속성을 교체하면 같은 cmds 모듈로 다른 씬을 사용할 수 있습니다.
+    """
+    def __init__(self, scene=None):
+        self.scene = scene or FakeScene()
+        self.undo_chunks = 0
+        self.assigned_members = 0
+        # cmds.file(path, open=True)로 씬을 열 때 호출할 함수 (경로, 옵션 딕셔너리) -> FakeScene
+        self.scene_loader = None
+        # cmds.file(loadReference=참조 노드)로 참조를 불러올 때 호출할 함수 (씬, 참조 노드, 옵션 딕셔너리)
+        self.reference_loader = None
+        # cmds.loadPlugin으로 플러그인을 불러올 때 호출할 함수 (플러그인 이름)
+        self.plugin_loader = None
+        self.loaded_plugins = set()
+        self.undo_flushes = 0
+
+    # --- 내부 헬퍼 ---
+    def _node(self, name):
+        return self.scene.resolve(name)
+
+    def _split_plug(self, plug):
+        node_name, attr = plug.split(".", 1)
+        return self._node(node_name), attr
+
+    def _mesh_of(self, name):
+        node = self._node(name)
+        if node is None:
+            return None
+        if node.type == "mesh":
+            return node
+        shapes = self.scene.shapes(node)
+        return shapes[0] if shapes else None
+
+    @staticmethod
+    def _flatten_args(args):
+        result = []
+        for arg in args:
+            if isinstance(arg, (list, tuple)):
+                result.extend(arg)
+            else:
+                result.append(arg)
+        return result
+
+    # --- 조회 ---
+    def ls(self, *args, type=None, long=False, sl=False, selection=False, uuid=False, dag=False, shapes=False,
+           noIntermediate=False, ni=False, **kwargs):
+        names = self.scene.selection if (sl or selection) else self._flatten_args(args)
+        if not names and not (sl or selection):
+            nodes = list(self.scene.nodes)
+        else:
+            nodes = []
+            found = []
+            for name in names:
+                match = _COMPONENT_RE.match(name)
+                if match:
+                    if self._node(match.group("node")) is not None:
+                        found.append(name)
+                    continue
+                node = self._node(name)
+                if node is not None:
+                    nodes.append(node)
+            if found and not uuid:
+                return found + [self.scene.display_name(n, long) for n in nodes
+                                if type is None or n.type == type]
+            if uuid:
+                return [n.uuid for n in nodes]
+
+        if dag:
+            expanded = []
+            stack = list(reversed(nodes))
+            while stack:
+                node = stack.pop()
+                expanded.append(node)
+                stack.extend(reversed(node.children))
+            nodes = expanded
+        if shapes:
+            nodes = [n for n in nodes if n.type in self.scene.SHAPE_TYPES]
+        if noIntermediate or ni:
+            nodes = [n for n in nodes if not n.attrs.get("intermediateObject")]
+        if type is not None:
+            types_ = set(type if isinstance(type, (list, tuple)) else [type])
+            if "geometryShape" in types_:
+                types_ |= self.scene.SHAPE_TYPES
+            nodes = [n for n in nodes if n.type in types_]
+        return [self.scene.display_name(n, long) for n in nodes]
+
+    def objExists(self, name):
+        match = _COMPONENT_RE.match(name)
+        if match:
+            return self._mesh_of(match.group("node")) is not None
+        return self._node(name) is not None
+
+    def getAttr(self, plug):
+        node, attr = self._split_plug(plug)
+        if node is None:
+            raise ValueError(f"No object matches name: {plug}")
+        if attr in ("translate", "rotate", "scale"):
+            default = (1.0, 1.0, 1.0) if attr == "scale" else (0.0, 0.0, 0.0)
+            return [tuple(node.attrs.get(attr, default))]
+        return node.attrs.get(attr, False)
+
+    def setAttr(self, plug, *values, **kwargs):
+        node, attr = self._split_plug(plug)
+        node.attrs[attr] = values if len(values) > 1 else values[0]
+
+    def listRelatives(self, node_name, parent=False, shapes=False, children=False, fullPath=False,
+                      type=None, **kwargs):
+        node = self._node(node_name)
+        if node is None:
+            return None
+        if parent:
+            related = [node.parent] if node.parent is not None else []
+        elif shapes:
+            related = self.scene.shapes(node)
+        else:
+            related = list(node.children)
+        if type:
+            related = [n for n in related if n.type == type]
+        return [self.scene.display_name(n, fullPath) for n in related] or None
+
+    def listConnections(self, *args, type=None, source=True, destination=True, connections=False,
+                        plugs=False, **kwargs):
+        # 쉐이프 -> 쉐이딩 그룹 연결만 지원합니다. (쉐이프의 'sgs' 속성)
+        result = []
+        for name in self._flatten_args(args):
+            node = self._node(name)
+            if node is None:
+                raise ValueError(f"No object matches name: {name}")
+            if not destination or (type is not None and type != "shadingEngine"):
+                continue
+            for sg in node.attrs.get("sgs", ()):
+                if connections:
+                    result.append(f"{self.scene.display_name(node)}.instObjGroups[0]")
+                result.append(sg)
+        return result or None
+
+    def sets(self, *args, query=False, q=False, edit=False, e=False, forceElement=None, **kwargs):
+        if query or q:
+            node = self._node(args[0])
+            return list(node.attrs.get("members", [])) or None
+        if (edit or e) and forceElement:
+            sg = self._node(forceElement)
+            if sg is None:
+                raise ValueError(f"No object matches name: {forceElement}")
+            assignments = []
+            for member in self._flatten_args(args):
+                match = _COMPONENT_RE.match(member)
+                mesh = self._mesh_of(match.group("node") if match else member)
+                if mesh is None:
+                    raise ValueError(f"No object matches name: {member}")
+                faces = None
+                if match:
+                    first, _, last = match.group("index").partition(":")
+                    first, last = int(first), int(last or first)
+                    if last >= mesh.attrs.get("faces", 0):
+                        raise RuntimeError(f"Component index out of range: {member}")
+                    faces = (first, last)
+                assignments.append((mesh, faces))
+            if self.scene.track_membership:
+                self._force_element(sg, assignments)
+            else:
+                for mesh, _faces in assignments:
+                    sgs = mesh.attrs.setdefault("sgs", [])
+                    if sg.name not in sgs:
+                        sgs.append(sg.name)
+            self.assigned_members += len(assignments)
+            return None
+        raise NotImplementedError("mock sets supports -query and -edit -forceElement only")
+
+    def _force_element(self, sg, assignments):
+        """
+        [(메쉬, (시작, 끝) 페이스 범위 또는 None(오브젝트 전체))]를 sg에 할당합니다.
+        실제 Maya처럼 다른 SG에서는 해당 페이스를 제거하고, 멤버는 병합된 페이스 범위로 다시 기록합니다.
+        (오브젝트 단위 멤버는 쉐이프 이름, 페이스 멤버는 트랜스폼 이름 + 컴포넌트)
+        """
+        requested = {}  # 메쉬 -> 할당할 페이스 집합 (None이면 오브젝트 전체)
+        for mesh, face_range in assignments:
+            faces = None if face_range is None else set(range(face_range[0], face_range[1] + 1))
+            if mesh in requested:
+                previous = requested[mesh]
+                faces = None if previous is None or faces is None else previous | faces
+            requested[mesh] = faces
+
+        by_name = {}
+        sg_nodes = {sg.name: sg}
+        for mesh in requested:
+            by_name[mesh.name] = mesh
+            by_name[mesh.parent.name if mesh.parent is not None else mesh.name] = mesh
+            for sg_name in mesh.attrs.setdefault("sgs", []):
+                sg_nodes.setdefault(sg_name, self._node(sg_name))
+
+        # 관련된 SG의 멤버를 한 번씩만 훑어, 할당 대상 메쉬의 현재 페이스를 꺼냅니다.
+        owned = {}  # (SG 노드, 메쉬) -> 페이스 집합 (None이면 오브젝트 전체)
+        for node in sg_nodes.values():
+            kept = []
+            for member in node.attrs.get("members", []):
+                match = _COMPONENT_RE.match(member)
+                mesh = by_name.get(match.group("node") if match else member)
+                if mesh is None:
+                    kept.append(member)
+                    continue
+                key = (node, mesh)
+                if not match:
+                    owned[key] = None
+                elif owned.get(key, ()) is not None:
+                    first, _, last = match.group("index").partition(":")
+                    owned.setdefault(key, set()).update(range(int(first), int(last or first) + 1))
+            node.attrs["members"] = kept
+
+        for mesh, faces in requested.items():
+            total = mesh.attrs.get("faces", 0)
+            transform = mesh.parent.name if mesh.parent is not None else mesh.name
+            sg_names = mesh.attrs["sgs"]
+            for node in [sg_nodes[name] for name in sg_names] + ([sg] if sg.name not in sg_names else []):
+                node_faces = owned.get((node, mesh), set())
+                if node is sg:
+                    node_faces = None if faces is None or node_faces is None else node_faces | faces
+                elif faces is None:
+                    node_faces = set()
+                else:
+                    node_faces = (set(range(total)) if node_faces is None else node_faces) - faces
+
+                if node_faces is None:
+                    node.attrs["members"].append(mesh.name)
+                else:
+                    indices = sorted(node_faces)
+                    start = 0
+                    for i in range(1, len(indices) + 1):
+                        if i == len(indices) or indices[i] != indices[i - 1] + 1:
+                            first, last = indices[start], indices[i - 1]
+                            component = f"f[{first}]" if first == last else f"f[{first}:{last}]"
+                            node.attrs["members"].append(f"{transform}.{component}")
+                            start = i
+
+                if node_faces is None or node_faces:
+                    if node.name not in sg_names:
+                        sg_names.append(node.name)
+                elif node.name in sg_names:
+                    sg_names.remove(node.name)
+
+    def referenceQuery(self, ref_node, filename=False, withoutCopyNumber=False, namespace=False, **kwargs):
+        node = self._node(ref_node)
+        if node is None:
+            raise RuntimeError(f"No reference node: {ref_node}")
+        if filename:
+            return node.attrs.get("filename", "")
+        if namespace:
+            return node.attrs.get("namespace", "")
+        return None
+
+    def listHistory(self, node_name, pruneDagObjects=False, **kwargs):
+        node = self._node(node_name)
+        shapes = self.scene.shapes(node) if node.type == "transform" else [node]
+        return [f"{s.name}_polyHistory" for s in shapes if s.attrs.get("history")]
+
+    # --- 선택 ---
+    def select(self, *args, r=False, replace=False, cl=False, clear=False, add=False, noExpand=False, **kwargs):
+        if cl or clear:
+            self.scene.selection = []
+            return
+        items = self._flatten_args(args)
+        if add:
+            self.scene.selection.extend(items)
+        else:
+            self.scene.selection = list(items)
+
+    # --- 폴리곤 ---
+    def polyEvaluate(self, mesh_name, f=False, **kwargs):
+        mesh = self._mesh_of(mesh_name)
+        return mesh.attrs.get("faces", 0) if f else 0
+
+    def polySelectConstraint(self, mode=None, type=None, size=None, disable=False, **kwargs):
+        if disable:
+            return
+        selected = self.scene.selection[0] if self.scene.selection else None
+        mesh = self._mesh_of(selected) if selected else None
+        ngons = sorted(mesh.attrs.get("ngons", ())) if mesh else []
+        self.scene.selection = [f"{mesh.name}.f[{i}]" for i in ngons]
+
+    def polyInfo(self, mesh_name, nonManifoldVertices=False, nonManifoldEdges=False, **kwargs):
+        mesh = self._mesh_of(mesh_name)
+        if mesh.attrs.get("non_manifold"):
+            return [f"{mesh.name}.vtx[0]"] if nonManifoldVertices else [f"{mesh.name}.e[0]"]
+        return None
+
+    def polyUVSet(self, mesh_name, q=False, query=False, allUVSets=False, delete=False, rename=False,
+                  uvSet=None, newUVSet=None, **kwargs):
+        mesh = self._mesh_of(mesh_name)
+        uv_sets = mesh.attrs.setdefault("uv_sets", ["map1"])
+        if q or query:
+            return list(uv_sets) if uv_sets else None
+        if delete:
+            uv_sets.remove(uvSet)
+        elif rename:
+            uv_sets[uv_sets.index(uvSet)] = newUVSet
+
+    def polyListComponentConversion(self, component, fromFace=False, toUV=False, **kwargs):
+        match = _COMPONENT_RE.match(component)
+        mesh = self._mesh_of(match.group("node"))
+        if int(match.group("index")) in mesh.attrs.get("unmapped", ()):
+            return []
+        return [f"{mesh.name}.map[{match.group('index')}]"]
+
+    def polyUVOverlap(self, *args, oc=False, **kwargs):
+        comps = self._flatten_args(args) or self.scene.selection
+        overlapping = []
+        for comp in comps:
+            match = _COMPONENT_RE.match(comp)
+            mesh = self._mesh_of(match.group("node") if match else comp)
+            overlapping.extend(f"{mesh.name}.f[{i}]" for i in sorted(mesh.attrs.get("overlap", ())))
+        return overlapping or None
+
+    # --- 수정 ---
+    def undoInfo(self, openChunk=False, closeChunk=False, **kwargs):
+        if openChunk:
+            self.undo_chunks += 1
+
+    def rename(self, node_name, new_name, **kwargs):
+        node = self._node(node_name)
+        if node is None:
+            raise RuntimeError(f"No object matches name: {node_name}")
+        self.scene.rename_node(node, new_name)
+        return new_name
+
+    def delete(self, *args, constructionHistory=False, ch=False, **kwargs):
+        for name in self._flatten_args(args):
+            node = self._node(name)
+            if node is None:
+                raise ValueError(f"No object matches name: {name}")
+            if constructionHistory or ch:
+                shapes = self.scene.shapes(node) if node.type == "transform" else [node]
+                for shape in shapes:
+                    shape.attrs["history"] = False
+            else:
+                self.scene.remove_node(node)
+
+    def makeIdentity(self, *args, apply=False, translate=False, rotate=False, scale=False, **kwargs):
+        for name in self._flatten_args(args):
+            node = self._node(name)
+            if translate:
+                node.attrs["translate"] = (0.0, 0.0, 0.0)
+            if rotate:
+                node.attrs["rotate"] = (0.0, 0.0, 0.0)
+            if scale:
+                node.attrs["scale"] = (1.0, 1.0, 1.0)
+
+    def lockNode(self, *args, query=False, q=False, lock=None, **kwargs):
+        nodes = [self._node(name) for name in self._flatten_args(args)]
+        if query or q:
+            return [node.locked for node in nodes]
+        for node in nodes:
+            node.locked = bool(lock)
+
+    # --- 파일 ---
+    def file(self, *args, query=False, q=False, sceneName=False, open=False, o=False, new=False,
+             loadReference=None, lr=None, **kwargs):
+        if (query or q) and sceneName:
+            return self.scene.scene_name
+        if (loadReference or lr) and self.reference_loader is not None:
+            self.reference_loader(self.scene, loadReference or lr, kwargs)
+            return ""
+        if new:
+            self.scene = FakeScene()
+            return ""
+        if (open or o) and self.scene_loader is not None:
+            self.scene = self.scene_loader(args[0], kwargs)
+            self.scene.scene_name = args[0]
+            return args[0]
+        raise NotImplementedError("mock file supports -q -sceneName, -new, -open (with scene_loader) "
+                                  "and -loadReference (with reference_loader) only")
+
+    def pluginInfo(self, name, query=False, q=False, loaded=False, **kwargs):
+        if (query or q) and loaded:
+            return name in self.loaded_plugins
+        raise NotImplementedError("mock pluginInfo supports -q -loaded only")
+
+    def loadPlugin(self, name, quiet=False, **kwargs):
+        if name not in self.loaded_plugins and self.plugin_loader is not None:
+            self.plugin_loader(name)
+        self.loaded_plugins.add(name)
+        return [name]
+
+    def flushUndo(self):
+        self.undo_flushes += 1
+
+    def workspace(self, *args, query=False, q=False, directory=False, **kwargs):
+        return self.scene.workspace_dir
+
+    def playbackOptions(self, query=False, q=False, min=False, max=False, **kwargs):
+        if (query or q) and (min or max):
+            return float(self.scene.playback_range[0 if min else 1])
+        raise NotImplementedError("mock playbackOptions supports -q -min / -max only")
+
+    # --- 메시지 ---
+    def warning(self, message):
+        pass
+
+    def error(self, message):
+        raise RuntimeError(message)
+
+
+class MSelectionList:
+    """maya.api.OpenMaya.MSelectionList 대체 (add/getDagPath만 지원, DAG 경로 대신 FakeNode를 사용)"""
+
+    def __init__(self):
+        self._nodes = []
+
+    def add(self, name):
+        node = _active_cmds._node(name)
+        if node is None:
+            raise RuntimeError(f"(kInvalidParameter): Object does not exist: {name}")
+        self._nodes.append(node)
+        return self
+
+    def getDagPath(self, index):
+        return self._nodes[index]
+
+
+class MFnMesh:
+    """maya.api.OpenMaya.MFnMesh 대체 (getVertices만 지원, Ngon 페이스는 정점 5개)"""
+
+    def __init__(self, dag_path):
+        self._mesh = dag_path if dag_path.type == "mesh" else _active_cmds.scene.shapes(dag_path)[0]
+
+    def getVertices(self):
+        ngons = self._mesh.attrs.get("ngons", ())
+        counts = [5 if i in ngons else 4 for i in range(self._mesh.attrs.get("faces", 0))]
+        # 툴은 페이스별 정점 수만 사용하므로 정점 번호 목록은 비워 둡니다.
+        return counts, []
+
+
+# 현재 설치된 cmds 구현 (install 후 set_scene으로 씬 교체)
+_active_cmds = None
+
+
+def install(scene=None):
+    """
+    sys.modules에 maya, maya.cmds, maya.standalone, maya.api, maya.api.OpenMaya 대체 모듈을 등록합니다.
+    이미 설치되어 있으면 씬만 교체합니다.
+
+    :param scene: 사용할 FakeScene (None이면 빈 씬)
+    :return: FakeCmds 인스턴스
+    """
+    global _active_cmds
+    if _active_cmds is not None:
+        set_scene(scene or FakeScene())
+        return _active_cmds
+
+    _active_cmds = FakeCmds(scene)
+
+    maya_module = types.ModuleType("maya")
+    cmds_module = types.ModuleType("maya.cmds")
+    for name in dir(FakeCmds):
+        if not name.startswith("_"):
+            setattr(cmds_module, name, getattr(_active_cmds, name))
+
+    # maya.standalone.initialize / uninitialize는 아무 것도 하지 않습니다.
+    standalone_module = types.ModuleType("maya.standalone")
+    standalone_module.initialize = lambda *args, **kwargs: None
+    standalone_module.uninitialize = lambda *args, **kwargs: None
+
+    api_module = types.ModuleType("maya.api")
+    om2_module = types.ModuleType("maya.api.OpenMaya")
+    om2_module.MSelectionList = MSelectionList
+    om2_module.MFnMesh = MFnMesh
+    api_module.OpenMaya = om2_module
+    maya_module.cmds = cmds_module
+    maya_module.standalone = standalone_module
+    maya_module.api = api_module
+
+    sys.modules["maya"] = maya_module
+    sys.modules["maya.cmds"] = cmds_module
+    sys.modules["maya.standalone"] = standalone_module
+    sys.modules["maya.api"] = api_module
+    sys.modules["maya.api.OpenMaya"] = om2_module
+    return _active_cmds
+
+
+def set_scene(scene):
+    """설치된 cmds 대체 모듈이 사용할 씬을 교체합니다."""
+    _active_cmds.scene = scene
+    _active_cmds.undo_chunks = 0
+    _active_cmds.assigned_members = 0
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성(synthetic) 씬 생성 함수 모음입니다.
+모든 생성 함수는 seed를 받아 항상 같은 씬을 만들므로, 실행 간 결과를 비교할 수 있습니다.
+"""
+import random
+
+import mock_maya
+
+# 그룹 하나에 들어가는 메쉬 개수 (실제 에셋의 계층 구조를 흉내냅니다)
+MESHES_PER_GROUP = 100
+
+
+def build_validation_scene(num_meshes, faces=6, error_ratio=0.05, seed=0):
+    """
+    씬 검수 툴용 합성 씬을 생성합니다.
+
+    각 메쉬는 '|grp_0000|part_00001_geo|part_00001_geoShape' 형태의 계층으로 만들어지며,
+    error_ratio 비율만큼 네이밍/트랜스폼/히스토리/UV 셋/Ngon/Non-manifold/UV 할당/UV 겹침 문제가
+    무작위로 섞여 들어갑니다.
+
+    :param num_meshes: 생성할 메쉬 개수
+    :param faces: 메쉬당 페이스 개수
+    :param error_ratio: 항목별 문제가 발생할 확률 (0.0 ~ 1.0)
+    :param seed: 난수 시드
+    :return: 생성된 FakeScene
+    :rtype: mock_maya.FakeScene
+    """
+    rng = random.Random(seed)
+    scene = mock_maya.FakeScene()
+
+    def broken():
+        return rng.random() < error_ratio
+
+    group = None
+    for i in range(num_meshes):
+        if i % MESHES_PER_GROUP == 0:
+            group = scene.create_node("transform", f"grp_{i // MESHES_PER_GROUP:04d}")
+
+        name = f"part_{i:05d}" if broken() else f"part_{i:05d}_geo"
+        transform_attrs = {}
+        if broken():
+            transform_attrs["translate"] = (rng.uniform(-10, 10), 0.0, 0.0)
+        if broken():
+            transform_attrs["scale"] = (2.0, 2.0, 2.0)
+        transform = scene.create_node("transform", name, parent=group, **transform_attrs)
+
+        mesh_attrs = {"faces": faces, "uv_sets": ["map1"]}
+        if broken():
+            mesh_attrs["history"] = True
+        if broken():
+            mesh_attrs["uv_sets"] = ["map1", "uvSet1"] if rng.random() < 0.5 else ["uvSet"]
+        if broken():
+            mesh_attrs["ngons"] = {rng.randrange(faces)}
+        if broken():
+            mesh_attrs["non_manifold"] = True
+        if broken():
+            mesh_attrs["unmapped"] = {rng.randrange(faces)}
+        if broken():
+            mesh_attrs["overlap"] = {rng.randrange(faces), rng.randrange(faces)}
+        scene.create_node("mesh", f"{name}Shape", parent=transform, **mesh_attrs)
+
+    for i in range(max(1, int(num_meshes * error_ratio * 0.1))):
+        scene.create_node("unknown", f"unknownNode{i}")
+
+    return scene
+
+
+def build_fix_scene(num_meshes, nested_ratio=0.3, seed=0):
+    """
+    Fix-All 벤치마크용 합성 씬을 생성합니다.
+
+    모든 메쉬가 네이밍/트랜스폼/히스토리/UV 셋 문제를 동시에 가지며,
+    nested_ratio 비율만큼의 메쉬는 직전 메쉬 트랜스폼의 자식으로 만들어집니다.
+    (부모 이름이 먼저 바뀌면 자식의 DAG 경로가 무효가 되는 상황을 재현합니다.)
+
+    :param num_meshes: 생성할 메쉬 개수
+    :param nested_ratio: 메쉬 트랜스폼 아래에 중첩될 확률 (0.0 ~ 1.0)
+    :param seed: 난수 시드
+    :return: 생성된 FakeScene
+    :rtype: mock_maya.FakeScene
+    """
+    rng = random.Random(seed)
+    scene = mock_maya.FakeScene()
+
+    group = None
+    previous = None
+    for i in range(num_meshes):
+        if i % MESHES_PER_GROUP == 0:
+            group = scene.create_node("transform", f"grp_{i // MESHES_PER_GROUP:04d}")
+            previous = None
+
+        parent = previous if previous is not None and rng.random() < nested_ratio else group
+        name = f"part_{i:05d}"
+        transform = scene.create_node("transform", name, parent=parent,
+                                      translate=(rng.uniform(-10, 10), 0.0, 0.0))
+        uv_sets = ["map1", "uvSet1"] if rng.random() < 0.5 else ["uvSet"]
+        scene.create_node("mesh", f"{name}Shape", parent=transform,
+                          faces=6, uv_sets=uv_sets, history=True)
+        previous = transform
+
+    for i in range(max(1, num_meshes // 100)):
+        scene.create_node("unknown", f"unknownNode{i}")
+
+    return scene
+
+
+def write_ma_scene(path, num_meshes, faces=96, error_ratio=0.05, seed=0):
+    """
+    Maya ASCII(.ma) 형식의 합성 씬 파일을 작성합니다. (오프라인 .ma 파서 벤치마크용)
+
+    실제 Maya가 저장하는 것과 같은 형태로 createNode / rename -uid / setAttr / connectAttr 명령문과
+    메쉬 정점/페이스 데이터를 기록하며, error_ratio 비율만큼 네이밍/트랜스폼 문제와 Unknown 노드가 섞여 들어갑니다.
+
+    :param path: 저장할 .ma 파일 경로
+    :param num_meshes: 메쉬 개수
+    :param faces: 메쉬당 페이스 개수 (정점 데이터 크기를 결정합니다.)
+    :param error_ratio: 항목별 문제가 발생할 확률
+    :param seed: 난수 시드
+    :return: 작성된 파일 크기 (bytes)
+    """
+    rng = random.Random(seed)
+    vertex_count = faces + 2
+    vertex_lines = []
+    for start in range(0, vertex_count, 3):
+        values = " ".join(f"{rng.uniform(-1, 1):.6f} {rng.uniform(-1, 1):.6f} {rng.uniform(-1, 1):.6f}"
+                          for _ in range(start, min(start + 3, vertex_count)))
+        vertex_lines.append(f"\t\t {values}")
+    vertex_block = "\n".join(vertex_lines)
+    face_block = "\n".join(f"\t\t f 4 {i} {i + 1} {i + 2} {i + 3}" for i in range(faces))
+
+    with open(path, "w", newline="\n") as f:
+        f.write("//Maya ASCII 2024 scene\n//Name: synthetic.ma\n")
+        f.write('requires maya "2024";\n')
+        f.write('requires -nodeType "aiStandardSurface" "mtoa" "5.3.0";\n')
+        f.write('currentUnit -l centimeter -a degree -t film;\n')
+        f.write('fileInfo "application" "maya";\n')
+
+        group = None
+        for i in range(num_meshes):
+            if i % MESHES_PER_GROUP == 0:
+                group = f"grp_{i // MESHES_PER_GROUP:04d}"
+                f.write(f'createNode transform -n "{group}";\n\trename -uid "{rng.getrandbits(64):016X}";\n')
+            name = f"part_{i:05d}" if rng.random() < error_ratio else f"part_{i:05d}_geo"
+            f.write(f'createNode transform -n "{name}" -p "{group}";\n\trename -uid "{rng.getrandbits(64):016X}";\n')
+            if rng.random() < error_ratio:
+                f.write(f'\tsetAttr ".t" -type "double3" {rng.uniform(-10, 10):.4f} 0 0 ;\n')
+            if rng.random() < error_ratio:
+                f.write('\tsetAttr ".sy" 2;\n')
+            f.write(f'createNode mesh -n "{name}Shape" -p "{name}";\n\trename -uid "{rng.getrandbits(64):016X}";\n')
+            f.write('\tsetAttr -k off ".v";\n\tsetAttr ".vir" yes;\n')
+            f.write('\tsetAttr ".uvst[0].uvsn" -type "string" "map1";\n')
+            f.write(f'\tsetAttr -s {vertex_count} ".vt[0:{vertex_count - 1}]"\n{vertex_block};\n')
+            f.write(f'\tsetAttr -s {faces} -ch {faces * 4} ".fc[0:{faces - 1}]" -type "polyFaces" \n{face_block};\n')
+            f.write(f'\tsetAttr ".cd" -type "dataPolyComponent" Index_Data Edge 0 ;\n')
+
+        for i in range(max(1, int(num_meshes * error_ratio * 0.1))):
+            f.write(f'createNode unknown -n "unknownNode{i}";\n\tsetAttr ".a" -type "string" "a;b \\"c\\"";\n')
+        f.write('createNode aiStandardSurface -n "aiStandardSurface1";\n')
+        f.write('select -ne :time1;\n\tsetAttr ".o" 1;\n')
+        for i in range(num_meshes):
+            f.write(f'connectAttr "part_{i:05d}_geoShape.iog" ":initialShadingGroup.dsm" -na;\n')
+        f.write("// End of synthetic.ma\n")
+        return f.tell()
+
+
+def build_shader_scene(num_shapes, num_sgs=200, faces=96, face_assign_ratio=0.2, namespace="", seed=0, scene=None):
+    """
+    쉐이더 맵 익스포터/임포터 벤치마크용 합성 씬을 생성합니다.
+
+    모든 메쉬는 num_sgs개의 쉐이딩 그룹 중 하나를 오브젝트 단위로 공유하며,
+    face_assign_ratio 비율만큼의 메쉬는 추가로 다른 SG 두 개를 페이스 범위 단위로 할당받습니다.
+    SG 멤버는 Maya의 'sets -q' 결과와 같은 형식(오브젝트는 쉐이프 이름, 페이스는 트랜스폼 이름 + 컴포넌트)으로 기록됩니다.
+
+    :param num_shapes: 메쉬 개수
+    :param num_sgs: 쉐이딩 그룹 개수
+    :param faces: 메쉬당 페이스 개수
+    :param face_assign_ratio: 페이스 단위 할당이 섞인 메쉬의 비율
+    :param namespace: 노드 이름 앞에 붙일 네임스페이스 (예: 'bag01:')
+    :param seed: 난수 시드
+    :param scene: 노드를 추가할 FakeScene (None이면 새로 생성). 레퍼런스 에셋 여러 개를 한 씬에 만들 때 사용합니다.
+    :return: 생성된 FakeScene
+    :rtype: mock_maya.FakeScene
+    """
+    rng = random.Random(seed)
+    scene = scene or mock_maya.FakeScene()
+    sgs = [scene.create_node("shadingEngine", f"{namespace}mat_{i:03d}SG", members=[])
+           for i in range(num_sgs)]
+
+    group = None
+    for i in range(num_shapes):
+        if i % MESHES_PER_GROUP == 0:
+            group = scene.create_node("transform", f"{namespace}grp_{i // MESHES_PER_GROUP:04d}")
+        name = f"{namespace}part_{i:05d}_geo"
+        transform = scene.create_node("transform", name, parent=group)
+        shape = scene.create_node("mesh", f"{name}Shape", parent=transform, faces=faces, sgs=[])
+
+        base_sg = rng.choice(sgs)
+        if rng.random() < face_assign_ratio and faces >= 3:
+            split_a = rng.randrange(1, faces - 1)
+            split_b = rng.randrange(split_a + 1, faces)
+            assigned = [(base_sg, f"f[0:{split_a - 1}]"),
+                        (rng.choice(sgs), f"f[{split_a}:{split_b - 1}]"),
+                        (rng.choice(sgs), f"f[{split_b}:{faces - 1}]")]
+            for sg, component in assigned:
+                sg.attrs["members"].append(f"{name}.{component}")
+                if sg.name not in shape.attrs["sgs"]:
+                    shape.attrs["sgs"].append(sg.name)
+        else:
+            base_sg.attrs["members"].append(f"{name}Shape")
+            shape.attrs["sgs"].append(base_sg.name)
+
+    return scene
+
+
+def build_shot_scene(asset_names, instances_per_asset, shapes_per_asset, num_sgs=20, faces=96,
+                     face_assign_ratio=0.2, seed=0):
+    """
+    레퍼런스 에셋 여러 개로 구성된 샷 씬을 생성합니다. (쉐이더 맵 임포터 벤치마크용)
+
+    에셋마다 instances_per_asset개의 레퍼런스가 'asset_01:' 같은 네임스페이스로 만들어지며,
+    같은 에셋의 레퍼런스는 같은 시드로 생성되어 노드 구성이 동일합니다. 쉐이딩 그룹의 멤버는 비어 있습니다.
+
+    :param asset_names: 에셋 이름 리스트 (레퍼런스 파일명 '<asset>.ma'로 사용됩니다.)
+    :param instances_per_asset: 에셋당 레퍼런스 개수
+    :param shapes_per_asset: 에셋당 메쉬 개수
+    :return: 생성된 FakeScene
+    :rtype: mock_maya.FakeScene
+    """
+    scene = mock_maya.FakeScene()
+    for asset_index, asset_name in enumerate(asset_names):
+        for instance in range(instances_per_asset):
+            namespace = f"{asset_name}_{instance + 1:02d}"
+            scene.create_node("reference", f"{namespace}RN", filename=f"/show/assets/{asset_name}.ma",
+                              namespace=f":{namespace}")
+            build_shader_scene(shapes_per_asset, num_sgs, faces, face_assign_ratio,
+                               namespace=f"{namespace}:", seed=seed + asset_index, scene=scene)
+    for node in scene.nodes:
+        if node.type == "shadingEngine":
+            node.attrs["members"] = []
+        elif node.type == "mesh":
+            node.attrs["sgs"] = []
+    return scene
+
+
+def write_shaded_ma_scene(path, num_shapes, num_sgs=200, faces=96, face_assign_ratio=0.2, seed=0,
+                          placeholder_assignments=0):
+    """
+    쉐이더가 할당된 Maya ASCII(.ma) 씬 파일을 작성합니다. (오프라인 쉐이더 맵 추출 벤치마크용)
+
+    build_shader_scene()과 같은 시드로 같은 할당을 만들므로, 오프라인 추출 결과를 가짜 씬에서
+    익스포터로 추출한 결과와 비교할 수 있습니다. 할당은 실제 Maya가 저장하는 형태로 기록합니다.
+    (오브젝트 전체: 'iog -> dsm' 연결, 페이스: 'iog[0].og[i].gcl' componentList + 'iog.og[i] -> dsm' 연결)
+
+    :param placeholder_assignments: 레퍼런스 플레이스홀더('modelRN.phl[i]')로 연결된 할당 개수
+    :return: 작성된 파일 크기 (bytes)
+    """
+    rng = random.Random(seed)
+    data_rng = random.Random(seed + 1)
+    vertex_count = faces + 2
+    vertex_block = "\n".join(
+        "\t\t " + " ".join(f"{data_rng.uniform(-1, 1):.6f}" for _ in range(3 * min(3, vertex_count - start)))
+        for start in range(0, vertex_count, 3))
+    face_block = "\n".join(f"\t\t f 4 {i} {i + 1} {i + 2} {i + 3}" for i in range(faces))
+    sg_names = [f"mat_{i:03d}SG" for i in range(num_sgs)]
+
+    connections = []
+    group_id = 0
+    with open(path, "w", newline="\n") as f:
+        f.write("//Maya ASCII 2024 scene\n//Name: shaded.ma\n")
+        if placeholder_assignments:
+            f.write('file -rdi 1 -ns "model" -rfn "modelRN" -typ "mayaAscii" "/show/assets/model.ma";\n')
+            f.write('file -r -ns "model" -dr 1 -rfn "modelRN" -typ "mayaAscii" "/show/assets/model.ma";\n')
+        f.write('requires maya "2024";\n')
+        f.write('currentUnit -l centimeter -a degree -t film;\n')
+
+        group = None
+        for i in range(num_shapes):
+            if i % MESHES_PER_GROUP == 0:
+                group = f"grp_{i // MESHES_PER_GROUP:04d}"
+                f.write(f'createNode transform -n "{group}";\n')
+            name = f"part_{i:05d}_geo"
+            shape = f"{name}Shape"
+            f.write(f'createNode transform -n "{name}" -p "{group}";\n')
+            f.write(f'createNode mesh -n "{shape}" -p "{name}";\n')
+            f.write('\tsetAttr -k off ".v";\n')
+
+            base_sg = rng.choice(sg_names)
+            if rng.random() < face_assign_ratio and faces >= 3:
+                split_a = rng.randrange(1, faces - 1)
+                split_b = rng.randrange(split_a + 1, faces)
+                assigned = [(base_sg, f"f[0:{split_a - 1}]"),
+                            (rng.choice(sg_names), f"f[{split_a}:{split_b - 1}]"),
+                            (rng.choice(sg_names), f"f[{split_b}:{faces - 1}]")]
+                by_sg = {}
+                for sg, component in assigned:
+                    by_sg.setdefault(sg, []).append(component)
+                f.write(f'\tsetAttr -s {len(by_sg)} ".iog[0].og";\n')
+                for og, (sg, components) in enumerate(by_sg.items()):
+                    quoted = " ".join(f'"{c}"' for c in components)
+                    f.write(f'\tsetAttr ".iog[0].og[{og}].gcl" -type "componentList" {len(components)} {quoted};\n')
+                    connections.append(f'connectAttr "groupId{group_id}.id" "{shape}.iog.og[{og}].gid";')
+                    connections.append(f'connectAttr "{sg}.mwc" "{shape}.iog.og[{og}].gco";')
+                    connections.append(f'connectAttr "{shape}.iog.og[{og}]" "{sg}.dsm" -na;')
+                    connections.append(f'connectAttr "groupId{group_id}.msg" "{sg}.gn" -na;')
+                    group_id += 1
+            else:
+                connections.append(f'connectAttr "{shape}.iog" "{base_sg}.dsm" -na;')
+            f.write(f'\tsetAttr -s {vertex_count} ".vt[0:{vertex_count - 1}]"\n{vertex_block};\n')
+            f.write(f'\tsetAttr -s {faces} -ch {faces * 4} ".fc[0:{faces - 1}]" -type "polyFaces" \n{face_block};\n')
+
+        for sg in sg_names:
+            f.write(f'createNode shadingEngine -n "{sg}";\n\tsetAttr ".ihi" 0;\n\tsetAttr ".ro" yes;\n')
+            f.write(f'createNode lambert -n "{sg[:-2]}";\n')
+            connections.append(f'connectAttr "{sg[:-2]}.oc" "{sg}.ss";')
+        for i in range(group_id):
+            f.write(f'createNode groupId -n "groupId{i}";\n\tsetAttr ".ihi" 0;\n')
+        for i in range(placeholder_assignments):
+            connections.append(f'connectAttr "modelRN.phl[{i + 1}]" "{sg_names[i % num_sgs]}.dsm" -na;')
+        f.write("\n".join(connections))
+        f.write("\n// End of shaded.ma\n")
+        return f.tell()
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import configparser
+import json
 import os
 
 def get_config_value(config_path, section, option, fallback=None):
@@ -19,3 +20,26 @@ def get_config_value(config_path, section, option, fallback=None):
     
     config.read(config_path)
     return config.get(section, option, fallback=fallback)
+
+
+def save_json_atomic(path, data, **dump_kwargs):
+    """
+    JSON 파일을 같은 폴더의 임시 파일에 쓴 뒤 os.replace로 교체합니다.
+    중간에 중단되어도 기존 파일이 깨지지 않고, 다른 프로세스가 쓰다 만 파일을 읽지 않습니다.
+
+    :param path: 저장할 JSON 파일 경로
+    :param data: 저장할 값
+    :param dump_kwargs: json.dump에 넘길 옵션 (indent, separators 등)
+    :return: 저장한 파일 경로
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, ".{}.{}.tmp".format(os.path.basename(path), os.getpid()))
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+"""
+Maya ASCII(.ma) 파일을 Maya 없이 읽기 위한 스트리밍 파서입니다.
+
+.ma 파일은 MEL 명령문(';'로 끝나는)의 나열입니다. 이 모듈은 파일을 고정 크기 청크로 읽으면서
+명령문 단위로 토큰을 잘라 MaStatement로 돌려주므로, 수 GB 파일도 일정한 메모리로 처리할 수 있습니다.
+
+- 관심 없는 명령문(commands 필터에 없는 명령)과 토큰 개수 제한(max_tokens)을 넘은 나머지 부분은
+  토큰을 만들지 않고 정규식 한 번으로 건너뜁니다. (메쉬 정점 데이터 같은 대용량 setAttr)
+- 문자열 리터럴 안의 ';'와 주석('//')을 올바르게 처리합니다.
+- scan_scene()은 노드 계층, requires, 트랜스폼 값, 연결 정보를 요약한 MaScene을 만듭니다.
+"""
+import re
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MB
+DEFAULT_MAX_TOKENS = 64
+
+# 공백을 건너뛴 뒤 문자열 / ';' / 주석 / 일반 토큰 중 하나를 읽습니다.
+_TOKEN_RE = re.compile(r'\s*(?:("(?:[^"\\]|\\.)*")|(;)|(//[^\n]*)|([^\s;"]+))')
+# 명령문의 나머지를 ';' 직전까지 건너뜁니다. (문자열과 주석 안의 ';'는 무시)
+_SKIP_RE = re.compile(r'(?:[^";/]+|"(?:[^"\\]|\\.)*"|//[^\n]*|/)*')
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_ESCAPE_RE = re.compile(r'\\(.)')
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+# 명령별 플래그 인자 개수 (목록에 없는 플래그는 인자가 없는 것으로 간주합니다.)
+FLAG_ARITY = {
+    "createNode": {"n": 1, "name": 1, "p": 1, "parent": 1},
+    "setAttr": {"k": 1, "keyable": 1, "l": 1, "lock": 1, "cb": 1, "channelBox": 1,
+                "type": 1, "typ": 1, "s": 1, "size": 1, "c": 1, "clamp": 1},
+    "requires": {"nodeType": 1, "dataType": 1},
+    "rename": {"uid": 1, "uuid": 1},
+    "connectAttr": {"l": 1, "lock": 1},
+    "file": {"rdi": 1, "ns": 1, "namespace": 1, "rfn": 1, "referenceNode": 1, "typ": 1, "type": 1,
+             "op": 1, "options": 1, "dr": 1, "deferReference": 1, "rpr": 1, "lrd": 1},
+}
+
+
+def unquote(token):
+    """따옴표로 감싼 MEL 문자열 토큰을 파이썬 문자열로 변환합니다. 문자열이 아니면 그대로 반환합니다."""
+    if len(token) >= 2 and token[0] == '"' and token[-1] == '"':
+        body = token[1:-1]
+        if "\\" in body:
+            body = _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), body)
+        return body
+    return token
+
+
+def _is_flag(token):
+    return len(token) > 1 and token[0] == "-" and token[1].isalpha()
+
+
+class MaStatement:
+    """
+    .ma 파일의 명령문 하나입니다.
+
+    :ivar command: 명령 이름 (예: 'createNode')
+    :ivar tokens: 명령 뒤의 원본 토큰 리스트 (문자열은 따옴표 포함)
+    :ivar line: 명령문이 시작된 줄 번호 (1부터)
+    :ivar truncated: max_tokens를 넘어 뒷부분 토큰이 생략되었는지 여부
+    """
+    __slots__ = ("command", "tokens", "line", "truncated")
+
+    def __init__(self, command, tokens, line, truncated=False):
+        self.command = command
+        self.tokens = tokens
+        self.line = line
+        self.truncated = truncated
+
+    def parse(self):
+        """
+        토큰을 플래그와 위치 인자로 나눕니다. 문자열 인자는 따옴표를 제거하여 반환합니다.
+
+        :return: ({플래그 이름: [값 리스트]}, [위치 인자])
+        :rtype: tuple
+        """
+        arity = FLAG_ARITY.get(self.command, {})
+        flags = {}
+        positional = []
+        tokens = self.tokens
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if _is_flag(token):
+                name = token[1:]
+                count = arity.get(name, 0)
+                values = [unquote(t) for t in tokens[i + 1:i + 1 + count]]
+                flags.setdefault(name, []).extend(values)
+                i += 1 + count
+                continue
+            positional.append(unquote(token))
+            i += 1
+        return flags, positional
+
+    def __repr__(self):
+        return f"MaStatement({self.command!r}, line={self.line}, tokens={self.tokens[:4]!r})"
+
+
+def iter_statements(source, commands=None, max_tokens=DEFAULT_MAX_TOKENS, chunk_size=DEFAULT_CHUNK_SIZE,
+                    token_limits=None, extend_limit=None):
+    """
+    .ma 파일의 명령문을 순서대로 읽어 MaStatement로 반환하는 제너레이터입니다.
+
+    :param source: 파일 경로 또는 텍스트 모드로 열린 파일 객체
+    :param commands: 반환할 명령 이름 집합 (None이면 모든 명령). 나머지 명령문은 건너뜁니다.
+    :param max_tokens: 명령문당 보관할 최대 토큰 개수. 넘는 부분은 건너뛰고 truncated=True로 표시합니다.
+    :param chunk_size: 한 번에 읽을 문자 수
+    :param token_limits: 명령별 max_tokens 값 (예: {'requires': 4096})
+    :param extend_limit: 명령문이 토큰 개수 제한에 도달했을 때 호출되는 함수 (명령, 토큰 리스트) -> 새 제한 또는 None.
+                         더 큰 값을 반환하면 해당 명령문만 제한을 늘려 계속 읽습니다.
+                         (예: 속성 이름을 보고 componentList setAttr만 끝까지 읽기)
+    """
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        with open(source, "r", encoding="utf-8", errors="replace", newline="") as f:
+            yield from _iter_stream(f, commands, max_tokens, chunk_size, token_limits or {}, extend_limit)
+    else:
+        yield from _iter_stream(source, commands, max_tokens, chunk_size, token_limits or {}, extend_limit)
+
+
+def _iter_stream(stream, commands, max_tokens, chunk_size, token_limits, extend_limit=None):
+    buf = ""
+    pos = 0
+    eof = False
+    line = 1               # buf[0] 위치의 줄 번호
+    line_pos = 0           # line 값이 계산된 buf 위치
+    command = None         # 진행 중인 명령문 (없으면 None)
+    tokens = None
+    start_line = 0
+    limit = max_tokens
+    truncated = False
+    skipping = False       # 명령문의 나머지를 건너뛰는 중인지 여부
+
+    while True:
+        need_more = False
+        if skipping:
+            end = _find_statement_end(buf, pos)
+            if end < len(buf) and buf[end] == ";":
+                if tokens is not None:
+                    yield MaStatement(command, tokens, start_line, truncated)
+                command = tokens = None
+                skipping = truncated = False
+                pos = end + 1
+            elif eof:
+                break
+            else:
+                # 청크 경계에서 잘린 주석/문자열일 수 있으므로 마지막 줄은 다음 청크와 함께 다시 읽습니다.
+                cut = buf.rfind("\n", pos, end)
+                pos = cut + 1 if cut >= 0 else pos
+                need_more = True
+        else:
+            match = _TOKEN_RE.match(buf, pos)
+            if match is None or (match.end() == len(buf) and not eof):
+                if eof:
+                    break
+                need_more = True
+            else:
+                string, semicolon, comment, word = match.groups()
+                token = string or word
+                pos = match.end()
+                if comment is not None:
+                    pass
+                elif semicolon is not None:
+                    if command is not None and tokens is not None:
+                        yield MaStatement(command, tokens, start_line, truncated)
+                    command = tokens = None
+                    truncated = False
+                elif command is None:
+                    command = token
+                    line += buf.count("\n", line_pos, match.start(match.lastindex))
+                    line_pos = match.start(match.lastindex)
+                    start_line = line
+                    if commands is not None and command not in commands:
+                        tokens = None
+                        skipping = True
+                    else:
+                        tokens = []
+                        limit = token_limits.get(command, max_tokens)
+                elif len(tokens) < limit:
+                    tokens.append(token)
+                else:
+                    extended = extend_limit(command, tokens) if extend_limit is not None else None
+                    if extended is not None and extended > limit:
+                        limit = extended
+                        tokens.append(token)
+                    else:
+                        truncated = True
+                        skipping = True
+
+        if need_more:
+            line += buf.count("\n", line_pos, pos)
+            buf = buf[pos:]
+            pos = line_pos = 0
+            data = stream.read(chunk_size)
+            if data:
+                buf += data
+            else:
+                eof = True
+
+    if command is not None and tokens is not None:
+        # 마지막 명령문에 ';'가 없는 경우
+        yield MaStatement(command, tokens, start_line, truncated)
+
+
+def _find_statement_end(buf, pos):
+    """
+    pos부터 명령문을 끝내는 ';'의 위치를 찾습니다. 찾지 못하면 더 읽어야 하는 위치를 반환합니다.
+    대용량 숫자 데이터는 str.find로 건너뛰고, 문자열 리터럴만 정규식으로 확인합니다.
+    """
+    scan = pos
+    while True:
+        end = buf.find(";", scan)
+        if end < 0:
+            return _SKIP_RE.match(buf, scan).end()
+        quote = buf.find('"', scan, end)
+        comment = buf.find("//", scan, end)
+        if comment >= 0 and (quote < 0 or comment < quote):
+            return _SKIP_RE.match(buf, scan).end()
+        if quote < 0:
+            return end
+        string = _STRING_RE.match(buf, quote)
+        if string is None:
+            return quote  # 청크 경계에서 잘린 문자열
+        scan = string.end()
+
+
+class MaNode:
+    """.ma 파일에서 생성된 노드 정보"""
+    __slots__ = ("name", "type", "parent", "uuid", "attrs", "line")
+
+    def __init__(self, name, node_type, parent=None, line=0):
+        self.name = name
+        self.type = node_type
+        self.parent = parent
+        self.uuid = None
+        self.attrs = {}
+        self.line = line
+
+    def long_name(self):
+        parts = []
+        node = self
+        while node is not None:
+            parts.append(node.name)
+            node = node.parent
+        return "|" + "|".join(reversed(parts))
+
+    def __repr__(self):
+        return f"MaNode({self.name!r}, {self.type!r})"
+
+
+class MaScene:
+    """
+    scan_scene()이 만든 .ma 파일 요약입니다.
+
+    :ivar nodes: 생성 순서대로의 MaNode 리스트
+    :ivar requires: [(플러그인 이름, 버전, [nodeType 리스트])]
+    :ivar references: 참조 파일 경로 리스트
+    :ivar connection_count: connectAttr 명령 개수
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self.nodes = []
+        self.requires = []
+        self.references = []
+        self.connection_count = 0
+        self._by_name = {}
+
+    def add_node(self, node):
+        self.nodes.append(node)
+        self._by_name.setdefault(node.name, []).append(node)
+
+    def find(self, name):
+        """
+        .ma 파일 안의 노드 이름(짧은 이름 또는 'grp|node' 같은 부분 경로)으로 노드를 찾습니다.
+        같은 이름의 노드가 여럿이면 가장 최근에 생성된 노드를 반환합니다.
+        """
+        if not name:
+            return None
+        parts = [p for p in name.split("|") if p]
+        candidates = self._by_name.get(parts[-1]) if parts else None
+        if not candidates:
+            return None
+        if len(parts) == 1:
+            return candidates[-1]
+        for node in reversed(candidates):
+            current = node
+            for part in reversed(parts):
+                if current is None or current.name != part:
+                    break
+                current = current.parent
+            else:
+                return node
+        return None
+
+    def rename(self, node, new_name):
+        self._by_name[node.name].remove(node)
+        node.name = new_name
+        self._by_name.setdefault(new_name, []).append(node)
+
+    def nodes_of_type(self, *node_types):
+        return [n for n in self.nodes if n.type in node_types]
+
+    def plugin_node_types(self):
+        """{노드 타입: 플러그인 이름} 딕셔너리 (requires -nodeType 선언 기준)"""
+        result = {}
+        for plugin, _version, node_types in self.requires:
+            for node_type in node_types:
+                result[node_type] = plugin
+        return result
+
+
+# scan_scene에서 값을 보관하는 트랜스폼 관련 속성 (짧은 이름 -> 정규화된 이름)
+TRANSFORM_ATTRS = {
+    ".t": "translate", ".translate": "translate",
+    ".r": "rotate", ".rotate": "rotate",
+    ".s": "scale", ".scale": "scale",
+    ".io": "intermediateObject", ".intermediateObject": "intermediateObject",
+}
+_AXIS_ATTRS = {}
+for _short, _long in (("t", "translate"), ("r", "rotate"), ("s", "scale")):
+    for _i, _axis in enumerate("xyz"):
+        _AXIS_ATTRS[f".{_short}{_axis}"] = (_long, _i)
+        _AXIS_ATTRS[f".{_long}{_axis.upper()}"] = (_long, _i)
+
+SCAN_COMMANDS = {"createNode", "rename", "requires", "setAttr", "connectAttr", "select", "file"}
+# scan_scene은 명령문 앞부분만 사용하므로 토큰을 적게 보관합니다. (requires는 -nodeType 목록이 길 수 있음)
+SCAN_MAX_TOKENS = 12
+SCAN_TOKEN_LIMITS = {"requires": 4096, "file": 64}
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _to_bool(value):
+    return value in ("1", "yes", "on", "true")
+
+
+def scan_scene(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    .ma 파일을 한 번 훑어 노드 계층, requires, 참조, 트랜스폼 값을 요약합니다.
+    setAttr은 현재 노드(직전 createNode 또는 select -ne 대상)에 적용된 것으로 처리합니다.
+
+    :param source: 파일 경로 또는 파일 객체
+    :param chunk_size: 한 번에 읽을 문자 수
+    :return: 요약된 MaScene
+    :rtype: MaScene
+    """
+    scene = MaScene(source if isinstance(source, str) else None)
+    current = None
+    for statement in iter_statements(source, commands=SCAN_COMMANDS, max_tokens=SCAN_MAX_TOKENS,
+                                     chunk_size=chunk_size, token_limits=SCAN_TOKEN_LIMITS):
+        command = statement.command
+        if command == "setAttr":
+            if current is None:
+                continue
+            flags, args = statement.parse()
+            if not args:
+                continue
+            attr = args[0]
+            if attr in TRANSFORM_ATTRS:
+                values = args[1:]
+                if TRANSFORM_ATTRS[attr] == "intermediateObject":
+                    current.attrs["intermediateObject"] = bool(values) and _to_bool(values[0])
+                else:
+                    floats = [_to_float(v) for v in values[:3]]
+                    if len(floats) == 3 and None not in floats:
+                        current.attrs[TRANSFORM_ATTRS[attr]] = tuple(floats)
+            elif attr in _AXIS_ATTRS and len(args) > 1:
+                name, index = _AXIS_ATTRS[attr]
+                value = _to_float(args[1])
+                if value is not None:
+                    default = 1.0 if name == "scale" else 0.0
+                    vector = list(current.attrs.get(name, (default, default, default)))
+                    vector[index] = value
+                    current.attrs[name] = tuple(vector)
+        elif command == "createNode":
+            flags, args = statement.parse()
+            if not args:
+                continue
+            name = (flags.get("n") or flags.get("name") or [args[0]])[-1]
+            parent_name = (flags.get("p") or flags.get("parent") or [None])[-1]
+            parent = scene.find(parent_name) if parent_name else None
+            current = MaNode(name, args[0], parent, statement.line)
+            scene.add_node(current)
+        elif command == "rename":
+            flags, args = statement.parse()
+            uid = (flags.get("uid") or flags.get("uuid") or [None])[-1]
+            if uid and current is not None:
+                current.uuid = uid
+            elif len(args) == 2:
+                node = scene.find(args[0])
+                if node is not None:
+                    scene.rename(node, args[1])
+        elif command == "select":
+            flags, args = statement.parse()
+            current = scene.find(args[-1].lstrip(":")) if args else None
+        elif command == "connectAttr":
+            scene.connection_count += 1
+        elif command == "requires":
+            flags, args = statement.parse()
+            if args:
+                plugin = args[0]
+                version = args[1] if len(args) > 1 else None
+                scene.requires.append((plugin, version, flags.get("nodeType", [])))
+        elif command == "file":
+            flags, args = statement.parse()
+            if ("r" in flags or "reference" in flags or "rdi" in flags) and args:
+                scene.references.append(args[-1])
+    return scene
@@ -20,6 +20,19 @@ def get_all_mesh_transforms():
             valid_transforms.append(parent[0])
     return list(set(valid_transforms))
 
+def get_existing_nodes(nodes):
+    """
+    주어진 이름 중 씬에 실제로 존재하는 노드만 반환합니다.
+    노드마다 cmds.objExists를 호출하지 않고, 한 번의 cmds.ls 호출로 일괄 확인합니다.
+
+    :param nodes: 확인할 노드 이름 리스트
+    :return: 씬에 존재하는 노드의 전체 경로 리스트
+    :rtype: list
+    """
+    if not nodes:
+        return []
+    return cmds.ls(nodes, long=True) or []
+
 def delete_unknown_nodes():
     """
     [수정] Unknown 노드 정리
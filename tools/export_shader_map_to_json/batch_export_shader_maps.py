@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+쉐이더 맵 일괄(batch) 익스포트 모듈입니다.
+
+퍼블리시된 룩뎁 씬 목록을 maya.standalone 작업 프로세스 풀에서 열고, export_shader_map_to_json과 같은
+추출 로직(get_target_shapes, collect_shader_map)으로 씬마다 쉐이더 맵을 저장합니다.
+작업 프로세스는 maya.standalone을 한 번만 초기화하고 여러 씬을 차례로 처리합니다.
+씬은 레퍼런스를 지정한 깊이까지만 불러와 열며(기본: 최상위 레퍼런스만), 처리 후 새 씬으로 비워 메모리를 정리합니다.
+
+[출력 경로] (core.PathParser 필드 기준, shader_map_library의 폴더 구조와 같습니다.)
+    /show/PROJ/assets/char/hero/lookdev/pub/maya/hero_lookdev_v003.ma
+        -> <output_root>/char/hero/hero_v003.json
+    에셋 경로가 아니면 <output_root>/<씬 파일명>.json
+
+[건너뛰기]
+    쉐이더 맵 파일의 수정 시간이 씬 파일의 수정 시간보다 같거나 늦으면 건너뜁니다. (--force로 무시)
+    쉐이더 맵은 임시 파일에 쓴 뒤 교체하므로, 중간에 실패한 파일이 최신으로 판단되지 않습니다.
+
+[실행 방법] (저장소 루트에서, Maya의 mayapy로 실행)
+    PYTHONPATH=. mayapy tools/export_shader_map_to_json/batch_export_shader_maps.py /show/PROJ/assets \\
+        --output_root /show/PROJ/lookdev/shader_maps --task lookdev --status pub --latest_only --workers 4
+    PYTHONPATH=. mayapy tools/export_shader_map_to_json/batch_export_shader_maps.py scenes.txt --dry_run
+"""
+import argparse
+import atexit
+import concurrent.futures
+import multiprocessing
+import os
+import re
+import sys
+import time
+
+from core import log as core_log
+from core.PathParser import AssetPath, PathParser
+
+import shader_map_format
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+LOG_FILE_PATH = os.path.join(script_dir, 'batch_export_shader_maps.log')
+
+SCENE_EXTENSIONS = (".ma", ".mb")
+DEFAULT_WORKERS = 4
+
+# 씬을 열 때 불러올 레퍼런스 깊이 (cmds.file의 loadReferenceDepth 값)
+LOAD_REFERENCE_DEPTHS = {"all": "all", "top": "topOnly", "none": "none"}
+
+STATUS_EXPORTED = "exported"
+STATUS_EMPTY = "empty"
+STATUS_FAILED = "failed"
+
+# core.PathParser._extract_version()과 같은 버전 패턴
+_VERSION_RE = re.compile(r'_v(\d+)')
+
+
+def find_scene_files(paths):
+    """
+    파일 경로, 폴더 경로(하위 폴더 포함), 씬 목록 텍스트 파일(.txt, 한 줄에 경로 하나)에서 Maya 씬 목록을 수집합니다.
+
+    :param paths: 경로 리스트
+    :return: 씬 파일 경로 리스트 (중복 제거, 입력 순서 유지)
+    :rtype: list
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(SCENE_EXTENSIONS))
+        elif path.endswith(".txt"):
+            with open(path, 'r') as f:
+                files.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+        else:
+            files.append(path)
+    return list(dict.fromkeys(os.path.normpath(f) for f in files))
+
+
+def parse_scene_path(scene_path):
+    """씬 경로를 PathParser(에셋 경로이면 AssetPath)로 분석합니다. Windows 경로 구분자도 처리합니다."""
+    return PathParser.create(scene_path.replace("\\", "/"))
+
+
+def build_output_path(scene_path, output_root, extension=".json"):
+    """
+    씬 경로의 PathParser 필드로 쉐이더 맵 저장 경로를 만듭니다.
+
+    에셋 경로이면 '<output_root>/<에셋 타입>/<에셋 이름>/<에셋 이름>_v###<확장자>' (버전이 없으면 '_v###' 생략),
+    아니면 '<output_root>/<씬 파일명><확장자>'입니다.
+
+    :param scene_path: 씬 파일 경로
+    :param output_root: 쉐이더 맵 루트 폴더
+    :param extension: '.json', '.json.gz', '.json.xz' 중 하나
+    :rtype: str
+    """
+    parsed = parse_scene_path(scene_path)
+    if isinstance(parsed, AssetPath) and parsed.asset_type and parsed.asset_name:
+        file_name = parsed.asset_name
+        if parsed.version is not None:
+            file_name = "{}_{}".format(file_name, parsed.get_version_str())
+        return os.path.join(output_root, parsed.asset_type, parsed.asset_name, file_name + extension)
+    return os.path.join(output_root, parsed.stem + extension)
+
+
+def is_up_to_date(scene_path, output_path):
+    """쉐이더 맵 파일이 있고, 수정 시간이 씬 파일보다 같거나 늦으면 True를 반환합니다."""
+    try:
+        return os.stat(output_path).st_mtime >= os.stat(scene_path).st_mtime
+    except OSError:
+        return False
+
+
+def filter_scenes(scene_paths, task=None, status=None, latest_only=False):
+    """
+    PathParser 필드로 씬 목록을 거릅니다.
+
+    :param task: 태스크 폴더 이름 (예: 'lookdev', None이면 거르지 않음)
+    :param status: 상태 폴더 이름 (예: 'pub', None이면 거르지 않음)
+    :param latest_only: 같은 출력 대상(에셋 또는 버전을 제외한 파일명)에서 가장 높은 버전의 씬만 남김
+    :rtype: list
+    """
+    selected = []
+    for scene_path in scene_paths:
+        parsed = parse_scene_path(scene_path)
+        if task is not None and parsed.task != task:
+            continue
+        if status is not None and parsed.status != status:
+            continue
+        selected.append((scene_path, parsed))
+
+    if not latest_only:
+        return [scene_path for scene_path, _ in selected]
+
+    latest = {}
+    for scene_path, parsed in selected:
+        if isinstance(parsed, AssetPath) and parsed.asset_name:
+            key = (parsed.asset_type, parsed.asset_name)
+        else:
+            key = (None, _VERSION_RE.sub("", parsed.stem, count=1))
+        version = parsed.version if parsed.version is not None else -1
+        if key not in latest or version > latest[key][0]:
+            latest[key] = (version, scene_path)
+    keep = {scene_path for _, scene_path in latest.values()}
+    return [scene_path for scene_path, _ in selected if scene_path in keep]
+
+
+def plan_exports(scene_paths, output_root, extension=".json", force=False):
+    """
+    씬별 출력 경로를 정하고, 최신인 쉐이더 맵은 건너뛰도록 작업 목록을 만듭니다. (Maya 없이 동작합니다.)
+
+    :return: [{'scene', 'output', 'up_to_date', 'duplicate_of'}] 리스트
+             duplicate_of는 출력 경로가 같은 앞의 씬 경로입니다. (해당 작업은 실행하지 않습니다.)
+    :rtype: list
+    """
+    jobs = []
+    owners = {}
+    for scene_path in scene_paths:
+        output_path = build_output_path(scene_path, output_root, extension)
+        job = {"scene": scene_path, "output": output_path, "up_to_date": False,
+               "duplicate_of": owners.get(output_path)}
+        if job["duplicate_of"] is None:
+            owners[output_path] = scene_path
+            job["up_to_date"] = not force and is_up_to_date(scene_path, output_path)
+        jobs.append(job)
+    return jobs
+
+
+def init_standalone_worker():
+    """작업 프로세스에서 maya.standalone을 한 번 초기화하고, 프로세스가 끝날 때 정리하도록 등록합니다."""
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    atexit.register(maya.standalone.uninitialize)
+
+
+def write_shader_map_atomic(output_path, shader_map, version):
+    """쉐이더 맵을 같은 폴더의 숨김 임시 파일에 쓴 뒤 교체합니다. (확장자는 압축 방식 판단을 위해 유지)"""
+    directory, file_name = os.path.split(output_path)
+    os.makedirs(directory, exist_ok=True)
+    extension = next((ext for ext in sorted(shader_map_format.SHADER_MAP_EXTENSIONS, key=len, reverse=True)
+                      if file_name.endswith(ext)), os.path.splitext(file_name)[1])
+    tmp_path = os.path.join(directory, ".{}.{}.tmp{}".format(file_name[:-len(extension)], os.getpid(), extension))
+    try:
+        shader_map_format.write_shader_map(tmp_path, shader_map, version)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def export_scene(scene_path, output_path, version=shader_map_format.LATEST_VERSION, load_references="top"):
+    """
+    씬 하나를 열어 씬 전체 지오메트리의 쉐이더 맵을 저장합니다. 작업 프로세스에서 실행됩니다.
+
+    :param scene_path: 씬 파일 경로
+    :param output_path: 쉐이더 맵 저장 경로
+    :param version: 쉐이더 맵 포맷 버전
+    :param load_references: 'all', 'top'(최상위 레퍼런스만), 'none'
+    :return: {'scene', 'output', 'status', 'objects', 'elapsed', 'error'} 딕셔너리
+    :rtype: dict
+    """
+    import maya.cmds as cmds
+    import export_shader_map_to_json as exporter
+
+    result = {"scene": scene_path, "output": output_path, "status": STATUS_FAILED, "objects": 0,
+              "elapsed": 0.0, "error": None}
+    started = time.perf_counter()
+    try:
+        cmds.file(scene_path, open=True, force=True, prompt=False,
+                  loadReferenceDepth=LOAD_REFERENCE_DEPTHS[load_references])
+        shader_map = exporter.collect_shader_map(exporter.get_target_shapes(exporter.SCOPE_SCENE))
+        result["objects"] = len(shader_map)
+        if shader_map:
+            write_shader_map_atomic(output_path, shader_map, version)
+            result["status"] = STATUS_EXPORTED
+        else:
+            result["status"] = STATUS_EMPTY
+    except Exception as e:
+        result["error"] = "{}: {}".format(type(e).__name__, e)
+    finally:
+        try:
+            cmds.file(new=True, force=True)
+        except Exception:
+            pass
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def export_shader_maps(jobs, workers=DEFAULT_WORKERS, version=shader_map_format.LATEST_VERSION,
+                       load_references="top", initializer=init_standalone_worker, initargs=()):
+    """
+    작업 목록의 씬들을 작업 프로세스 풀에서 익스포트하고, 끝나는 순서대로 결과를 반환하는 제너레이터입니다.
+
+    Maya는 fork 후 동작을 보장하지 않으므로 작업 프로세스는 spawn으로 시작합니다. (mayapy로 실행하면 작업 프로세스도 mayapy)
+    작업 프로세스가 비정상 종료되면(BrokenProcessPool) 남은 작업은 실패로 반환합니다.
+
+    :param jobs: plan_exports()의 결과 중 실행할 작업 리스트
+    :param workers: 작업 프로세스 개수 (1 이하이면 현재 프로세스에서 차례로 실행)
+    :param initializer: 작업 프로세스 초기화 함수 (기본: maya.standalone 초기화)
+    :return: export_scene() 결과 딕셔너리 제너레이터
+    """
+    if not jobs:
+        return
+    if workers <= 1:
+        initializer(*initargs)
+        for job in jobs:
+            yield export_scene(job["scene"], job["output"], version, load_references)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=context,
+                                                initializer=initializer, initargs=initargs) as executor:
+        futures = {executor.submit(export_scene, job["scene"], job["output"], version, load_references): job
+                   for job in jobs}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                job = futures[future]
+                yield {"scene": job["scene"], "output": job["output"], "status": STATUS_FAILED, "objects": 0,
+                       "elapsed": 0.0, "error": "{}: {}".format(type(e).__name__, e)}
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Batch shader map export with a pool of maya.standalone workers")
+    parser.add_argument("paths", nargs="+", help="Scene files, directories, or .txt scene lists")
+    parser.add_argument("--output_root", required=True, help="Shader map library root")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of mayapy worker processes")
+    parser.add_argument("--task", default=None, help="Only scenes in this task folder (e.g. lookdev)")
+    parser.add_argument("--status", default=None, help="Only scenes in this status folder (e.g. pub)")
+    parser.add_argument("--latest_only", action="store_true", help="Only the highest version per asset")
+    parser.add_argument("--extension", default=".json", choices=shader_map_format.SHADER_MAP_EXTENSIONS)
+    parser.add_argument("--format_version", type=int, default=shader_map_format.LATEST_VERSION,
+                        choices=shader_map_format.SUPPORTED_VERSIONS)
+    parser.add_argument("--load_references", default="top", choices=sorted(LOAD_REFERENCE_DEPTHS),
+                        help="Reference depth to load when opening scenes")
+    parser.add_argument("--force", action="store_true", help="Export even if the shader map is up to date")
+    parser.add_argument("--dry_run", action="store_true", help="Only print the export plan")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    opts = parse_args(sys.argv[1:] if args is None else args)
+    log = core_log.get_logger(__name__, LOG_FILE_PATH)
+
+    scenes = filter_scenes(find_scene_files(opts.paths), opts.task, opts.status, opts.latest_only)
+    if not scenes:
+        log.warning("익스포트할 씬이 없습니다: %s", opts.paths)
+        return 1
+
+    jobs = plan_exports(scenes, opts.output_root, opts.extension, opts.force)
+    pending = [job for job in jobs if not job["up_to_date"] and job["duplicate_of"] is None]
+    for job in jobs:
+        if job["duplicate_of"] is not None:
+            log.warning("[SKIP] %s: 출력 경로가 %s와 같습니다. (%s)", job["scene"], job["duplicate_of"], job["output"])
+        elif job["up_to_date"]:
+            log.debug("[UP TO DATE] %s", job["output"])
+        elif opts.dry_run:
+            log.info("[PLAN] %s -> %s", job["scene"], job["output"])
+    log.info("%d개 씬 중 %d개 익스포트, %d개 최신", len(jobs), len(pending),
+             sum(1 for job in jobs if job["up_to_date"]))
+    if opts.dry_run or not pending:
+        return 0
+
+    started = time.perf_counter()
+    counts = {}
+    for result in export_shader_maps(pending, opts.workers, opts.format_version, opts.load_references):
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+        if result["status"] == STATUS_FAILED:
+            log.error("[FAILED] %s: %s", result["scene"], result["error"])
+        elif result["status"] == STATUS_EMPTY:
+            log.warning("[EMPTY] %s: 추출할 쉐이더 정보가 없습니다.", result["scene"])
+        else:
+            log.info("[EXPORTED] %s (%d objects, %.1fs)", result["output"], result["objects"], result["elapsed"])
+
+    log.info("완료: %s, %.1fs", ", ".join("{} {}".format(k, v) for k, v in sorted(counts.items())),
+             time.perf_counter() - started)
+    return 1 if counts.get(STATUS_FAILED) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,102 +1,196 @@
 import maya.cmds as cmds
-import json
 import os
 
-def export_shader_map_to_json(file_name="shader_map_data.json"):
+import shader_map_format
+
+SCOPE_SELECTION = "selection"
+SCOPE_SCENE = "scene"
+
+
+def _base_name(name):
+    """DAG 경로와 네임스페이스를 제거한 이름을 반환합니다. (예: '|grp|ns:pCube1' -> 'pCube1')"""
+    return name.split('|')[-1].split(':')[-1]
+
+
+def build_sg_membership_index():
     """
-    선택된 지오메트리에 할당된 쉐이더 정보를 JSON 파일로 저장합니다.
+    씬의 모든 쉐이딩 그룹 멤버를 한 번씩만 조회하여, 멤버 이름 기준의 역색인(inverted index)을 만듭니다.
 
-    [주요 기능]
-    - 오브젝트 단위, 페이스 단위의 쉐이더 할당 정보를 모두 추출합니다.
-    - 네임스페이스를 제거하여 레퍼런스 환경에서도 동일한 키를 유지합니다.
-    - JSON 파일은 현재 Maya 씬 파일과 동일한 경로에 생성됩니다.
+    쉐이프마다 연결된 SG의 전체 멤버 목록을 다시 조회하고 필터링하는 대신,
+    SG당 한 번의 cmds.sets 호출로 모든 쉐이프의 할당 정보를 수집합니다.
 
-    [사용법]
-    1. 쉐이더 정보를 추출할 지오메트리(트랜스폼 노드)를 선택합니다.
-    2. export_shader_map_to_json("my_asset_shaders.json") 형식으로 실행합니다.
-       파일명을 생략하면 "shader_map_data.json"으로 저장됩니다.
+    :return: {네임스페이스를 제거한 멤버 이름: {SG 이름: [컴포넌트 문자열 또는 None]}}
+             None은 오브젝트 전체 할당, 'f[0:9]' 같은 문자열은 컴포넌트 할당을 의미합니다.
+    :rtype: dict
     """
-    scene_path = cmds.file(query=True, sceneName=True)
-    if not scene_path:
-        save_dir = cmds.workspace(query=True, directory=True)
-        cmds.warning("씬 파일이 저장되지 않았습니다. 워크스페이스 경로에 저장합니다: {}".format(save_dir))
+    index = {}
+    for sg in cmds.ls(type='shadingEngine') or []:
+        for member in cmds.sets(sg, query=True) or []:
+            # 'ns:pCube1.f[0:9]'처럼 컴포넌트에도 ':'가 있으므로, 노드 이름 부분에서만 네임스페이스를 제거합니다.
+            node_part, _, component_part = member.partition('.')
+            member_key = _base_name(node_part)
+            index.setdefault(member_key, {}).setdefault(sg, []).append(component_part or None)
+    return index
+
+
+def get_target_shapes(scope=SCOPE_SELECTION):
+    """
+    쉐이더 정보를 추출할 트랜스폼과 그 쉐이프(intermediate 제외)를 수집합니다.
+
+    :param scope: 'selection'이면 선택된 트랜스폼, 'scene'이면 씬의 모든 지오메트리 트랜스폼
+    :return: [(트랜스폼 전체 경로, [쉐이프 전체 경로])] 리스트 (트랜스폼 순서 유지)
+    :rtype: list
+    """
+    if scope == SCOPE_SCENE:
+        shapes = cmds.ls(type='geometryShape', long=True, noIntermediate=True) or []
+        transforms = sorted({shape.rsplit('|', 1)[0] for shape in shapes})
+    elif scope == SCOPE_SELECTION:
+        transforms = cmds.ls(selection=True, type='transform', long=True) or []
+        if not transforms:
+            return []
+        # 선택된 트랜스폼 아래의 쉐이프를 한 번에 가져온 뒤, 직계 쉐이프만 남깁니다.
+        shapes = cmds.ls(transforms, dag=True, shapes=True, long=True, noIntermediate=True) or []
     else:
-        save_dir = os.path.dirname(scene_path)
+        raise ValueError("알 수 없는 scope 입니다: {}".format(scope))
 
-    json_path = os.path.join(save_dir, file_name)
+    shapes_by_transform = {transform: [] for transform in transforms}
+    for shape in shapes:
+        parent = shape.rsplit('|', 1)[0]
+        if parent in shapes_by_transform and shape not in shapes_by_transform[parent]:
+            shapes_by_transform[parent].append(shape)
+    return [(transform, shapes_by_transform[transform]) for transform in transforms]
 
-    selection = cmds.ls(selection=True, type='transform')
-    if not selection:
-        cmds.error("지오메트리 트랜스폼 노드를 하나 이상 선택해야 합니다.")
-        return
 
-    shader_mapping_dict = {}
-    print("선택된 오브젝트로부터 쉐이더 정보 추출을 시작합니다...")
+def get_connected_shading_engines(shapes):
+    """
+    쉐이프에 연결된 쉐이딩 그룹을 한 번의 cmds.listConnections 호출로 조회합니다.
 
-    for node_path in selection:
-        short_name_with_ns = node_path.split('|')[-1]
-        object_key = short_name_with_ns.split(':')[-1]
+    :param shapes: 쉐이프 전체 경로 리스트
+    :return: {쉐이프 전체 경로: set(SG 이름)}
+    :rtype: dict
+    """
+    connected = {shape: set() for shape in shapes}
+    if not shapes:
+        return connected
+
+    # listConnections의 플러그 이름은 '고유한 최소 경로'를 사용하므로, 전체 경로의 모든 접미 경로로 찾습니다.
+    by_suffix = {}
+    for shape in shapes:
+        parts = shape.lstrip('|').split('|')
+        for i in range(len(parts)):
+            suffix = '|'.join(parts[i:])
+            by_suffix.setdefault(suffix, set()).add(shape)
+
+    pairs = cmds.listConnections(shapes, type='shadingEngine', destination=True, source=False,
+                                 connections=True) or []
+    for plug, sg in zip(pairs[0::2], pairs[1::2]):
+        candidates = by_suffix.get(plug.split('.', 1)[0].lstrip('|'), ())
+        if len(candidates) == 1:
+            connected[next(iter(candidates))].add(sg)
+    return connected
+
+
+def collect_shader_map(targets, index=None):
+    """
+    트랜스폼별 쉐이더 할당 정보를 수집합니다.
 
-        shader_info_list = []
+    :param targets: get_target_shapes()의 결과
+    :param index: build_sg_membership_index()의 결과 (None이면 새로 만듭니다.)
+    :return: {오브젝트 키: [{'sg_name': ..., 'members': [...]}]} 딕셔너리
+    :rtype: dict
+    """
+    if index is None:
+        index = build_sg_membership_index()
+    connected = get_connected_shading_engines([shape for _, shapes in targets for shape in shapes])
 
-        all_shapes = cmds.listRelatives(node_path, shapes=True, fullPath=True) or []
-        shapes = [s for s in all_shapes if not cmds.getAttr("{}.intermediateObject".format(s))]
+    shader_mapping_dict = {}
+    for node_path, shapes in targets:
+        object_key = _base_name(node_path)
 
         if not shapes:
             print("경고: '{}'에서 유효한 쉐이프 노드를 찾을 수 없습니다.".format(node_path))
             continue
 
+        object_assignments = index.get(object_key, {})
+        shader_info_list = []
         for shape_node in shapes:
-            short_shape_name = shape_node.split('|')[-1].split(':')[-1]
-
-            connected_sgs = cmds.listConnections(shape_node, type='shadingEngine', destination=True, source=False)
-            if not connected_sgs:
-                continue
-            
-            connected_sgs = sorted(list(set(connected_sgs)))
-
-            for full_sg_name in connected_sgs:
-                sg_name = full_sg_name.split(':')[-1]
-
-                sg_members = cmds.sets(full_sg_name, query=True)
-                if not sg_members:
-                    continue
-
-                filtered_members = []
-                for member in sg_members:
-                    base_member_name = member.split('|')[-1].split(':')[-1]
-
-                    if '.' in base_member_name:
-                        component_base = base_member_name.split('.')[0]
-                        if component_base == object_key or component_base == short_shape_name:
-                            component_part = base_member_name.split('.', 1)[1]
-                            filtered_members.append("{}.{}".format(short_shape_name, component_part))
-                    
-                    elif base_member_name == object_key or base_member_name == short_shape_name:
-                        filtered_members.append(short_shape_name)
+            short_shape_name = _base_name(shape_node)
+            shape_assignments = index.get(short_shape_name, {})
+
+            for full_sg_name in sorted(connected[shape_node]):
+                filtered_members = set()
+                for assignments in (object_assignments, shape_assignments):
+                    for component_part in assignments.get(full_sg_name, ()):
+                        if component_part is None:
+                            filtered_members.add(short_shape_name)
+                        else:
+                            filtered_members.add("{}.{}".format(short_shape_name, component_part))
 
                 if filtered_members:
                     shader_info_list.append({
-                        "sg_name": sg_name,
-                        "members": sorted(list(set(filtered_members)))
+                        "sg_name": full_sg_name.split(':')[-1],
+                        "members": sorted(filtered_members)
                     })
 
         if shader_info_list:
+            if object_key in shader_mapping_dict:
+                print("경고: 이름이 같은 오브젝트가 여러 개 있습니다. '{}'의 정보를 덮어씁니다.".format(node_path))
             shader_mapping_dict[object_key] = shader_info_list
-            print(" > '{}'의 쉐이더 정보 처리 완료.".format(object_key))
+    return shader_mapping_dict
+
+
+def export_shader_map_to_json(file_name="shader_map_data.json", scope=SCOPE_SELECTION,
+                              version=shader_map_format.LATEST_VERSION):
+    """
+    선택된(또는 씬 전체의) 지오메트리에 할당된 쉐이더 정보를 JSON 파일로 저장합니다.
+
+    [주요 기능]
+    - 오브젝트 단위, 페이스 단위의 쉐이더 할당 정보를 모두 추출합니다.
+    - 네임스페이스를 제거하여 레퍼런스 환경에서도 동일한 키를 유지합니다.
+    - JSON 파일은 현재 Maya 씬 파일과 동일한 경로에 생성됩니다.
+    - 모든 쉐이딩 그룹의 멤버를 한 번씩만 조회하는 역색인을 사용하므로, 쉐이프와 SG가 많은 에셋에서도 빠릅니다.
+    - 기본으로 v2 포맷(JSON Lines, 페이스 범위 병합, 이름 사전 인코딩)으로 저장합니다.
+      파일명이 '.json.gz' / '.json.xz'로 끝나면 압축하여 저장합니다. (shader_map_format 참고)
+
+    [사용법]
+    1. 쉐이더 정보를 추출할 지오메트리(트랜스폼 노드)를 선택합니다.
+    2. export_shader_map_to_json("my_asset_shaders.json") 형식으로 실행합니다.
+       파일명을 생략하면 "shader_map_data.json"으로 저장됩니다.
+    3. 선택 없이 씬 전체를 추출하려면 scope="scene"을 지정합니다.
+    4. 이전 버전의 임포터에서 읽어야 하는 경우 version=1을 지정하면 기존 JSON 포맷으로 저장합니다.
+    """
+    scene_path = cmds.file(query=True, sceneName=True)
+    if not scene_path:
+        save_dir = cmds.workspace(query=True, directory=True)
+        cmds.warning("씬 파일이 저장되지 않았습니다. 워크스페이스 경로에 저장합니다: {}".format(save_dir))
+    else:
+        save_dir = os.path.dirname(scene_path)
+
+    json_path = os.path.join(save_dir, file_name)
+
+    targets = get_target_shapes(scope)
+    if not targets:
+        if scope == SCOPE_SELECTION:
+            cmds.error("지오메트리 트랜스폼 노드를 하나 이상 선택해야 합니다.")
+        else:
+            cmds.error("씬에 지오메트리가 없습니다.")
+        return
+
+    print("{}개 오브젝트로부터 쉐이더 정보 추출을 시작합니다...".format(len(targets)))
+    shader_mapping_dict = collect_shader_map(targets)
+    print(" > {}개 오브젝트의 쉐이더 정보 처리 완료.".format(len(shader_mapping_dict)))
 
     if not shader_mapping_dict:
         cmds.warning("추출할 쉐이더 정보가 없습니다.")
         return
 
     try:
-        with open(json_path, 'w') as f:
-            json.dump(shader_mapping_dict, f, indent=4, ensure_ascii=False)
-        
+        shader_map_format.write_shader_map(json_path, shader_mapping_dict, version)
+
         print("="*50)
         print("✅ JSON 쉐이더 맵 파일 생성이 완료되었습니다.")
-        print("   위치: {}".format(json_path))
+        print("   위치: {} (v{}, {:,} bytes)".format(json_path, version, os.path.getsize(json_path)))
         print("="*50)
 
     except Exception as e:
-        cmds.error("파일 저장 중 오류 발생: {}".format(e))
\ No newline at end of file
+        cmds.error("파일 저장 중 오류 발생: {}".format(e))
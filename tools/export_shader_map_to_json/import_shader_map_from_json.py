@@ -1,82 +1,530 @@
 import maya.cmds as cmds
+import concurrent.futures
 import json
 import os
+import queue
+import threading
+import time
 
-def import_shaders_from_json(map_root_directory):
+import shader_map_format
+import shader_map_library
+
+# 쉐이더 맵을 미리 읽는 스레드 개수와, 읽었지만 아직 할당하지 않은 에셋의 최대 개수
+DEFAULT_PREFETCH_WORKERS = 8
+DEFAULT_PREFETCH_QUEUE_SIZE = 16
+
+# 세션 동안 유지되는 쉐이더 맵 캐시: {JSON 경로: ((mtime_ns, size), AssignmentTemplate)}
+# importlib.reload 후에도 캐시가 유지되도록 이미 있으면 다시 만들지 않습니다.
+try:
+    _TEMPLATE_CACHE
+except NameError:
+    _TEMPLATE_CACHE = {}
+
+
+def build_assignments(shader_map, ns_prefix):
+    """
+    JSON 쉐이더 맵을 SG별 멤버 목록으로 묶습니다.
+
+    오브젝트 단위 할당을 먼저, 페이스 단위 할당을 나중에 적용하도록 두 단계로 나눕니다.
+    (오브젝트 단위 할당이 나중에 적용되면 같은 쉐이프의 페이스 할당을 덮어쓰기 때문입니다.)
+
+    :param shader_map: export_shader_map_to_json으로 저장된 딕셔너리,
+                       또는 shader_map_format.iter_shader_map()처럼 (오브젝트 키, 쉐이더 정보 목록)을 반환하는 이터러블
+    :param ns_prefix: 레퍼런스 네임스페이스 접두사 (예: 'bag01:')
+    :return: [{SG 이름: [멤버]}(오브젝트 단위), {SG 이름: [멤버]}(페이스 단위)]
+    :rtype: list
+    """
+    object_level = {}
+    component_level = {}
+    records = shader_map.items() if isinstance(shader_map, dict) else shader_map
+    for _, info_list in records:
+        for info in info_list:
+            full_sg = "{}{}".format(ns_prefix, info['sg_name'])
+            for member in info['members']:
+                target = component_level if '.' in member else object_level
+                target.setdefault(full_sg, []).append("{}{}".format(ns_prefix, member))
+    return [object_level, component_level]
+
+
+class AssignmentTemplate:
+    """
+    네임스페이스가 없는 상태로 미리 계산한 에셋의 할당 계획입니다.
+    같은 에셋의 레퍼런스가 여러 개여도 JSON 파싱과 SG별 그룹화는 한 번만 하고,
+    레퍼런스마다 bind()로 네임스페이스 접두사만 붙여 사용합니다.
+    """
+    __slots__ = ("steps", "node_names", "shapes_by_object")
+
+    def __init__(self, shader_map):
+        """
+        :param shader_map: 쉐이더 맵 딕셔너리 또는 (오브젝트 키, 쉐이더 정보 목록) 이터러블 (build_assignments() 참고)
+        """
+        records = shader_map.items() if isinstance(shader_map, dict) else shader_map
+        # 오브젝트 키(트랜스폼 이름) -> 쉐이프 이름 (쉐이프가 하나인 오브젝트만)
+        # Maya는 페이스 멤버를 트랜스폼 이름으로 반환하므로, 현재 할당과 비교할 때 사용합니다.
+        self.shapes_by_object = {}
+
+        def capture_shapes():
+            for object_key, info_list in records:
+                shapes = {member.split('.', 1)[0] for info in info_list for member in info['members']}
+                if len(shapes) == 1:
+                    self.shapes_by_object[object_key] = shapes.pop()
+                yield object_key, info_list
+
+        self.steps = [[(sg, tuple(members)) for sg, members in step.items()]
+                      for step in build_assignments(capture_shapes(), "")]
+        node_names = set()
+        for step in self.steps:
+            for sg, members in step:
+                node_names.add(sg)
+                node_names.update(member.split('.', 1)[0] for member in members)
+        self.node_names = sorted(node_names)
+
+    def bind(self, ns_prefix):
+        """
+        네임스페이스 접두사를 붙인 할당 계획을 반환합니다.
+
+        :param ns_prefix: 레퍼런스 네임스페이스 접두사 (예: 'bag01:')
+        :return: (build_assignments()와 같은 형식의 리스트, 존재 여부를 확인할 노드 이름 리스트)
+        :rtype: tuple
+        """
+        steps = [{ns_prefix + sg: [ns_prefix + m for m in members] for sg, members in step}
+                 for step in self.steps]
+        return steps, [ns_prefix + name for name in self.node_names]
+
+    def bind_shapes(self, ns_prefix):
+        """네임스페이스 접두사를 붙인 {트랜스폼 이름: 쉐이프 이름} 딕셔너리를 반환합니다."""
+        return {ns_prefix + obj: ns_prefix + shape for obj, shape in self.shapes_by_object.items()}
+
+
+def load_assignment_template(json_path):
+    """
+    쉐이더 맵 파일(v1, v2)을 읽어 AssignmentTemplate을 반환합니다.
+    파일은 오브젝트 단위로 스트리밍하며 읽으므로, 파일 전체를 파싱한 딕셔너리는 만들어지지 않습니다.
+    (경로, 수정 시간, 파일 크기)가 같으면 세션 캐시에 있는 템플릿을 다시 사용합니다.
+
+    :param json_path: 쉐이더 맵 파일 경로
+    :return: (AssignmentTemplate, 캐시 사용 여부)
+    :rtype: tuple
+    """
+    stat = os.stat(json_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _TEMPLATE_CACHE.get(json_path)
+    if cached is not None and cached[0] == key:
+        return cached[1], True
+
+    template = AssignmentTemplate(shader_map_format.iter_shader_map(json_path))
+    _TEMPLATE_CACHE[json_path] = (key, template)
+    return template, False
+
+
+def clear_shader_map_cache():
+    """세션 쉐이더 맵 캐시를 비웁니다."""
+    _TEMPLATE_CACHE.clear()
+
+
+def prefetch_templates(asset_paths, workers=DEFAULT_PREFETCH_WORKERS, queue_size=DEFAULT_PREFETCH_QUEUE_SIZE):
+    """
+    에셋별 쉐이더 맵 파일 읽기를 스레드 풀에서 미리 실행하고, 준비된 순서대로 반환하는 제너레이터입니다.
+
+    스레드는 파일 I/O와 파싱만 하고 Maya 명령은 호출하지 않습니다. 읽은 결과는 크기가 제한된 큐로
+    메인 스레드에 전달되므로, 할당이 느리면 스레드가 기다려 메모리에 쌓이는 템플릿 수가 제한됩니다.
+
+    :param asset_paths: [(에셋 이름, 쉐이더 맵 파일 경로)] 리스트 (에셋 이름 중복 없음)
+    :param workers: 스레드 개수 (0이면 스레드 없이 현재 스레드에서 차례로 읽습니다.)
+    :param queue_size: 큐의 최대 크기
+    :return: (에셋 이름, 파일 경로, AssignmentTemplate (오류 시 None), 캐시 사용 여부, 예외 또는 None) 제너레이터
+    """
+    def load(asset_base_name, json_path):
+        try:
+            template, cached = load_assignment_template(json_path)
+            return asset_base_name, json_path, template, cached, None
+        except Exception as e:
+            return asset_base_name, json_path, None, False, e
+
+    if workers <= 0:
+        for asset_base_name, json_path in asset_paths:
+            yield load(asset_base_name, json_path)
+        return
+
+    results = queue.Queue(maxsize=max(1, queue_size))
+    stop = threading.Event()
+
+    def worker(asset_base_name, json_path):
+        if stop.is_set():
+            return
+        item = load(asset_base_name, json_path)
+        # 메인 스레드가 중단되면(stop) 큐가 가득 차 있어도 기다리지 않고 끝냅니다.
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    try:
+        for asset_base_name, json_path in asset_paths:
+            executor.submit(worker, asset_base_name, json_path)
+        for _ in asset_paths:
+            yield results.get()
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
+
+
+def get_existing_nodes(names):
+    """
+    주어진 노드(또는 컴포넌트의 노드) 이름 중 씬에 존재하는 이름의 집합을 반환합니다.
+    한 번의 cmds.ls 호출로 확인하고, 이름이 중복되어 ls 결과와 바로 비교할 수 없는 경우만 개별 확인합니다.
+
+    :param names: 노드 이름 리스트
+    :rtype: set
+    """
+    names = list(dict.fromkeys(names))
+    if not names:
+        return set()
+    existing = set(cmds.ls(names) or [])
+    for name in names:
+        if name not in existing and cmds.objExists(name):
+            existing.add(name)
+    return existing
+
+
+class CurrentAssignment:
+    """쉐이딩 그룹 하나에 대한 쉐이프 하나의 현재 할당 상태"""
+    __slots__ = ("whole", "ranges", "others")
+
+    def __init__(self):
+        self.whole = False   # 오브젝트 전체 할당 여부
+        self.ranges = []     # 병합된 페이스 (시작, 끝) 범위
+        self.others = set()  # 페이스가 아닌 컴포넌트 문자열
+
+    def contains(self, component):
+        """
+        컴포넌트(빈 문자열이면 오브젝트 전체)가 이미 할당되어 있는지 확인합니다.
+
+        :param component: 'f[0:9]' 형식의 컴포넌트 문자열 또는 ''
+        :rtype: bool
+        """
+        if self.whole:
+            return True
+        if not component:
+            return False
+        face_range = shader_map_format.parse_face_component(component)
+        if face_range is None:
+            return component in self.others
+        return shader_map_format.ranges_contain(self.ranges, *face_range)
+
+
+def snapshot_assignments(sg_names, shapes_by_transform=None):
+    """
+    쉐이딩 그룹의 현재 멤버를 SG당 한 번의 cmds.sets 조회로 수집합니다.
+
+    :param sg_names: 조회할 SG 이름 리스트 (존재하는 SG만 전달해야 합니다.)
+    :param shapes_by_transform: {트랜스폼 이름: 쉐이프 이름} (AssignmentTemplate.bind_shapes()의 결과)
+                                Maya는 페이스 멤버를 트랜스폼 이름으로 반환하므로 쉐이프 이름으로 바꿉니다.
+    :return: {SG 이름: {쉐이프 이름: CurrentAssignment}}
+    :rtype: dict
+    """
+    shapes_by_transform = shapes_by_transform or {}
+    snapshot = {}
+    for sg in dict.fromkeys(sg_names):
+        by_shape = snapshot.setdefault(sg, {})
+        face_ranges = {}
+        for member in cmds.sets(sg, query=True) or []:
+            node_part, _, component = member.partition('.')
+            node = node_part.split('|')[-1]
+            node = shapes_by_transform.get(node, node)
+            state = by_shape.get(node)
+            if state is None:
+                state = by_shape[node] = CurrentAssignment()
+            if not component:
+                state.whole = True
+                continue
+            face_range = shader_map_format.parse_face_component(component)
+            if face_range is None:
+                state.others.add(component)
+            else:
+                face_ranges.setdefault(node, []).append(face_range)
+        for node, ranges in face_ranges.items():
+            by_shape[node].ranges = shader_map_format.merge_face_ranges(ranges)
+    return snapshot
+
+
+def diff_assignments(assignment_steps, snapshot):
+    """
+    할당 계획에서 이미 올바르게 할당된 멤버를 제외합니다.
+
+    오브젝트 단위 할당은 같은 쉐이프의 페이스 할당을 덮어쓰므로, 오브젝트 단위로 다시 할당하는 쉐이프는
+    이후 단계의 페이스 할당도 모두 다시 적용합니다.
+
+    :param assignment_steps: build_assignments()의 결과
+    :param snapshot: snapshot_assignments()의 결과
+    :return: (변경이 필요한 멤버만 남긴 assignment_steps, 이미 올바른 멤버 수)
+    :rtype: tuple
+    """
+    changed_steps = []
+    unchanged = 0
+    reassigned_shapes = set()
+    for assignments in assignment_steps:
+        changed = {}
+        for full_sg, members in assignments.items():
+            by_shape = snapshot.get(full_sg, {})
+            for member in members:
+                node, _, component = member.partition('.')
+                state = by_shape.get(node)
+                if node not in reassigned_shapes and state is not None and state.contains(component):
+                    unchanged += 1
+                else:
+                    changed.setdefault(full_sg, []).append(member)
+        for full_sg, members in changed.items():
+            reassigned_shapes.update(m for m in members if '.' not in m)
+        changed_steps.append(changed)
+    return changed_steps, unchanged
+
+
+def apply_assignments(assignment_steps, node_names=None, existing=None):
+    """
+    SG별로 묶인 멤버를 SG당 한 번의 cmds.sets(forceElement) 호출로 할당합니다.
+    일괄 할당이 실패하면 해당 SG만 멤버별로 다시 시도하여 실패한 멤버를 찾아냅니다.
+
+    :param assignment_steps: build_assignments()의 결과
+    :param node_names: 존재 여부를 확인할 노드 이름 리스트 (None이면 assignment_steps에서 수집합니다.)
+    :param existing: 이미 확인한 get_existing_nodes()의 결과 (있으면 다시 확인하지 않습니다.)
+    :return: {'sgs': 할당한 SG 수, 'members': 할당한 멤버 수, 'missing': 건너뛴 멤버 수}
+    :rtype: dict
+    """
+    stats = {"sgs": 0, "members": 0, "missing": 0}
+    if existing is None:
+        if node_names is None:
+            node_names = set()
+            for assignments in assignment_steps:
+                for full_sg, members in assignments.items():
+                    node_names.add(full_sg)
+                    node_names.update(member.split('.', 1)[0] for member in members)
+            node_names = sorted(node_names)
+        existing = get_existing_nodes(node_names)
+
+    for assignments in assignment_steps:
+        for full_sg, members in assignments.items():
+            if full_sg not in existing:
+                cmds.warning("'{}' Shading Group을 찾을 수 없어 건너뜁니다.".format(full_sg))
+                stats["missing"] += len(members)
+                continue
+
+            valid_members = []
+            for member in members:
+                if member.split('.', 1)[0] in existing:
+                    valid_members.append(member)
+                else:
+                    cmds.warning("'{}' 멤버를 찾을 수 없어 건너뜁니다.".format(member))
+                    stats["missing"] += 1
+            if not valid_members:
+                continue
+
+            try:
+                cmds.sets(valid_members, edit=True, forceElement=full_sg)
+                stats["members"] += len(valid_members)
+            except (RuntimeError, ValueError):
+                # 잘못된 컴포넌트가 섞여 있으면 전체 호출이 실패하므로, 멤버별로 다시 할당합니다.
+                for member in valid_members:
+                    try:
+                        cmds.sets(member, edit=True, forceElement=full_sg)
+                        stats["members"] += 1
+                    except (RuntimeError, ValueError) as e:
+                        cmds.warning("'{}' 멤버 할당 실패: {}".format(member, e))
+                        stats["missing"] += 1
+            stats["sgs"] += 1
+    return stats
+
+
+def preview_assignments(assignment_steps, existing):
+    """
+    할당 계획을 실제로 적용하지 않고, 적용될 내용을 요약합니다. (드라이 런)
+
+    :param assignment_steps: build_assignments() 또는 diff_assignments()의 결과
+    :param existing: get_existing_nodes()의 결과
+    :return: (apply_assignments()와 같은 형식의 통계, {SG 이름: [할당될 멤버]})
+    :rtype: tuple
+    """
+    stats = {"sgs": 0, "members": 0, "missing": 0}
+    changes = {}
+    for assignments in assignment_steps:
+        for full_sg, members in assignments.items():
+            if full_sg not in existing:
+                stats["missing"] += len(members)
+                continue
+            valid_members = [m for m in members if m.split('.', 1)[0] in existing]
+            stats["missing"] += len(members) - len(valid_members)
+            if valid_members:
+                changes.setdefault(full_sg, []).extend(valid_members)
+                stats["members"] += len(valid_members)
+    stats["sgs"] = len(changes)
+    return stats, changes
+
+
+def import_shaders_from_json(map_root_directory, workers=DEFAULT_PREFETCH_WORKERS, incremental=False,
+                             dry_run=False, report_path=None, index_path=None):
     """
     지정된 폴더에서 레퍼런스 에셋 이름과 일치하는 JSON을 찾아 쉐이더를 가져옵니다.
 
     [주요 기능]
     - 현재 씬의 모든 레퍼런스를 순회합니다.
-    - 레퍼런스 파일명과 동일한 이름의 JSON 파일을 지정된 폴더에서 찾습니다.
+    - 레퍼런스 파일명과 동일한 이름의 JSON 파일(.json, .json.gz, .json.xz)을 지정된 폴더(하위 폴더 포함)에서 찾습니다.
+      파일명에 버전('_v003')이 있으면 이름이 정확히 같은 파일, 없으면 가장 높은 버전을 사용합니다.
+      기존 포맷(v1)과 범위 인코딩 포맷(v2)을 모두 읽습니다.
+    - 쉐이더 맵 파일 목록은 로컬에 저장되는 인덱스(shader_map_library)에서 찾으며,
+      폴더의 수정 시간이 바뀐 경우만 해당 폴더를 다시 읽습니다. 레퍼런스마다 파일을 stat하지 않습니다.
     - JSON 파일의 정보를 기반으로 쉐이더(SG)를 다시 할당합니다.
       (오브젝트 단위, 페이스 단위 할당 모두 지원)
+    - 멤버 존재 여부는 레퍼런스당 한 번의 cmds.ls로 확인하고, 할당은 SG당 한 번의 cmds.sets로 처리합니다.
+    - 전체 작업은 하나의 Undo 청크로 묶이며, 마지막에 레퍼런스별 소요 시간을 출력합니다.
+    - 파싱된 쉐이더 맵은 세션 동안 캐시되므로, 같은 에셋의 레퍼런스가 여러 개여도 JSON은 한 번만 읽습니다.
+    - 레퍼런스 정보를 먼저 모두 조회한 뒤, 쉐이더 맵은 스레드 풀에서 미리 읽습니다.
+      먼저 준비된 에셋부터 메인 스레드에서 할당하므로 파일 I/O(네트워크 지연)와 Maya 작업이 겹쳐 실행됩니다.
+    - incremental=True이면 현재 할당을 SG당 한 번씩 조회하여 쉐이더 맵과 비교하고, 달라진 멤버만 다시 할당합니다.
+      이미 올바른 멤버는 다시 할당하지 않으므로 씬이 불필요하게 변경(dirty)되지 않습니다.
+    - dry_run=True이면 아무것도 할당하지 않고, 변경될 내용만 출력하고 반환합니다.
 
     [사용법]
     1. 쉐이더 맵 JSON 파일들이 저장된 폴더 경로를 인자로 전달하여 함수를 실행합니다.
     2. 예: import_shaders_from_json("C:/my_project/assets/char/shader_maps")
+    3. 파일을 읽는 스레드 개수는 workers로 지정합니다. (0이면 스레드 없이 차례로 읽습니다.)
+    4. 룩뎁 업데이트 후 다시 가져올 때: import_shaders_from_json(path, incremental=True)
+       변경될 내용만 확인할 때: import_shaders_from_json(path, dry_run=True, report_path="C:/tmp/shader_diff.json")
+
+    :param map_root_directory: 쉐이더 맵 JSON 파일들이 저장된 폴더, 또는 폴더 리스트 (앞의 폴더가 우선)
+    :param workers: 쉐이더 맵을 미리 읽는 스레드 개수
+    :param incremental: 현재 할당과 비교하여 달라진 멤버만 할당
+    :param dry_run: 할당하지 않고 변경될 내용만 확인 (incremental 비교를 포함합니다.)
+    :param report_path: 변경 내용 리포트를 저장할 JSON 경로 (선택)
+    :param index_path: 쉐이더 맵 인덱스 저장 경로 (None이면 임시 폴더)
+    :return: incremental 또는 dry_run이면 {네임스페이스: {'asset', 'unchanged', 'missing', 'changes': {SG: [멤버]}}}
+    :rtype: dict
     """
-    print("쉐이더 가져오기를 시작합니다. 대상 폴더: {}".format(map_root_directory))
-    
+    print("쉐이더 가져오기를 시작합니다. 대상 폴더: {}{}".format(
+        map_root_directory, " (Dry Run)" if dry_run else " (Incremental)" if incremental else ""))
+    compare = incremental or dry_run
+
     all_refs = cmds.ls(type='reference')
     if not all_refs:
         cmds.warning("씬에 레퍼런스 노드가 없습니다.")
         return
 
-    imported_count = 0
+    # 1. 메인 스레드에서 모든 레퍼런스의 에셋 이름과 네임스페이스를 먼저 조회합니다.
+    refs_by_asset = {}  # {에셋 이름: [(레퍼런스 노드, 네임스페이스)]} (레퍼런스 순서 유지)
     for ref_node in all_refs:
         # sharedReferenceNode는 실제 에셋 레퍼런스가 아니므로 건너뜁니다.
         if 'sharedReferenceNode' in ref_node or '_UNKNOWN_REF_NODE_' in ref_node:
             continue
-        
+
         try:
             # 레퍼런스 파일 경로와 네임스페이스를 가져옵니다.
             ref_path = cmds.referenceQuery(ref_node, filename=True, withoutCopyNumber=True)
             ref_ns = cmds.referenceQuery(ref_node, namespace=True)
-            
-            if not ref_ns or not ref_ns.startswith(':'):
-                continue
-            ref_ns = ref_ns[1:]
+        except Exception as e:
+            cmds.warning(" '{}' 노드 처리 중 오류 발생: {}".format(ref_node, e))
+            continue
 
-            # 레퍼런스 파일명(확장자 제외)을 기반으로 JSON 파일 경로를 조합합니다.
-            asset_base_name = os.path.splitext(os.path.basename(ref_path))[0]
-            json_path = os.path.join(map_root_directory, "{}.json".format(asset_base_name))
+        if not ref_ns or not ref_ns.startswith(':'):
+            continue
+        asset_base_name = os.path.splitext(os.path.basename(ref_path))[0]
+        refs_by_asset.setdefault(asset_base_name, []).append((ref_node, ref_ns[1:]))
 
-            if not os.path.exists(json_path):
+    imported_count = 0
+    timings = [] # (에셋 이름, 네임스페이스, SG 수, 멤버 수, 건너뛴 멤버 수, 변경 없는 멤버 수, 캐시 사용 여부, 소요 시간)
+    report = {}
+    total_start = time.perf_counter()
+    wait_time = 0.0
+    # 2. 인덱스에서 에셋별 쉐이더 맵 경로를 찾습니다.
+    library = shader_map_library.ShaderMapLibrary(map_root_directory, index_path)
+    index_stats = library.refresh()
+    print("쉐이더 맵 인덱스: {}개 파일, 폴더 {}개 확인 / {}개 다시 읽음 ({:.2f}s)".format(
+        index_stats["files"], index_stats["dirs_checked"], index_stats["dirs_scanned"], index_stats["elapsed"]))
+    asset_paths = []
+    for asset_base_name in refs_by_asset:
+        json_path = library.find(asset_base_name)
+        if json_path is not None:
+            asset_paths.append((asset_base_name, json_path))
+            continue
+        parsed = shader_map_library.split_shader_map_name(asset_base_name + ".json")
+        others = library.versions(parsed[1]) if parsed and parsed[2] is not None else []
+        if others:
+            cmds.warning(" '{}' 버전의 쉐이더 맵이 없어 할당하지 않습니다. (있는 버전: {})".format(
+                asset_base_name, ", ".join("v{:03d}".format(v) for v, _ in others if v is not None)))
+
+    # 3. 쉐이더 맵은 스레드 풀에서 읽고, 준비된 에셋부터 메인 스레드에서 할당합니다.
+    prefetched = prefetch_templates(asset_paths, workers)
+    cmds.undoInfo(openChunk=True, chunkName="ImportShadersFromJson")
+    try:
+        while True:
+            wait_start = time.perf_counter()
+            item = next(prefetched, None)
+            wait_time += time.perf_counter() - wait_start
+            if item is None:
+                break
+
+            asset_base_name, json_path, template, cached, error = item
+            if error is not None:
+                cmds.warning(" '{}' 쉐이더 맵을 읽는 중 오류 발생: {} ({})".format(asset_base_name, error, json_path))
                 continue
 
-            print(" > '{}' 에셋의 쉐이더 할당을 진행합니다... (네임스페이스: {})".format(asset_base_name, ref_ns))
-            
-            with open(json_path, 'r') as f:
-                shader_map = json.load(f)
-
-            # JSON 데이터를 기반으로 쉐이더를 할당합니다.
-            for transform_short, info_list in shader_map.items():
-                ns_prefix = "{}:".format(ref_ns)
-                
-                for info in info_list:
-                    full_sg = "{}{}".format(ns_prefix, info['sg_name'])
-                    if not cmds.objExists(full_sg):
-                        cmds.warning("'{}' Shading Group을 찾을 수 없어 건너뜁니다.".format(full_sg))
-                        continue
-                    
-                    for member in info['members']:
-                        full_member_path = "{}{}".format(ns_prefix, member)
-
-                        if cmds.objExists(full_member_path):
-                            cmds.sets(full_member_path, edit=True, forceElement=full_sg)
-                        else:
-                            cmds.warning("'{}' 멤버를 찾을 수 없어 건너뜁니다.".format(full_member_path))
-            
-            print("   - '{}' 할당 완료.".format(asset_base_name))
-            imported_count += 1
+            for ref_node, ref_ns in refs_by_asset[asset_base_name]:
+                try:
+                    print(" > '{}' 에셋의 쉐이더 할당을 진행합니다... (네임스페이스: {})".format(asset_base_name, ref_ns))
+                    ref_start = time.perf_counter()
+
+                    # 캐시된 템플릿에 네임스페이스를 붙여 SG별로 한 번에 할당합니다.
+                    ns_prefix = "{}:".format(ref_ns)
+                    assignment_steps, node_names = template.bind(ns_prefix)
+                    existing = get_existing_nodes(node_names)
+                    unchanged = 0
+                    if compare:
+                        # 현재 할당을 SG당 한 번씩 조회하여, 달라진 멤버만 남깁니다.
+                        sgs = [sg for assignments in assignment_steps for sg in assignments if sg in existing]
+                        snapshot = snapshot_assignments(sgs, template.bind_shapes(ns_prefix))
+                        assignment_steps, unchanged = diff_assignments(assignment_steps, snapshot)
+                        stats, changes = preview_assignments(assignment_steps, existing)
+                        report[ref_ns] = {"asset": asset_base_name, "unchanged": unchanged,
+                                          "missing": stats["missing"], "changes": changes}
+
+                    if dry_run:
+                        for full_sg, members in changes.items():
+                            print("   - {} <- {}개 멤버 (예: {})".format(full_sg, len(members), ", ".join(members[:3])))
+                    else:
+                        stats = apply_assignments(assignment_steps, existing=existing)
+
+                    elapsed = time.perf_counter() - ref_start
+                    timings.append((asset_base_name, ref_ns, stats["sgs"], stats["members"], stats["missing"],
+                                    unchanged, cached, elapsed))
+                    print("   - '{}' {} 완료. ({:.2f}s)".format(asset_base_name, "확인" if dry_run else "할당", elapsed))
+                    imported_count += 1
+                    # 같은 에셋의 두 번째 레퍼런스부터는 캐시된 템플릿을 사용한 것입니다.
+                    cached = True
+
+                except Exception as e:
+                    cmds.warning(" '{}' 노드 처리 중 오류 발생: {}".format(ref_node, e))
+    finally:
+        prefetched.close()
+        cmds.undoInfo(closeChunk=True)
 
-        except Exception as e:
-            cmds.warning(" '{}' 노드 처리 중 오류 발생: {}".format(ref_node, e))
-        
     print("="*50)
     if imported_count > 0:
-        print("✅ 총 {}개의 레퍼런스 에셋에 대한 쉐이더 할당을 완료했습니다.".format(imported_count))
+        print("✅ 총 {}개의 레퍼런스 에셋에 대한 쉐이더 {}을 완료했습니다. ({:.2f}s, 쉐이더 맵 대기 {:.2f}s)".format(
+            imported_count, "변경 확인(Dry Run)" if dry_run else "할당", time.perf_counter() - total_start, wait_time))
+        print("{:<30} {:<20} {:>5} {:>8} {:>8} {:>9} {:>6} {:>8}".format(
+            "Asset", "Namespace", "SGs", "Members", "Skipped", "Unchanged", "Cache", "Time(s)"))
+        for asset_base_name, ref_ns, sg_count, member_count, missing_count, unchanged, cached, elapsed in sorted(
+                timings, key=lambda t: t[-1], reverse=True):
+            print("{:<30} {:<20} {:>5} {:>8} {:>8} {:>9} {:>6} {:>8.2f}".format(
+                asset_base_name, ref_ns, sg_count, member_count, missing_count, unchanged,
+                "hit" if cached else "miss", elapsed))
     else:
         print("ℹ️ 할당할 쉐이더 정보가 있는 에셋을 찾지 못했습니다.")
-    print("="*50)
\ No newline at end of file
+    print("="*50)
+
+    if compare and report_path:
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=4, ensure_ascii=False)
+        print("변경 내용 리포트 저장: {}".format(report_path))
+    return report if compare else None
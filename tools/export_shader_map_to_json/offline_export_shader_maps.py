@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""
+Maya 없이 .ma 파일에서 쉐이더 할당 정보를 추출하는 모듈입니다.
+
+Maya ASCII 파일의 쉐이더 할당은 다음 명령문으로 저장됩니다.
+    오브젝트 전체 할당: connectAttr "pCubeShape1.iog" "lambert2SG.dsm" -na;
+    페이스 할당:       setAttr ".iog[0].og[1].gcl" -type "componentList" 2 "f[0:79]" "f[120:139]";  (쉐이프 노드)
+                       connectAttr "pCylinderShape1.iog.og[1]" "metalSG.dsm" -na;
+core.ma_parser로 파일을 스트리밍으로 읽어 이 명령문만 해석하고, export_shader_map_to_json이 씬 전체(scope="scene")를
+추출한 것과 같은 구조의 쉐이더 맵을 만듭니다. 메쉬 정점 데이터 같은 대용량 setAttr은 토큰을 만들지 않고 건너뜁니다.
+
+출력 경로와 건너뛰기 규칙은 batch_export_shader_maps와 같습니다. (PathParser 필드 기준 경로, 씬보다 최신이면 건너뛰기)
+여러 파일은 프로세스 풀에서 병렬로 처리하므로, Maya 라이선스가 없는 리눅스 머신에서도 쉐이더 맵을 다시 만들 수 있습니다.
+
+[Maya가 필요한 경우 (needs_maya)]
+    .mb 파일, 그리고 레퍼런스된 노드에 할당된 쉐이더(connectAttr "modelRN.phl[3]" "SG.dsm")는 할당 대상이
+    레퍼런스 편집(reference edits)에 저장되므로 해석하지 않습니다. 이런 씬은 쉐이더 맵을 쓰지 않고
+    --needs_maya_list로 목록을 저장하여 batch_export_shader_maps로 처리할 수 있습니다.
+
+[실행 방법] (저장소 루트에서)
+    PYTHONPATH=. python tools/export_shader_map_to_json/offline_export_shader_maps.py /show/PROJ/assets \\
+        --output_root /show/PROJ/lookdev/shader_maps --task lookdev --status pub --latest_only --workers 16 \\
+        --needs_maya_list /tmp/needs_maya.txt
+"""
+import argparse
+import concurrent.futures
+import os
+import re
+import sys
+import time
+
+from core import log as core_log
+from core import ma_parser
+
+import batch_export_shader_maps as batch
+import shader_map_format
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+LOG_FILE_PATH = os.path.join(script_dir, 'offline_export_shader_maps.log')
+
+STATUS_NEEDS_MAYA = "needs_maya"
+
+# export_shader_map_to_json이 cmds.ls(type='geometryShape')로 찾는 쉐이프 중 .ma에서 해석하는 타입
+GEOMETRY_SHAPE_TYPES = {"mesh", "nurbsSurface", "nurbsCurve", "subdiv"}
+# .ma 파일에서 createNode 없이 사용되는 기본 쉐이딩 그룹
+DEFAULT_SHADING_GROUPS = {"initialShadingGroup", "initialParticleSE"}
+
+EXTRACT_COMMANDS = {"createNode", "rename", "select", "setAttr", "connectAttr", "file"}
+EXTRACT_MAX_TOKENS = 8
+# componentList setAttr만 끝까지 읽을 때의 최대 토큰 수
+COMPONENT_LIST_MAX_TOKENS = 1 << 20
+
+# 'iog', 'iog[0]', 'iog.og[2]', 'iog[0].og[2]' (긴 이름 포함) -> (인스턴스 번호, 오브젝트 그룹 번호 또는 None)
+_IOG_RE = re.compile(r'^(?:iog|instObjGroups)(?:\[(\d+)\])?(?:\.(?:og|objectGroups)\[(\d+)\])?$')
+_GCL_RE = re.compile(r'^\.(?:iog|instObjGroups)(?:\[(\d+)\])?\.(?:og|objectGroups)\[(\d+)\]\.(?:gcl|objectGrpCompList)$')
+_DSM_RE = re.compile(r'^(?:dsm|dagSetMembers)(?:\[\d+\])?$')
+_PLACEHOLDER_RE = re.compile(r'^(?:phl|placeHolderList)\[\d+\]$')
+
+
+def _extend_component_list(command, tokens):
+    """componentList를 저장하는 setAttr만 토큰 개수 제한을 늘립니다."""
+    if command == "setAttr" and '"componentList"' in tokens:
+        return COMPONENT_LIST_MAX_TOKENS
+    return None
+
+
+def _base_name(name):
+    """DAG 경로와 네임스페이스를 제거한 이름을 반환합니다. (export_shader_map_to_json._base_name과 같은 규칙)"""
+    return name.split('|')[-1].split(':')[-1]
+
+
+def _split_plug(plug):
+    """'|grp|node.attr[0].sub' -> ('|grp|node', 'attr[0].sub')"""
+    node, _, attr = plug.lstrip(':').partition('.')
+    return node, attr
+
+
+def scan_shader_assignments(source, chunk_size=ma_parser.DEFAULT_CHUNK_SIZE):
+    """
+    .ma 파일을 한 번 훑어 쉐이프별 쉐이더 할당 정보를 수집합니다.
+
+    :param source: .ma 파일 경로 또는 파일 객체
+    :return: (MaScene, {쉐이프 MaNode: {SG 이름: set(멤버)}}, 해석하지 못한 SG 연결 수)
+    :rtype: tuple
+    """
+    scene = ma_parser.MaScene(source if isinstance(source, str) else None)
+    current = None
+    components = {}     # (쉐이프 MaNode, 인스턴스, 오브젝트 그룹) -> [컴포넌트]
+    connections = []    # (쉐이프 이름, 인스턴스, 오브젝트 그룹 또는 None(오브젝트 전체), SG 이름)
+    unresolved = 0
+
+    for statement in ma_parser.iter_statements(source, commands=EXTRACT_COMMANDS, max_tokens=EXTRACT_MAX_TOKENS,
+                                               chunk_size=chunk_size, extend_limit=_extend_component_list):
+        command = statement.command
+        if command == "setAttr":
+            if current is None:
+                continue
+            flags, args = statement.parse()
+            if not args:
+                continue
+            if args[0] in (".io", ".intermediateObject"):
+                current.attrs["intermediateObject"] = len(args) > 1 and args[1] in ("1", "yes", "on", "true")
+                continue
+            match = _GCL_RE.match(args[0])
+            if match and flags.get("type") == ["componentList"] and not statement.truncated:
+                key = (current, int(match.group(1) or 0), int(match.group(2)))
+                components[key] = args[2:]
+        elif command == "connectAttr":
+            _flags, args = statement.parse()
+            if len(args) < 2:
+                continue
+            src_node, src_attr = _split_plug(args[0])
+            dst_node, dst_attr = _split_plug(args[1])
+            if not _DSM_RE.match(dst_attr):
+                continue
+            match = _IOG_RE.match(src_attr)
+            if match:
+                group = int(match.group(2)) if match.group(2) is not None else None
+                connections.append((src_node, int(match.group(1) or 0), group, dst_node))
+            elif _PLACEHOLDER_RE.match(src_attr):
+                unresolved += 1
+        elif command == "createNode":
+            flags, args = statement.parse()
+            if not args:
+                continue
+            name = (flags.get("n") or flags.get("name") or [args[0]])[-1]
+            parent_name = (flags.get("p") or flags.get("parent") or [None])[-1]
+            parent = scene.find(parent_name) if parent_name else None
+            current = ma_parser.MaNode(name, args[0], parent, statement.line)
+            scene.add_node(current)
+        elif command == "rename":
+            flags, args = statement.parse()
+            if len(args) == 2 and not (flags.get("uid") or flags.get("uuid")):
+                node = scene.find(args[0])
+                if node is not None:
+                    scene.rename(node, args[1])
+        elif command == "select":
+            _flags, args = statement.parse()
+            current = scene.find(args[-1].lstrip(":")) if args else None
+        elif command == "file":
+            flags, args = statement.parse()
+            if ("r" in flags or "reference" in flags or "rdi" in flags) and args:
+                scene.references.append(args[-1])
+
+    assignments = {}
+    for shape_name, instance, group, sg_name in connections:
+        shape = scene.find(shape_name)
+        sg = scene.find(sg_name)
+        if shape is None or shape.type not in GEOMETRY_SHAPE_TYPES:
+            # 레퍼런스된 노드 이름으로 직접 연결된 경우 (플레이스홀더 없이)
+            unresolved += shape is None
+            continue
+        if sg is not None and sg.type != "shadingEngine":
+            continue
+        if sg is None and _base_name(sg_name) not in DEFAULT_SHADING_GROUPS:
+            continue
+        short_shape = _base_name(shape.name)
+        members = assignments.setdefault(shape, {}).setdefault(sg.name if sg else _base_name(sg_name), set())
+        if group is None:
+            members.add(short_shape)
+        else:
+            members.update("{}.{}".format(short_shape, c) for c in components.get((shape, instance, group), ()))
+    return scene, assignments, unresolved
+
+
+def build_shader_map(scene, assignments, warnings=None):
+    """
+    scan_shader_assignments()의 결과로 export_shader_map_to_json.collect_shader_map()과 같은 구조의 쉐이더 맵을 만듭니다.
+    (트랜스폼 전체 경로 순서, 쉐이프 생성 순서, SG 이름 순서, 정렬된 멤버)
+
+    :param warnings: 경고 메시지를 추가할 리스트 (선택)
+    :return: {오브젝트 키: [{'sg_name': ..., 'members': [...]}]}
+    :rtype: dict
+    """
+    shapes_by_transform = {}
+    for shape in scene.nodes:
+        if shape.type in GEOMETRY_SHAPE_TYPES and shape.parent is not None \
+                and not shape.attrs.get("intermediateObject"):
+            shapes_by_transform.setdefault(shape.parent, []).append(shape)
+
+    shader_map = {}
+    for transform in sorted(shapes_by_transform, key=lambda node: node.long_name()):
+        info_list = []
+        for shape in shapes_by_transform[transform]:
+            for sg_name, members in sorted(assignments.get(shape, {}).items()):
+                if members:
+                    info_list.append({"sg_name": sg_name.split(':')[-1], "members": sorted(members)})
+        if not info_list:
+            continue
+        object_key = _base_name(transform.name)
+        if object_key in shader_map and warnings is not None:
+            warnings.append("이름이 같은 오브젝트가 여러 개 있습니다. '{}'의 정보를 덮어씁니다.".format(
+                transform.long_name()))
+        shader_map[object_key] = info_list
+    return shader_map
+
+
+def extract_shader_map(scene_path):
+    """
+    .ma 파일 하나의 쉐이더 맵을 추출합니다.
+
+    :return: (쉐이더 맵, 해석하지 못한 SG 연결 수, 경고 리스트)
+    :rtype: tuple
+    """
+    scene, assignments, unresolved = scan_shader_assignments(scene_path)
+    warnings = []
+    return build_shader_map(scene, assignments, warnings), unresolved, warnings
+
+
+def extract_scene(scene_path, output_path, version=shader_map_format.LATEST_VERSION):
+    """
+    .ma 파일 하나의 쉐이더 맵을 추출하여 저장합니다. 프로세스 풀에서 실행할 수 있도록 결과를 딕셔너리로 반환합니다.
+
+    :return: {'scene', 'output', 'status', 'objects', 'elapsed', 'size', 'unresolved', 'warnings', 'error'} 딕셔너리
+    :rtype: dict
+    """
+    result = {"scene": scene_path, "output": output_path, "status": batch.STATUS_FAILED, "objects": 0,
+              "elapsed": 0.0, "size": 0, "unresolved": 0, "warnings": [], "error": None}
+    started = time.perf_counter()
+    try:
+        result["size"] = os.path.getsize(scene_path)
+        if not scene_path.endswith(".ma"):
+            result["status"] = STATUS_NEEDS_MAYA
+            result["error"] = "Maya ASCII(.ma) 파일이 아닙니다."
+            return result
+        shader_map, result["unresolved"], result["warnings"] = extract_shader_map(scene_path)
+        result["objects"] = len(shader_map)
+        if result["unresolved"]:
+            result["status"] = STATUS_NEEDS_MAYA
+            result["error"] = "레퍼런스된 노드에 할당된 SG 연결 {}개".format(result["unresolved"])
+        elif shader_map:
+            batch.write_shader_map_atomic(output_path, shader_map, version)
+            result["status"] = batch.STATUS_EXPORTED
+        else:
+            result["status"] = batch.STATUS_EMPTY
+    except (OSError, UnicodeError, ValueError) as e:
+        result["error"] = "{}: {}".format(type(e).__name__, e)
+    finally:
+        result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def extract_scenes(jobs, workers=None, version=shader_map_format.LATEST_VERSION):
+    """
+    작업 목록의 .ma 파일을 프로세스 풀에서 병렬로 추출하고, 끝나는 순서대로 결과를 반환하는 제너레이터입니다.
+
+    :param jobs: batch_export_shader_maps.plan_exports()의 결과 중 실행할 작업 리스트
+    :param workers: 프로세스 개수 (None이면 CPU 개수, 1이면 현재 프로세스에서 순차 실행)
+    :return: extract_scene() 결과 딕셔너리 제너레이터
+    """
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield extract_scene(job["scene"], job["output"], version)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        # 작은 파일이 많을 때 작업 전달 비용을 줄이기 위해 map에 chunksize를 사용합니다.
+        chunksize = max(1, min(64, len(jobs) // ((workers or os.cpu_count() or 1) * 4)))
+        yield from executor.map(extract_scene, [job["scene"] for job in jobs], [job["output"] for job in jobs],
+                                [version] * len(jobs), chunksize=chunksize)
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Maya-free shader map extraction from Maya ASCII (.ma) files")
+    parser.add_argument("paths", nargs="+", help=".ma files, directories, or .txt scene lists")
+    parser.add_argument("--output_root", required=True, help="Shader map library root")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--task", default=None, help="Only scenes in this task folder (e.g. lookdev)")
+    parser.add_argument("--status", default=None, help="Only scenes in this status folder (e.g. pub)")
+    parser.add_argument("--latest_only", action="store_true", help="Only the highest version per asset")
+    parser.add_argument("--extension", default=".json", choices=shader_map_format.SHADER_MAP_EXTENSIONS)
+    parser.add_argument("--format_version", type=int, default=shader_map_format.LATEST_VERSION,
+                        choices=shader_map_format.SUPPORTED_VERSIONS)
+    parser.add_argument("--force", action="store_true", help="Extract even if the shader map is up to date")
+    parser.add_argument("--needs_maya_list", default=None,
+                        help="Write scenes that need Maya (.mb, referenced assignments) to this .txt file")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    opts = parse_args(sys.argv[1:] if args is None else args)
+    log = core_log.get_logger(__name__, LOG_FILE_PATH)
+
+    scenes = batch.filter_scenes(batch.find_scene_files(opts.paths), opts.task, opts.status, opts.latest_only)
+    if not scenes:
+        log.warning("추출할 씬이 없습니다: %s", opts.paths)
+        return 1
+
+    jobs = batch.plan_exports(scenes, opts.output_root, opts.extension, opts.force)
+    pending = [job for job in jobs if not job["up_to_date"] and job["duplicate_of"] is None]
+    for job in jobs:
+        if job["duplicate_of"] is not None:
+            log.warning("[SKIP] %s: 출력 경로가 %s와 같습니다. (%s)", job["scene"], job["duplicate_of"], job["output"])
+    log.info("%d개 씬 중 %d개 추출, %d개 최신", len(jobs), len(pending), sum(1 for job in jobs if job["up_to_date"]))
+
+    started = time.perf_counter()
+    counts = {}
+    total_size = 0
+    needs_maya = []
+    for result in extract_scenes(pending, opts.workers, opts.format_version):
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+        total_size += result["size"]
+        for warning in result["warnings"]:
+            log.warning("%s: %s", result["scene"], warning)
+        if result["status"] == STATUS_NEEDS_MAYA:
+            needs_maya.append(result["scene"])
+            log.warning("[NEEDS MAYA] %s: %s", result["scene"], result["error"])
+        elif result["status"] == batch.STATUS_FAILED:
+            log.error("[FAILED] %s: %s", result["scene"], result["error"])
+        elif result["status"] == batch.STATUS_EMPTY:
+            log.warning("[EMPTY] %s: 추출할 쉐이더 정보가 없습니다.", result["scene"])
+        else:
+            log.debug("[EXPORTED] %s (%d objects, %.2fs)", result["output"], result["objects"], result["elapsed"])
+
+    elapsed = time.perf_counter() - started
+    log.info("완료: %s, %.1f MB, %.2fs (%.1f MB/s)",
+             ", ".join("{} {}".format(k, v) for k, v in sorted(counts.items())) or "0",
+             total_size / 1e6, elapsed, total_size / 1e6 / elapsed if elapsed else 0.0)
+
+    if opts.needs_maya_list and needs_maya:
+        with open(opts.needs_maya_list, "w") as f:
+            f.write("\n".join(sorted(needs_maya)) + "\n")
+        log.info("Maya가 필요한 씬 목록 저장: %s (batch_export_shader_maps.py로 처리)", opts.needs_maya_list)
+    return 1 if counts.get(batch.STATUS_FAILED) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""
+쉐이더 맵 파일 포맷 모듈입니다. (Maya 없이 동작합니다.)
+
+[v1] 하나의 JSON 객체 (기존 포맷)
+    {오브젝트 키: [{'sg_name': SG 이름, 'members': [멤버, ...]}, ...]}
+    페이스마다 멤버 문자열이 따로 저장되고 indent=4로 저장되어, 페이스 할당이 많은 에셋은 수십 MB가 됩니다.
+
+[v2] JSON Lines (한 줄에 JSON 하나)
+    1번째 줄 (헤더): {"format": "shader_map", "version": 2, "sgs": [SG 이름, ...], "objects": 오브젝트 수}
+    2번째 줄부터 (오브젝트당 한 줄): {"o": 오브젝트 키, "s": [쉐이프 이름, ...], "a": [할당, ...]}
+    - SG 이름은 헤더의 "sgs" 목록, 쉐이프 이름은 레코드의 "s" 목록의 인덱스로 저장합니다. (이름 사전 인코딩)
+    - 할당은 [SG 인덱스, 쉐이프 인덱스] (오브젝트 전체) 또는 [SG 인덱스, 쉐이프 인덱스, 컴포넌트 목록] 입니다.
+    - 컴포넌트 목록의 페이스는 병합된 범위로 저장합니다. 정수 i는 'f[i]', [s, e]는 'f[s:e]',
+      문자열은 페이스가 아닌 컴포넌트를 그대로 저장한 것입니다.
+    - 파일 확장자가 '.gz'이면 gzip, '.xz' 또는 '.lzma'이면 lzma로 압축합니다.
+      읽을 때는 확장자가 아니라 파일의 매직 바이트로 압축 여부를 판단합니다.
+
+읽기는 iter_shader_map()으로 오브젝트 단위로 스트리밍하므로, v2 파일은 전체 내용을 메모리에 올리지 않습니다.
+"""
+import bisect
+import gzip
+import io
+import json
+import lzma
+import re
+
+FORMAT_NAME = "shader_map"
+LATEST_VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+
+# 임포터가 '<에셋 이름><확장자>'를 찾는 순서
+SHADER_MAP_EXTENSIONS = (".json", ".json.gz", ".json.xz")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+_FACE_RE = re.compile(r"^f\[(\d+)(?::(\d+))?\]$")
+
+
+def _open_binary(path, mode):
+    """확장자(쓰기) 또는 매직 바이트(읽기)에 따라 압축 스트림을 엽니다."""
+    if mode == "wb":
+        lower = path.lower()
+        if lower.endswith(".gz"):
+            return gzip.open(path, "wb", compresslevel=6)
+        if lower.endswith((".xz", ".lzma")):
+            return lzma.open(path, "wb", preset=6)
+        return open(path, "wb")
+
+    with open(path, "rb") as f:
+        magic = f.read(len(_XZ_MAGIC))
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rb")
+    if magic.startswith(_XZ_MAGIC):
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+
+def merge_face_ranges(indices):
+    """
+    페이스 (시작, 끝) 범위 목록을 정렬하고, 겹치거나 이어지는 범위를 병합합니다.
+
+    :param indices: [(시작, 끝)] 리스트
+    :return: 병합된 [(시작, 끝)] 리스트
+    :rtype: list
+    """
+    merged = []
+    for start, end in sorted(indices):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def parse_face_component(component):
+    """
+    페이스 컴포넌트 문자열을 (시작, 끝) 범위로 변환합니다. (예: 'f[0:9]' -> (0, 9), 'f[3]' -> (3, 3))
+
+    :return: (시작, 끝) 또는 페이스 컴포넌트가 아니면 None
+    """
+    match = _FACE_RE.match(component)
+    if not match:
+        return None
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) is not None else start
+    return min(start, end), max(start, end)
+
+
+def ranges_contain(ranges, start, end):
+    """
+    병합된 페이스 범위 목록(merge_face_ranges()의 결과)이 (start, end) 범위를 모두 포함하는지 확인합니다.
+
+    :param ranges: 정렬, 병합된 [(시작, 끝)] 리스트
+    :rtype: bool
+    """
+    i = bisect.bisect_right(ranges, (start, float("inf"))) - 1
+    return i >= 0 and ranges[i][0] <= start and end <= ranges[i][1]
+
+
+def encode_components(components):
+    """
+    컴포넌트 문자열 목록을 v2 컴포넌트 목록으로 변환합니다. (예: ['f[0]', 'f[1:9]', 'f[20]'] -> [[0, 9], 20])
+
+    :param components: 'f[0:9]' 형식의 컴포넌트 문자열 리스트
+    :rtype: list
+    """
+    ranges = []
+    others = []
+    for component in components:
+        face_range = parse_face_component(component)
+        if face_range is not None:
+            ranges.append(face_range)
+        elif component not in others:
+            others.append(component)
+    encoded = [start if start == end else [start, end] for start, end in merge_face_ranges(ranges)]
+    return encoded + others
+
+
+def decode_components(encoded):
+    """v2 컴포넌트 목록을 컴포넌트 문자열 리스트로 변환합니다. (예: [[0, 9], 20] -> ['f[0:9]', 'f[20]'])"""
+    components = []
+    for item in encoded:
+        if isinstance(item, int):
+            components.append("f[{}]".format(item))
+        elif isinstance(item, list):
+            components.append("f[{}:{}]".format(item[0], item[1]))
+        else:
+            components.append(item)
+    return components
+
+
+def encode_record(object_key, info_list, sg_index):
+    """
+    오브젝트 하나의 v1 쉐이더 정보 목록을 v2 레코드로 변환합니다.
+
+    :param object_key: 오브젝트 키
+    :param info_list: [{'sg_name': ..., 'members': [...]}] 리스트
+    :param sg_index: {SG 이름: 인덱스} 딕셔너리 (없는 SG는 추가됩니다.)
+    :rtype: dict
+    """
+    shapes = []
+    shape_index = {}
+    whole = []          # [(SG 인덱스, 쉐이프 인덱스)] (입력 순서 유지)
+    components = {}     # (SG 인덱스, 쉐이프 인덱스) -> [컴포넌트 문자열]
+    for info in info_list:
+        sg = sg_index.setdefault(info['sg_name'], len(sg_index))
+        for member in info['members']:
+            node, _, component = member.partition('.')
+            if node not in shape_index:
+                shape_index[node] = len(shapes)
+                shapes.append(node)
+            key = (sg, shape_index[node])
+            if component:
+                components.setdefault(key, []).append(component)
+            elif key not in whole:
+                whole.append(key)
+
+    assignments = [[sg, shape] for sg, shape in whole]
+    for (sg, shape), parts in components.items():
+        assignments.append([sg, shape, encode_components(parts)])
+    return {"o": object_key, "s": shapes, "a": assignments}
+
+
+def decode_record(record, sg_names):
+    """
+    v2 레코드를 (오브젝트 키, v1 형식의 쉐이더 정보 목록)으로 변환합니다.
+
+    :param record: encode_record()의 결과
+    :param sg_names: 헤더의 SG 이름 리스트
+    :rtype: tuple
+    """
+    shapes = record["s"]
+    info_list = []
+    for assignment in record["a"]:
+        shape = shapes[assignment[1]]
+        if len(assignment) > 2:
+            members = ["{}.{}".format(shape, c) for c in decode_components(assignment[2])]
+        else:
+            members = [shape]
+        info_list.append({"sg_name": sg_names[assignment[0]], "members": members})
+    return record["o"], info_list
+
+
+def write_shader_map(path, shader_map, version=LATEST_VERSION):
+    """
+    쉐이더 맵을 파일로 저장합니다.
+
+    :param path: 저장 경로 (확장자가 '.gz' / '.xz'이면 압축하여 저장)
+    :param shader_map: {오브젝트 키: [{'sg_name': ..., 'members': [...]}]} 딕셔너리
+    :param version: 1이면 기존 JSON 포맷, 2이면 JSON Lines 포맷
+    """
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError("지원하지 않는 쉐이더 맵 버전입니다: {}".format(version))
+
+    with _open_binary(path, "wb") as raw, io.TextIOWrapper(raw, encoding="utf-8", newline="\n") as f:
+        if version == 1:
+            json.dump(shader_map, f, indent=4, ensure_ascii=False)
+            return
+
+        sg_index = {}
+        records = [encode_record(key, info_list, sg_index) for key, info_list in shader_map.items()]
+        header = {"format": FORMAT_NAME, "version": version, "sgs": list(sg_index), "objects": len(records)}
+        f.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")))
+        f.write("\n")
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+
+
+def _parse_first_line(line):
+    """
+    첫 줄을 파싱합니다.
+
+    :return: (v2 헤더 또는 None, 파싱된 JSON 값 또는 None)
+             v1 파일을 indent 없이 저장하면 파일 전체가 한 줄이므로, 파싱된 값을 다시 사용합니다.
+    """
+    try:
+        value = json.loads(line)
+    except ValueError:
+        return None, None
+    if isinstance(value, dict) and value.get("format") == FORMAT_NAME:
+        return value, None
+    return None, value
+
+
+def iter_shader_map(path):
+    """
+    쉐이더 맵 파일을 오브젝트 단위로 읽는 제너레이터입니다. v1, v2 파일을 모두 읽습니다.
+
+    v2 파일은 한 줄씩 디코딩하므로 전체 내용이 메모리에 올라가지 않습니다.
+    v1 파일은 하나의 JSON 객체이므로 한 번에 읽은 뒤 오브젝트 단위로 반환합니다.
+
+    :param path: 쉐이더 맵 파일 경로
+    :return: (오브젝트 키, [{'sg_name': ..., 'members': [...]}]) 제너레이터
+    """
+    with _open_binary(path, "rb") as raw, io.TextIOWrapper(raw, encoding="utf-8") as f:
+        first_line = f.readline()
+        header, value = _parse_first_line(first_line)
+        if header is None:
+            rest = f.read()
+            shader_map = value if value is not None and not rest.strip() else json.loads(first_line + rest)
+            for item in shader_map.items():
+                yield item
+            return
+
+        if header.get("version") not in SUPPORTED_VERSIONS:
+            raise ValueError("지원하지 않는 쉐이더 맵 버전입니다: {} ({})".format(header.get("version"), path))
+        sg_names = header["sgs"]
+        for line in f:
+            if line.strip():
+                yield decode_record(json.loads(line), sg_names)
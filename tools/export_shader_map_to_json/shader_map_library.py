@@ -0,0 +1,241 @@
+"""
+쉐이더 맵 라이브러리 인덱스 모듈입니다. (Maya 없이 동작합니다.)
+
+하나 이상의 쉐이더 맵 루트 폴더(하위 폴더 포함)를 훑어 '에셋 이름 -> 쉐이더 맵 파일' 인덱스를 만들고,
+로컬 JSON 파일로 저장합니다. 다음 실행부터는 저장된 인덱스를 읽고, 폴더마다 os.stat 한 번으로 수정 시간(mtime)만
+확인하여 바뀐 폴더만 다시 읽습니다. 레퍼런스가 수백 개인 샷에서도 레퍼런스마다 네트워크 경로를 stat하지 않습니다.
+폴더 확인은 같은 깊이의 폴더끼리 스레드 풀에서 동시에 실행하여 네트워크 지연이 겹치도록 합니다.
+
+[폴더 구조 예시]
+    shader_maps/char/hero/hero_v002.json
+    shader_maps/char/hero/hero_v003.json.gz
+    shader_maps/prop/bag.json
+
+[찾기 규칙]
+    1. 파일명(확장자 제외)이 에셋 이름과 정확히 같은 파일 (예: 'hero_v002' -> hero_v002.json)
+    2. 버전이 있는 이름은 버전을 제외한 이름과 버전이 같은 파일 (예: 'hero_v2' -> hero_v002.json)
+       없으면 다른 버전으로 대신하지 않고 None을 반환합니다. (예: 'hero_v001' -> None)
+    3. 버전이 없는 이름은 같은 이름의 파일 중 가장 높은 버전 (예: 'hero' -> hero_v003.json.gz)
+    버전은 core.PathParser로 파일명의 '_v###'에서 읽습니다.
+    같은 이름/버전이 여러 루트에 있으면 앞의 루트가 우선합니다.
+
+주의: 폴더의 수정 시간은 파일이 추가/삭제/이름 변경될 때 바뀌며, 기존 파일을 덮어쓸 때는 바뀌지 않습니다.
+덮어쓴 파일의 내용은 임포터의 쉐이더 맵 캐시가 (수정 시간, 크기)로 따로 확인합니다.
+"""
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+from core import core_utils
+from core.PathParser import PathParser
+
+import shader_map_format
+
+INDEX_VERSION = 1
+
+# 폴더 stat/scandir을 동시에 실행할 스레드 개수
+DEFAULT_SCAN_WORKERS = 16
+
+# core.PathParser._extract_version()과 같은 버전 패턴 (에셋 이름에서 버전을 제거할 때 사용)
+_VERSION_RE = re.compile(r'_v(\d+)')
+
+
+def default_index_path(roots):
+    """루트 목록별로 구분되는 로컬 인덱스 파일 경로를 반환합니다. (임시 폴더)"""
+    key = hashlib.sha1("\n".join(roots).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(tempfile.gettempdir(), "shader_map_index_{}.json".format(key))
+
+
+def split_shader_map_name(file_name):
+    """
+    쉐이더 맵 파일명을 (확장자를 제외한 이름, 버전을 제외한 에셋 이름, 버전)으로 나눕니다.
+    (예: 'hero_v003.json.gz' -> ('hero_v003', 'hero', 3))
+
+    :return: 튜플 (쉐이더 맵 파일이 아니면 None)
+    """
+    for extension in sorted(shader_map_format.SHADER_MAP_EXTENSIONS, key=len, reverse=True):
+        if file_name.endswith(extension):
+            stem = file_name[:-len(extension)]
+            break
+    else:
+        return None
+    version = PathParser(stem).version
+    asset_name = _VERSION_RE.sub("", stem, count=1) if version is not None else stem
+    return stem, asset_name, version
+
+
+class ShaderMapLibrary:
+    """
+    쉐이더 맵 루트 폴더들의 영구(persistent) 인덱스입니다.
+
+    사용 예:
+        library = ShaderMapLibrary(["/show/lookdev/shader_maps"])
+        library.refresh()
+        json_path = library.find("hero")
+    """
+    def __init__(self, roots, index_path=None, workers=DEFAULT_SCAN_WORKERS):
+        """
+        :param roots: 쉐이더 맵 루트 폴더 경로 또는 경로 리스트 (앞의 루트가 우선합니다.)
+        :param index_path: 인덱스를 저장할 JSON 경로 (None이면 임시 폴더에 루트 목록별로 저장)
+        :param workers: 폴더 확인 스레드 개수 (1 이하이면 현재 스레드에서 차례로 확인)
+        """
+        if isinstance(roots, str):
+            roots = [roots]
+        self.roots = [os.path.normpath(root) for root in roots]
+        self.index_path = index_path or default_index_path(self.roots)
+        self.workers = workers
+        self._dirs = {}       # {폴더 경로: {'mtime_ns', 'files', 'dirs'}}
+        self._by_stem = {}    # {확장자를 제외한 파일명: 경로}
+        self._by_asset = {}   # {버전을 제외한 에셋 이름: [(버전, 경로)]} (높은 버전 먼저)
+        self.stats = {"dirs_checked": 0, "dirs_scanned": 0, "files": 0, "loaded": False, "saved": False,
+                      "elapsed": 0.0}
+
+    def __len__(self):
+        return len(self._by_stem)
+
+    def refresh(self):
+        """
+        저장된 인덱스를 읽고, 수정 시간이 바뀐 폴더만 다시 읽어 인덱스를 갱신합니다. 바뀐 내용이 있으면 저장합니다.
+
+        :return: {'dirs_checked': stat한 폴더 수, 'dirs_scanned': 다시 읽은 폴더 수, 'files': 쉐이더 맵 파일 수,
+                  'loaded': 저장된 인덱스 사용 여부, 'saved': 인덱스 저장 여부, 'elapsed': 소요 시간}
+        :rtype: dict
+        """
+        started = time.perf_counter()
+        cached_dirs = self._load_index()
+        self.stats.update(dirs_checked=0, dirs_scanned=0, loaded=bool(cached_dirs), saved=False)
+
+        dirs = {}
+        executor = concurrent.futures.ThreadPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            # 같은 깊이의 폴더를 한 번에 확인합니다.
+            level = list(dict.fromkeys(self.roots))
+            while level:
+                def scan(directory):
+                    return self._scan_directory(directory, cached_dirs.get(directory))
+                results = executor.map(scan, level) if executor else map(scan, level)
+                next_level = []
+                for directory, (entry, scanned) in zip(level, results):
+                    if entry is None or directory in dirs:
+                        continue
+                    self.stats["dirs_checked"] += 1
+                    self.stats["dirs_scanned"] += int(scanned)
+                    dirs[directory] = entry
+                    next_level.extend(os.path.join(directory, name) for name in entry["dirs"])
+                level = next_level
+        finally:
+            if executor:
+                executor.shutdown()
+
+        if dirs != cached_dirs:
+            self._save_index(dirs)
+            self.stats["saved"] = True
+        self._dirs = dirs
+        self._build_entries()
+        self.stats["files"] = sum(len(entry["files"]) for entry in dirs.values())
+        self.stats["elapsed"] = time.perf_counter() - started
+        return self.stats
+
+    def find(self, asset_base_name):
+        """
+        에셋 이름에 해당하는 쉐이더 맵 파일 경로를 반환합니다. (찾기 규칙은 모듈 설명 참고)
+
+        :param asset_base_name: 레퍼런스 파일명에서 확장자를 제외한 이름 (예: 'hero_v002')
+        :return: 파일 경로 (없으면 None)
+        """
+        path = self._by_stem.get(asset_base_name)
+        if path is not None:
+            return path
+        version = PathParser(asset_base_name).version
+        if version is None:
+            versions = self._by_asset.get(asset_base_name)
+            return versions[0][1] if versions else None
+        # 버전을 지정한 레퍼런스는 다른 버전의 쉐이더 맵으로 대신하지 않습니다.
+        asset_name = _VERSION_RE.sub("", asset_base_name, count=1)
+        for map_version, path in self._by_asset.get(asset_name, ()):
+            if map_version == version:
+                return path
+        return None
+
+    def versions(self, asset_name):
+        """
+        에셋의 모든 쉐이더 맵 버전을 높은 버전부터 반환합니다.
+
+        :param asset_name: 버전을 제외한 에셋 이름 (예: 'hero')
+        :return: [(버전 또는 None, 경로)] 리스트
+        """
+        return list(self._by_asset.get(asset_name, ()))
+
+    @staticmethod
+    def _scan_directory(directory, cached):
+        """
+        폴더를 stat하고, 수정 시간이 저장된 값과 다를 때만 다시 읽습니다. (스레드에서 실행됩니다.)
+
+        :return: (폴더 항목 또는 None(폴더 없음), 다시 읽었는지 여부)
+        """
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None, False
+        if cached is not None and cached["mtime_ns"] == mtime_ns:
+            return cached, False
+
+        files, subdirs = [], []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        subdirs.append(entry.name)
+                    elif split_shader_map_name(entry.name) is not None:
+                        files.append(entry.name)
+        except OSError:
+            return None, False
+        return {"mtime_ns": mtime_ns, "files": sorted(files), "dirs": sorted(subdirs)}, True
+
+    def _build_entries(self):
+        """폴더 목록에서 이름별, 에셋별 찾기 테이블을 만듭니다. (루트 순서, 폴더 경로 순서로 앞의 항목이 우선)"""
+        by_stem = {}
+        by_asset = {}
+        order = 0
+        for root in self.roots:
+            prefix = root.rstrip(os.sep) + os.sep
+            directories = sorted(d for d in self._dirs if d == root or d.startswith(prefix))
+            for directory in directories:
+                for file_name in self._dirs[directory]["files"]:
+                    stem, asset_name, version = split_shader_map_name(file_name)
+                    path = os.path.join(directory, file_name)
+                    by_stem.setdefault(stem, path)
+                    by_asset.setdefault(asset_name, []).append((version, order, path))
+                    order += 1
+        # 높은 버전 먼저, 같은 버전이면 먼저 찾은(우선순위가 높은) 파일 먼저
+        self._by_stem = by_stem
+        self._by_asset = {
+            name: [(version, path) for version, _, path in
+                   sorted(items, key=lambda item: (-(item[0] if item[0] is not None else -1), item[1]))]
+            for name, items in by_asset.items()
+        }
+
+    def _load_index(self):
+        """저장된 인덱스의 폴더 목록을 읽습니다. 없거나 형식이 다르면 빈 딕셔너리를 반환합니다."""
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != INDEX_VERSION or data.get("roots") != self.roots:
+            return {}
+        return data.get("dirs", {})
+
+    def _save_index(self, dirs):
+        """인덱스를 임시 파일에 쓴 뒤 교체하여, 다른 프로세스가 쓰다 만 파일을 읽지 않도록 합니다."""
+        data = {"version": INDEX_VERSION, "roots": self.roots, "dirs": dirs}
+        try:
+            core_utils.save_json_atomic(self.index_path, data, separators=(",", ":"))
+        except OSError as e:
+            print("경고: 쉐이더 맵 인덱스를 저장하지 못했습니다: {} ({})".format(self.index_path, e))
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+검사 항목별 실행 시간과 maya.cmds 호출 횟수를 측정하는 계측(instrumentation) 모듈입니다.
+
+검사 로직이 사용하는 모듈의 `cmds` 전역 변수를 호출 횟수를 세는 프록시로 잠시 교체하여,
+검사 코드를 수정하지 않고도 어떤 검사가 cmds 호출을 많이 하는지 확인할 수 있습니다.
+이 모듈은 Maya에 의존하지 않습니다.
+"""
+import collections
+import contextlib
+import time
+
+
+class CmdsCallCounter:
+    """
+    cmds 모듈을 감싸 함수별 호출 횟수를 기록하는 프록시입니다.
+    함수가 아닌 속성은 원본 그대로 반환합니다.
+    """
+    def __init__(self, cmds_module):
+        self._cmds = cmds_module
+        self._wrappers = {}
+        self.counts = collections.Counter()
+
+    def __getattr__(self, name):
+        wrapper = self._wrappers.get(name)
+        if wrapper is not None:
+            return wrapper
+
+        attr = getattr(self._cmds, name)
+        if not callable(attr):
+            return attr
+
+        counts = self.counts
+
+        def counted(*args, **kwargs):
+            counts[name] += 1
+            return attr(*args, **kwargs)
+
+        self._wrappers[name] = counted
+        return counted
+
+    @property
+    def total(self):
+        """전체 cmds 호출 횟수"""
+        return sum(self.counts.values())
+
+
+class CheckProfiler:
+    """
+    지정된 모듈들의 `cmds` 전역 변수를 CmdsCallCounter로 교체하여 호출 횟수를 측정합니다.
+    """
+    def __init__(self, modules, attr_name="cmds"):
+        """
+        :param modules: cmds를 사용하는 모듈 리스트 (예: scene_validation_tool, maya_utils)
+        :param attr_name: 교체할 모듈 전역 변수 이름
+        """
+        self.modules = [m for m in modules if hasattr(m, attr_name)]
+        self.attr_name = attr_name
+
+    @contextlib.contextmanager
+    def instrument(self):
+        """
+        with 블록 동안 cmds 호출 횟수와 경과 시간을 측정합니다.
+        블록이 끝나면 원래의 cmds 모듈로 복구됩니다.
+
+        :return: 측정 결과가 담길 Profile 인스턴스
+        """
+        originals = [(m, getattr(m, self.attr_name)) for m in self.modules]
+        counter = CmdsCallCounter(originals[0][1]) if originals else None
+        profile = Profile()
+        for module, _ in originals:
+            setattr(module, self.attr_name, counter)
+
+        start = time.perf_counter()
+        try:
+            yield profile
+        finally:
+            profile.elapsed = time.perf_counter() - start
+            for module, original in originals:
+                setattr(module, self.attr_name, original)
+            if counter is not None:
+                profile.cmds_calls = dict(counter.counts)
+
+
+class Profile:
+    """단일 측정 구간의 결과 (경과 시간, 함수별 cmds 호출 횟수)"""
+    def __init__(self):
+        self.elapsed = 0.0
+        self.cmds_calls = {}
+
+    @property
+    def total_calls(self):
+        return sum(self.cmds_calls.values())
+
+
+def format_profile_report(results, top_calls=3):
+    """
+    CheckResult 리스트를 실행 시간 내림차순의 표 형태 문자열 리스트로 만듭니다.
+
+    :param results: 프로파일 정보(elapsed, cmds_calls)가 담긴 CheckResult 리스트
+    :param top_calls: 검사별로 표시할 상위 cmds 함수 개수
+    :return: 로그에 한 줄씩 기록할 문자열 리스트
+    :rtype: list
+    """
+    executed = [r for r in results if r.cmds_calls is not None]
+    total_time = sum(r.elapsed for r in executed) or 1e-9
+
+    lines = [f"{'Check':<24} {'Time(s)':>9} {'Share':>6} {'cmds':>9} {'Items':>7}  Top cmds"]
+    for result in sorted(executed, key=lambda r: r.elapsed, reverse=True):
+        calls = result.cmds_calls
+        top = ", ".join(f"{name}={count}" for name, count in
+                        collections.Counter(calls).most_common(top_calls))
+        lines.append(
+            f"{result.check.name:<24} {result.elapsed:>9.3f} {result.elapsed / total_time:>6.0%} "
+            f"{sum(calls.values()):>9} {len(result.items):>7}  {top}"
+        )
+    return lines
@@ -0,0 +1,435 @@
+# -*- coding: utf-8 -*-
+"""
+씬 검사 항목 레지스트리와 실행 엔진입니다.
+
+검사 항목은 예상 비용(cost), 의존 관계(depends_on), 심각도(severity)를 선언하여
+레지스트리에 등록됩니다. 엔진은 비용이 낮은 검사부터 실행하고, 퍼블리시 게이트용
+fail-fast 모드와 전체 실행 시간 예산(time budget)을 지원합니다.
+이 모듈은 Maya에 의존하지 않으므로 UI와 헤드리스(배치) 실행 양쪽에서 사용할 수 있습니다.
+"""
+import collections
+import contextlib
+import time
+
+# --- 비용 등급 (Cost Class) ---
+COST_CHEAP = 0      # 문자열 처리, 단일 ls 호출 등
+COST_MODERATE = 1   # 노드당 몇 번의 cmds 호출
+COST_EXPENSIVE = 2  # 선택/컴포넌트 단위 처리 (UV 겹침, 페이스 순회 등)
+
+COST_LABELS = {
+    COST_CHEAP: "cheap",
+    COST_MODERATE: "moderate",
+    COST_EXPENSIVE: "expensive",
+}
+
+# --- 심각도 (Severity) ---
+SEVERITY_ERROR = "error"
+SEVERITY_WARNING = "warning"
+
+# --- 검사 결과 상태 (Status) ---
+STATUS_PASSED = "passed"
+STATUS_FAILED = "failed"
+STATUS_NOT_RUN = "not_run"
+STATUS_ERROR = "error"
+
+
+class ValidationCheck:
+    """
+    레지스트리에 등록되는 단일 검사 항목의 정의입니다.
+    """
+    def __init__(self, name, label, header, func, cost=COST_MODERATE,
+                 severity=SEVERITY_ERROR, depends_on=None, needs_targets=True, chunkable=True):
+        """
+        :param name: 검사 항목의 고유 이름 (예: 'naming')
+        :param label: UI 및 로그에 표시될 이름 (예: '이름 규칙')
+        :param header: 결과 리스트에 표시될 카테고리 헤더 (예: '--- Naming Issues ---')
+        :param func: 검사 대상 노드 리스트를 받아 문제 항목 리스트를 반환하는 함수
+        :param cost: 예상 비용 등급 (COST_CHEAP, COST_MODERATE, COST_EXPENSIVE)
+        :param severity: 실패 시 심각도 (SEVERITY_ERROR, SEVERITY_WARNING)
+        :param depends_on: 먼저 실행되어야 하는 검사 이름 리스트
+        :param needs_targets: 메쉬 대상 노드가 필요한 검사인지 여부
+        :param chunkable: 대상 노드를 나누어 검사해도 결과가 같은지 여부 (노드 간 비교가 없는 검사)
+        """
+        if cost not in COST_LABELS:
+            raise ValueError(f"알 수 없는 비용 등급입니다: {cost}")
+        if severity not in (SEVERITY_ERROR, SEVERITY_WARNING):
+            raise ValueError(f"알 수 없는 심각도입니다: {severity}")
+
+        self.name = name
+        self.label = label
+        self.header = header
+        self.func = func
+        self.cost = cost
+        self.severity = severity
+        self.depends_on = list(depends_on or [])
+        self.needs_targets = needs_targets
+        self.chunkable = chunkable
+
+    def __repr__(self):
+        return f"ValidationCheck({self.name!r}, cost={COST_LABELS[self.cost]}, severity={self.severity})"
+
+
+class CheckResult:
+    """
+    단일 검사 항목의 실행 결과입니다.
+    """
+    def __init__(self, check, status, items=None, elapsed=0.0, reason="", cmds_calls=None):
+        """
+        :param check: 실행된 ValidationCheck 인스턴스
+        :param status: STATUS_PASSED / STATUS_FAILED / STATUS_NOT_RUN / STATUS_ERROR
+        :param items: 발견된 문제 항목 리스트
+        :param elapsed: 실행 시간 (초)
+        :param reason: 실행되지 않았거나 에러가 발생한 이유
+        :param cmds_calls: 프로파일링 시 함수별 cmds 호출 횟수 ({name: count}), 미측정 시 None
+        """
+        self.check = check
+        self.status = status
+        self.items = list(items or [])
+        self.elapsed = elapsed
+        self.reason = reason
+        self.cmds_calls = cmds_calls
+
+    @property
+    def total_cmds_calls(self):
+        """전체 cmds 호출 횟수 (미측정 시 None)"""
+        return sum(self.cmds_calls.values()) if self.cmds_calls is not None else None
+
+    @property
+    def passed(self):
+        return self.status == STATUS_PASSED
+
+    @property
+    def blocking(self):
+        """퍼블리시를 막아야 하는 결과인지 여부 (에러 심각도의 실패 또는 실행 에러)"""
+        if self.status == STATUS_ERROR:
+            return True
+        return self.status == STATUS_FAILED and self.check.severity == SEVERITY_ERROR
+
+    def __repr__(self):
+        return f"CheckResult({self.check.name!r}, {self.status}, {len(self.items)} items)"
+
+
+class ProgressEvent:
+    """
+    ValidationEngine.iter_run이 청크 하나를 처리할 때마다 반환하는 진행 정보입니다.
+    """
+    def __init__(self, check, check_index, check_count, done, total, elapsed, new_items=None, result=None):
+        """
+        :param check: 현재 실행 중인 ValidationCheck
+        :param check_index: 전체 실행 순서에서 현재 검사의 인덱스 (0부터)
+        :param check_count: 실행할 전체 검사 개수
+        :param done: 현재 검사에서 처리한 노드 개수
+        :param total: 현재 검사의 전체 노드 개수
+        :param elapsed: 현재 검사의 누적 실행 시간 (초)
+        :param new_items: 이번 청크에서 새로 발견된 문제 항목 리스트
+        :param result: 검사가 끝났을 때의 CheckResult (진행 중이면 None)
+        """
+        self.check = check
+        self.check_index = check_index
+        self.check_count = check_count
+        self.done = done
+        self.total = total
+        self.elapsed = elapsed
+        self.new_items = list(new_items or [])
+        self.result = result
+
+    @property
+    def fraction(self):
+        """전체 검사 기준 진행률 (0.0 ~ 1.0)"""
+        if not self.check_count:
+            return 1.0
+        check_fraction = self.done / self.total if self.total else 1.0
+        return (self.check_index + check_fraction) / self.check_count
+
+    @property
+    def eta(self):
+        """현재 검사의 남은 예상 시간 (초). 아직 추정할 수 없으면 None"""
+        if not self.done or not self.total:
+            return None
+        return self.elapsed / self.done * (self.total - self.done)
+
+
+class CheckRegistry:
+    """
+    검사 항목을 등록하고, 의존 관계와 비용을 고려한 실행 순서를 계산합니다.
+    """
+    def __init__(self):
+        self._checks = {}
+
+    def register(self, check):
+        """
+        검사 항목을 등록합니다. 같은 이름이 이미 등록되어 있으면 ValueError를 발생시킵니다.
+
+        :param check: 등록할 ValidationCheck 인스턴스
+        :return: 등록된 check (데코레이터/체이닝 용도)
+        """
+        if check.name in self._checks:
+            raise ValueError(f"이미 등록된 검사 항목입니다: {check.name}")
+        self._checks[check.name] = check
+        return check
+
+    def unregister(self, name):
+        """등록된 검사 항목을 제거합니다."""
+        self._checks.pop(name, None)
+
+    def get(self, name):
+        """이름으로 검사 항목을 찾습니다. 없으면 None을 반환합니다."""
+        return self._checks.get(name)
+
+    def find_by_header(self, header):
+        """결과 리스트 헤더 문자열로 검사 항목을 찾습니다. 없으면 None을 반환합니다."""
+        for check in self._checks.values():
+            if check.header == header:
+                return check
+        return None
+
+    @property
+    def checks(self):
+        """등록 순서대로 정렬된 검사 항목 리스트"""
+        return list(self._checks.values())
+
+    def __contains__(self, name):
+        return name in self._checks
+
+    def __len__(self):
+        return len(self._checks)
+
+    def ordered(self, names=None):
+        """
+        실행 순서대로 정렬된 검사 항목 리스트를 반환합니다.
+        의존 관계를 만족하는 항목 중 비용이 가장 낮은 것을 먼저 선택하며,
+        비용이 같으면 등록 순서를 따릅니다.
+
+        :param names: 실행할 검사 이름 리스트 (None이면 전체). 의존 항목은 자동으로 포함됩니다.
+        :return: 정렬된 ValidationCheck 리스트
+        """
+        selected = self._collect_with_dependencies(names)
+        registration_index = {name: i for i, name in enumerate(self._checks)}
+
+        ordered = []
+        done = set()
+        pending = set(selected)
+        while pending:
+            ready = [name for name in pending
+                     if all(dep in done for dep in self._checks[name].depends_on)]
+            if not ready:
+                raise ValueError(f"검사 항목 간 순환 의존이 있습니다: {sorted(pending)}")
+            name = min(ready, key=lambda n: (self._checks[n].cost, registration_index[n]))
+            ordered.append(self._checks[name])
+            done.add(name)
+            pending.discard(name)
+        return ordered
+
+    def _collect_with_dependencies(self, names):
+        """지정된 검사와 그 의존 항목들의 이름 집합을 반환합니다."""
+        if names is None:
+            names = list(self._checks)
+
+        collected = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in collected:
+                continue
+            check = self._checks.get(name)
+            if check is None:
+                raise ValueError(f"등록되지 않은 검사 항목입니다: {name}")
+            collected.add(name)
+            stack.extend(check.depends_on)
+        return collected
+
+
+class ValidationEngine:
+    """
+    레지스트리의 검사 항목을 비용 순서대로 실행하는 엔진입니다.
+
+    - fail_fast: 에러 심각도의 검사가 실패하면 나머지 검사를 실행하지 않습니다.
+    - time_budget: 전체 실행 시간 예산(초). 예산을 다 쓰면 남은 cheap 이외의 검사는
+      '실행 안 됨(not run)'으로 보고됩니다.
+    - profiler: 지정하면 검사별 cmds 호출 횟수를 측정합니다. (check_profiler.CheckProfiler)
+    """
+    def __init__(self, registry, fail_fast=False, time_budget=None, log=None, profiler=None):
+        """
+        :param registry: CheckRegistry 인스턴스
+        :param fail_fast: 에러 발생 시 즉시 중단 여부
+        :param time_budget: 실행 시간 예산 (초). None 또는 0 이하이면 제한 없음
+        :param log: 진행 상황을 기록할 로거 (선택)
+        :param profiler: cmds 호출 횟수를 측정할 CheckProfiler (선택)
+        """
+        self.registry = registry
+        self.fail_fast = fail_fast
+        self.time_budget = time_budget if time_budget and time_budget > 0 else None
+        self.log = log
+        self.profiler = profiler
+        self._cancelled = False
+        self._started = time.perf_counter()
+
+    def cancel(self):
+        """
+        실행 중인 검사를 취소합니다. 진행 중인 검사와 남은 검사는 '실행 안 됨'으로 보고됩니다.
+        (iter_run 제너레이터를 계속 진행시키면 남은 결과가 즉시 반환됩니다.)
+        """
+        self._cancelled = True
+
+    def run(self, targets, names=None, on_result=None, chunk_size=None):
+        """
+        검사를 실행하고 결과 리스트를 반환합니다.
+
+        :param targets: 검사 대상 메쉬 트랜스폼 노드 리스트
+        :param names: 실행할 검사 이름 리스트 (None이면 전체)
+        :param on_result: 각 검사가 끝날 때마다 CheckResult를 인자로 호출되는 콜백 (선택)
+        :param chunk_size: 한 번에 검사할 노드 개수 (None이면 전체를 한 번에)
+        :return: 실행 순서대로 정렬된 CheckResult 리스트
+        """
+        results = []
+        for event in self.iter_run(targets, names=names, chunk_size=chunk_size):
+            if event.result is None:
+                continue
+            results.append(event.result)
+            if on_result:
+                on_result(event.result)
+        return results
+
+    def iter_run(self, targets, names=None, chunk_size=None):
+        """
+        검사를 노드 청크(chunk) 단위로 나누어 실행하는 제너레이터를 반환합니다.
+        청크 하나를 처리할 때마다 ProgressEvent를 반환하므로, 호출하는 쪽(UI의 QTimer 등)에서
+        원하는 만큼만 진행시키고 제어권을 돌려받을 수 있습니다.
+        검사가 끝나는 이벤트에는 result(CheckResult)가 채워집니다.
+
+        :param targets: 검사 대상 메쉬 트랜스폼 노드 리스트
+        :param names: 실행할 검사 이름 리스트 (None이면 전체)
+        :param chunk_size: 한 번에 검사할 노드 개수 (None이면 전체를 한 번에)
+        :return: ProgressEvent 제너레이터
+        """
+        # 제너레이터 본문은 첫 next()에서야 실행되므로, 그 전에 호출된 cancel()이 지워지지 않도록 여기서 초기화합니다.
+        self._cancelled = False
+        return self._iter_run(targets, names, chunk_size)
+
+    def _iter_run(self, targets, names, chunk_size):
+        executed = set()
+        stop_reason = ""
+        self._started = time.perf_counter()
+        checks = self.registry.ordered(names)
+
+        for index, check in enumerate(checks):
+            result = None
+            missing_deps = [dep for dep in check.depends_on if dep not in executed]
+
+            if self._cancelled:
+                result = CheckResult(check, STATUS_NOT_RUN, reason="사용자 취소")
+            elif stop_reason:
+                result = CheckResult(check, STATUS_NOT_RUN, reason=stop_reason)
+            elif missing_deps:
+                result = CheckResult(check, STATUS_NOT_RUN, reason=f"의존 검사 미실행: {', '.join(missing_deps)}")
+            elif self._budget_exceeded(check):
+                result = CheckResult(check, STATUS_NOT_RUN, reason=self._budget_reason())
+            else:
+                for event in self._iter_check(check, targets, chunk_size, index, len(checks)):
+                    if event.result is None:
+                        yield event
+                    else:
+                        result = event.result
+                if result.status in (STATUS_PASSED, STATUS_FAILED):
+                    executed.add(check.name)
+                if self.fail_fast and result.blocking:
+                    stop_reason = f"fail-fast: '{check.label}' 검사 실패"
+
+            if self.log:
+                self._log_result(result)
+            total = len(targets) if check.needs_targets else 1
+            yield ProgressEvent(check, index, len(checks), total, total, result.elapsed, result=result)
+
+    def _iter_check(self, check, targets, chunk_size, index, check_count):
+        """
+        단일 검사를 청크 단위로 실행합니다. 마지막 이벤트에 CheckResult를 담아 반환합니다.
+        """
+        if check.needs_targets and check.chunkable and chunk_size:
+            chunks = [targets[i:i + chunk_size] for i in range(0, len(targets), chunk_size)]
+        else:
+            chunks = [targets]
+        total = len(targets) if check.needs_targets else 1
+
+        items = []
+        seen = set()
+        cmds_calls = collections.Counter() if self.profiler else None
+        elapsed = 0.0
+        done = 0
+
+        for chunk in chunks:
+            if self._cancelled or (done and self._budget_exceeded(check)):
+                reason = "사용자 취소" if self._cancelled else self._budget_reason()
+                reason = f"{reason} - {done}/{total} 노드 검사 후 중단"
+                yield ProgressEvent(check, index, check_count, done, total, elapsed, result=CheckResult(
+                    check, STATUS_NOT_RUN, items=items, elapsed=elapsed, reason=reason,
+                    cmds_calls=dict(cmds_calls) if cmds_calls is not None else None))
+                return
+
+            start = time.perf_counter()
+            profile_ctx = self.profiler.instrument() if self.profiler else contextlib.nullcontext()
+            profile = None
+            try:
+                with profile_ctx as profile:
+                    chunk_items = check.func(chunk) if check.needs_targets else check.func()
+            except Exception as e:
+                elapsed += time.perf_counter() - start
+                if profile is not None:
+                    cmds_calls.update(profile.cmds_calls)
+                if self.log:
+                    self.log.exception("'%s' 검사 중 오류가 발생했습니다.", check.label)
+                yield ProgressEvent(check, index, check_count, done, total, elapsed, result=CheckResult(
+                    check, STATUS_ERROR, items=items, elapsed=elapsed, reason=str(e),
+                    cmds_calls=dict(cmds_calls) if cmds_calls is not None else None))
+                return
+
+            elapsed += time.perf_counter() - start
+            if profile is not None:
+                cmds_calls.update(profile.cmds_calls)
+            done += len(chunk) if check.needs_targets else 1
+
+            new_items = [item for item in (chunk_items or []) if item not in seen]
+            seen.update(new_items)
+            items.extend(new_items)
+            yield ProgressEvent(check, index, check_count, done, total, elapsed, new_items=new_items)
+
+        status = STATUS_FAILED if items else STATUS_PASSED
+        yield ProgressEvent(check, index, check_count, done, total, elapsed, result=CheckResult(
+            check, status, items=items, elapsed=elapsed,
+            cmds_calls=dict(cmds_calls) if cmds_calls is not None else None))
+
+    def _budget_exceeded(self, check):
+        """시간 예산을 다 써서 이 검사를 실행하면 안 되는지 여부"""
+        if self.time_budget is None or check.cost <= COST_CHEAP:
+            return False
+        return time.perf_counter() - self._started >= self.time_budget
+
+    def _budget_reason(self):
+        elapsed_total = time.perf_counter() - self._started
+        return f"시간 예산 초과 ({elapsed_total:.1f}s / {self.time_budget:.1f}s)"
+
+    def _log_result(self, result):
+        """검사 결과 한 줄을 로거에 기록합니다."""
+        check = result.check
+        if result.status == STATUS_NOT_RUN:
+            self.log.warning("[NOT RUN] %s (%s)", check.label, result.reason)
+        elif result.status == STATUS_ERROR:
+            self.log.error("[ERROR] %s (%s)", check.label, result.reason)
+        elif result.cmds_calls is not None:
+            self.log.info("[%s] %s: %d items, %.3fs, %d cmds calls (cost=%s)", result.status.upper(), check.label,
+                          len(result.items), result.elapsed, result.total_cmds_calls, COST_LABELS[check.cost])
+        else:
+            self.log.debug("[%s] %s: %d items, %.3fs (cost=%s)", result.status.upper(), check.label,
+                           len(result.items), result.elapsed, COST_LABELS[check.cost])
+
+
+def summarize(results):
+    """
+    결과 리스트를 상태별 개수로 요약합니다.
+
+    :param results: CheckResult 리스트
+    :return: {status: count} 딕셔너리
+    """
+    summary = {STATUS_PASSED: 0, STATUS_FAILED: 0, STATUS_NOT_RUN: 0, STATUS_ERROR: 0}
+    for result in results:
+        summary[result.status] += 1
+    return summary
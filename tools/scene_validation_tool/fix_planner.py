@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Fix-All을 위한 일괄 수정 계획(Fix Plan) 모듈입니다.
+
+개별 수정 함수(fix_naming_conventions, cleanup_uvsets, fix_history_and_transforms)를 차례로 호출하면
+수정 함수마다 노드를 하나씩 처리하고 Undo 청크도 따로 생성됩니다. 또한 이름 변경이 DAG 경로 기준으로
+이루어지기 때문에, 부모 노드의 이름이 먼저 바뀌면 이후 자식 노드의 경로가 무효가 됩니다.
+
+FixPlan은 모든 수정 동작(FixAction)을 먼저 수집한 뒤,
+1) 존재 여부를 한 번의 cmds.ls 호출로 확인하고,
+2) 경로가 바뀌지 않는 동작(삭제, UV 셋 정리, 히스토리 삭제, Freeze)을 먼저 일괄 실행하고,
+3) 이름 변경은 가장 깊은 DAG 경로부터 실행하여 아직 처리되지 않은 경로가 항상 유효하도록 보장하며,
+4) 전체를 하나의 Undo 청크로 묶어 한 번의 Undo로 되돌릴 수 있게 합니다.
+"""
+import maya.cmds as cmds
+
+# --- 수정 동작 종류 (실행 순서대로) ---
+ACTION_DELETE_UNKNOWN = "delete_unknown"
+ACTION_CLEANUP_UVSETS = "cleanup_uvsets"
+ACTION_DELETE_HISTORY = "delete_history"
+ACTION_FREEZE_TRANSFORMS = "freeze_transforms"
+ACTION_RENAME = "rename"
+
+ACTION_ORDER = [
+    ACTION_DELETE_UNKNOWN,
+    ACTION_CLEANUP_UVSETS,
+    ACTION_DELETE_HISTORY,
+    ACTION_FREEZE_TRANSFORMS,
+    ACTION_RENAME,  # 경로를 바꾸는 동작은 항상 마지막에 실행합니다.
+]
+
+# 검사 항목 이름 -> 수정 동작 리스트
+FIX_ACTIONS_BY_CHECK = {
+    "unknown_nodes": [ACTION_DELETE_UNKNOWN],
+    "naming": [ACTION_RENAME],
+    "history": [ACTION_DELETE_HISTORY, ACTION_FREEZE_TRANSFORMS],
+    "freeze_transforms": [ACTION_DELETE_HISTORY, ACTION_FREEZE_TRANSFORMS],
+    "multi_uvsets": [ACTION_CLEANUP_UVSETS],
+}
+
+
+def clean_item_name(item):
+    """결과 항목 문자열에서 노드 이름만 추출합니다. (예: 'pCube1 (Multiple UV Sets: 2)' -> 'pCube1')"""
+    return item.split(' (')[0].strip()
+
+
+class FixAction:
+    """단일 수정 동작"""
+    __slots__ = ("kind", "node", "new_name")
+
+    def __init__(self, kind, node, new_name=None):
+        self.kind = kind
+        self.node = node
+        self.new_name = new_name
+
+    @property
+    def depth(self):
+        """DAG 경로의 깊이 (이름 변경 순서 결정용)"""
+        return self.node.count('|')
+
+    def __repr__(self):
+        return f"FixAction({self.kind!r}, {self.node!r})"
+
+
+class FixPlan:
+    """
+    수정 동작을 수집하고, 안전한 순서로 정렬하여 하나의 트랜잭션(Undo 청크)으로 적용합니다.
+    """
+    def __init__(self, mesh_suffix, log=None):
+        """
+        :param mesh_suffix: 이름 변경 시 붙일 메쉬 접미사 (예: '_geo')
+        :param log: 진행 상황을 기록할 로거 (선택)
+        """
+        self.mesh_suffix = mesh_suffix
+        self.log = log
+        self._actions = {}  # (kind, node) -> FixAction
+
+    def __len__(self):
+        return len(self._actions)
+
+    def add(self, kind, node):
+        """
+        수정 동작을 추가합니다. 같은 노드에 같은 동작은 한 번만 추가됩니다.
+
+        :param kind: ACTION_* 상수
+        :param node: 대상 노드 (전체 경로 권장)
+        """
+        if kind not in ACTION_ORDER:
+            raise ValueError(f"알 수 없는 수정 동작입니다: {kind}")
+        key = (kind, node)
+        if key in self._actions:
+            return
+        new_name = None
+        if kind == ACTION_RENAME:
+            short_name = node.split('|')[-1]
+            if short_name.endswith(self.mesh_suffix):
+                return
+            new_name = short_name + self.mesh_suffix
+        self._actions[key] = FixAction(kind, node, new_name)
+
+    def add_check_items(self, check_name, items):
+        """
+        검사 결과 항목들을 해당 검사의 수정 동작으로 변환하여 추가합니다.
+
+        :param check_name: 검사 항목 이름 (예: 'naming')
+        :param items: 검사 결과 항목 문자열 리스트
+        :return: 추가할 수정 동작이 있는 검사였는지 여부
+        """
+        kinds = FIX_ACTIONS_BY_CHECK.get(check_name)
+        if not kinds:
+            return False
+        for item in items:
+            node = clean_item_name(item)
+            for kind in kinds:
+                self.add(kind, node)
+        return True
+
+    def ordered(self):
+        """
+        실행 순서대로 정렬된 수정 동작 리스트를 반환합니다.
+        동작 종류 순서(ACTION_ORDER)를 따르며, 이름 변경은 깊은 경로부터 실행합니다.
+        """
+        rank = {kind: i for i, kind in enumerate(ACTION_ORDER)}
+        return sorted(
+            self._actions.values(),
+            key=lambda a: (rank[a.kind], -a.depth if a.kind == ACTION_RENAME else 0)
+        )
+
+    def apply(self):
+        """
+        계획된 모든 수정 동작을 하나의 Undo 청크 안에서 실행합니다.
+
+        :return: {동작 종류: 처리된 노드 개수} 딕셔너리
+        :rtype: dict
+        """
+        summary = {kind: 0 for kind in ACTION_ORDER}
+        if not self._actions:
+            return summary
+
+        actions = self.ordered()
+        by_kind = {kind: [] for kind in ACTION_ORDER}
+        for action in actions:
+            by_kind[action.kind].append(action)
+
+        # 1. 존재 여부를 한 번에 확인하고, 모든 대상을 전체 경로로 통일합니다.
+        long_names = self._resolve_long_names({a.node for a in actions if a.kind != ACTION_DELETE_UNKNOWN})
+        for kind in ACTION_ORDER[1:]:
+            missing = [a.node for a in by_kind[kind] if a.node not in long_names]
+            if missing and self.log:
+                self.log.warning("%d개 노드가 씬에 존재하지 않아 '%s' 수정을 건너뜁니다.", len(missing), kind)
+            resolved = []
+            for action in by_kind[kind]:
+                if action.node in long_names:
+                    action.node = long_names[action.node]
+                    resolved.append(action)
+            by_kind[kind] = resolved
+        # 전체 경로로 바뀌었으므로 이름 변경 순서(깊은 경로 우선)를 다시 정렬합니다.
+        by_kind[ACTION_RENAME].sort(key=lambda a: -a.depth)
+
+        cmds.undoInfo(openChunk=True, chunkName="SceneValidatorFixAll")
+        try:
+            summary[ACTION_DELETE_UNKNOWN] = self._delete_unknown([a.node for a in by_kind[ACTION_DELETE_UNKNOWN]])
+            summary[ACTION_CLEANUP_UVSETS] = self._cleanup_uvsets([a.node for a in by_kind[ACTION_CLEANUP_UVSETS]])
+
+            history_nodes = [a.node for a in by_kind[ACTION_DELETE_HISTORY]]
+            if history_nodes:
+                cmds.delete(history_nodes, constructionHistory=True)
+                summary[ACTION_DELETE_HISTORY] = len(history_nodes)
+
+            freeze_nodes = [a.node for a in by_kind[ACTION_FREEZE_TRANSFORMS]]
+            if freeze_nodes:
+                cmds.makeIdentity(freeze_nodes, apply=True, translate=1, rotate=1, scale=1, normal=0)
+                summary[ACTION_FREEZE_TRANSFORMS] = len(freeze_nodes)
+
+            summary[ACTION_RENAME] = self._rename(by_kind[ACTION_RENAME])
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        if self.log:
+            self.log.info("일괄 수정 완료: %s", summary)
+        return summary
+
+    @staticmethod
+    def _resolve_long_names(nodes):
+        """
+        노드 이름을 {입력 이름: 전체 경로} 딕셔너리로 변환합니다. 존재하지 않는 노드는 제외됩니다.
+        전체 경로로 입력된 노드는 한 번의 cmds.ls 호출로 확인하고, 짧은 이름만 개별 조회합니다.
+        """
+        long_inputs = sorted(n for n in nodes if n.startswith('|'))
+        existing = set(cmds.ls(long_inputs, long=True) or []) if long_inputs else set()
+        resolved = {n: n for n in long_inputs if n in existing}
+        for node in nodes:
+            if node.startswith('|'):
+                continue
+            matches = cmds.ls(node, long=True) or []
+            if len(matches) == 1:
+                resolved[node] = matches[0]
+        return resolved
+
+    def _delete_unknown(self, nodes):
+        """잠기지 않은 Unknown 노드를 한 번에 삭제합니다."""
+        if not nodes:
+            return 0
+        nodes = cmds.ls(nodes) or []
+        if not nodes:
+            return 0
+        locked = cmds.lockNode(nodes, query=True) or []
+        unlocked = [n for n, is_locked in zip(nodes, locked) if not is_locked]
+        skipped = len(nodes) - len(unlocked)
+        if skipped and self.log:
+            self.log.warning("잠긴(locked) Unknown 노드 %d개는 건너뜁니다.", skipped)
+        if unlocked:
+            cmds.delete(unlocked)
+        return len(unlocked)
+
+    def _cleanup_uvsets(self, nodes):
+        """메쉬마다 'map1' 하나만 남도록 UV 셋을 정리합니다."""
+        count = 0
+        for node in nodes:
+            shapes = cmds.listRelatives(node, shapes=True, fullPath=True, type='mesh') or []
+            if not shapes:
+                continue
+            mesh = shapes[0]
+            uv_sets = cmds.polyUVSet(mesh, q=True, allUVSets=True) or []
+            if not uv_sets or uv_sets == ['map1']:
+                continue
+
+            if 'map1' in uv_sets:
+                keep = 'map1'
+            else:
+                cmds.polyUVSet(mesh, rename=True, newUVSet='map1', uvSet=uv_sets[0])
+                keep = uv_sets[0]
+            for uv_set in uv_sets:
+                if uv_set != keep:
+                    cmds.polyUVSet(mesh, delete=True, uvSet=uv_set)
+            count += 1
+        return count
+
+    def _rename(self, actions):
+        """
+        깊은 경로부터 이름을 변경합니다.
+        자식이 항상 부모보다 먼저 처리되므로, 처리 시점의 경로는 항상 유효합니다.
+        """
+        count = 0
+        for action in actions:
+            try:
+                cmds.rename(action.node, action.new_name)
+                count += 1
+            except RuntimeError as e:
+                if self.log:
+                    self.log.warning("이름 변경 실패 '%s': %s", action.node, e)
+        return count
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Maya 없이 .ma 파일을 사전 검사(pre-validation)하는 모듈입니다.
+
+퍼블리시된 .ma 파일에 Unknown 노드, 사용할 수 없는 플러그인(requires), 네이밍 규칙 위반,
+Freeze되지 않은 트랜스폼이 있는지 확인하기 위해 Maya를 띄우는 대신, core.ma_parser로 파일을
+스트리밍으로 읽어 SceneValidatorCore와 같은 규칙(validation_rules)과 같은 레지스트리/엔진(check_registry)으로 검사합니다.
+여러 파일은 프로세스 풀에서 병렬로 검사합니다.
+
+[실행 방법] (저장소 루트에서)
+    python -m tools.scene_validation_tool.offline_validation /show/assets/prop/bag/publish/maya/
+    python -m tools.scene_validation_tool.offline_validation a.ma b.ma --workers 8 --plugins mtoa pgYetiMaya
+    python -m tools.scene_validation_tool.offline_validation scenes/ --json report.json --fail_fast
+"""
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+
+from core import core_utils
+from core import log as core_log
+from core import ma_parser
+from . import check_registry
+from . import validation_rules
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(script_dir, 'naming_convention.config')
+LOG_FILE_PATH = os.path.join(script_dir, 'offline_validation.log')
+
+# Maya 기본으로 항상 존재하는 requires 항목
+BUILTIN_REQUIRES = {"maya"}
+
+
+def get_mesh_suffix():
+    """naming_convention.config에서 메쉬 접미사를 읽습니다. (SceneValidatorCore와 같은 설정)"""
+    return core_utils.get_config_value(CONFIG_PATH, 'naming_convention', 'mesh_suffix', fallback='_geo')
+
+
+def get_mesh_transforms(scene):
+    """
+    중간 계산용(intermediate) 메쉬를 제외한 메쉬의 트랜스폼 노드를 {전체 경로: MaNode}로 반환합니다.
+
+    :param scene: ma_parser.MaScene
+    :rtype: dict
+    """
+    transforms = {}
+    for mesh in scene.nodes_of_type("mesh"):
+        if mesh.attrs.get("intermediateObject") or mesh.parent is None:
+            continue
+        transforms[mesh.parent.long_name()] = mesh.parent
+    return transforms
+
+
+def build_offline_registry(scene, transforms, mesh_suffix, available_plugins=None):
+    """
+    .ma 요약(MaScene)을 대상으로 하는 검사 항목 레지스트리를 만듭니다.
+    검사 이름과 헤더는 SceneValidatorCore.build_check_registry()와 같으므로 결과를 같은 방식으로 다룰 수 있습니다.
+
+    :param scene: ma_parser.MaScene
+    :param transforms: get_mesh_transforms()의 결과
+    :param mesh_suffix: 메쉬 접미사
+    :param available_plugins: 사용 가능한 플러그인 이름 리스트 (None이면 플러그인 검사를 하지 않습니다.)
+    :rtype: check_registry.CheckRegistry
+    """
+    cr = check_registry
+    plugins = None if available_plugins is None else set(available_plugins) | BUILTIN_REQUIRES
+    plugin_types = scene.plugin_node_types()
+
+    def check_missing_plugins():
+        return [f"{plugin} ({version})" if version else plugin
+                for plugin, version, _types in scene.requires if plugin not in plugins]
+
+    def check_unknown_nodes():
+        unknown = []
+        for node in scene.nodes:
+            if node.type in validation_rules.UNKNOWN_NODE_TYPES:
+                unknown.append(node.name)
+            elif plugins is not None and plugin_types.get(node.type, "maya") not in plugins:
+                unknown.append(f"{node.name} ({node.type})")
+        return unknown
+
+    def check_naming_conventions(nodes):
+        return [n for n in nodes if not validation_rules.is_valid_mesh_name(n, mesh_suffix)]
+
+    def check_freeze_transforms(nodes):
+        unfrozen = []
+        for node in nodes:
+            attrs = transforms[node].attrs
+            if not validation_rules.is_frozen(attrs.get("translate", (0.0, 0.0, 0.0)),
+                                              attrs.get("rotate", (0.0, 0.0, 0.0)),
+                                              attrs.get("scale", (1.0, 1.0, 1.0))):
+                unfrozen.append(node)
+        return unfrozen
+
+    registry = cr.CheckRegistry()
+    if plugins is not None:
+        registry.register(cr.ValidationCheck(
+            "missing_plugins", "플러그인", "--- Missing Plugins ---", check_missing_plugins,
+            cost=cr.COST_CHEAP, needs_targets=False))
+    registry.register(cr.ValidationCheck(
+        "unknown_nodes", "알 수 없는 노드", "--- Unknown Nodes ---", check_unknown_nodes,
+        cost=cr.COST_CHEAP, needs_targets=False))
+    registry.register(cr.ValidationCheck(
+        "naming", "이름 규칙", "--- Naming Issues ---", check_naming_conventions,
+        cost=cr.COST_CHEAP))
+    registry.register(cr.ValidationCheck(
+        "freeze_transforms", "Freeze Transform", "--- Unfrozen Transforms ---", check_freeze_transforms,
+        cost=cr.COST_CHEAP))
+    return registry
+
+
+def validate_file(path, mesh_suffix=None, available_plugins=None, fail_fast=False):
+    """
+    .ma 파일 하나를 검사합니다. 프로세스 풀에서 실행할 수 있도록 결과를 딕셔너리로 반환합니다.
+
+    :param path: .ma 파일 경로
+    :param mesh_suffix: 메쉬 접미사 (None이면 설정 파일 값)
+    :param available_plugins: 사용 가능한 플러그인 이름 리스트 (선택)
+    :param fail_fast: 에러 심각도의 검사가 실패하면 나머지 검사를 건너뜀
+    :return: {'path', 'size', 'parse_time', 'nodes', 'passed', 'results', 'error'} 딕셔너리
+    :rtype: dict
+    """
+    report = {"path": path, "size": 0, "parse_time": 0.0, "nodes": 0,
+              "passed": False, "results": [], "error": None}
+    try:
+        report["size"] = os.path.getsize(path)
+        started = time.perf_counter()
+        scene = ma_parser.scan_scene(path)
+        report["parse_time"] = time.perf_counter() - started
+    except (OSError, UnicodeError) as e:
+        report["error"] = str(e)
+        return report
+
+    report["nodes"] = len(scene.nodes)
+    transforms = get_mesh_transforms(scene)
+    registry = build_offline_registry(scene, transforms, mesh_suffix or get_mesh_suffix(), available_plugins)
+    names = None if transforms else [c.name for c in registry.checks if not c.needs_targets]
+    engine = check_registry.ValidationEngine(registry, fail_fast=fail_fast)
+    results = engine.run(sorted(transforms), names=names)
+
+    report["passed"] = not any(r.blocking for r in results)
+    report["results"] = [{
+        "name": r.check.name,
+        "header": r.check.header,
+        "severity": r.check.severity,
+        "status": r.status,
+        "items": r.items,
+        "reason": r.reason,
+    } for r in results]
+    return report
+
+
+def find_ma_files(paths):
+    """파일 경로와 폴더 경로(하위 폴더 포함)에서 .ma 파일 목록을 수집합니다."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, names in os.walk(path):
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(".ma"))
+        else:
+            files.append(path)
+    return files
+
+
+def validate_files(paths, workers=None, mesh_suffix=None, available_plugins=None, fail_fast=False):
+    """
+    여러 .ma 파일을 프로세스 풀에서 병렬로 검사하고, 끝나는 순서대로 결과를 반환하는 제너레이터입니다.
+
+    :param paths: .ma 파일 경로 리스트
+    :param workers: 프로세스 개수 (None이면 CPU 개수, 1이면 현재 프로세스에서 순차 실행)
+    :return: validate_file() 결과 딕셔너리 제너레이터
+    """
+    mesh_suffix = mesh_suffix or get_mesh_suffix()
+    if workers == 1 or len(paths) <= 1:
+        for path in paths:
+            yield validate_file(path, mesh_suffix, available_plugins, fail_fast)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(validate_file, path, mesh_suffix, available_plugins, fail_fast)
+                   for path in paths]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Maya-free pre-validation of Maya ASCII (.ma) files")
+    parser.add_argument("paths", nargs="+", help=".ma files or directories to scan")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--suffix", default=None, help="Mesh suffix (default: naming_convention.config)")
+    parser.add_argument("--plugins", nargs="*", default=None,
+                        help="Available plugin names. If given, requires/plugin node types are checked")
+    parser.add_argument("--fail_fast", action="store_true", help="Stop checking a file at the first error")
+    parser.add_argument("--json", dest="json_path", help="Write the full report as JSON")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    opts = parse_args(sys.argv[1:] if args is None else args)
+    log = core_log.get_logger(__name__, LOG_FILE_PATH)
+
+    files = find_ma_files(opts.paths)
+    if not files:
+        log.warning("검사할 .ma 파일이 없습니다: %s", opts.paths)
+        return 1
+
+    log.info("%d개 .ma 파일 오프라인 검사 시작", len(files))
+    started = time.perf_counter()
+    reports = []
+    total_size = 0
+    for report in validate_files(files, opts.workers, opts.suffix, opts.plugins, opts.fail_fast):
+        reports.append(report)
+        total_size += report["size"]
+        if report["error"]:
+            log.error("[ERROR] %s: %s", report["path"], report["error"])
+            continue
+        failed = [r for r in report["results"] if r["items"]]
+        status = "PASSED" if report["passed"] else "FAILED"
+        log.info("[%s] %s (%d nodes, %.2fs)", status, report["path"], report["nodes"], report["parse_time"])
+        for result in failed:
+            log.info("    %s %d개 (%s)", result["header"], len(result["items"]), result["severity"])
+
+    elapsed = time.perf_counter() - started
+    failed_files = [r for r in reports if r["error"] or not r["passed"]]
+    log.info("완료: %d개 파일, %d개 실패, %.1f MB, %.2fs (%.1f MB/s)",
+             len(reports), len(failed_files), total_size / 1e6, elapsed,
+             total_size / 1e6 / elapsed if elapsed else 0.0)
+
+    if opts.json_path:
+        with open(opts.json_path, "w") as f:
+            json.dump(sorted(reports, key=lambda r: r["path"]), f, indent=4, ensure_ascii=False)
+        log.info("리포트 저장: %s", opts.json_path)
+    return 1 if failed_files else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+대용량 검사 결과를 표시하기 위한 가상화(virtualized) 모델입니다.
+
+QListWidget은 항목마다 QListWidgetItem을 만들기 때문에 수만 개의 문제 항목을 채우는 데 수 초가 걸리고
+메모리도 많이 사용합니다. 이 모델은 문제 항목을 검사 헤더별 문자열 리스트로만 보관하고,
+뷰가 요청하는 행만 그때그때 계산하여 반환합니다.
+
+- 지연 로딩: canFetchMore/fetchMore로 스크롤한 만큼만 행을 노출합니다.
+- 접기/펼치기: 헤더 행을 클릭하면 해당 검사의 항목을 접거나 펼칩니다.
+- 필터: 소문자 검색 인덱스를 미리 만들어 두고, 검색어가 이어서 입력되는 경우 이전 결과 안에서만 다시 찾습니다.
+"""
+import bisect
+
+from PySide2 import QtCore, QtGui
+
+# 모델이 제공하는 사용자 정의 역할(Role)
+HeaderRole = QtCore.Qt.UserRole + 1    # 행이 속한 검사 헤더 문자열
+IsHeaderRole = QtCore.Qt.UserRole + 2  # 헤더 행 여부
+ItemTextRole = QtCore.Qt.UserRole + 3  # 문제 항목 원본 문자열 (헤더/메시지 행은 None)
+
+
+class _ResultGroup:
+    """검사 헤더 하나와 그 문제 항목들을 보관합니다."""
+    __slots__ = ("header", "items", "keys", "visible")
+
+    def __init__(self, header):
+        self.header = header
+        self.items = []      # 원본 문자열
+        self.keys = []       # 필터용 소문자 인덱스
+        self.visible = None  # 필터 결과 인덱스 리스트 (None이면 전체)
+
+
+class ValidationResultModel(QtCore.QAbstractListModel):
+    """
+    검사 헤더별로 그룹화된 문제 항목을 제공하는 리스트 모델입니다.
+    """
+    FETCH_BATCH = 500 # fetchMore 한 번에 노출할 행 개수
+
+    HEADER_FOREGROUND = QtGui.QColor("#FFCF5E")
+    HEADER_BACKGROUND = QtGui.QColor(50, 50, 50)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._groups = []
+        self._group_index = {}   # header -> group index
+        self._collapsed = set()
+        self._filter = ""
+        self._message = None     # 결과가 없을 때 표시할 안내 문구
+        self._offsets = [0]      # 그룹별 시작 행 (누적 합)
+        self._loaded = 0         # 뷰에 노출된 행 개수
+
+    # --- 데이터 변경 ---
+    def clear(self):
+        """모든 결과와 안내 문구를 지웁니다. (필터와 접힘 상태는 유지합니다.)"""
+        self.beginResetModel()
+        self._groups = []
+        self._group_index = {}
+        self._message = None
+        self._rebuild_offsets()
+        self._loaded = 0
+        self.endResetModel()
+
+    def set_message(self, text):
+        """결과 대신 표시할 안내 문구를 설정합니다. (예: '모든 검사를 통과했습니다.')"""
+        self.beginResetModel()
+        self._message = text
+        self._loaded = self._total_rows()
+        self.endResetModel()
+
+    def add_items(self, header, items):
+        """
+        검사 헤더에 문제 항목을 추가합니다. 헤더가 없으면 마지막에 새로 만듭니다.
+        검사 결과를 스트리밍으로 추가할 때 마지막 그룹에 이어 붙이는 경우는 행 삽입만 알리고,
+        중간 그룹이 바뀌면 모델을 다시 구성합니다.
+
+        :param header: 검사 헤더 문자열
+        :param items: 추가할 문제 항목 문자열 리스트
+        """
+        if not items:
+            return
+        if self._message is not None: # 안내 문구가 있던 상태라면 문구를 지우고 다시 구성합니다.
+            self._message = None
+            self._reset_rows()
+
+        old_total = self._total_rows()
+        fully_loaded = self._loaded >= old_total
+        index = self._group_index.get(header)
+        appending_last = index is None or index == len(self._groups) - 1
+        existing = index is not None
+
+        if index is None:
+            index = len(self._groups)
+            self._group_index[header] = index
+            self._groups.append(_ResultGroup(header))
+        group = self._groups[index]
+
+        keys = [item.lower() for item in items]
+        start = len(group.items)
+        group.items.extend(items)
+        group.keys.extend(keys)
+        if self._filter:
+            matched = [start + i for i, key in enumerate(keys) if self._filter in key]
+            if group.visible is None:
+                group.visible = []
+            group.visible.extend(matched)
+
+        if not appending_last:
+            self._reset_rows()
+            return
+
+        self._rebuild_offsets()
+        header_row = self._offsets[index]
+        if existing and header_row < self._loaded:
+            # 기존 그룹에 이어 붙이면 헤더의 항목 수 "(n)"가 바뀌므로 헤더 행도 다시 그리게 합니다.
+            header_index = self.index(header_row, 0)
+            self.dataChanged.emit(header_index, header_index)
+        new_total = self._total_rows()
+        if fully_loaded and new_total > old_total:
+            # 이미 모두 노출된 상태라면 한 배치만큼 바로 보여주고, 나머지는 fetchMore에 맡깁니다.
+            last = min(new_total, old_total + self.FETCH_BATCH) - 1
+            self.beginInsertRows(QtCore.QModelIndex(), old_total, last)
+            self._loaded = last + 1
+            self.endInsertRows()
+
+    def set_filter(self, text):
+        """
+        항목 필터를 설정합니다. (대소문자 구분 없음, 부분 일치)
+        새 검색어가 이전 검색어를 포함하면 이전 결과 안에서만 다시 찾습니다.
+
+        :param text: 검색어 (빈 문자열이면 필터 해제)
+        """
+        text = text.strip().lower()
+        if text == self._filter:
+            return
+
+        narrowing = bool(self._filter) and self._filter in text
+        for group in self._groups:
+            if not text:
+                group.visible = None
+            elif narrowing and group.visible is not None:
+                keys = group.keys
+                group.visible = [i for i in group.visible if text in keys[i]]
+            else:
+                group.visible = [i for i, key in enumerate(group.keys) if text in key]
+        self._filter = text
+        self._reset_rows()
+
+    def toggle_collapsed(self, header):
+        """헤더의 접힘 상태를 전환합니다."""
+        if header in self._collapsed:
+            self._collapsed.discard(header)
+        else:
+            self._collapsed.add(header)
+        self._reset_rows()
+
+    def set_all_collapsed(self, collapsed):
+        """모든 헤더를 접거나 펼칩니다."""
+        self._collapsed = {g.header for g in self._groups} if collapsed else set()
+        self._reset_rows()
+
+    # --- 조회 ---
+    def item_count(self):
+        """필터/접힘과 관계없이 전체 문제 항목 개수를 반환합니다."""
+        return sum(len(g.items) for g in self._groups)
+
+    def iter_items(self):
+        """필터/접힘과 관계없이 모든 (헤더, 항목) 쌍을 순회합니다."""
+        for group in self._groups:
+            for item in group.items:
+                yield group.header, item
+
+    def headers(self):
+        """결과에 포함된 헤더 리스트를 반환합니다."""
+        return [g.header for g in self._groups]
+
+    # --- QAbstractListModel 구현 ---
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < self._total_rows()
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return
+        total = self._total_rows()
+        count = min(self.FETCH_BATCH, total - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        group, item_index = self._locate(index.row())
+        if group is None or item_index is None:
+            # 헤더는 클릭(접기/펼치기)만 가능하고 선택은 되지 않습니다.
+            return QtCore.Qt.ItemIsEnabled if group is not None else QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        group, item_index = self._locate(index.row())
+
+        if group is None: # 안내 문구 행
+            if role in (QtCore.Qt.DisplayRole, QtCore.Qt.ToolTipRole):
+                return self._message
+            return None
+
+        is_header = item_index is None
+        if role == QtCore.Qt.DisplayRole:
+            if is_header:
+                arrow = "▶" if group.header in self._collapsed else "▼"
+                shown = len(group.items) if group.visible is None else len(group.visible)
+                count = f"{shown}/{len(group.items)}" if group.visible is not None else f"{len(group.items)}"
+                return f"{arrow} {group.header} ({count})"
+            return group.items[item_index]
+        if role == ItemTextRole:
+            return None if is_header else group.items[item_index]
+        if role == HeaderRole:
+            return group.header
+        if role == IsHeaderRole:
+            return is_header
+        if is_header and role == QtCore.Qt.ForegroundRole:
+            return self.HEADER_FOREGROUND
+        if is_header and role == QtCore.Qt.BackgroundRole:
+            return self.HEADER_BACKGROUND
+        return None
+
+    # --- 내부 헬퍼 ---
+    def _group_rows(self, group):
+        if group.header in self._collapsed:
+            return 1
+        return 1 + (len(group.items) if group.visible is None else len(group.visible))
+
+    def _rebuild_offsets(self):
+        offsets = [0]
+        for group in self._groups:
+            offsets.append(offsets[-1] + self._group_rows(group))
+        self._offsets = offsets
+
+    def _total_rows(self):
+        if not self._groups:
+            return 1 if self._message else 0
+        return self._offsets[-1]
+
+    def _reset_rows(self):
+        self.beginResetModel()
+        self._rebuild_offsets()
+        self._loaded = min(self._total_rows(), max(self._loaded, self.FETCH_BATCH))
+        self.endResetModel()
+
+    def _locate(self, row):
+        """
+        행 번호를 (그룹, 그룹 내 항목 인덱스)로 변환합니다.
+        헤더 행이면 항목 인덱스는 None, 안내 문구 행이면 (None, None)입니다.
+        """
+        if not self._groups:
+            return None, None
+        group_index = bisect.bisect_right(self._offsets, row) - 1
+        group = self._groups[group_index]
+        local = row - self._offsets[group_index]
+        if local == 0:
+            return group, None
+        local -= 1
+        return group, (local if group.visible is None else group.visible[local])
@@ -6,9 +6,14 @@ import maya.cmds as cmds # Maya 커맨드 모듈 임포트
 import os # os 모듈 임포트
 import subprocess # subprocess 모듈 임포트
 import platform # platform 모듈 임포트
+import time # time 모듈 임포트
 from . import scene_validation_tool # 씬 검사 로직 코어 모듈 임포트
+from . import check_registry # 검사 항목 레지스트리 모듈 임포트
+from . import result_model # 대용량 결과 표시용 모델 모듈 임포트
+from maya_utils import maya_utils # Maya 공통 유틸리티 모듈 임포트
 import importlib # importlib 임포트
 importlib.reload(scene_validation_tool) # 코어 모듈 리로드
+importlib.reload(result_model) # 결과 모델 모듈 리로드
 
 
 class SceneValidatorUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
@@ -17,21 +22,30 @@ class SceneValidatorUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
     이 클래스는 씬의 네이밍 규칙, 히스토리, 트랜스폼, UV 등 다양한 항목을 검사하고,
     결과를 목록으로 보여주며, 선택된 문제나 전체 문제를 수정하는 기능을 제공합니다.
     """
+    VALIDATION_CHUNK_SIZE = 200 # 한 번에 검사할 노드 개수
+    VALIDATION_TICK_MS = 40 # QTimer 틱 하나에서 검사에 사용할 최대 시간 (ms)
+    SELECTION_SYNC_DELAY_MS = 50 # 리스트 선택 변경을 모아서 Maya에 반영하기까지의 지연 시간 (ms)
+    FILTER_DELAY_MS = 150 # 필터 입력이 멈춘 뒤 필터를 적용하기까지의 지연 시간 (ms)
+
     def __init__(self, parent=None):
         """
         UI 클래스의 생성자입니다.
-        창 설정, 코어 로직 초기화, 수정 기능 맵핑, UI 구성을 담당합니다.
+        창 설정, 코어 로직 초기화, 검사 레지스트리 생성, UI 구성을 담당합니다.
         """
         super().__init__(parent=parent) # 부모 클래스의 생성자를 호출합니다.
         self.core = scene_validation_tool.SceneValidatorCore() # 검사 로직을 담고 있는 코어 클래스를 인스턴스화합니다.
         self.setWindowTitle("Advanced Scene Validator") # 윈도우의 제목을 설정합니다.
         self.setMinimumSize(800, 650) # 윈도우의 최소 크기를 설정합니다. (너비 확장)
-        self.fix_map = { # 수정 가능한 항목의 헤더와 해당 수정 함수를 맵핑합니다.
-            "--- Naming Issues ---": self.core.fix_naming_conventions, # 이름 규칙 위반 문제를 수정하는 함수를 맵핑합니다.
-            "--- Histroy Detected ---": self.core.fix_history_and_transforms, # 히스토리 문제를 수정하는 함수를 맵핑합니다.
-            "--- Unfrozen Transforms ---": self.core.fix_history_and_transforms, # 동결되지 않은 트랜스폼 문제를 수정하는 함수를 맵핑합니다.
-            "--- UV Set Issues ---": self.core.cleanup_uvsets # UV 세트 문제를 수정하는 함수를 맵핑합니다.
-        }
+        self.registry = self.core.build_check_registry() # 검사 항목 레지스트리를 생성합니다.
+        self._validation_run = None # 진행 중인 검사 상태 (없으면 None)
+        self._validation_timer = QtCore.QTimer(self) # 검사를 조금씩 나누어 실행하기 위한 타이머입니다.
+        self._validation_timer.timeout.connect(self._process_validation_tick)
+        self._selection_sync_timer = QtCore.QTimer(self) # 선택 동기화를 한 번에 모아서 처리하기 위한 타이머입니다.
+        self._selection_sync_timer.setSingleShot(True)
+        self._selection_sync_timer.timeout.connect(self.sync_selection_to_maya)
+        self._filter_timer = QtCore.QTimer(self) # 필터 입력을 모아서 적용하기 위한 타이머입니다.
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self.apply_result_filter)
         self.setup_ui() # UI를 설정하는 메소드를 호출합니다.
 
     def setup_ui(self):
@@ -64,19 +78,64 @@ class SceneValidatorUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         top_btn_layout.addWidget(self.btn_open_log) # 버튼을 상단 레이아웃에 추가합니다.
         layout.addLayout(top_btn_layout) # 상단 버튼 레이아웃을 메인 레이아웃에 추가합니다.
 
+        # 1-1. 검사 실행 옵션 (fail-fast, 시간 예산)
+        option_layout = QtWidgets.QHBoxLayout() # 실행 옵션을 위한 수평 레이아웃을 생성합니다.
+        self.chk_fail_fast = QtWidgets.QCheckBox("Fail Fast (퍼블리시 게이트)") # 에러 발생 시 즉시 중단하는 옵션입니다.
+        self.spin_time_budget = QtWidgets.QDoubleSpinBox() # 실행 시간 예산(초)을 입력받는 스핀박스입니다.
+        self.spin_time_budget.setRange(0.0, 3600.0) # 0은 제한 없음을 의미합니다.
+        self.spin_time_budget.setSuffix(" s")
+        self.spin_time_budget.setSpecialValueText("제한 없음") # 0일 때 표시될 문자열입니다.
+        self.chk_profile = QtWidgets.QCheckBox("Profile (시간/cmds 호출 측정)") # 검사별 프로파일링 옵션입니다.
+        self.chk_profile.setChecked(True)
+        option_layout.addWidget(self.chk_fail_fast)
+        option_layout.addWidget(self.chk_profile)
+        option_layout.addStretch()
+        option_layout.addWidget(QtWidgets.QLabel("Time Budget:"))
+        option_layout.addWidget(self.spin_time_budget)
+        layout.addLayout(option_layout) # 옵션 레이아웃을 메인 레이아웃에 추가합니다.
+
+        # 1-2. 진행 상태 표시 (진행 표시줄, 현재 검사/예상 남은 시간, 취소 버튼)
+        progress_layout = QtWidgets.QHBoxLayout() # 진행 상태를 위한 수평 레이아웃을 생성합니다.
+        self.progress_bar = QtWidgets.QProgressBar() # 전체 진행률을 표시하는 진행 표시줄입니다.
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setTextVisible(False)
+        self.progress_label = QtWidgets.QLabel("대기 중") # 현재 검사와 예상 남은 시간을 표시합니다.
+        self.progress_label.setMinimumWidth(280)
+        self.btn_cancel = QtWidgets.QPushButton("Cancel") # 진행 중인 검사를 취소하는 버튼입니다.
+        self.btn_cancel.setEnabled(False)
+        progress_layout.addWidget(self.progress_bar, 1)
+        progress_layout.addWidget(self.progress_label)
+        progress_layout.addWidget(self.btn_cancel)
+        layout.addLayout(progress_layout) # 진행 상태 레이아웃을 메인 레이아웃에 추가합니다.
+
         # 2. 결과 및 로그 표시를 위한 스플리터
         splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal) # 수평 스플리터를 생성합니다.
 
         # 2-1. 왼쪽: 문제가 발견된 항목 리스트
         result_group = QtWidgets.QGroupBox("문제가 발견된 항목 (Failed Items)") # 그룹박스를 생성합니다.
         result_layout = QtWidgets.QVBoxLayout(result_group) # 그룹박스용 레이아웃을 생성합니다.
-        self.result_list = QtWidgets.QListWidget() # 결과를 표시할 리스트 위젯을 생성합니다.
+        filter_layout = QtWidgets.QHBoxLayout() # 필터와 접기/펼치기 버튼을 위한 수평 레이아웃입니다.
+        self.result_filter = QtWidgets.QLineEdit() # 결과 항목을 이름으로 거르는 입력란입니다.
+        self.result_filter.setPlaceholderText("필터 (노드 이름 일부)")
+        self.result_filter.setClearButtonEnabled(True)
+        self.btn_expand_all = QtWidgets.QPushButton("펼치기") # 모든 헤더를 펼치는 버튼입니다.
+        self.btn_collapse_all = QtWidgets.QPushButton("접기") # 모든 헤더를 접는 버튼입니다.
+        filter_layout.addWidget(self.result_filter, 1)
+        filter_layout.addWidget(self.btn_expand_all)
+        filter_layout.addWidget(self.btn_collapse_all)
+        result_layout.addLayout(filter_layout)
+
+        # 항목 수가 많아도 빠르게 표시할 수 있도록 모델/뷰(가상화) 방식으로 결과를 표시합니다.
+        self.result_model = result_model.ValidationResultModel(self) # 결과 데이터를 보관하는 모델입니다.
+        self.result_list = QtWidgets.QListView() # 결과를 표시할 리스트 뷰를 생성합니다.
+        self.result_list.setModel(self.result_model)
+        self.result_list.setUniformItemSizes(True) # 모든 행의 높이가 같다고 알려 레이아웃 계산을 생략합니다.
         self.result_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection) # 여러 항목을 선택할 수 있도록 설정합니다.
         self.result_list.setStyleSheet("""
-            QListWidget { border: 1px solid #333; border-radius: 5px; background-color: #2D2D2D; }
-            QListWidget::item:selected { background-color: #5A98D1; color: white; }
-        """) # 리스트 위젯의 스타일시트를 설정합니다.
-        result_layout.addWidget(self.result_list) # 리스트 위젯을 그룹 레이아웃에 추가합니다.
+            QListView { border: 1px solid #333; border-radius: 5px; background-color: #2D2D2D; }
+            QListView::item:selected { background-color: #5A98D1; color: white; }
+        """) # 리스트 뷰의 스타일시트를 설정합니다.
+        result_layout.addWidget(self.result_list) # 리스트 뷰를 그룹 레이아웃에 추가합니다.
 
         # 2-2. 오른쪽: 검사 진행 내역 로그
         log_group = QtWidgets.QGroupBox("검사 진행 내역 (Validation Log)") # 그룹박스를 생성합니다.
@@ -115,29 +174,57 @@ class SceneValidatorUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         # 시그널-슬롯 연결
         self.btn_check.clicked.connect(self.run_full_check) # '씬 검사' 버튼 클릭 시 run_full_check 함수를 실행합니다.
         self.btn_open_log.clicked.connect(self.open_log_file) # '로그 파일 열기' 버튼 클릭 시 open_log_file 함수를 실행합니다.
+        self.btn_cancel.clicked.connect(self.cancel_full_check) # '취소' 버튼 클릭 시 진행 중인 검사를 취소합니다.
         self.btn_fix_selected.clicked.connect(self.run_fix_selected) # '선택 항목 수정' 버튼 클릭 시 run_fix_selected 함수를 실행합니다.
         self.btn_fix_all.clicked.connect(self.run_fix_all) # '전체 수정' 버튼 클릭 시 run_fix_all 함수를 실행합니다.
-        self.result_list.itemSelectionChanged.connect(self.sync_selection_to_maya) # 리스트의 선택이 변경되면 Maya 씬의 선택과 동기화합니다.
+        self.result_list.selectionModel().selectionChanged.connect(self._schedule_selection_sync) # 리스트의 선택이 변경되면 Maya 씬의 선택과 동기화합니다.
+        self.result_list.clicked.connect(self._on_result_clicked) # 헤더를 클릭하면 접거나 펼칩니다.
+        self.result_filter.textChanged.connect(lambda _: self._filter_timer.start(self.FILTER_DELAY_MS)) # 입력이 멈추면 필터를 적용합니다.
+        self.btn_expand_all.clicked.connect(lambda: self.result_model.set_all_collapsed(False))
+        self.btn_collapse_all.clicked.connect(lambda: self.result_model.set_all_collapsed(True))
+
+    def apply_result_filter(self):
+        """
+        필터 입력란의 문자열로 결과 항목을 거릅니다.
+        """
+        self.result_model.set_filter(self.result_filter.text())
+
+    def _on_result_clicked(self, index):
+        """
+        헤더 행을 클릭하면 해당 검사의 항목을 접거나 펼칩니다.
+        :param index: 클릭된 행의 QModelIndex
+        """
+        if index.data(result_model.IsHeaderRole):
+            self.result_model.toggle_collapsed(index.data(result_model.HeaderRole))
+
+    def _schedule_selection_sync(self, *args):
+        """
+        선택 변경을 바로 처리하지 않고, 짧은 지연 후 한 번에 Maya에 반영하도록 예약합니다.
+        (Shift 클릭 등으로 선택이 연속해서 바뀌어도 동기화는 한 번만 실행됩니다.)
+        """
+        self._selection_sync_timer.start(self.SELECTION_SYNC_DELAY_MS)
 
-    def add_selection_header(self, title):
+    def _selected_result_items(self):
         """
-        '문제가 발견된 항목' 리스트에 카테고리 헤더 아이템을 추가합니다.
-        :param title: 헤더로 표시될 문자열
+        리스트에서 선택된 문제 항목들을 (헤더, 항목 문자열) 리스트로 반환합니다.
         """
-        item = QtWidgets.QListWidgetItem(title) # 리스트 위젯 아이템을 생성합니다.
-        item.setFlags(QtCore.Qt.NoItemFlags) # 선택이나 다른 상호작용이 불가능하도록 플래그를 설정합니다.
-        item.setBackground(QtGui.QColor(50, 50, 50)) # 배경색을 설정합니다.
-        item.setForeground(QtGui.QColor("#FFCF5E")) # 글자색을 설정합니다.
-        self.result_list.addItem(item) # 리스트에 아이템을 추가합니다.
+        selected = []
+        for index in self.result_list.selectionModel().selectedIndexes():
+            item_text = index.data(result_model.ItemTextRole)
+            if item_text is not None: # 헤더나 안내 문구 행은 제외합니다.
+                selected.append((index.data(result_model.HeaderRole), item_text))
+        return selected
 
     def add_log_entry(self, text, passed):
         """
         '검사 진행 내역' 리스트에 로그를 추가하고, 결과에 따라 색상을 지정합니다.
         :param text: 로그로 표시될 문자열
-        :param passed: 검사 통과 여부 (True/False)
+        :param passed: 검사 통과 여부 (True/False, 실행되지 않은 검사는 None)
         """
         item = QtWidgets.QListWidgetItem(text) # 리스트 위젯 아이템을 생성합니다.
-        if passed: # 검사를 통과했다면
+        if passed is None: # 검사가 실행되지 않았다면
+            item.setForeground(QtGui.QColor("#FFA726")) # 주황색으로 표시합니다.
+        elif passed: # 검사를 통과했다면
             item.setForeground(QtGui.QColor("#4CAF50")) # 초록색으로 표시합니다.
         else: # 검사를 실패했다면
             item.setForeground(QtGui.QColor("#F44336")) # 빨간색으로 표시합니다.
@@ -145,71 +232,130 @@ class SceneValidatorUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
 
     def run_full_check(self):
         """
-        씬의 모든 항목에 대한 검사를 수행하고, 문제 항목과 검사 내역을 UI에 표시합니다.
-        모든 검사가 끝난 후, 발견된 모든 문제점을 요약하여 로그 파일에 한 번에 기록합니다.
+        레지스트리에 등록된 검사를 비용이 낮은 순서로 수행하고, 문제 항목과 검사 내역을 UI에 표시합니다.
+        검사는 노드 청크 단위로 나뉘어 QTimer 틱마다 조금씩 실행되므로 검사 중에도 Maya UI가 멈추지 않으며,
+        발견된 문제 항목은 즉시 리스트에 추가됩니다. 모든 검사가 끝나면 결과를 로그 파일에 한 번에 기록합니다.
         """
-        self.result_list.clear()
+        if self._validation_run is not None: # 이미 검사가 진행 중이면
+            return # 새 검사를 시작하지 않습니다.
+
+        self.result_model.clear()
         self.log_list.clear()
         
         logger = self.core.log
         logger.info("="*20 + " Starting New Scene Validation " + "="*20)
 
-        # UI에 표시될 문제 아이템들을 임시 저장
-        all_found_items = {}
-
         # --- 1. 수집 단계 (Aggregation Phase) ---
-        
-        # 1-1. 알 수 없는 노드(Unknown Node) 검사
-        unknown_nodes = cmds.ls(type='unknown')
-        if unknown_nodes:
-            self.add_log_entry(f"• 알 수 없는 노드 검사... 실패 ({len(unknown_nodes)}개)", passed=False)
-            all_found_items["--- Unknown Nodes ---"] = unknown_nodes
-        else:
-            self.add_log_entry("• 알 수 없는 노드 검사... 통과", passed=True)
-
-        # 1-2. 메시(Mesh) 관련 검사
         targets = self.core.get_all_mesh_transforms()
+        names = None
         if not targets:
+            # 메시가 없으면 대상이 필요 없는 검사(Unknown 노드 등)만 실행합니다.
             self.add_log_entry("• 메시 관련 검사... 대상 없음", passed=True)
-            if not unknown_nodes:
-                self.result_list.addItem("검사할 대상(Mesh)이 없습니다.")
-            # 로그 파일에 요약 기록 후 종료
-            logger.info("Validation finished: No meshes found to check.")
-            logger.info("="*20 + " Scene Validation Finished " + "="*20 + "\n")
+            names = [c.name for c in self.registry.checks if not c.needs_targets]
+
+        engine = check_registry.ValidationEngine(
+            self.registry,
+            fail_fast=self.chk_fail_fast.isChecked(),
+            time_budget=self.spin_time_budget.value(),
+            log=logger,
+            profiler=self.core.create_profiler() if self.chk_profile.isChecked() else None
+        )
+
+        # --- 2. 점진적 실행 단계 (Time-sliced Phase) ---
+        # 진행 상태는 하나의 딕셔너리로 관리하며, 틱마다 _process_validation_tick에서 갱신합니다.
+        self._validation_run = {
+            "engine": engine,
+            "events": engine.iter_run(targets, names=names, chunk_size=self.VALIDATION_CHUNK_SIZE),
+            "has_targets": bool(targets),
+            "results": [],
+        }
+        self._set_validation_running(True)
+        self._validation_timer.start(0)
+
+    def cancel_full_check(self):
+        """
+        진행 중인 검사를 취소합니다. 남은 검사는 '실행 안 됨'으로 보고됩니다.
+        """
+        if self._validation_run is not None:
+            self._validation_run["engine"].cancel()
+            self.progress_label.setText("취소하는 중...")
+
+    def _process_validation_tick(self):
+        """
+        QTimer 틱마다 호출되어 정해진 시간(VALIDATION_TICK_MS) 동안만 검사를 진행합니다.
+        새로 발견된 문제 항목은 바로 리스트에 추가하고, 진행률과 예상 남은 시간을 갱신합니다.
+        """
+        run = self._validation_run
+        if run is None:
+            self._validation_timer.stop()
             return
 
-        # 실행할 검사 목록 정의
-        checks_to_run = [
-            {"name": "이름 규칙", "header": "--- Naming Issues ---", "func": self.core.check_naming_conventions},
-            {"name": "히스토리", "header": "--- Histroy Detected ---", "func": self.core.check_history},
-            {"name": "트랜스폼 동결", "header": "--- Unfrozen Transforms ---", "func": self.core.check_freeze_transforms},
-            {"name": "다중 UV 세트", "header": "--- UV Set Issues ---", "func": self.core.check_multi_uvsets},
-            {"name": "UV 오버랩", "header": "--- UV Overlap (Faces) ---", "func": self.core.check_uv_overlapping},
-            {"name": "메시 에러", "header": "--- Mesh Errors (NGons, Non-manifold) ---", "func": self.core.check_mesh_errors},
-            {"name": "UV 할당 에러", "header": "--- UV Errors (Missing, Unassigned) ---", "func": self.core.check_uv_errors},
-        ]
-
-        # 정의된 검사들을 순회하며 에러 수집
-        for check in checks_to_run:
-            errors = check["func"](targets)
-            if errors:
-                self.add_log_entry(f"• {check['name']} 검사... 실패 ({len(errors)}개)", passed=False)
-                all_found_items[check["header"]] = errors
-            else:
-                self.add_log_entry(f"• {check['name']} 검사... 통과", passed=True)
+        deadline = time.perf_counter() + self.VALIDATION_TICK_MS / 1000.0
+        try:
+            while time.perf_counter() < deadline:
+                event = next(run["events"])
+                self._handle_progress_event(event)
+        except StopIteration:
+            self._finish_full_check()
+        except Exception:
+            self.core.log.exception("씬 검사 중 예상치 못한 오류가 발생했습니다.")
+            self._finish_full_check()
+
+    def _handle_progress_event(self, event):
+        """
+        엔진의 ProgressEvent 하나를 UI에 반영합니다.
+        :param event: check_registry.ProgressEvent
+        """
+        check = event.check
+        run = self._validation_run
 
-        # --- 2. UI 채우기 단계 (UI Population Phase) ---
+        if event.new_items: # 새로 발견된 문제 항목을 바로 리스트에 추가합니다.
+            self.result_model.add_items(check.header, event.new_items)
 
-        if not all_found_items:
-            self.result_list.addItem("모든 검사를 통과했습니다.")
+        self.progress_bar.setValue(int(event.fraction * 1000))
+        if event.result is None:
+            eta = f", 남은 시간 약 {event.eta:.0f}초" if event.eta is not None else ""
+            self.progress_label.setText(f"{check.label} 검사 중... {event.done:,}/{event.total:,}{eta}")
+            return
+
+        result = event.result
+        run["results"].append(result)
+        if result.status == check_registry.STATUS_NOT_RUN:
+            self.add_log_entry(f"• {check.label} 검사... 실행 안 됨 ({result.reason})", passed=None)
+        elif result.status == check_registry.STATUS_ERROR:
+            self.add_log_entry(f"• {check.label} 검사... 오류 ({result.reason})", passed=False)
+        elif result.items:
+            self.add_log_entry(f"• {check.label} 검사... 실패 ({len(result.items)}개){self._format_profile(result)}", passed=False)
         else:
-            for header, items in all_found_items.items():
-                self.add_selection_header(header)
-                for item in items:
-                    self.result_list.addItem(item)
-        
+            self.add_log_entry(f"• {check.label} 검사... 통과{self._format_profile(result)}", passed=True)
+
+    def _finish_full_check(self):
+        """
+        모든 검사가 끝나거나 취소되었을 때 UI 상태를 복구하고, 결과를 로그 파일에 기록합니다.
+        """
+        self._validation_timer.stop()
+        run, self._validation_run = self._validation_run, None
+        self._set_validation_running(False)
+
+        logger = self.core.log
+        results = run["results"]
+        all_found_items = {r.check.header: r.items for r in results if r.items}
+
+        if not all_found_items:
+            if not run["has_targets"]:
+                self.result_model.set_message("검사할 대상(Mesh)이 없습니다.")
+            else:
+                self.result_model.set_message("모든 검사를 통과했습니다.")
+
         # --- 3. 파일 로깅 단계 (File Logging Phase) ---
         
+        if self.chk_profile.isChecked():
+            self.core.log_profile_report(results)
+
+        not_run = [r.check.label for r in results if r.status == check_registry.STATUS_NOT_RUN]
+        if not_run:
+            logger.warning("Checks not run: %s", ", ".join(not_run))
+
         if not all_found_items:
             logger.info("All validation checks passed successfully.")
         else:
@@ -221,132 +367,108 @@ class SceneValidatorUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         
         logger.info("="*20 + " Scene Validation Finished " + "="*20 + "\n")
 
+    def _set_validation_running(self, running):
+        """
+        검사 진행 여부에 따라 버튼 활성화 상태와 진행 표시줄을 전환합니다.
+        :param running: 검사 진행 중 여부
+        """
+        self.btn_check.setEnabled(not running)
+        self.btn_fix_selected.setEnabled(not running)
+        self.btn_fix_all.setEnabled(not running)
+        self.btn_cancel.setEnabled(running)
+        self.progress_bar.setValue(0 if running else 1000)
+        self.progress_label.setText("검사 준비 중..." if running else "대기 중")
+
+    @staticmethod
+    def _format_profile(result):
+        """
+        검사 결과의 프로파일 정보(실행 시간, cmds 호출 횟수)를 로그 패널용 문자열로 만듭니다.
+        :param result: CheckResult 인스턴스
+        """
+        if result.cmds_calls is None:
+            return ""
+        return f"  [{result.elapsed:.2f}s, cmds {result.total_cmds_calls:,}회]"
+
     def sync_selection_to_maya(self):
         """
         UI 리스트의 선택 상태를 Maya 씬의 실제 오브젝트 선택과 동기화합니다.
+        선택된 모든 항목의 존재 여부를 한 번의 cmds.ls 호출로 확인합니다.
         """
-        selected_items = self.result_list.selectedItems() # 리스트에서 선택된 아이템들을 가져옵니다.
-        to_select = [] # Maya에서 선택할 오브젝트들을 담을 리스트입니다.
-
-        for item in selected_items: # 선택된 각 아이템에 대해
-            text = item.text() # 아이템의 텍스트를 가져옵니다.
-
-            if text.startswith("---"): # 텍스트가 헤더이면
-                continue # 다음 아이템으로 넘어갑니다.
-
-            # e.g. "pCube1 (Multiple UV Sets: 2)" -> "pCube1"
-            clean_name = text.split('(')[0].strip() # 텍스트에서 실제 오브젝트 이름만 추출합니다.
-            if cmds.objExists(clean_name): # 해당 이름의 오브젝트가 씬에 존재하면
-                to_select.append(clean_name) # 선택할 목록에 추가합니다.
+        # e.g. "pCube1 (Multiple UV Sets: 2)" -> "pCube1"
+        names = {text.split('(')[0].strip() for _, text in self._selected_result_items()} # 텍스트에서 실제 오브젝트 이름만 추출합니다.
+        to_select = maya_utils.get_existing_nodes(list(names)) if names else [] # 씬에 존재하는 오브젝트만 한 번에 걸러냅니다.
 
         if to_select: # 선택할 오브젝트가 있으면
             cmds.select(to_select, replace=True) # 해당 오브젝트들을 선택합니다.
         else: # 선택할 오브젝트가 없으면
             cmds.select(clear=True) # 씬의 선택을 해제합니다.
 
+    def _build_fix_plan(self, result_items):
+        """
+        (헤더, 항목) 리스트를 검사별로 묶어 일괄 수정 계획(FixPlan)을 만듭니다.
+        :param result_items: (헤더, 항목 문자열) 리스트
+        :return: fix_planner.FixPlan
+        """
+        items_by_check = {} # {검사 이름: [항목1, 항목2]} 형식의 딕셔너리
+        for header_text, item_text in result_items:
+            check = self.registry.find_by_header(header_text) # 헤더에 해당하는 검사 항목을 찾습니다.
+            if check: # 검사 항목이 존재하면
+                items_by_check.setdefault(check.name, []).append(item_text) # 해당 검사의 항목 목록에 추가합니다.
+        return self.core.plan_fixes(items_by_check)
+
     def run_fix_selected(self):
         """
         리스트에서 선택된 항목들에 대한 수정을 진행합니다.
         """
-        selected_items = self.result_list.selectedItems() # 리스트에서 선택된 아이템들을 가져옵니다.
+        selected_items = self._selected_result_items() # 리스트에서 선택된 (헤더, 항목)들을 가져옵니다.
         if not selected_items: # 선택된 아이템이 없으면
             QtWidgets.QMessageBox.warning(self, "알림", "수정할 노드를 리스트에서 선택하세요") # 경고 메시지를 표시합니다.
             return # 함수 실행을 종료합니다.
 
-        fixes_to_run = {}  # {수정 함수: [대상 노드1, 대상 노드2]} 형식의 딕셔너리
-        run_unknown_node_cleanup = False # 알 수 없는 노드 수정 플래그
-
-        for item in selected_items: # 선택된 각 아이템에 대해
-            if item.text().startswith("---"): # 아이템이 헤더이면
-                continue # 건너뜁니다.
-
-            current_row = self.result_list.row(item) # 현재 아이템의 행 번호를 가져옵니다.
-            header_text = "" # 헤더 텍스트를 저장할 변수입니다.
-            for i in range(current_row, -1, -1): # 현재 행부터 위로 올라가며
-                header_item = self.result_list.item(i) # 해당 행의 아이템을 가져옵니다.
-                if header_item.text().startswith("---"): # 아이템이 헤더이면
-                    header_text = header_item.text() # 헤더 텍스트를 저장하고
-                    break # 반복을 멈춥니다.
-
-            # 'Unknown Nodes' 헤더는 특별히 처리합니다.
-            if header_text == "--- Unknown Nodes ---": # 알 수 없는 노드 카테고리이면
-                run_unknown_node_cleanup = True # 플래그를 True로 설정합니다.
-                continue # 다음 아이템으로 넘어갑니다.
-
-            fix_function = self.fix_map.get(header_text) # 헤더에 해당하는 수정 함수를 맵에서 찾습니다.
-            if fix_function: # 수정 함수가 존재하면
-                if fix_function not in fixes_to_run: # 딕셔너리에 해당 함수가 아직 없으면
-                    fixes_to_run[fix_function] = [] # 새로운 리스트를 생성하여 추가합니다.
-                
-                node_name = item.text() # 아이템의 텍스트(노드 이름)를 가져옵니다.
-                fixes_to_run[fix_function].append(node_name) # 해당 함수의 노드 목록에 추가합니다.
-
-        if not fixes_to_run and not run_unknown_node_cleanup: # 실행할 수정 작업이 없으면
+        plan = self._build_fix_plan(selected_items) # 선택된 항목으로 수정 계획을 만듭니다.
+        if not len(plan): # 실행할 수정 작업이 없으면
             QtWidgets.QMessageBox.information(self, "알림", "선택된 항목에 대한 자동 수정 기능이 없습니다.") # 정보 메시지를 표시합니다.
             return # 함수 실행을 종료합니다.
 
-        if run_unknown_node_cleanup: # 알 수 없는 노드 수정 플래그가 켜져 있으면
-            removed = self.core.cleanup_unknown_nodes() # 모든 알 수 없는 노드를 삭제하는 함수를 실행합니다.
-            self.core.log.info(f"{len(removed)}개의 Unknown 노드를 삭제했습니다.") # 스크립트 에디터에 삭제된 노드 수를 출력합니다.
-
-        for function, nodes in fixes_to_run.items(): # 실행할 수정 함수 목록을 순회합니다.
-            clean_nodes = [n.split('(')[0].strip() for n in nodes] # 텍스트에서 순수 노드 이름만 추출합니다.
-            function(list(set(clean_nodes))) # 중복을 제거한 노드 리스트를 인자로 하여 수정 함수를 실행합니다.
-
+        plan.apply() # 모든 수정을 하나의 Undo 단계로 적용합니다.
         self.run_full_check() # 모든 수정이 끝난 후, 씬을 다시 검사하여 결과를 갱신합니다.
 
     def run_fix_all(self):
         """
         리스트에 있는 모든 수정 가능한 항목들을 자동으로 수정합니다.
+        (필터나 접힘 상태와 관계없이 모든 결과 항목이 대상이며, 한 번의 Undo로 되돌릴 수 있습니다.)
         """
-        if self.result_list.count() == 0 or (self.result_list.count() == 1 and "검사할" in self.result_list.item(0).text()):
+        if self.result_model.item_count() == 0:
             QtWidgets.QMessageBox.information(self, "알림", "수정할 항목이 없습니다.") # 정보 메시지를 표시합니다.
             return # 함수 실행을 종료합니다.
 
+        plan = self._build_fix_plan(self.result_model.iter_items()) # 모든 결과 항목으로 수정 계획을 만듭니다.
+        if not len(plan): # 실행할 수정 작업이 없으면
+            QtWidgets.QMessageBox.information(self, "알림", "자동 수정 가능한 항목이 없습니다.")
+            return
+
         reply = QtWidgets.QMessageBox.question(self, '확인',
-                                           "모든 자동 수정 가능한 항목을 수정하시겠습니까?\n이 작업은 되돌릴 수 없습니다.",
+                                           f"모든 자동 수정 가능한 항목({len(plan)}개 동작)을 수정하시겠습니까?\n"
+                                           "모든 수정은 한 번의 Undo로 되돌릴 수 있습니다.",
                                            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No, QtWidgets.QMessageBox.No)
 
         if reply == QtWidgets.QMessageBox.No: # 사용자가 'No'를 선택하면
             return # 함수 실행을 종료합니다.
 
-        fixes_to_run = {} # 실행할 수정 함수들을 담을 딕셔너리입니다.
-        run_unknown_node_cleanup = False # 알 수 없는 노드 수정 플래그입니다.
-
-        for row in range(self.result_list.count()):
-            item = self.result_list.item(row) # 해당 행의 아이템을 가져옵니다.
-            item_text = item.text() # 아이템의 텍스트를 가져옵니다.
-            if item_text.startswith("---"): # 아이템이 헤더이면
-                continue # 건너뜁니다.
-
-            header_text = ""
-            for i in range(row, -1, -1):
-                header_item = self.result_list.item(i)
-                if header_item.text().startswith("---"):
-                    header_text = header_item.text()
-                    break
-
-            if header_text == "--- Unknown Nodes ---": # 알 수 없는 노드 카테고리이면
-                run_unknown_node_cleanup = True # 플래그를 켭니다.
-                continue # 다음 아이템으로 넘어갑니다.
-
-            fix_function = self.fix_map.get(header_text) # 헤더에 해당하는 수정 함수를 찾습니다.
-            if fix_function: # 수정 함수가 있으면
-                if fix_function not in fixes_to_run: # 딕셔너리에 함수가 없으면
-                    fixes_to_run[fix_function] = [] # 새로 추가합니다.
-                node_name = item_text # 아이템 텍스트(노드 이름)를 가져옵니다.
-                fixes_to_run[fix_function].append(node_name) # 해당 함수의 노드 목록에 추가합니다.
-
-        if run_unknown_node_cleanup: # 알 수 없는 노드 수정이 필요하면
-            self.core.cleanup_unknown_nodes() # 해당 함수를 실행합니다.
-
-        for function, nodes in fixes_to_run.items(): # 다른 모든 수정 작업을 순회하며
-            clean_nodes = [n.split('(')[0].strip() for n in nodes] # 노드 이름을 정리하고
-            function(list(set(clean_nodes))) # 수정 함수를 실행합니다.
-
-        QtWidgets.QMessageBox.information(self, "완료", "모든 수정 가능한 항목에 대한 수정이 완료되었습니다.")
+        summary = plan.apply() # 수정 계획을 하나의 트랜잭션으로 적용합니다.
+        done = ", ".join(f"{kind} {count}개" for kind, count in summary.items() if count)
+        QtWidgets.QMessageBox.information(self, "완료", f"모든 수정 가능한 항목에 대한 수정이 완료되었습니다.\n{done}")
         self.run_full_check() # 씬을 다시 검사하여 결과를 갱신합니다.
 
+    def closeEvent(self, event):
+        """
+        창을 닫을 때 진행 중인 검사 타이머를 정지합니다.
+        """
+        self._validation_timer.stop()
+        self._selection_sync_timer.stop()
+        self._validation_run = None
+        super().closeEvent(event)
+
     def open_log_file(self):
         """
         코어에 정의된 로그 파일을 시스템 기본 편집기로 엽니다.
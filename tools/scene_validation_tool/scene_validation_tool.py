@@ -1,15 +1,25 @@
 # -*- coding: utf-8 -*-
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 import os
+import sys
 import importlib
 
 # 공통 유틸리티 모듈 임포트
 from core import core_utils as core_utils
 from core import log as core_log # 새로 만든 로그 모듈 임포트
 from maya_utils import maya_utils
+from . import check_registry
+from . import check_profiler
+from . import fix_planner
+from . import validation_rules
 importlib.reload(core_utils)
 importlib.reload(core_log) # 로그 모듈도 리로드
 importlib.reload(maya_utils)
+importlib.reload(check_registry)
+importlib.reload(check_profiler)
+importlib.reload(fix_planner)
+importlib.reload(validation_rules)
 
 # --- 로거 설정 ---
 # 로그 파일 경로를 현재 스크립트 위치 기준으로 설정
@@ -56,14 +66,126 @@ class SceneValidatorCore:
         """
         return maya_utils.get_all_mesh_transforms()
 
+    def build_check_registry(self):
+        """
+        기본 검사 항목들을 비용/의존 관계/심각도와 함께 등록한 레지스트리를 생성합니다.
+        UI와 헤드리스 실행이 같은 레지스트리를 사용합니다.
+
+        :return: 기본 검사 항목이 등록된 CheckRegistry
+        :rtype: check_registry.CheckRegistry
+        """
+        cr = check_registry
+        registry = cr.CheckRegistry()
+        registry.register(cr.ValidationCheck(
+            "unknown_nodes", "알 수 없는 노드", "--- Unknown Nodes ---", self.check_unknown_nodes,
+            cost=cr.COST_CHEAP, needs_targets=False))
+        registry.register(cr.ValidationCheck(
+            "naming", "이름 규칙", "--- Naming Issues ---", self.check_naming_conventions,
+            cost=cr.COST_CHEAP))
+        registry.register(cr.ValidationCheck(
+            "history", "히스토리", "--- Histroy Detected ---", self.check_history,
+            cost=cr.COST_MODERATE))
+        registry.register(cr.ValidationCheck(
+            "freeze_transforms", "트랜스폼 동결", "--- Unfrozen Transforms ---", self.check_freeze_transforms,
+            cost=cr.COST_MODERATE))
+        registry.register(cr.ValidationCheck(
+            "multi_uvsets", "다중 UV 세트", "--- UV Set Issues ---", self.check_multi_uvsets,
+            cost=cr.COST_MODERATE, severity=cr.SEVERITY_WARNING))
+        registry.register(cr.ValidationCheck(
+            "mesh_errors", "메시 에러", "--- Mesh Errors (NGons, Non-manifold) ---", self.check_mesh_errors,
+            cost=cr.COST_EXPENSIVE))
+        registry.register(cr.ValidationCheck(
+            "uv_errors", "UV 할당 에러", "--- UV Errors (Missing, Unassigned) ---", self.check_uv_errors,
+            cost=cr.COST_EXPENSIVE))
+        # UV가 없는 메쉬는 겹침 검사 의미가 없으므로 UV 할당 검사 이후에 실행합니다.
+        registry.register(cr.ValidationCheck(
+            "uv_overlap", "UV 오버랩", "--- UV Overlap (Faces) ---", self.check_uv_overlapping,
+            cost=cr.COST_EXPENSIVE, severity=cr.SEVERITY_WARNING, depends_on=["uv_errors"]))
+        return registry
+
+    def create_profiler(self):
+        """
+        검사/수정 로직이 사용하는 모듈(이 모듈, maya_utils, fix_planner)의 cmds 호출 횟수를 측정하는 프로파일러를 생성합니다.
+
+        :return: CheckProfiler 인스턴스
+        :rtype: check_profiler.CheckProfiler
+        """
+        return check_profiler.CheckProfiler([sys.modules[__name__], maya_utils, fix_planner])
+
+    def log_profile_report(self, results):
+        """
+        검사별 실행 시간과 cmds 호출 횟수를 표 형태로 로그 파일에 기록합니다.
+
+        :param results: 프로파일링된 CheckResult 리스트
+        :return: 기록된 문자열 리스트
+        :rtype: list
+        """
+        lines = check_profiler.format_profile_report(results)
+        self.log.info("검사별 프로파일 결과:")
+        for line in lines:
+            self.log.info("  %s", line)
+        return lines
+
+    def run_validation(self, names=None, fail_fast=False, time_budget=None, registry=None, on_result=None,
+                       profile=False, chunk_size=None):
+        """
+        UI 없이(헤드리스) 레지스트리 기반 검사를 실행합니다.
+
+        :param names: 실행할 검사 이름 리스트 (None이면 전체)
+        :param fail_fast: 에러 심각도의 검사가 실패하면 즉시 중단 (퍼블리시 게이트용)
+        :param time_budget: 실행 시간 예산 (초). 초과 시 비싼 검사는 'not run'으로 보고됩니다.
+        :param registry: 사용할 CheckRegistry (None이면 기본 레지스트리)
+        :param on_result: 각 검사 결과마다 호출되는 콜백 (선택)
+        :param profile: True이면 검사별 실행 시간과 cmds 호출 횟수를 측정하여 로그에 기록합니다.
+        :param chunk_size: 한 번에 검사할 노드 개수. 지정하면 시간 예산을 검사 도중에도 확인합니다.
+        :return: CheckResult 리스트
+        :rtype: list
+        """
+        registry = registry or self.build_check_registry()
+        targets = self.get_all_mesh_transforms()
+        if not targets:
+            # 메쉬가 없으면 대상이 필요 없는 검사만 실행합니다.
+            names = [c.name for c in registry.checks
+                     if not c.needs_targets and (names is None or c.name in names)]
+
+        engine = check_registry.ValidationEngine(
+            registry, fail_fast=fail_fast, time_budget=time_budget, log=self.log,
+            profiler=self.create_profiler() if profile else None
+        )
+        results = engine.run(targets, names=names, on_result=on_result, chunk_size=chunk_size)
+        self.log.info("검사 결과 요약: %s", check_registry.summarize(results))
+        if profile:
+            self.log_profile_report(results)
+        return results
+
+    def plan_fixes(self, items_by_check):
+        """
+        검사 결과를 하나의 일괄 수정 계획(FixPlan)으로 변환합니다.
+        계획은 plan.apply()로 하나의 Undo 청크 안에서 안전한 순서로 적용됩니다.
+
+        :param items_by_check: {검사 이름: [결과 항목 문자열]} 딕셔너리
+        :return: 수정 동작이 수집된 FixPlan
+        :rtype: fix_planner.FixPlan
+        """
+        plan = fix_planner.FixPlan(self.mesh_suffix, log=self.log)
+        for check_name, items in items_by_check.items():
+            plan.add_check_items(check_name, items)
+        self.log.info("수정 계획 생성: %d개 동작", len(plan))
+        return plan
+
+    def check_unknown_nodes(self):
+        """
+        [검증] Unknown 노드
+        """
+        return cmds.ls(type=list(validation_rules.UNKNOWN_NODE_TYPES)) or []
+
     def check_naming_conventions(self, nodes):
         """
         [검증] 네이밍 규칙
         """
         invalid_names = []
         for node in nodes:
-            name_only = node.split('|')[-1]
-            if not name_only.endswith(self.mesh_suffix):
+            if not validation_rules.is_valid_mesh_name(node, self.mesh_suffix):
                 invalid_names.append(node)
         return list(set(invalid_names))
 
@@ -77,11 +199,7 @@ class SceneValidatorCore:
             r = cmds.getAttr(f"{node}.rotate")[0]
             s = cmds.getAttr(f"{node}.scale")[0]
 
-            is_translated = any(abs(v) > 0.0001 for v in t)
-            is_rotated = any(abs(v) > 0.0001 for v in r)
-            is_scaled = any(abs(v - 1.0) > 0.0001 for v in s)
-
-            if is_translated or is_rotated or is_scaled:
+            if not validation_rules.is_frozen(t, r, s):
                 unfrozen.append(node)
         return list(set(unfrozen))
 
@@ -94,26 +212,24 @@ class SceneValidatorCore:
     def check_mesh_errors(self, nodes):
         """
         [검증] 지오메트리 에러 (Ngons, Non-manifold)
+        검사가 청크 단위로 나뉘어 실행되는 동안에도 사용자의 선택을 바꾸지 않도록, 선택(polySelectConstraint) 대신
+        OpenMaya로 페이스별 정점 수를 읽어 Ngon을 찾습니다.
         """
         errors = []
         for node in nodes:
-            # ... (내부 로직은 기존과 동일)
             shapes = cmds.listRelatives(node, shapes=True, fullPath=True, type='mesh') or []
             if not shapes: continue
             mesh_node = shapes[0]
 
-            cmds.select(mesh_node, r=True)
-            cmds.polySelectConstraint(mode=3, type=0x0008, size=3)
-            ngons_components = cmds.ls(sl=True)
-            cmds.polySelectConstraint(disable=True)
-
-            non_manifold_vtx = cmds.polyInfo(mesh_node, nonManifoldVertices=True)
-            non_manifold_edge = cmds.polyInfo(mesh_node, nonManifoldEdges=True)
+            selection = om.MSelectionList()
+            selection.add(mesh_node)
+            vertex_counts, _ = om.MFnMesh(selection.getDagPath(0)).getVertices()
+            has_ngons = any(count > 4 for count in vertex_counts)
 
-            if ngons_components or non_manifold_vtx or non_manifold_edge:
+            if (has_ngons or cmds.polyInfo(mesh_node, nonManifoldVertices=True)
+                    or cmds.polyInfo(mesh_node, nonManifoldEdges=True)):
                 errors.append(node)
 
-        cmds.select(cl=True)
         return list(set(errors))
 
     def cleanup_unknown_nodes(self):
@@ -190,28 +306,18 @@ class SceneValidatorCore:
     def check_uv_overlapping(self, nodes):
         """
         [검증] UV 겹침 (Overlapping)
+        페이스 컴포넌트를 선택하지 않고 polyUVOverlap에 직접 넘겨, 사용자의 선택을 바꾸지 않습니다.
         """
         nodes_with_overlap = []
-        original_selection = cmds.ls(sl=True) or []
+        for node in nodes:
+            faces = f'{node}.f[*]'
+            if not cmds.objExists(faces): continue
 
-        try:
-            for node in nodes:
-                faces = f'{node}.f[*]'
-                if not cmds.objExists(faces): continue
+            overlapping_components = cmds.polyUVOverlap(faces, oc=True)
+            if overlapping_components:
+                num_overlapping_uvs = len(overlapping_components)
+                nodes_with_overlap.append(f"{node} ({num_overlapping_uvs} overlapping UVs)")
 
-                cmds.select(faces, r=True, noExpand=True)
-                overlapping_components = cmds.polyUVOverlap(oc=True)
-                
-                if overlapping_components:
-                    num_overlapping_uvs = len(overlapping_components)
-                    nodes_with_overlap.append(f"{node} ({num_overlapping_uvs} overlapping UVs)")
-
-        finally:
-            if original_selection:
-                cmds.select(original_selection, r=True)
-            else:
-                cmds.select(cl=True)
-                
         return list(set(nodes_with_overlap))
 
     def fix_naming_conventions(self, nodes):
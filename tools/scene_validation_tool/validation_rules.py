@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+씬 검수 규칙 모음입니다.
+
+Maya 안에서 실행되는 SceneValidatorCore와 Maya 없이 .ma 파일을 검사하는 offline_validation이
+같은 판정 기준을 사용하도록, 값만 받아서 판정하는 순수 함수로 분리했습니다. 이 모듈은 Maya에 의존하지 않습니다.
+"""
+# Freeze 판정 허용 오차
+TRANSFORM_TOLERANCE = 0.0001
+
+# Unknown 노드로 저장되는 노드 타입
+UNKNOWN_NODE_TYPES = ("unknown", "unknownDag", "unknownTransform")
+
+
+def short_name(node):
+    """DAG 경로에서 짧은 이름만 반환합니다. (예: '|grp|pCube1' -> 'pCube1')"""
+    return node.split('|')[-1]
+
+
+def is_valid_mesh_name(node, mesh_suffix):
+    """
+    메쉬 트랜스폼 이름이 접미사 규칙을 따르는지 확인합니다.
+
+    :param node: 노드 이름 또는 DAG 경로
+    :param mesh_suffix: 메쉬 접미사 (예: '_geo')
+    :rtype: bool
+    """
+    return short_name(node).endswith(mesh_suffix)
+
+
+def is_frozen(translate, rotate, scale, tolerance=TRANSFORM_TOLERANCE):
+    """
+    트랜스폼 값이 초기화(Freeze)된 상태인지 확인합니다.
+
+    :param translate: (x, y, z) 이동 값
+    :param rotate: (x, y, z) 회전 값
+    :param scale: (x, y, z) 스케일 값
+    :param tolerance: 허용 오차
+    :rtype: bool
+    """
+    if any(abs(v) > tolerance for v in translate):
+        return False
+    if any(abs(v) > tolerance for v in rotate):
+        return False
+    return not any(abs(v - 1.0) > tolerance for v in scale)
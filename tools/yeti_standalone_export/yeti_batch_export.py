@@ -0,0 +1,207 @@
+"""
+Yeti 캐시 일괄(batch) 추출
+
+yeti_standalone_export.py는 씬 하나마다 maya.standalone 초기화와 Yeti 플러그인 불러오기(30~60초)를 반복합니다.
+이 스크립트는 mayapy 프로세스 하나에서 standalone 세션을 한 번만 초기화하고, 씬 목록을 차례로 열어 추출합니다.
+씬 사이에는 새 씬으로 비우고 undo 기록을 지워 이전 씬의 상태가 남지 않도록 하며, 씬별 결과를 모아 보고합니다.
+
+[씬 목록]
+    - 씬 파일 경로 (.ma / .mb)
+    - 씬 목록 텍스트 파일 (.txt, 한 줄에 경로 하나, '#'으로 시작하는 줄은 주석)
+    - 작업 목록 JSON (.json): 씬별로 추출 옵션을 지정할 수 있습니다. (씬 옵션 > defaults > 명령줄 옵션)
+        {"defaults": {"samples": 3, "references": "yeti"},
+         "scenes": ["/show/PROJ/shot010/fx/pub/maya/shot010_fx_v003.ma",
+                    {"scenefile": "/show/PROJ/shot020/fx/pub/maya/shot020_fx_v002.ma",
+                     "start_frame": 1001, "end_frame": 1100, "nodes": ["charA:charA_fur"]}]}
+
+[실행 방법] (Maya의 mayapy로 실행)
+    mayapy yeti_batch_export.py shots.txt --samples 3 --batch_report /tmp/yeti_batch.json
+    mayapy yeti_batch_export.py batch.json
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+
+import maya.cmds as cmds
+
+from yeti_standalone_export import (HANDLES, REFERENCES_ALL, REFERENCES_YETI, YetiCacheExporter,
+                                    initialize_standalone, uninitialize_standalone)
+
+# 작업 목록에서 지정할 수 있는 씬별 옵션 (YetiCacheExporter 인자 이름)
+SCENE_OPTIONS = ("start_frame", "end_frame", "samples", "nodes", "handles", "force", "references", "scratch_dir")
+
+STATUS_EXPORTED = "exported"
+STATUS_FAILED = "failed"
+
+
+def _scene_job(entry, defaults, source):
+    """작업 목록의 항목 하나를 {'scenefile', 옵션...} 딕셔너리로 만듭니다."""
+    if isinstance(entry, str):
+        entry = {"scenefile": entry}
+    unknown = set(entry) - set(SCENE_OPTIONS) - {"scenefile"}
+    if unknown or not entry.get("scenefile"):
+        raise ValueError("{}: 씬 항목이 올바르지 않습니다. (scenefile 필요, 알 수 없는 옵션 {}) {}".format(
+            source, sorted(unknown), entry))
+    job = dict(defaults)
+    job.update(entry)
+    job["scenefile"] = os.path.normpath(job["scenefile"])
+    return job
+
+
+def load_jobs(paths, defaults=None):
+    """
+    씬 파일, 씬 목록(.txt), 작업 목록(.json)에서 추출 작업 목록을 만듭니다.
+    긴 일괄 작업을 시작하기 전에 작업 목록의 오류를 찾도록, 알 수 없는 옵션이 있으면 ValueError를 발생시킵니다.
+
+    :param paths: 경로 리스트
+    :param defaults: 모든 씬에 적용할 기본 옵션 (명령줄 옵션)
+    :return: [{'scenefile', 옵션...}] 리스트 (입력 순서 유지)
+    :rtype: list
+    """
+    defaults = dict(defaults or {})
+    jobs = []
+    for path in paths:
+        if path.endswith(".json"):
+            with open(path, "r") as f:
+                data = json.load(f)
+            scene_defaults = dict(defaults)
+            scene_defaults.update(data.get("defaults", {}))
+            unknown = set(data.get("defaults", {})) - set(SCENE_OPTIONS)
+            if unknown:
+                raise ValueError("{}: 알 수 없는 기본 옵션 {}".format(path, sorted(unknown)))
+            jobs.extend(_scene_job(entry, scene_defaults, path) for entry in data.get("scenes", []))
+        elif path.endswith(".txt"):
+            with open(path, "r") as f:
+                jobs.extend(_scene_job(line.strip(), defaults, path) for line in f
+                            if line.strip() and not line.startswith("#"))
+        else:
+            jobs.append(_scene_job(path, defaults, path))
+    return jobs
+
+
+def reset_session():
+    """다음 씬을 위해 새 씬으로 비우고 undo 기록을 지웁니다. (이전 씬의 노드와 메모리가 남지 않도록)"""
+    cmds.file(new=True, force=True)
+    cmds.flushUndo()
+
+
+def export_scene(job):
+    """
+    현재 standalone 세션에서 씬 하나를 추출합니다. 노드 하나가 실패해도 나머지 노드를 계속 추출합니다.
+
+    :param job: load_jobs()의 작업 딕셔너리
+    :return: {'scene', 'status', 'exported', 'up_to_date', 'failed', 'elapsed', 'report', 'error'} 딕셔너리
+    :rtype: dict
+    """
+    scene_file = job["scenefile"]
+    result = {"scene": scene_file, "status": STATUS_FAILED, "exported": 0, "up_to_date": 0, "failed": {},
+              "elapsed": 0.0, "report": None, "error": None}
+    started = time.perf_counter()
+    exporter = None
+    try:
+        if not os.path.exists(scene_file):
+            raise IOError("씬 파일을 찾을 수 없습니다: {}".format(scene_file))
+        options = {key: value for key, value in job.items() if key != "scenefile"}
+        exporter = YetiCacheExporter(scene_file, **options)
+        exporter.export(continue_on_error=True)
+        result["exported"] = len(exporter.exported) - len(exporter.skipped)
+        result["up_to_date"] = len(exporter.skipped)
+        result["failed"] = dict(exporter.failed)
+        if not exporter.failed:
+            result["status"] = STATUS_EXPORTED
+    except Exception as e:
+        result["error"] = "{}: {}".format(type(e).__name__, e)
+    finally:
+        if exporter is not None:
+            try:
+                result["report"] = exporter.save_report()
+            except OSError as e:
+                print(f"[WARNING] 추출 리포트를 저장하지 못했습니다: {e}")
+        try:
+            reset_session()
+        except Exception as e:
+            # 세션을 비우지 못하면 다음 씬도 실패하므로 일괄 작업을 멈춥니다.
+            raise RuntimeError("씬을 닫지 못했습니다: {} ({})".format(scene_file, e))
+    result["elapsed"] = round(time.perf_counter() - started, 6)
+    return result
+
+
+def run_batch(jobs):
+    """
+    standalone 세션을 한 번 초기화하고 작업 목록의 씬을 차례로 추출합니다.
+
+    :param jobs: load_jobs()의 결과
+    :return: {'started_at', 'startup_seconds', 'total_seconds', 'scenes': [export_scene() 결과]}
+    :rtype: dict
+    """
+    batch = {"started_at": datetime.datetime.now().isoformat(timespec="seconds"), "startup_seconds": 0.0,
+             "total_seconds": 0.0, "scenes": []}
+    started = time.perf_counter()
+    initialize_standalone()
+    batch["startup_seconds"] = round(time.perf_counter() - started, 6)
+    print(f"[INFO] Standalone session ready in {batch['startup_seconds']:.1f}s, {len(jobs)} scenes")
+
+    for index, job in enumerate(jobs, 1):
+        print(f"[SCENE {index}/{len(jobs)}] {job['scenefile']}")
+        result = export_scene(job)
+        batch["scenes"].append(result)
+        if result["status"] == STATUS_EXPORTED:
+            print(f"[SCENE DONE] {result['scene']}: {result['exported']} exported, "
+                  f"{result['up_to_date']} up to date ({result['elapsed']:.1f}s)")
+        else:
+            print(f"[SCENE FAILED] {result['scene']}: {result['error'] or result['failed']}")
+    batch["total_seconds"] = round(time.perf_counter() - started, 6)
+    return batch
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Export Yeti caches from many scenes in one mayapy session")
+    parser.add_argument("paths", nargs="+", help="Scene files, .txt scene lists, or .json job lists")
+    parser.add_argument("--start_frame", type=int, default=None, help="start frame (default: scene settings)")
+    parser.add_argument("--end_frame", type=int, default=None, help="end frame (default: scene settings)")
+    parser.add_argument("--samples", type=int, default=5, help="Sample count")
+    parser.add_argument("--handles", type=int, default=HANDLES,
+                        help="Frames added before and after the frame range (default: {})".format(HANDLES))
+    parser.add_argument("--references", choices=(REFERENCES_ALL, REFERENCES_YETI), default=REFERENCES_ALL,
+                        help="References to load when opening each scene (default: {})".format(REFERENCES_ALL))
+    parser.add_argument("--force", action="store_true", help="Ignore the export manifests and re-export every frame")
+    parser.add_argument("--scratch_dir", default=None,
+                        help="Write caches to this local scratch folder first and copy them to pub/caches/fur")
+    parser.add_argument("--batch_report", default=None, help="Write per-scene results to this JSON file")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    opts = parse_args(sys.argv[1:] if args is None else args)
+    defaults = {"start_frame": opts.start_frame, "end_frame": opts.end_frame, "samples": opts.samples,
+                "handles": opts.handles, "references": opts.references, "force": opts.force,
+                "scratch_dir": opts.scratch_dir}
+    try:
+        jobs = load_jobs(opts.paths, defaults)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] {e}")
+        return 1
+    if not jobs:
+        print(f"[WARNING] 추출할 씬이 없습니다: {opts.paths}")
+        return 1
+
+    try:
+        batch = run_batch(jobs)
+    finally:
+        uninitialize_standalone()
+
+    if opts.batch_report:
+        with open(opts.batch_report, "w") as f:
+            json.dump(batch, f, indent=2)
+        print(f"[REPORT] {opts.batch_report}")
+    failed = [result for result in batch["scenes"] if result["status"] != STATUS_EXPORTED]
+    print(f"[ALL DONE] {len(batch['scenes']) - len(failed)} of {len(batch['scenes'])} scenes exported "
+          f"in {batch['total_seconds']:.1f}s (startup {batch['startup_seconds']:.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+Yeti 캐시 추출 기록(manifest) (Maya 없이 동작합니다.)
+
+캐시 버전 폴더(pub/caches/fur/vNNN)마다 manifest.json을 두고, 씬 해시, 샘플 값, 노드별 캐시 경로와 프레임 범위,
+프레임별 파일 크기를 기록합니다. 다시 실행할 때는 기록과 디스크의 파일 크기가 같은 프레임을 건너뛰고,
+빠졌거나 바뀐(stale) 프레임만 추출합니다. 씬 내용이나 샘플 값이 바뀌면 기존 기록은 모두 무효가 됩니다.
+
+manifest.json 형식:
+    {"format": 1, "scene": 씬 경로, "scene_hash": sha1, "scene_size": 바이트, "scene_mtime": 수정 시간,
+     "samples": 샘플 값,
+     "nodes": {노드 이름: {"cache_path": 'name.%04d.fur', "start": 시작, "end": 끝, "frames": {"1001": 크기, ...}}}}
+"""
+import hashlib
+import json
+import os
+
+from core import core_utils
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 1
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def hash_file(path):
+    """
+    파일 내용의 sha1 해시 (큰 씬 파일도 메모리에 모두 올리지 않도록 블록 단위로 읽습니다.)
+
+    :rtype: str
+    """
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def group_frames(frames):
+    """
+    프레임 리스트를 연속된 범위로 묶습니다. 예) [1, 2, 3, 7, 8] -> [(1, 3), (7, 8)]
+
+    :rtype: list
+    """
+    ranges = []
+    for frame in sorted(frames):
+        if ranges and frame == ranges[-1][1] + 1:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return [tuple(r) for r in ranges]
+
+
+def _file_stats(directory):
+    """폴더 안의 파일 이름 -> (크기, 수정 시간 ns) (폴더를 한 번만 읽습니다.)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: (entry.stat().st_size, entry.stat().st_mtime_ns) for entry in entries
+                    if entry.is_file()}
+    except OSError:
+        return {}
+
+
+def _file_sizes(directory):
+    """폴더 안의 파일 이름 -> 크기"""
+    return {name: stat[0] for name, stat in _file_stats(directory).items()}
+
+
+class CacheManifest:
+    """캐시 버전 폴더 하나의 추출 기록"""
+
+    def __init__(self, version_dir):
+        """
+        :param version_dir: 캐시 버전 폴더 (pub/caches/fur/vNNN)
+        """
+        self.path = os.path.join(version_dir, MANIFEST_NAME)
+        self.data = self._load()
+
+    @staticmethod
+    def _empty():
+        return {"format": MANIFEST_FORMAT, "scene": None, "scene_hash": None, "scene_size": None,
+                "scene_mtime": None, "samples": None, "nodes": {}}
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self._empty()
+        if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT:
+            return self._empty()
+        return data
+
+    def bind(self, scene_file, samples):
+        """
+        현재 씬과 샘플 값을 기록과 비교합니다. 다르면 기존 노드 기록을 모두 버립니다.
+        씬 경로, 크기, 수정 시간이 기록과 같으면 저장된 해시를 그대로 사용하여 큰 씬을 다시 읽지 않습니다.
+
+        :param scene_file: 씬 파일 경로
+        :param samples: Yeti 샘플 값
+        :return: 기존 기록을 그대로 사용할 수 있으면 True
+        :rtype: bool
+        """
+        st = os.stat(scene_file)
+        data = self.data
+        if (data["scene"] == scene_file and data["scene_size"] == st.st_size
+                and data["scene_mtime"] == st.st_mtime and data["scene_hash"]):
+            scene_hash = data["scene_hash"]
+        else:
+            scene_hash = hash_file(scene_file)
+
+        valid = scene_hash == data["scene_hash"] and samples == data["samples"]
+        if not valid:
+            data["nodes"] = {}
+        data.update(scene=scene_file, scene_hash=scene_hash, scene_size=st.st_size, scene_mtime=st.st_mtime,
+                    samples=samples)
+        return valid
+
+    def missing_frames(self, node, cache_path, start, end):
+        """
+        start~end 중 다시 추출해야 하는 프레임을 찾습니다.
+        기록이 없거나, 디스크에 파일이 없거나, 파일 크기가 기록과 다르거나 0인 프레임입니다.
+
+        :param node: Yeti 노드 이름
+        :param cache_path: 'name.%04d.fur' 형식의 캐시 경로
+        :return: 프레임 리스트
+        :rtype: list
+        """
+        entry = self.data["nodes"].get(node)
+        if not entry or entry.get("cache_path") != cache_path:
+            return list(range(start, end + 1))
+        recorded = entry.get("frames", {})
+        sizes = _file_sizes(os.path.dirname(cache_path))
+        missing = []
+        for frame in range(start, end + 1):
+            size = recorded.get(str(frame))
+            if not size or sizes.get(os.path.basename(cache_path % frame)) != size:
+                missing.append(frame)
+        return missing
+
+    @staticmethod
+    def snapshot(cache_path, frames):
+        """
+        추출 전 frames 파일의 (크기, 수정 시간)을 기록해 둡니다.
+        추출이 중간에 실패하면 record(before=...)로 이번 실행에서 다시 쓴 프레임만 기록합니다.
+
+        :return: {프레임: (크기, 수정 시간 ns) 또는 None}
+        :rtype: dict
+        """
+        stats = _file_stats(os.path.dirname(cache_path))
+        return {frame: stats.get(os.path.basename(cache_path % frame)) for frame in frames}
+
+    def record(self, node, cache_path, start, end, before=None):
+        """
+        start~end 프레임 중 디스크에 있는 파일의 크기를 기록합니다. (추출이 끝난 뒤 호출합니다.)
+
+        :param node: Yeti 노드 이름
+        :param cache_path: 'name.%04d.fur' 형식의 캐시 경로
+        :param before: 추출이 실패했을 때 snapshot()의 결과. before의 프레임 중 파일이 추출 전과 같은(이번 실행에서
+                       쓰지 않은) 프레임은 이전 씬/샘플 값으로 쓴 파일일 수 있으므로 기록하지 않습니다.
+        """
+        entry = self.data["nodes"].get(node)
+        if not entry or entry.get("cache_path") != cache_path:
+            entry = self.data["nodes"][node] = {"cache_path": cache_path, "start": None, "end": None, "frames": {}}
+        stats = _file_stats(os.path.dirname(cache_path))
+        before = before or {}
+        for frame in range(start, end + 1):
+            stat = stats.get(os.path.basename(cache_path % frame))
+            if stat and stat[0] and (frame not in before or before[frame] != stat):
+                entry["frames"][str(frame)] = stat[0]
+            else:
+                entry["frames"].pop(str(frame), None)
+        frames = [int(frame) for frame in entry["frames"]]
+        entry["start"] = min(frames) if frames else None
+        entry["end"] = max(frames) if frames else None
+
+    def forget(self, node, frames):
+        """
+        frames의 기록을 지워 다음 추출에서 다시 추출하도록 합니다. (크기는 같지만 내용이 깨진 프레임 등)
+
+        :param node: Yeti 노드 이름
+        :param frames: 프레임 리스트
+        """
+        entry = self.data["nodes"].get(node)
+        if not entry:
+            return
+        for frame in frames:
+            entry["frames"].pop(str(frame), None)
+        frames = [int(frame) for frame in entry["frames"]]
+        entry["start"] = min(frames) if frames else None
+        entry["end"] = max(frames) if frames else None
+
+    def recorded_frames(self, node, frames):
+        """frames 중 기록된(디스크에 있는) 프레임 리스트"""
+        recorded = self.data["nodes"].get(node, {}).get("frames", {})
+        return [frame for frame in frames if str(frame) in recorded]
+
+    def written(self, node, frames):
+        """
+        frames 중 기록된(디스크에 있는) 프레임 수와 파일 크기의 합 (추출 리포트용)
+
+        :return: (프레임 수, 바이트 수)
+        """
+        recorded = self.data["nodes"].get(node, {}).get("frames", {})
+        sizes = [recorded[str(frame)] for frame in self.recorded_frames(node, frames)]
+        return len(sizes), sum(sizes)
+
+    def save(self):
+        """기록을 저장합니다. (임시 파일에 쓴 뒤 교체하여, 중간에 중단되어도 기존 기록이 깨지지 않습니다.)"""
+        core_utils.save_json_atomic(self.path, self.data, indent=2)
@@ -0,0 +1,103 @@
+"""
+Yeti 캐시 경로 규칙 (Maya 없이 동작합니다.)
+
+YetiCacheExporter와 추출 계획(yeti_export_plan)이 같은 규칙으로 씬 경로에서 캐시 경로를 만들도록 이름 규칙만 모았습니다.
+이 모듈의 함수는 폴더를 만들지 않습니다. (추출할 때 폴더는 YetiCacheExporter._get_cache_path가 만듭니다.)
+
+    [PROJECT_ROOT]/[TASK]/pub/maya/shot010_fx_v003.ma
+    -> [PROJECT_ROOT]/[TASK]/pub/caches/fur/v003/<namespace 또는 asset>/<part>/<asset>_<part>.%04d.fur
+"""
+import os
+import re
+
+
+def _warn(message):
+    print(f"[WARNING] {message}")
+
+
+def get_root_path(scene_file_path, warn=_warn):
+    """
+    씬 파일 경로에서 회사 파이프라인 기준에 맞춰 프로젝트의 Root 경로를 추론합니다.
+    경로 패턴: [PROJECT_ROOT]/[TASK]/[pub 또는 dev]/maya/[SCENE_FILE].ma
+    반환값: [PROJECT_ROOT]/[TASK]
+
+    :param warn: 경로가 패턴에 맞지 않을 때 경고를 출력할 함수 (Maya에서는 cmds.warning)
+    """
+    # 경로를 표준화하고 '/'로 분리합니다.
+    normalized_path = os.path.normpath(scene_file_path).replace("\\", "/")
+    parts = normalized_path.split('/')
+
+    # 'maya' 폴더를 찾고 그 앞의 'pub' 또는 'dev'를 찾습니다.
+    try:
+        maya_index = parts.index('maya')
+    except ValueError:
+        # 'maya' 폴더를 찾을 수 없는 경우
+        warn(f"경로에서 'maya' 폴더를 찾을 수 없습니다: {scene_file_path}")
+        return os.path.dirname(scene_file_path)
+
+    if maya_index >= 2:  # 'maya' 앞에 최소 'env'와 'task'가 있어야 함
+        env_dir = parts[maya_index - 1]  # 'pub' or 'dev'
+
+        if env_dir in ['pub', 'dev']:
+            # PROJECT_ROOT / TASK 까지의 경로를 조합
+            return "/".join(parts[:maya_index - 1])  # 'env_dir'와 'maya' 디렉토리를 제외
+        else:
+            warn(f"예상되는 환경 폴더 ('pub' 또는 'dev')를 찾을 수 없습니다: {scene_file_path}")
+
+    # 패턴에 맞지 않으면 씬 파일의 상위 디렉토리를 반환합니다.
+    return os.path.dirname(scene_file_path)
+
+
+def get_scene_version(path):
+    """씬 파일 이름에서 _v 패턴 추출"""
+    m = re.search(r"v([0-9]{2,3})", path)
+    return int(m.group(1)) if m else 1
+
+
+def get_output_root(root_path):
+    """캐시 루트 (root / pub / caches / fur)"""
+    return os.path.join(root_path, 'pub', 'caches', 'fur')
+
+
+def get_version_dir(output_root, version):
+    """캐시 버전 폴더 (output_root / 버전)"""
+    return os.path.join(output_root, f"v{version:03d}")
+
+
+def get_cache_path(output_root, version, node):
+    """
+    노드별 캐시 경로 생성 (원본 스크립트 방식) + 네임스페이스 처리
+    - 네임스페이스가 있으면 캐시 폴더는 namespace/part_name
+    - 네임스페이스가 없으면 asset_name/part_name
+
+    :param output_root: 캐시 루트 (pub/caches/fur)
+    :param version: 캐시 버전
+    :param node: Yeti 노드 이름 (DAG 경로여도 됨, 예: '|charA:grp|charA:charA_fur_yetiShape')
+    :return: 'name.%04d.fur' 형식의 캐시 경로
+    """
+    node_clean = node.split("|")[-1]
+
+    # 네임스페이스 분리
+    if ":" in node_clean:
+        namespace, base_name = node_clean.split(":", 1)
+    else:
+        namespace, base_name = None, node_clean
+
+    # 노드에서 _yetiShape 제거
+    base_name = base_name.replace("_yetiShape", "")
+
+    # assetName / partName 추출
+    if "_" in base_name:
+        asset_name, part_name = base_name.split("_", 1)
+    else:
+        asset_name, part_name = base_name, "main"
+
+    # part_name에서 _yeti 제거
+    if part_name.endswith("_yeti"):
+        part_name = part_name.rsplit("_", 1)[0]
+
+    file_name = f"{asset_name}_{part_name}.%04d.fur"
+
+    # 기본 폴더: output_root / 버전 / asset_name(namespace) / part_name
+    cache_dir = os.path.join(get_version_dir(output_root, version), namespace or asset_name, part_name)
+    return os.path.join(cache_dir, file_name)
@@ -0,0 +1,272 @@
+"""
+Yeti 캐시 로컬 스크래치 스테이징 (Maya 없이 동작합니다.)
+
+pgYetiCommand가 프레임 파일을 네트워크 저장소(pub/caches/fur)에 바로 쓰면, 프레임마다 파일 서버 지연을 기다리게 됩니다.
+CacheStager를 사용하면 캐시를 로컬 스크래치에 쓰고, 백그라운드 스레드가 끝난 프레임을 최종 위치로 옮깁니다.
+
+1. 추출 중: 스크래치 폴더를 주기적으로 확인하여, 다음 프레임이 생긴(쓰기가 끝난) 프레임을 크기 단위(batch_bytes)로 묶어
+   최종 폴더 옆의 숨김 스테이징 폴더(.name.staging.PID)에 큰 버퍼로 순서대로 복사합니다.
+   복사하면서 원본의 sha1을 계산하고, 복사본을 다시 읽어 sha1이 같은지 확인합니다. (다르면 한 번 더 복사)
+2. 노드 추출이 끝나면: 남은 프레임을 복사하고, 최종 폴더에 이미 있던 프레임(추출 기록상 최신이라 건너뛴 프레임)은
+   스테이징 폴더에 하드 링크한 뒤 공개합니다. 최종 폴더(예: .../charA/fur)는 숨김 시퀀스 폴더(.fur.PID.시각)를 가리키는
+   상대 심볼릭 링크이며, 스테이징 폴더를 새 시퀀스 폴더로 옮기고 새 링크를 os.replace로 한 번에 바꿉니다.
+   rename은 NFS에서도 원자적이므로 캐시를 읽는 쪽은 이전 시퀀스 또는 새 시퀀스 전체만 보게 됩니다.
+   단, 최종 폴더가 아직 일반 폴더(스테이징 없이 추출한 캐시)이면 처음 한 번은 링크로 바꿔야 합니다.
+   리눅스 로컬 파일 시스템에서는 renameat2(RENAME_EXCHANGE)로 한 번에 바꾸지만, 지원하지 않으면(NFS 등) 기존 폴더를
+   옆으로 옮긴 뒤 링크를 놓으므로 그 사이 잠깐 최종 폴더가 보이지 않습니다.
+3. 노드 추출이 실패하면 스테이징 폴더를 버리고 최종 폴더는 그대로 둡니다.
+"""
+import ctypes
+import hashlib
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+
+from yeti_cache_manifest import hash_file
+
+# 한 번에 묶어 복사할 크기와 복사 버퍼 크기
+DEFAULT_BATCH_BYTES = 256 << 20
+COPY_BUFFER_SIZE = 8 << 20
+# 스크래치 폴더를 확인하는 간격(초)
+DEFAULT_POLL_INTERVAL = 0.5
+# 복사본의 해시가 다를 때 다시 복사할 횟수
+COPY_RETRIES = 1
+
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+
+
+def _frame_regex(cache_path):
+    """'name.%04d.fur' -> 'name.(\\d+).fur'에 맞는 정규식"""
+    prefix, _, suffix = os.path.basename(cache_path).partition("%04d")
+    return re.compile(re.escape(prefix) + r"(-?\d+)" + re.escape(suffix) + "$")
+
+
+def copy_verified(src, dst):
+    """
+    src를 dst로 복사하면서 sha1을 계산하고, 복사본을 다시 읽어 해시를 비교합니다.
+
+    :return: (sha1, 바이트 수)
+    :raises IOError: 복사본의 해시가 COPY_RETRIES번 다시 복사해도 다를 때
+    """
+    for _ in range(COPY_RETRIES + 1):
+        h = hashlib.sha1()
+        size = 0
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            for block in iter(lambda: fsrc.read(COPY_BUFFER_SIZE), b""):
+                h.update(block)
+                fdst.write(block)
+                size += len(block)
+        digest = h.hexdigest()
+        if hash_file(dst) == digest:
+            return digest, size
+    raise IOError("복사본의 체크섬이 원본과 다릅니다: {} -> {}".format(src, dst))
+
+
+def _rename_exchange(src, dst):
+    """src와 dst 경로를 한 번에 맞바꿉니다. (리눅스 renameat2, 지원하지 않으면 False)"""
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (AttributeError, OSError, TypeError):
+        return False
+    return renameat2(_AT_FDCWD, os.fsencode(src), _AT_FDCWD, os.fsencode(dst), _RENAME_EXCHANGE) == 0
+
+
+def swap_directory(staging_dir, final_dir):
+    """
+    스테이징 폴더를 숨김 시퀀스 폴더로 옮기고, 최종 폴더 링크가 그 폴더를 가리키도록 한 번에 바꿉니다.
+    (이전 시퀀스 폴더는 교체 후 삭제)
+
+    :param staging_dir: 완성된 시퀀스가 들어 있는 폴더 (final_dir과 같은 파일 시스템)
+    :param final_dir: 최종 폴더 (심볼릭 링크, 없거나 일반 폴더이면 링크로 바꿉니다.)
+    """
+    parent, name = os.path.split(final_dir)
+    sequence_name = ".{}.{}.{}".format(name, os.getpid(), time.time_ns())
+    os.rename(staging_dir, os.path.join(parent, sequence_name))
+    link_path = os.path.join(parent, ".{}.link.{}".format(name, os.getpid()))
+    if os.path.lexists(link_path):
+        os.remove(link_path)
+    os.symlink(sequence_name, link_path)
+
+    old_dir = None
+    if os.path.islink(final_dir):
+        old_dir = os.path.join(parent, os.readlink(final_dir))
+        os.replace(link_path, final_dir)
+        # 다른 곳을 가리키도록 직접 바꾼 링크라면 이전 폴더를 지우지 않습니다.
+        if os.path.dirname(os.path.normpath(old_dir)) != os.path.normpath(parent):
+            old_dir = None
+    elif not os.path.lexists(final_dir):
+        os.replace(link_path, final_dir)
+    elif _rename_exchange(link_path, final_dir):
+        # 일반 폴더를 링크로 바꿨습니다. (link_path에 이전 폴더가 있습니다.)
+        old_dir = link_path
+    else:
+        # renameat2를 지원하지 않으면(NFS 등) 처음 한 번은 최종 폴더가 잠깐 보이지 않습니다.
+        old_dir = os.path.join(parent, ".{}.old.{}".format(name, os.getpid()))
+        os.rename(final_dir, old_dir)
+        os.replace(link_path, final_dir)
+    if old_dir:
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+
+class StagedSequence:
+    """스크래치에 쓰고 최종 폴더로 옮기는 노드 하나의 캐시 시퀀스"""
+
+    def __init__(self, cache_path, scratch_path):
+        """
+        :param cache_path: 최종 캐시 경로 ('name.%04d.fur')
+        :param scratch_path: pgYetiCommand가 쓸 스크래치 캐시 경로
+        """
+        self.cache_path = cache_path
+        self.scratch_path = scratch_path
+        final_dir = os.path.dirname(cache_path)
+        self.staging_dir = os.path.join(os.path.dirname(final_dir),
+                                        ".{}.staging.{}".format(os.path.basename(final_dir), os.getpid()))
+        self.pattern = _frame_regex(cache_path)
+        self.checksums = {}   # 파일 이름 -> sha1
+        self.bytes = 0
+        self.batches = 0
+        self.ok = False
+        self.committed = False
+        self.error = None
+        self.done = threading.Event()
+
+
+class CacheStager:
+    """로컬 스크래치에 쓴 캐시를 백그라운드 스레드로 최종 위치에 옮깁니다."""
+
+    def __init__(self, output_root, scratch_root, batch_bytes=DEFAULT_BATCH_BYTES,
+                 poll_interval=DEFAULT_POLL_INTERVAL, log=print):
+        """
+        :param output_root: 최종 캐시 루트 (pub/caches/fur)
+        :param scratch_root: 로컬 스크래치 폴더
+        :param batch_bytes: 한 번에 묶어 복사할 크기
+        :param poll_interval: 스크래치 폴더 확인 간격(초)
+        :param log: 진행 메시지를 출력할 함수
+        """
+        self.output_root = output_root
+        self.scratch_root = os.path.join(scratch_root, "yeti_stage_{}".format(os.getpid()))
+        self.batch_bytes = batch_bytes
+        self.poll_interval = poll_interval
+        self.log = log
+        self._queue = queue.Queue()
+        self._thread = None
+        self._sequences = []
+
+    def stage(self, cache_path):
+        """
+        노드 하나의 스테이징을 시작합니다. 반환된 scratch_path에 캐시를 쓰고, 끝나면 finish를 호출합니다.
+
+        :param cache_path: 최종 캐시 경로 ('name.%04d.fur')
+        :rtype: StagedSequence
+        """
+        relative = os.path.relpath(os.path.dirname(cache_path), self.output_root)
+        scratch_dir = os.path.join(self.scratch_root, relative)
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+        os.makedirs(scratch_dir)
+        sequence = StagedSequence(cache_path, os.path.join(scratch_dir, os.path.basename(cache_path)))
+        self._sequences.append(sequence)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="yeti-cache-stager", daemon=True)
+            self._thread.start()
+        self._queue.put(sequence)
+        return sequence
+
+    @staticmethod
+    def finish(sequence, ok):
+        """
+        노드 추출이 끝났음을 알립니다.
+
+        :param ok: True이면 시퀀스를 최종 폴더로 교체하고, False이면 버립니다.
+        """
+        sequence.ok = ok
+        sequence.done.set()
+
+    def wait(self):
+        """
+        모든 시퀀스의 복사와 교체가 끝날 때까지 기다립니다.
+
+        :return: StagedSequence 리스트 (stage 순서)
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        shutil.rmtree(self.scratch_root, ignore_errors=True)
+        sequences, self._sequences = self._sequences, []
+        return sequences
+
+    def _run(self):
+        while True:
+            sequence = self._queue.get()
+            if sequence is None:
+                return
+            self._transfer(sequence)
+
+    def _ready_frames(self, sequence, finished):
+        """아직 복사하지 않은 완성된 프레임 파일 이름 (추출 중이면 마지막 프레임은 쓰는 중일 수 있으므로 제외)"""
+        frames = []
+        with os.scandir(os.path.dirname(sequence.scratch_path)) as entries:
+            for entry in entries:
+                match = sequence.pattern.match(entry.name)
+                if match and entry.name not in sequence.checksums:
+                    frames.append((int(match.group(1)), entry.name, entry.stat().st_size))
+        frames.sort()
+        if not finished and frames:
+            frames.pop()
+        batch, size = [], 0
+        for _, name, frame_size in frames:
+            if batch and size + frame_size > self.batch_bytes:
+                break
+            batch.append(name)
+            size += frame_size
+        return batch
+
+    def _transfer(self, sequence):
+        scratch_dir = os.path.dirname(sequence.scratch_path)
+        try:
+            os.makedirs(sequence.staging_dir, exist_ok=True)
+            while True:
+                # 목록을 읽기 전에 완료 여부를 확인해야 마지막 프레임을 빠뜨리지 않습니다.
+                finished = sequence.done.is_set()
+                batch = self._ready_frames(sequence, finished)
+                if batch:
+                    for name in batch:
+                        digest, size = copy_verified(os.path.join(scratch_dir, name),
+                                                     os.path.join(sequence.staging_dir, name))
+                        sequence.checksums[name] = digest
+                        sequence.bytes += size
+                    sequence.batches += 1
+                elif finished:
+                    break
+                else:
+                    sequence.done.wait(self.poll_interval)
+            if sequence.ok:
+                self._commit(sequence)
+        except Exception as e:
+            sequence.error = "{}: {}".format(type(e).__name__, e)
+            self.log(f"[FAILED] Cache transfer: {sequence.cache_path}: {sequence.error}")
+        finally:
+            shutil.rmtree(sequence.staging_dir, ignore_errors=True)
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    def _commit(self, sequence):
+        """최종 폴더에만 있는 프레임을 스테이징 폴더에 링크한 뒤 폴더를 교체합니다."""
+        final_dir = os.path.dirname(sequence.cache_path)
+        if os.path.isdir(final_dir):
+            with os.scandir(final_dir) as entries:
+                existing = [entry.name for entry in entries
+                            if entry.is_file() and entry.name not in sequence.checksums]
+            for name in existing:
+                target = os.path.join(sequence.staging_dir, name)
+                try:
+                    os.link(os.path.join(final_dir, name), target)
+                except OSError:
+                    shutil.copy2(os.path.join(final_dir, name), target)
+        swap_directory(sequence.staging_dir, final_dir)
+        sequence.committed = True
+        self.log(f"[TRANSFERRED] {sequence.cache_path} ({len(sequence.checksums)} frames, "
+                 f"{sequence.bytes / 1e6:.1f} MB, {sequence.batches} batches)")
@@ -0,0 +1,294 @@
+"""
+Yeti 캐시 시퀀스 검사 (Maya 없이 동작합니다.)
+
+추출된 '%04d.fur' 시퀀스마다 예상 프레임 범위(핸들 포함)를 검사합니다.
+- 빠진 프레임, 0바이트 프레임 (오류)
+- 헤더가 깨진 프레임 (오류, --headers): 파일 앞부분을 mmap으로 읽어, 모두 0이거나 같은 시퀀스 대부분의 프레임과
+  앞 4바이트(파일 형식 식별자)가 다른 프레임
+- 크기가 튀는 프레임 (경고): 중앙값과 MAD(중앙값 절대 편차)로 구한 robust z-score가 기준보다 크고,
+  중앙값에서 25% 이상 벗어난 프레임. 평균/표준편차와 달리 깨진 프레임 몇 개가 기준을 흔들지 않습니다.
+
+폴더는 스레드 풀에서 os.scandir로 한 번씩만 읽으므로, 수천 프레임도 몇 초 안에 끝납니다.
+
+[실행 방법]
+    python yeti_cache_verify.py /proj/shot010/fx/pub/caches/fur/v003 --start_frame 1001 --end_frame 1100 --headers
+    (프레임 범위를 지정하지 않으면 시퀀스마다 디스크에 있는 첫/마지막 프레임 사이를 검사합니다.)
+"""
+import argparse
+import collections
+import concurrent.futures
+import json
+import mmap
+import os
+import re
+import statistics
+import sys
+import time
+
+from yeti_cache_manifest import group_frames
+
+DEFAULT_WORKERS = 16
+# robust z-score 기준 (Iglewicz-Hoaglin 권장값)과 중앙값 대비 최소 편차 비율
+OUTLIER_THRESHOLD = 3.5
+OUTLIER_MIN_RATIO = 0.25
+# 크기 비교에 필요한 최소 프레임 수
+OUTLIER_MIN_FRAMES = 5
+HEADER_BYTES = 64
+MAGIC_BYTES = 4
+# MAD를 정규분포의 표준편차 단위로 바꾸는 계수
+_MAD_SCALE = 0.6745
+
+_FRAME_FILE_RE = re.compile(r"^(.+)\.(-?\d+)\.fur$")
+
+
+def list_files(directory):
+    """폴더 안의 파일 이름 -> 크기 (없는 폴더는 빈 딕셔너리)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
+
+
+def _scan_dir(directory):
+    """
+    (폴더, {파일 이름: 크기}, [하위 폴더])
+    숨김 폴더(.name.staging.PID, 스테이징으로 공개한 시퀀스 폴더 .name.PID.시각 등)는 제외하고,
+    스테이징으로 공개한 노드 폴더(숨김 시퀀스 폴더를 가리키는 심볼릭 링크)는 링크 경로로 들어갑니다.
+    """
+    files, subdirs = {}, []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.name.startswith("."):
+                        subdirs.append(entry.path)
+                elif entry.is_file():
+                    files[entry.name] = entry.stat().st_size
+    except OSError:
+        pass
+    return directory, files, subdirs
+
+
+def scan_tree(root, workers=DEFAULT_WORKERS):
+    """
+    root 아래 모든 폴더를 스레드 풀에서 동시에 읽습니다.
+    심볼릭 링크를 따라가므로, 같은 실제 폴더는 한 번만 읽어 링크가 순환하더라도 끝납니다.
+
+    :return: {폴더: {파일 이름: 크기}}
+    :rtype: dict
+    """
+    listings = {}
+    seen = {os.path.realpath(root)}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_dir, root)}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                directory, files, subdirs = future.result()
+                listings[directory] = files
+                for subdir in subdirs:
+                    real = os.path.realpath(subdir)
+                    if real not in seen:
+                        seen.add(real)
+                        pending.add(pool.submit(_scan_dir, subdir))
+    return listings
+
+
+def find_sequences(listings):
+    """
+    폴더 목록에서 'name.####.fur' 시퀀스를 찾습니다.
+
+    :return: {'name.%04d.fur' 형식의 캐시 경로: (디스크에 있는 첫 프레임, 마지막 프레임)}
+    :rtype: dict
+    """
+    frames = collections.defaultdict(list)
+    for directory, files in listings.items():
+        for name in files:
+            match = _FRAME_FILE_RE.match(name)
+            if match:
+                frames[directory, match.group(1)].append(match.group(2))
+    sequences = {}
+    for (directory, prefix), numbers in frames.items():
+        # '%04d'는 1000 이상의 프레임을 자르지 않으므로, 가장 짧은 프레임 번호의 자릿수가 패딩입니다.
+        # 음수 프레임은 부호도 자릿수에 들어가므로('%04d' % -4 -> '-004') 0 이상인 프레임 번호로 정합니다.
+        non_negative = [number for number in numbers if not number.startswith("-")]
+        padding = min(len(number) for number in non_negative or numbers)
+        cache_path = os.path.join(directory, "{}.%0{}d.fur".format(prefix, padding))
+        values = [int(number) for number in numbers]
+        sequences[cache_path] = (min(values), max(values))
+    return sequences
+
+
+def size_outliers(sizes, threshold=OUTLIER_THRESHOLD, min_ratio=OUTLIER_MIN_RATIO):
+    """
+    크기가 튀는 프레임을 중앙값과 MAD로 찾습니다.
+
+    :param sizes: {프레임: 크기} (0바이트 프레임 제외)
+    :return: 프레임 리스트
+    """
+    if len(sizes) < OUTLIER_MIN_FRAMES:
+        return []
+    median = statistics.median(sizes.values())
+    mad = statistics.median(abs(size - median) for size in sizes.values())
+    outliers = []
+    for frame, size in sorted(sizes.items()):
+        deviation = abs(size - median)
+        if deviation <= median * min_ratio:
+            continue
+        # MAD가 0이면(대부분의 크기가 같으면) 중앙값에서 크게 벗어난 프레임은 모두 튀는 프레임입니다.
+        if mad == 0 or _MAD_SCALE * deviation / mad > threshold:
+            outliers.append(frame)
+    return outliers
+
+
+def _read_header(path):
+    """파일 앞부분 HEADER_BYTES를 mmap으로 읽습니다."""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:HEADER_BYTES]
+
+
+def header_errors(cache_path, frames):
+    """
+    헤더가 모두 0이거나, 앞 MAGIC_BYTES가 시퀀스 대부분(절반 초과)의 프레임과 다른 프레임을 찾습니다.
+
+    :param frames: 검사할 프레임 리스트 (0바이트가 아닌 프레임)
+    :return: 프레임 리스트
+    """
+    headers = {}
+    errors = []
+    for frame in frames:
+        try:
+            headers[frame] = _read_header(cache_path % frame)
+        except (OSError, ValueError):
+            errors.append(frame)
+    counts = collections.Counter(header[:MAGIC_BYTES] for header in headers.values())
+    magic, count = counts.most_common(1)[0] if counts else (None, 0)
+    # 대부분의 프레임이 같은 식별자를 쓰지 않으면(알 수 없는 형식) 0으로 채워진 헤더만 찾습니다.
+    if count * 2 <= len(headers):
+        magic = None
+    for frame, header in headers.items():
+        if not header.strip(b"\0") or (magic is not None and header[:MAGIC_BYTES] != magic):
+            errors.append(frame)
+    return sorted(errors)
+
+
+def check_sequence(cache_path, files, start, end, read_headers=False):
+    """
+    시퀀스 하나를 검사합니다.
+
+    :param cache_path: 'name.%04d.fur' 형식의 캐시 경로
+    :param files: 캐시 폴더의 {파일 이름: 크기}
+    :param start: 첫 프레임 (핸들 포함)
+    :param end: 마지막 프레임 (핸들 포함)
+    :param read_headers: True이면 프레임 헤더도 검사
+    :return: {"cache_path", "start", "end", "frames", "bytes", "missing", "zero", "header_errors", "outliers", "ok"}
+             (ok는 빠진/0바이트/헤더 오류 프레임이 없으면 True, 크기가 튀는 프레임은 경고)
+    :rtype: dict
+    """
+    name = os.path.basename(cache_path)
+    sizes = {}
+    missing = []
+    for frame in range(start, end + 1):
+        size = files.get(name % frame)
+        if size is None:
+            missing.append(frame)
+        else:
+            sizes[frame] = size
+    zero = [frame for frame, size in sizes.items() if size == 0]
+    nonzero = {frame: size for frame, size in sizes.items() if size}
+    errors = header_errors(cache_path, sorted(nonzero)) if read_headers else []
+    return {"cache_path": cache_path, "start": start, "end": end, "frames": len(sizes),
+            "bytes": sum(sizes.values()), "missing": missing, "zero": zero, "header_errors": errors,
+            "outliers": size_outliers(nonzero), "ok": not (missing or zero or errors)}
+
+
+def verify_sequences(ranges, workers=DEFAULT_WORKERS, read_headers=False, listings=None):
+    """
+    여러 시퀀스를 캐시 폴더 단위로 스레드 풀에서 동시에 검사합니다. (폴더마다 한 번만 읽습니다.)
+
+    :param ranges: {캐시 경로: (첫 프레임, 마지막 프레임)}
+    :param workers: 동시에 읽을 폴더 수
+    :param read_headers: True이면 프레임 헤더도 검사
+    :param listings: 이미 읽은 {폴더: {파일 이름: 크기}} (scan_tree 결과, 없으면 새로 읽음)
+    :return: {캐시 경로: check_sequence 결과}
+    :rtype: dict
+    """
+    by_dir = collections.defaultdict(list)
+    for cache_path in ranges:
+        by_dir[os.path.dirname(cache_path)].append(cache_path)
+
+    def check_dir(directory):
+        files = listings[directory] if listings and directory in listings else list_files(directory)
+        return [check_sequence(path, files, *ranges[path], read_headers=read_headers) for path in by_dir[directory]]
+
+    results = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for checked in pool.map(check_dir, by_dir):
+            results.update((result["cache_path"], result) for result in checked)
+    return results
+
+
+def verify_tree(root, start=None, end=None, workers=DEFAULT_WORKERS, read_headers=False):
+    """
+    캐시 폴더(버전 폴더 등) 아래 모든 시퀀스를 찾아 검사합니다.
+
+    :param start: 첫 프레임 (핸들 포함, None이면 시퀀스마다 디스크에 있는 첫 프레임)
+    :param end: 마지막 프레임 (핸들 포함, None이면 시퀀스마다 디스크에 있는 마지막 프레임)
+    :return: {캐시 경로: check_sequence 결과}
+    """
+    listings = scan_tree(root, workers)
+    ranges = {path: (first if start is None else start, last if end is None else end)
+              for path, (first, last) in find_sequences(listings).items()}
+    return verify_sequences(ranges, workers, read_headers, listings)
+
+
+def describe_problems(result):
+    """검사 결과의 문제를 한 줄로 요약합니다. 예) 'missing 1001-1003, zero 1050, outliers 1077'"""
+    parts = []
+    for key in ("missing", "zero", "header_errors", "outliers"):
+        if result[key]:
+            ranges = ", ".join(str(s) if s == e else "{}-{}".format(s, e) for s, e in group_frames(result[key]))
+            parts.append("{} {}".format(key, ranges))
+    return "; ".join(parts)
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Verify exported Yeti cache sequences")
+    parser.add_argument("root", help="Cache folder to scan (e.g. pub/caches/fur/v003)")
+    parser.add_argument("--start_frame", type=int, default=None, help="First frame without handles")
+    parser.add_argument("--end_frame", type=int, default=None, help="Last frame without handles")
+    parser.add_argument("--handles", type=int, default=5, help="Frames added before and after the range")
+    parser.add_argument("--headers", action="store_true", help="Also read frame headers with mmap")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Folders scanned at the same time")
+    parser.add_argument("--json", default=None, help="Write the results to this JSON file")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    opts = parse_args(sys.argv[1:] if args is None else args)
+    start = None if opts.start_frame is None else opts.start_frame - opts.handles
+    end = None if opts.end_frame is None else opts.end_frame + opts.handles
+    started = time.perf_counter()
+    results = verify_tree(opts.root, start, end, opts.workers, opts.headers)
+    elapsed = time.perf_counter() - started
+
+    bad = 0
+    for cache_path, result in sorted(results.items()):
+        problems = describe_problems(result)
+        if not result["ok"]:
+            bad += 1
+            print(f"[BAD] {cache_path}: {problems}")
+        elif problems:
+            print(f"[WARNING] {cache_path}: {problems}")
+    frames = sum(result["frames"] for result in results.values())
+    print(f"[DONE] {len(results)} sequences, {frames} frames, {bad} bad ({elapsed:.2f}s)")
+    if opts.json:
+        with open(opts.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 1 if bad or not results else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+"""
+Yeti 캐시 병렬 추출 코디네이터 (Maya 없이 동작합니다.)
+
+Yeti 노드 목록을 N개의 묶음(shard)으로 나누고, 묶음마다 작업자(worker)를 동시에 실행한 뒤
+추출된 캐시 경로와 실패한 노드를 모읍니다. 작업자가 실패하면(예외, 비정상 종료, 노드별 실패)
+아직 추출되지 않은 노드만 다시 실행합니다.
+
+작업자는 run_worker(shard, worker_index, attempt) 형태의 함수이며, 기본 작업자(MayapyWorker)는
+yeti_standalone_export.py를 mayapy 하위 프로세스로 실행하고 결과 JSON을 읽습니다.
+테스트나 벤치마크에서는 Maya 없이 동작하는 가짜 작업자를 넘길 수 있습니다.
+
+노드 하나가 전체 시간을 차지하는 경우에는 run_chunked_export로 그 노드의 프레임 범위를 연속된 청크로 나누어
+여러 작업자가 같은 '%04d.fur' 시퀀스에 나눠 씁니다. 청크 크기는 측정된 프레임당 시간으로 조절하고,
+마지막에 시퀀스에 빠지거나 겹친 프레임이 없는지 확인합니다.
+
+작업자 결과 형식:
+    {"exported": {노드 이름: 캐시 경로}, "failed": {노드 이름: 오류 메시지},
+     "frame_times": {노드 이름: 프레임당 추출 시간(초)},
+     "written": {노드 이름: 이번 실행에서 실제로 쓴 (시작, 끝) 프레임 범위 리스트},
+     "report": 작업자 추출 리포트(yeti_export_report)}
+"""
+import collections
+import concurrent.futures
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+DEFAULT_RETRIES = 1
+# 작업자 실패 시 오류 메시지에 남길 출력 줄 수
+OUTPUT_TAIL_LINES = 20
+# 청크 하나의 목표 추출 시간(초), 작업자마다 드는 초기화/씬 열기 시간보다 충분히 길게 잡습니다.
+DEFAULT_CHUNK_SECONDS = 600.0
+MIN_CHUNK_FRAMES = 5
+
+
+def shard_nodes(nodes, workers):
+    """
+    노드 목록을 최대 workers개의 묶음으로 나눕니다. (순서대로 돌아가며 배정하여, 앞쪽의 무거운 노드가 한 묶음에 몰리지 않도록 합니다.)
+
+    :param nodes: 노드 이름 리스트
+    :param workers: 작업자 수
+    :return: 비어 있지 않은 묶음 리스트
+    :rtype: list
+    """
+    count = max(1, min(workers, len(nodes)))
+    return [list(nodes[i::count]) for i in range(count) if nodes[i::count]]
+
+
+def _run_shard(run_worker, shard, index, retries, log):
+    """
+    묶음 하나를 실행하고, 실패한 노드만 retries번까지 다시 실행합니다.
+
+    :return: ({노드: 캐시 경로}, {노드: 오류 메시지}, 실행 횟수, 작업자 리포트 리스트)
+    """
+    exported = {}
+    failed = {}
+    reports = []
+    remaining = list(shard)
+    attempts = 0
+    for attempt in range(retries + 1):
+        attempts += 1
+        try:
+            result = run_worker(remaining, index, attempt)
+            if result.get("report"):
+                reports.append(result["report"])
+            exported.update(result.get("exported", {}))
+            failed = {node: error for node, error in result.get("failed", {}).items() if node not in exported}
+            # 결과에 없는 노드(작업자가 중간에 종료된 경우 등)도 실패로 처리합니다.
+            for node in remaining:
+                if node not in exported and node not in failed:
+                    failed[node] = "작업자 결과에 노드가 없습니다."
+        except Exception as e:
+            failed = {node: "{}: {}".format(type(e).__name__, e) for node in remaining}
+
+        remaining = [node for node in remaining if node in failed]
+        if not remaining:
+            break
+        if attempt < retries:
+            log("[RETRY] worker {}: {}개 노드 다시 실행 ({}/{})".format(index, len(remaining), attempt + 1, retries))
+    return exported, failed, attempts, reports
+
+
+def run_sharded_export(nodes, workers, run_worker, retries=DEFAULT_RETRIES, log=print):
+    """
+    노드를 묶음으로 나누어 작업자를 동시에 실행하고 결과를 모읍니다.
+
+    작업자는 하위 프로세스를 기다리는 동안 GIL을 놓으므로 스레드 풀에서 실행합니다.
+
+    :param nodes: Yeti 노드 이름 리스트
+    :param workers: 동시에 실행할 작업자 수
+    :param run_worker: run_worker(shard, worker_index, attempt) -> {'exported': {...}, 'failed': {...}}
+    :param retries: 작업자가 실패했을 때 다시 실행할 횟수
+    :param log: 진행 메시지 출력 함수
+    :return: {'exported': {노드: 경로}, 'failed': {노드: 오류}, 'shards': 묶음 수, 'attempts': 전체 실행 횟수,
+              'reports': 작업자 리포트 리스트, 'elapsed': 소요 시간}
+    :rtype: dict
+    """
+    started = time.perf_counter()
+    shards = shard_nodes(list(nodes), workers)
+    summary = {"exported": {}, "failed": {}, "shards": len(shards), "attempts": 0, "reports": [], "elapsed": 0.0}
+    if not shards:
+        return summary
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        futures = {executor.submit(_run_shard, run_worker, shard, index, retries, log): index
+                   for index, shard in enumerate(shards)}
+        for future in concurrent.futures.as_completed(futures):
+            exported, failed, attempts, reports = future.result()
+            summary["exported"].update(exported)
+            summary["failed"].update(failed)
+            summary["attempts"] += attempts
+            summary["reports"].extend(reports)
+            log("[WORKER {}] {}개 추출, {}개 실패".format(futures[future], len(exported), len(failed)))
+
+    # 결과는 입력 노드 순서로 정렬합니다.
+    order = {node: i for i, node in enumerate(nodes)}
+    summary["exported"] = dict(sorted(summary["exported"].items(), key=lambda item: order.get(item[0], 0)))
+    summary["failed"] = dict(sorted(summary["failed"].items(), key=lambda item: order.get(item[0], 0)))
+    summary["elapsed"] = time.perf_counter() - started
+    return summary
+
+
+def plan_chunk_size(remaining, workers, frame_time, target_seconds=DEFAULT_CHUNK_SECONDS,
+                    min_frames=MIN_CHUNK_FRAMES):
+    """
+    다음 청크의 프레임 수를 정합니다.
+
+    프레임당 시간을 측정하기 전에는 남은 범위의 절반을 작업자 수로 나눈 크기를 쓰고, 측정한 뒤에는
+    target_seconds 동안 추출할 수 있는 프레임 수를 씁니다. 끝부분이 한 작업자에 몰리지 않도록
+    남은 프레임을 작업자 수로 나눈 크기를 넘지 않지만, 작업자마다 드는 초기화/씬 열기 시간 때문에 min_frames보다 작게 나누지는 않습니다.
+
+    :param remaining: 아직 나눠 주지 않은 프레임 수
+    :param workers: 작업자 수
+    :param frame_time: 측정된 프레임당 시간(초, 없으면 None)
+    :param target_seconds: 청크 하나의 목표 추출 시간(초)
+    :param min_frames: 최소 청크 크기
+    :rtype: int
+    """
+    per_worker = -(-remaining // workers)
+    if frame_time:
+        size = int(target_seconds / frame_time)
+    else:
+        size = -(-remaining // (workers * 2))
+    return min(remaining, max(min_frames, min(per_worker, size), 1))
+
+
+class FrameChunkScheduler:
+    """
+    start~end 범위를 앞에서부터 연속된 청크로 나눠 주는 스레드 안전 스케줄러입니다.
+    작업자가 청크를 끝낼 때마다 추출 시간을 기록하고, 다음 청크 크기는 그때까지의 프레임당 평균 시간으로 정합니다.
+    """
+    def __init__(self, start, end, workers, target_seconds=DEFAULT_CHUNK_SECONDS, min_frames=MIN_CHUNK_FRAMES):
+        self.start = start
+        self.end = end
+        self.workers = workers
+        self.target_seconds = target_seconds
+        self.min_frames = min_frames
+        self._next = start
+        self._frames = 0
+        self._seconds = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def frame_time(self):
+        """측정된 프레임당 평균 시간(초), 측정값이 없으면 None"""
+        with self._lock:
+            return self._seconds / self._frames if self._frames else None
+
+    def next_chunk(self):
+        """다음 청크 (시작, 끝), 남은 프레임이 없으면 None"""
+        frame_time = self.frame_time
+        with self._lock:
+            if self._next > self.end:
+                return None
+            size = plan_chunk_size(self.end - self._next + 1, self.workers, frame_time,
+                                   self.target_seconds, self.min_frames)
+            chunk = (self._next, min(self.end, self._next + size - 1))
+            self._next = chunk[1] + 1
+            return chunk
+
+    def record(self, frames, seconds):
+        """청크 추출 시간을 기록합니다."""
+        with self._lock:
+            self._frames += frames
+            self._seconds += seconds
+
+
+def check_frame_coverage(chunks, start, end):
+    """
+    추출된 청크들이 start~end를 빈틈과 중복 없이 덮는지 확인합니다.
+
+    :param chunks: (시작, 끝) 리스트
+    :return: (빠진 프레임 리스트, 중복된 프레임 리스트)
+    """
+    counts = collections.Counter(frame for chunk_start, chunk_end in chunks
+                                 for frame in range(chunk_start, chunk_end + 1))
+    gaps = [frame for frame in range(start, end + 1) if not counts[frame]]
+    duplicates = sorted(frame for frame, count in counts.items() if count > 1)
+    return gaps, duplicates
+
+
+def find_missing_frames(cache_path, start, end):
+    """
+    '%04d' 캐시 시퀀스에서 디스크에 없는 프레임을 찾습니다. (폴더를 한 번만 읽습니다.)
+
+    :param cache_path: 'name.%04d.fur' 형식의 캐시 경로
+    :return: 빠진 프레임 리스트
+    """
+    try:
+        names = set(os.listdir(os.path.dirname(cache_path)))
+    except OSError:
+        names = set()
+    return [frame for frame in range(start, end + 1) if os.path.basename(cache_path % frame) not in names]
+
+
+def _run_chunk(run_chunk, node, chunk, index, retries, log):
+    """
+    청크 하나를 실행하고 실패하면 retries번까지 다시 실행합니다.
+
+    :return: (캐시 경로 또는 None, 오류 메시지, 프레임당 시간, 실행 횟수, 작업자 리포트 리스트)
+    """
+    frames = chunk[1] - chunk[0] + 1
+    error = None
+    reports = []
+    for attempt in range(retries + 1):
+        started = time.perf_counter()
+        try:
+            result = run_chunk(node, chunk[0], chunk[1], index, attempt)
+            if result.get("report"):
+                reports.append(result["report"])
+            if node in result.get("exported", {}):
+                # 작업자가 측정한 시간이 없으면 초기화/씬 열기를 포함한 전체 시간으로 대신합니다.
+                frame_time = result.get("frame_times", {}).get(node) or (time.perf_counter() - started) / frames
+                return result["exported"][node], None, frame_time, attempt + 1, reports
+            error = result.get("failed", {}).get(node, "작업자 결과에 노드가 없습니다.")
+        except Exception as e:
+            error = "{}: {}".format(type(e).__name__, e)
+        if attempt < retries:
+            log("[RETRY] {} {}-{}: {} ({}/{})".format(node, chunk[0], chunk[1], error, attempt + 1, retries))
+    return None, error, None, retries + 1, reports
+
+
+def run_chunked_export(node, start, end, workers, run_chunk, retries=DEFAULT_RETRIES,
+                       target_seconds=DEFAULT_CHUNK_SECONDS, min_frames=MIN_CHUNK_FRAMES, log=print):
+    """
+    노드 하나의 프레임 범위(핸들 포함)를 연속된 청크로 나누어 작업자들이 같은 캐시 시퀀스에 나눠 쓰게 합니다.
+    작업자는 청크를 하나 끝낼 때마다 다음 청크를 받아 가며, 청크 크기는 측정된 프레임당 시간으로 조절됩니다.
+    모든 청크가 끝나면 청크 범위와 디스크의 시퀀스 파일로 빠지거나 겹친 프레임이 없는지 확인합니다.
+
+    :param node: Yeti 노드 이름
+    :param start: 시작 프레임 (핸들 포함)
+    :param end: 끝 프레임 (핸들 포함)
+    :param workers: 동시에 실행할 작업자 수
+    :param run_chunk: run_chunk(node, chunk_start, chunk_end, worker_index, attempt) -> 작업자 결과
+    :param retries: 실패한 청크를 다시 실행할 횟수
+    :param target_seconds: 청크 하나의 목표 추출 시간(초)
+    :param min_frames: 최소 청크 크기
+    :param log: 진행 메시지 출력 함수
+    :return: {'node', 'cache_path', 'chunks': [(시작, 끝)], 'failed': {'시작-끝': 오류}, 'gaps', 'duplicates',
+              'missing', 'complete', 'attempts', 'frame_time', 'reports', 'elapsed'}
+    :rtype: dict
+    """
+    started = time.perf_counter()
+    scheduler = FrameChunkScheduler(start, end, workers, target_seconds, min_frames)
+    lock = threading.Lock()
+    summary = {"node": node, "cache_path": None, "chunks": [], "failed": {}, "gaps": [], "duplicates": [],
+               "missing": [], "complete": False, "attempts": 0, "frame_time": None, "reports": [], "elapsed": 0.0}
+    cache_paths = set()
+
+    def work(index):
+        while True:
+            chunk = scheduler.next_chunk()
+            if chunk is None:
+                return
+            cache_path, error, frame_time, attempts, reports = _run_chunk(run_chunk, node, chunk, index, retries, log)
+            with lock:
+                summary["attempts"] += attempts
+                summary["reports"].extend(reports)
+                if cache_path:
+                    summary["chunks"].append(chunk)
+                    cache_paths.add(cache_path)
+                else:
+                    summary["failed"]["{}-{}".format(*chunk)] = error
+            if frame_time:
+                scheduler.record(chunk[1] - chunk[0] + 1, frame_time * (chunk[1] - chunk[0] + 1))
+            log("[WORKER {}] {} {}-{} {}".format(index, node, chunk[0], chunk[1], "done" if cache_path else "failed"))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(work, index) for index in range(workers)]:
+            future.result()
+
+    summary["chunks"].sort()
+    summary["gaps"], summary["duplicates"] = check_frame_coverage(summary["chunks"], start, end)
+    if len(cache_paths) == 1:
+        summary["cache_path"] = cache_paths.pop()
+        summary["missing"] = find_missing_frames(summary["cache_path"], start, end)
+    elif cache_paths:
+        # 작업자마다 다른 경로에 썼다면 하나의 시퀀스로 합쳐지지 않은 것입니다.
+        summary["failed"]["cache_path"] = "청크마다 캐시 경로가 다릅니다: {}".format(sorted(cache_paths))
+    summary["complete"] = bool(summary["cache_path"]) and not (
+        summary["failed"] or summary["gaps"] or summary["duplicates"] or summary["missing"])
+    summary["frame_time"] = scheduler.frame_time
+    summary["elapsed"] = time.perf_counter() - started
+    return summary
+
+
+class MayapyWorker:
+    """
+    yeti_standalone_export.py를 mayapy 하위 프로세스로 실행하는 작업자입니다.
+    각 하위 프로세스는 씬을 한 번 열고 자기 묶음의 노드만 추출한 뒤, 결과를 JSON 파일로 저장합니다.
+    """
+    def __init__(self, scene_file, start_frame, end_frame, samples, script_path=None, python=None, timeout=None,
+                 handles=None, extra_args=None):
+        """
+        :param scene_file: 씬 파일 경로
+        :param start_frame: 시작 프레임 (핸들 제외, 모든 작업자가 같은 범위를 사용하도록 코디네이터에서 확정한 값)
+        :param end_frame: 끝 프레임 (핸들 제외)
+        :param samples: Yeti 샘플 값
+        :param script_path: 작업자 스크립트 경로 (기본: 같은 폴더의 yeti_standalone_export.py)
+        :param python: 실행할 파이썬 (기본: 현재 인터프리터, mayapy로 실행 중이면 mayapy)
+        :param timeout: 작업자 하나의 최대 실행 시간(초, None이면 제한 없음)
+        :param handles: 프레임 범위 앞뒤에 붙일 핸들 (None이면 작업자 스크립트의 기본값)
+        :param extra_args: 작업자 명령줄에 그대로 붙일 인자 리스트 (예: ['--load_references', 'charA_furRN'])
+        """
+        self.scene_file = scene_file
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.samples = samples
+        self.script_path = script_path or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                       "yeti_standalone_export.py")
+        self.python = python or sys.executable
+        self.timeout = timeout
+        self.handles = handles
+        self.extra_args = list(extra_args or [])
+
+    def build_command(self, shard, result_path, start_frame=None, end_frame=None, handles=None):
+        """
+        작업자 하위 프로세스의 명령줄을 만듭니다. (프레임/핸들을 지정하지 않으면 작업자 기본값)
+        프레임이 None이면 작업자가 씬의 재생 범위를 사용하고, 묶음이 비어 있으면 씬의 모든 Yeti 노드를 추출합니다.
+        """
+        start_frame = self.start_frame if start_frame is None else start_frame
+        end_frame = self.end_frame if end_frame is None else end_frame
+        handles = self.handles if handles is None else handles
+        command = [self.python, self.script_path,
+                   "--scenefile", self.scene_file,
+                   "--samples", str(self.samples),
+                   "--result_json", result_path]
+        if start_frame is not None:
+            command += ["--start_frame", str(start_frame)]
+        if end_frame is not None:
+            command += ["--end_frame", str(end_frame)]
+        if handles is not None:
+            command += ["--handles", str(handles)]
+        command += self.extra_args
+        return command + ["--nodes"] + list(shard) if shard else command
+
+    def __call__(self, shard, index, attempt):
+        return self._run(shard, index, attempt)
+
+    def export_chunk(self, node, start_frame, end_frame, index, attempt):
+        """노드 하나의 프레임 청크를 추출합니다. (청크 범위에 이미 핸들이 포함되어 있으므로 핸들 0)"""
+        return self._run([node], index, attempt, start_frame, end_frame, 0)
+
+    def _run(self, shard, index, attempt, start_frame=None, end_frame=None, handles=None):
+        fd, result_path = tempfile.mkstemp(prefix="yeti_worker{}_{}_".format(index, attempt), suffix=".json")
+        os.close(fd)
+        try:
+            command = self.build_command(shard, result_path, start_frame, end_frame, handles)
+            process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                     universal_newlines=True, timeout=self.timeout)
+            try:
+                with open(result_path, "r") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                tail = "\n".join(process.stdout.splitlines()[-OUTPUT_TAIL_LINES:])
+                raise RuntimeError("작업자가 결과 없이 종료되었습니다. (exit {})\n{}".format(process.returncode, tail))
+        finally:
+            if os.path.exists(result_path):
+                os.remove(result_path)
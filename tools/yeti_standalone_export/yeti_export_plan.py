@@ -0,0 +1,277 @@
+"""
+Yeti 캐시 추출 계획 (드라이 런, Maya 없이 동작합니다.)
+
+렌더팜 작업을 나누려면 Yeti 노드 목록과 캐시 경로가 필요하지만, 지금은 그것만을 위해 mayapy로 씬을 열어야 합니다.
+이 모듈은 씬(.ma)을 core.ma_parser로 스트리밍하여 다음을 찾고, 추출할 내용과 예상 시간을 출력합니다.
+폴더나 파일은 만들지 않습니다.
+
+- Yeti 노드: 씬의 pgYetiMaya 노드와, Yeti가 있는 참조 파일(yeti_reference_scan.ReferenceScanner로 헤더 판단)의
+  pgYetiMaya 노드 (하위 참조 포함, 참조 네임스페이스를 붙인 이름)
+- 재생 범위: sceneConfigurationScriptNode에 저장된 playbackOptions -min / -max
+- 캐시 경로: yeti_cache_paths (YetiCacheExporter와 같은 이름 규칙)
+- 추출할 프레임: 캐시 버전 폴더의 추출 기록(manifest.json)과 비교하여 빠졌거나 바뀐 프레임 (--force이면 전체)
+- 예상 시간: 같은(없으면 이전) 버전 폴더의 export_report.json에서 노드별 프레임당 시간을 샘플 값 비율로 보정하여 사용하고,
+  리포트가 없는 노드는 --frame_seconds를 사용합니다. --workers이면 노드 분할 추출의 예상 완료 시간도 계산합니다.
+
+.mb이거나 찾을 수 없는 참조 파일은 노드를 알 수 없으므로 unresolved_references로 보고합니다.
+
+[실행 방법] (저장소 루트가 PYTHONPATH에 있어야 합니다.)
+    python yeti_export_plan.py --scenefile /show/PROJ/shot010/fx/pub/maya/shot010_fx_v003.ma --samples 3 --workers 4
+"""
+import argparse
+import json
+import os
+import re
+import sys
+
+from core import ma_parser
+
+import yeti_cache_paths
+from yeti_cache_manifest import CacheManifest, group_frames
+from yeti_export_coordinator import shard_nodes
+from yeti_export_report import REPORT_NAME
+from yeti_reference_scan import YETI_NODE_TYPE, ReferenceScanner, resolve_reference_path
+
+# yeti_standalone_export.HANDLES와 같은 값
+HANDLES = 5
+# 이전 추출 리포트가 없는 노드의 프레임당 추출 시간 추정값(초)
+DEFAULT_FRAME_SECONDS = 1.0
+
+SCAN_COMMANDS = {"file", "createNode", "setAttr"}
+# 재생 범위(playbackOptions)를 저장하는 스크립트 노드
+PLAYBACK_SCRIPT_NODE = "sceneConfigurationScriptNode"
+_PLAYBACK_RE = re.compile(r"-(min|max)\s+(-?[\d.]+)")
+_VERSION_DIR_RE = re.compile(r"^v(\d+)$")
+
+
+def _join_namespace(namespace, name):
+    return "{}:{}".format(namespace, name) if namespace else name
+
+
+def _scan_file(path, namespace, scanner, nodes, unresolved, visiting):
+    """
+    .ma 파일 하나를 읽어 Yeti 노드를 nodes에 추가하고, Yeti가 있을 수 있는 참조 파일을 이어서 읽습니다.
+
+    :param namespace: 이 파일의 노드에 붙일 네임스페이스 (씬 파일은 '')
+    :param nodes: [{"node", "transform"}] (결과를 추가)
+    :param unresolved: 노드를 알 수 없는 참조 파일 경로 리스트 (결과를 추가)
+    :param visiting: 읽는 중인 파일 (순환 참조 방지)
+    :return: 재생 범위 (min, max), 찾지 못하면 None
+    """
+    playback = None
+    current = None
+    references = []
+    for statement in ma_parser.iter_statements(path, commands=SCAN_COMMANDS):
+        command = statement.command
+        if command == "createNode":
+            flags, args = statement.parse()
+            if not args:
+                continue
+            current = (flags.get("n") or flags.get("name") or [args[0]])[-1]
+            if args[0] == YETI_NODE_TYPE:
+                parent = (flags.get("p") or flags.get("parent") or [None])[-1]
+                nodes.append({"node": _join_namespace(namespace, current),
+                              "transform": _join_namespace(namespace, parent.split("|")[-1]) if parent else None})
+        elif command == "setAttr":
+            if current == PLAYBACK_SCRIPT_NODE and statement.tokens[:1] == ['".b"']:
+                flags, args = statement.parse()
+                values = dict(_PLAYBACK_RE.findall(args[-1])) if len(args) > 1 else {}
+                if "min" in values and "max" in values:
+                    playback = (int(float(values["min"])), int(float(values["max"])))
+        else:
+            flags, args = statement.parse()
+            if ("r" in flags or "reference" in flags) and args:
+                ref_namespace = (flags.get("ns") or flags.get("namespace") or [""])[-1].strip(":")
+                references.append((_join_namespace(namespace, ref_namespace), args[-1]))
+
+    visiting.add(os.path.normcase(os.path.abspath(path)))
+    for ref_namespace, ref_path in references:
+        resolved = resolve_reference_path(ref_path, os.path.dirname(path))
+        if resolved is None or not resolved.lower().endswith(".ma"):
+            unresolved.append(ref_path)
+        elif (scanner.has_yeti(resolved)
+              and os.path.normcase(os.path.abspath(resolved)) not in visiting):
+            _scan_file(resolved, ref_namespace, scanner, nodes, unresolved, visiting)
+    visiting.discard(os.path.normcase(os.path.abspath(path)))
+    return playback
+
+
+def find_yeti_nodes(scene_file, scanner=None):
+    """
+    씬(.ma)과 그 참조에서 Yeti 노드와 재생 범위를 찾습니다.
+
+    :param scene_file: 씬 파일 경로 (.ma)
+    :param scanner: 참조 파일 결과를 재사용할 ReferenceScanner (없으면 새로 생성)
+    :return: ([{"node", "transform"}], 재생 범위 (min, max) 또는 None, [노드를 알 수 없는 참조 파일])
+    :raises ValueError: .ma가 아닐 때
+    """
+    if not scene_file.lower().endswith(".ma"):
+        raise ValueError("Maya ASCII(.ma) 씬만 Maya 없이 읽을 수 있습니다: {}".format(scene_file))
+    nodes, unresolved = [], []
+    playback = _scan_file(scene_file, "", scanner or ReferenceScanner(), nodes, unresolved, set())
+    return nodes, playback, unresolved
+
+
+def select_nodes(nodes, names):
+    """
+    --nodes로 지정한 트랜스폼 또는 Yeti 셰이프 이름에 해당하는 노드를 고릅니다. (YetiCacheExporter._get_yeti_nodes와 같은 규칙)
+
+    :raises ValueError: 씬에 없는 이름이 있거나 Yeti 노드가 하나도 없을 때
+    """
+    if not names:
+        if not nodes:
+            raise ValueError("씬에 Yeti 노드가 존재하지 않습니다.")
+        return nodes
+    selected = []
+    for name in names:
+        name = name.split("|")[-1]
+        matches = [node for node in nodes if name in (node["node"], node["transform"])]
+        if not matches:
+            raise ValueError("씬에서 Yeti 노드를 찾을 수 없습니다: {}".format(name))
+        selected.extend(matches)
+    return selected
+
+
+def load_frame_seconds(output_root, version, samples):
+    """
+    추출 리포트에서 노드별 프레임당 추출 시간을 찾습니다. (현재 버전, 없으면 이전 버전 중 최신 리포트부터)
+    시간은 샘플 값에 비례한다고 보고 현재 샘플 값으로 보정합니다.
+
+    :return: {노드: 프레임당 시간(초)}
+    :rtype: dict
+    """
+    try:
+        versions = sorted((int(m.group(1)) for m in map(_VERSION_DIR_RE.match, os.listdir(output_root)) if m),
+                          reverse=True)
+    except OSError:
+        return {}
+    frame_seconds = {}
+    for report_version in [v for v in versions if v <= version]:
+        path = os.path.join(yeti_cache_paths.get_version_dir(output_root, report_version), REPORT_NAME)
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        scale = samples / data["samples"] if data.get("samples") else 1.0
+        for node, stats in data.get("nodes", {}).items():
+            if node not in frame_seconds and stats.get("frames") and stats.get("seconds"):
+                frame_seconds[node] = stats["seconds"] / stats["frames"] * scale
+    return frame_seconds
+
+
+def plan_export(scene_file, nodes=None, start_frame=None, end_frame=None, samples=5, handles=HANDLES,
+                force=False, workers=1, frame_seconds=DEFAULT_FRAME_SECONDS):
+    """
+    Maya 없이 추출 계획을 만듭니다. 폴더나 파일은 만들지 않습니다.
+
+    :param scene_file: 씬 파일 경로 (.ma)
+    :param nodes: Yeti 노드(트랜스폼 또는 셰이프) 리스트 (없으면 씬 내 모든 Yeti 노드)
+    :param start_frame: 시작 프레임 (없으면 씬의 재생 범위)
+    :param end_frame: 끝 프레임 (없으면 씬의 재생 범위)
+    :param samples: Yeti 샘플 값
+    :param handles: 프레임 범위 앞뒤에 붙일 핸들
+    :param force: True이면 추출 기록을 무시하고 모든 프레임을 추출하는 것으로 계산
+    :param workers: 노드 분할 추출의 작업자 수 (예상 완료 시간 계산용)
+    :param frame_seconds: 리포트가 없는 노드의 프레임당 추출 시간(초)
+    :return: {"scene", "output_root", "version", "version_dir", "samples", "start", "end", "handles",
+              "playback", "workers", "nodes": [{"node", "transform", "cache_path", "frames", "export_frames",
+              "ranges", "frame_seconds", "estimate", "estimated_seconds"}], "unresolved_references",
+              "estimated_seconds", "estimated_wall_seconds"}
+    :rtype: dict
+    :raises ValueError: .ma가 아니거나, 노드를 찾을 수 없거나, 프레임 범위를 정할 수 없을 때
+    """
+    found, playback, unresolved = find_yeti_nodes(scene_file)
+    selected = select_nodes(found, nodes)
+    start = start_frame if start_frame is not None else (playback[0] if playback else None)
+    end = end_frame if end_frame is not None else (playback[1] if playback else None)
+    if start is None or end is None:
+        raise ValueError("씬에서 재생 범위를 찾을 수 없습니다. --start_frame / --end_frame을 지정하세요: {}".format(
+            scene_file))
+    first, last = start - handles, end + handles
+
+    output_root = yeti_cache_paths.get_output_root(yeti_cache_paths.get_root_path(scene_file))
+    version = yeti_cache_paths.get_scene_version(scene_file)
+    version_dir = yeti_cache_paths.get_version_dir(output_root, version)
+    manifest = CacheManifest(version_dir)
+    # 씬이나 샘플 값이 바뀌었으면 기록을 쓰지 않습니다. (bind는 메모리의 기록만 바꾸며 저장하지 않습니다.)
+    use_manifest = not force and manifest.bind(scene_file, samples)
+    measured = load_frame_seconds(output_root, version, samples)
+
+    planned = []
+    for node in selected:
+        cache_path = yeti_cache_paths.get_cache_path(output_root, version, node["node"])
+        if use_manifest:
+            frames = manifest.missing_frames(node["node"], cache_path, first, last)
+        else:
+            frames = list(range(first, last + 1))
+        seconds = measured.get(node["node"], frame_seconds)
+        planned.append(dict(node, cache_path=cache_path, frames=last - first + 1, export_frames=len(frames),
+                            ranges=group_frames(frames), frame_seconds=round(seconds, 6),
+                            estimate="report" if node["node"] in measured else "default",
+                            estimated_seconds=round(seconds * len(frames), 3)))
+
+    costs = {node["node"]: node["estimated_seconds"] for node in planned if node["export_frames"]}
+    shards = shard_nodes(list(costs), workers) if costs else []
+    return {"scene": scene_file, "output_root": output_root, "version": version, "version_dir": version_dir,
+            "samples": samples, "start": start, "end": end, "handles": handles, "playback": playback,
+            "workers": workers, "nodes": planned, "unresolved_references": unresolved,
+            "estimated_seconds": round(sum(costs.values()), 3),
+            "estimated_wall_seconds": round(max([sum(costs[n] for n in shard) for shard in shards] or [0.0]), 3)}
+
+
+def print_plan(plan):
+    """추출 계획을 출력합니다."""
+    print(f"[PLAN] {plan['scene']}")
+    print(f"[PLAN] Version dir: {plan['version_dir']}")
+    print(f"[PLAN] Frames {plan['start']}-{plan['end']} (+{plan['handles']} handles), samples {plan['samples']}")
+    print(f"{'Node':<40} {'Frames':>7} {'Export':>7} {'s/frame':>8} {'Est(s)':>9}  Cache path")
+    for node in plan["nodes"]:
+        source = "" if node["estimate"] == "report" else "*"
+        print(f"{node['node']:<40} {node['frames']:>7} {node['export_frames']:>7} "
+              f"{node['frame_seconds']:>7.2f}{source:1} {node['estimated_seconds']:>9.1f}  {node['cache_path']}")
+        if node["export_frames"] and node["export_frames"] != node["frames"]:
+            ranges = ", ".join(f"{s}-{e}" if s != e else str(s) for s, e in node["ranges"])
+            print(f"{'':<40}   frames to export: {ranges}")
+    for path in plan["unresolved_references"]:
+        print(f"[WARNING] 노드를 알 수 없는 참조 (.mb 또는 찾을 수 없는 파일): {path}")
+    print(f"[PLAN] {len(plan['nodes'])} nodes, estimated {plan['estimated_seconds']:.1f}s "
+          f"({plan['estimated_wall_seconds']:.1f}s with {plan['workers']} workers)"
+          f"{'  (* no report, default s/frame)' if any(n['estimate'] != 'report' for n in plan['nodes']) else ''}")
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Plan a Yeti cache export without Maya (dry run)")
+    parser.add_argument("--scenefile", required=True, help="Scene file (.ma)")
+    parser.add_argument("--nodes", nargs="*", default=None, help="Yeti transforms or shapes (default: all)")
+    parser.add_argument("--start_frame", type=int, default=None, help="start frame (default: scene playback range)")
+    parser.add_argument("--end_frame", type=int, default=None, help="end frame (default: scene playback range)")
+    parser.add_argument("--samples", type=int, default=5, help="Sample count")
+    parser.add_argument("--handles", type=int, default=HANDLES,
+                        help="Frames added before and after the frame range (default: {})".format(HANDLES))
+    parser.add_argument("--force", action="store_true", help="Plan every frame, ignoring the export manifest")
+    parser.add_argument("--workers", type=int, default=1, help="Workers used to estimate the sharded export time")
+    parser.add_argument("--frame_seconds", type=float, default=DEFAULT_FRAME_SECONDS,
+                        help="Seconds per frame for nodes without an export report (default: {})".format(
+                            DEFAULT_FRAME_SECONDS))
+    parser.add_argument("--json", default=None, help="Write the plan to this JSON file")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    opts = parse_args(sys.argv[1:] if args is None else args)
+    try:
+        plan = plan_export(opts.scenefile, opts.nodes, opts.start_frame, opts.end_frame, opts.samples,
+                           opts.handles, opts.force, opts.workers, opts.frame_seconds)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] {e}")
+        return 1
+    print_plan(plan)
+    if opts.json:
+        with open(opts.json, "w") as f:
+            json.dump(plan, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Yeti 캐시 추출 계측(instrumentation) 리포트 (Maya 없이 동작합니다.)
+
+추출 한 번의 단계별 시간(standalone 초기화, 씬 열기, 노드 탐색 등)과 노드별 pgYetiCommand 시간, CPU 시간,
+쓴 프레임 수와 바이트 수를 모아 캐시 버전 폴더의 export_report.json으로 저장합니다.
+렌더팜 사양/슬롯 산정에 실제 측정값을 쓰기 위한 용도입니다.
+
+pgYetiCommand는 평가와 파일 쓰기를 한 번에 수행하므로 둘을 따로 잴 수는 없습니다. 대신 같은 구간의 프로세스 CPU 시간을
+함께 기록하여, CPU 사용률(cpu_seconds / seconds)이 낮으면 디스크/네트워크 쓰기에서 기다린 시간이 많다고 판단할 수 있습니다.
+
+export_report.json 형식:
+    {"format": 1, "scene", "version", "samples", "host", "pid", "started_at", "total_seconds",
+     "spans": {단계 이름: 초},
+     "references": {"loaded": [불러온 참조 노드], "deferred": [불러오지 않은 참조 노드]} (--references yeti일 때),
+     "verification": {노드 이름: {"cache_path", "start", "end", "frames", "bytes", "missing", "zero",
+                                 "header_errors", "outliers", "ok"}} (--verify일 때),
+     "nodes": {노드 이름: {"status", "cache_path", "frames", "ranges", "seconds", "cpu_seconds", "cpu_utilization",
+                          "bytes", "frames_per_second", "mb_per_second", "error", "measured_at"}},
+     "workers": [작업자 리포트 요약, ...]}
+
+추출 기록상 최신이라 건너뛴 노드(skipped)는 저장할 때 같은 폴더의 이전 리포트에서 측정값(frames, seconds, bytes 등)을
+옮겨 오고, 측정한 실행의 시작 시각을 measured_at에 남깁니다. 모두 최신인 재실행이 측정값을 0으로 덮어쓰지 않습니다.
+"""
+import contextlib
+import datetime
+import json
+import os
+import socket
+import time
+
+from core import core_utils
+
+REPORT_NAME = "export_report.json"
+REPORT_FORMAT = 1
+
+STATUS_EXPORTED = "exported"
+STATUS_SKIPPED = "skipped"
+STATUS_FAILED = "failed"
+
+# 작업자 리포트를 합칠 때 더하는 노드 값
+_SUMMED_NODE_KEYS = ("frames", "seconds", "cpu_seconds", "bytes")
+# 건너뛴 노드에 이전 리포트에서 옮겨 오는 측정값
+_MEASURED_NODE_KEYS = ("ranges", "frames", "seconds", "cpu_seconds", "bytes", "frames_per_second", "mb_per_second",
+                       "cpu_utilization")
+
+
+def _update_rates(stats):
+    """합계 값으로 처리량을 다시 계산합니다."""
+    seconds = stats["seconds"]
+    stats["frames_per_second"] = round(stats["frames"] / seconds, 3) if seconds else None
+    stats["mb_per_second"] = round(stats["bytes"] / 1e6 / seconds, 3) if seconds else None
+    stats["cpu_utilization"] = round(stats["cpu_seconds"] / seconds, 3) if seconds else None
+
+
+def load_report(version_dir):
+    """
+    캐시 버전 폴더의 추출 리포트를 읽습니다.
+
+    :return: 리포트 딕셔너리 (없거나 읽을 수 없으면 None)
+    """
+    try:
+        with open(os.path.join(version_dir, REPORT_NAME), "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) and data.get("format") == REPORT_FORMAT else None
+
+
+class ExportReport:
+    """Yeti 캐시 추출 한 번(또는 작업자 한 개)의 측정 결과"""
+
+    def __init__(self, scene_file, version, samples):
+        """
+        :param scene_file: 씬 파일 경로
+        :param version: 캐시 버전
+        :param samples: Yeti 샘플 값
+        """
+        self._started = time.perf_counter()
+        self.data = {
+            "format": REPORT_FORMAT,
+            "scene": scene_file,
+            "version": version,
+            "samples": samples,
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "started_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "total_seconds": 0.0,
+            "spans": {},
+            "references": None,
+            "verification": None,
+            "nodes": {},
+            "workers": [],
+        }
+
+    @contextlib.contextmanager
+    def span(self, name):
+        """
+        with 블록의 경과 시간을 name 단계에 더합니다.
+
+        :param name: 단계 이름 (예: 'standalone_init', 'scene_open')
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            spans = self.data["spans"]
+            spans[name] = round(spans.get(name, 0.0) + time.perf_counter() - started, 6)
+
+    def set_references(self, loaded, deferred):
+        """선택적으로 불러온 참조와 불러오지 않은 참조를 기록합니다."""
+        self.data["references"] = {"loaded": list(loaded), "deferred": list(deferred)}
+
+    def set_verification(self, results):
+        """추출 후 검사(yeti_cache_verify) 결과를 노드별로 기록합니다."""
+        self.data["verification"] = dict(results)
+
+    @contextlib.contextmanager
+    def measure_node(self, node, cache_path, ranges):
+        """
+        with 블록(노드의 pgYetiCommand 실행)의 경과 시간과 프로세스 CPU 시간을 측정합니다.
+        블록이 끝난 뒤 set_node_output으로 실제로 쓴 프레임 수와 바이트 수를 채웁니다.
+        예외가 나면 실패로 기록하고 예외를 그대로 전달합니다.
+
+        :param node: Yeti 노드 이름
+        :param cache_path: 'name.%04d.fur' 형식의 캐시 경로
+        :param ranges: 추출할 (시작, 끝) 프레임 범위 리스트
+        """
+        stats = {"status": STATUS_EXPORTED, "cache_path": cache_path, "ranges": [list(r) for r in ranges],
+                 "frames": 0, "seconds": 0.0, "cpu_seconds": 0.0, "bytes": 0, "error": None}
+        self.data["nodes"][node] = stats
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            yield stats
+        except Exception as e:
+            stats["status"] = STATUS_FAILED
+            stats["error"] = str(e)
+            raise
+        finally:
+            stats["seconds"] = round(time.perf_counter() - started, 6)
+            stats["cpu_seconds"] = round(time.process_time() - cpu_started, 6)
+            _update_rates(stats)
+
+    def set_node_output(self, node, frames, size):
+        """노드가 실제로 쓴 프레임 수와 바이트 수를 기록합니다. (실패한 노드는 실패 전까지 쓴 값)"""
+        stats = self.data["nodes"][node]
+        stats["frames"] = frames
+        stats["bytes"] = size
+        _update_rates(stats)
+
+    def add_skipped(self, node, cache_path):
+        """추출 기록상 최신이라 건너뛴 노드를 기록합니다."""
+        self.data["nodes"][node] = {"status": STATUS_SKIPPED, "cache_path": cache_path, "ranges": [], "frames": 0,
+                                    "seconds": 0.0, "cpu_seconds": 0.0, "bytes": 0, "frames_per_second": None,
+                                    "mb_per_second": None, "cpu_utilization": None, "error": None}
+
+    def add_failed(self, node, error):
+        """작업자가 결과 없이 실패한 노드 등, 측정 없이 실패만 기록합니다."""
+        stats = self.data["nodes"].setdefault(node, {"status": STATUS_FAILED, "cache_path": None, "ranges": [],
+                                                     "frames": 0, "seconds": 0.0, "cpu_seconds": 0.0, "bytes": 0,
+                                                     "frames_per_second": None, "mb_per_second": None,
+                                                     "cpu_utilization": None, "error": None})
+        stats["status"] = STATUS_FAILED
+        stats["error"] = error
+
+    def merge_worker(self, worker_data):
+        """
+        작업자 리포트(--result_json의 'report')를 합칩니다.
+        노드 값은 더하고(프레임 청크는 같은 노드를 여러 작업자가 나눠 쓰므로), 작업자의 단계별 시간은 workers에 남깁니다.
+
+        :param worker_data: 작업자 ExportReport.data
+        """
+        for node, stats in worker_data.get("nodes", {}).items():
+            merged = self.data["nodes"].get(node)
+            if merged is None or merged["status"] == STATUS_SKIPPED:
+                self.data["nodes"][node] = dict(stats, ranges=list(stats["ranges"]))
+                continue
+            for key in _SUMMED_NODE_KEYS:
+                merged[key] = round(merged[key] + stats[key], 6)
+            merged["ranges"] = sorted(merged["ranges"] + stats["ranges"])
+            # 재시도로 성공했다면 성공으로 기록합니다.
+            if stats["status"] == STATUS_EXPORTED:
+                merged["status"] = STATUS_EXPORTED
+                merged["error"] = None
+            elif merged["status"] != STATUS_EXPORTED:
+                merged["status"] = stats["status"]
+                merged["error"] = stats["error"]
+            _update_rates(merged)
+        self.data["workers"].append({key: worker_data.get(key) for key in
+                                     ("host", "pid", "started_at", "total_seconds", "spans")})
+
+    def carry_measurements(self, previous):
+        """
+        건너뛴 노드에 이전 리포트의 측정값을 옮겨 옵니다. (샘플 값이 다른 리포트의 값은 옮기지 않습니다.)
+
+        :param previous: 이전 리포트 딕셔너리 (load_report)
+        """
+        if not previous or previous.get("samples") != self.data["samples"]:
+            return
+        for node, stats in self.data["nodes"].items():
+            old = previous.get("nodes", {}).get(node)
+            if stats["status"] != STATUS_SKIPPED or not old or not old.get("seconds"):
+                continue
+            stats.update({key: old[key] for key in _MEASURED_NODE_KEYS if key in old})
+            stats["measured_at"] = old.get("measured_at") or previous.get("started_at")
+
+    def finish(self):
+        """전체 경과 시간을 기록합니다."""
+        self.data["total_seconds"] = round(time.perf_counter() - self._started, 6)
+        return self.data
+
+    def save(self, version_dir):
+        """
+        캐시 버전 폴더에 리포트를 저장합니다. (임시 파일에 쓴 뒤 교체)
+        건너뛴 노드는 같은 폴더의 이전 리포트에서 측정값을 옮겨 옵니다.
+
+        :return: 저장한 파일 경로
+        """
+        self.finish()
+        self.carry_measurements(load_report(version_dir))
+        return core_utils.save_json_atomic(os.path.join(version_dir, REPORT_NAME), self.data, indent=2)
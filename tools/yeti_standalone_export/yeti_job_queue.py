@@ -0,0 +1,477 @@
+"""
+Yeti 캐시 추출 작업 큐 (Maya 없이 동작합니다. 작업은 mayapy 하위 프로세스로 실행합니다.)
+
+팜 매니저 없이 워크스테이션 한 대에서 여러 샷의 추출 작업을 동시에 실행합니다.
+작업 하나는 씬 하나(와 그 노드 / 프레임 청크)이며, 작업마다 yeti_standalone_export.py를 작업자 모드(--result_json)로
+실행합니다(yeti_export_coordinator.MayapyWorker). 동시에 실행하는 작업 수는 --max_parallel로 제한합니다.
+
+- 실패한 작업(비정상 종료, 시간 초과, 노드별 실패)은 --backoff초부터 두 배씩 늘어나는 간격을 두고 --retries번까지 다시 실행합니다.
+  기다리는 동안 다른 작업이 빈 자리를 사용하며, 다시 실행할 때는 실패한 노드만 추출합니다.
+- 작업마다 상태(대기/실행 중/완료/실패, 실행 횟수, 오류, 시간)를 상태 파일(--state)에 저장합니다.
+  중단된 큐를 같은 상태 파일로 다시 실행하면 완료된 작업은 건너뛰고 나머지 작업만 실행합니다.
+  (작업 명세가 바뀐 작업은 다시 실행합니다.)
+- 작업자는 추출 기록(manifest.json)을 읽기만 하고, 기록은 작업이 끝날 때마다 큐가 잠금을 잡고 갱신합니다.
+  (같은 캐시 버전 폴더에 쓰는 작업이 동시에 실행되어도 기록이 덮어써지지 않습니다.)
+  작업자가 다시 추출하려던 프레임의 기록은 지우고, 작업자가 실제로 쓴 프레임('written')만 기록합니다.
+  비정상 종료한 작업자(결과 없음)의 프레임은 기록하지 않습니다.
+- 작업자 모드에서는 작업자가 추출 리포트(export_report.json)를 저장하지 않으므로, 큐가 같은 잠금 안에서
+  작업자 리포트를 캐시 버전 폴더의 리포트에 합쳐 저장합니다. (병렬 모드의 코디네이터와 같은 방식)
+
+[작업 명세] (.json, 폴더를 지정하면 폴더 안의 *.json을 이름 순으로 읽습니다.)
+    작업 하나: {"id": "shot010_fur", "scenefile": "/show/PROJ/shot010/fx/pub/maya/shot010_fx_v003.ma",
+               "nodes": ["charA:charA_fur"], "start_frame": 1001, "end_frame": 1100}
+    작업 여러 개: {"defaults": {"samples": 3, "references": "yeti"},
+                  "tasks": [{"scenefile": "...shot010_fx_v003.ma"},
+                            {"scenefile": "...shot020_fx_v002.ma", "nodes": ["dogA:dog_yeti"],
+                             "start_frame": 1001, "end_frame": 1050, "handles": 0}]}
+    프레임을 지정하지 않으면 씬의 재생 범위, 노드를 지정하지 않으면 씬의 모든 Yeti 노드를 추출합니다.
+    id를 지정하지 않으면 씬 이름과 명세 해시로 만듭니다.
+    같은 노드 캐시 폴더에 쓰는 작업은 프레임 범위(핸들 포함)가 겹치면 안 되며, scratch_dir을 사용하는 작업은
+    다른 작업과 같은 노드 캐시 폴더에 쓸 수 없습니다. (스테이징 공개가 다른 작업의 프레임을 지웁니다.)
+
+[실행 방법]
+    python yeti_job_queue.py shots.json --state /tmp/shots_state.json --max_parallel 4 \\
+        --python /usr/autodesk/maya2024/bin/mayapy
+"""
+import argparse
+import concurrent.futures
+import datetime
+import hashlib
+import heapq
+import json
+import os
+import sys
+import threading
+import time
+
+from core import core_utils
+
+import yeti_cache_paths
+import yeti_export_coordinator as coordinator
+from yeti_cache_manifest import CacheManifest
+from yeti_export_report import STATUS_SKIPPED, ExportReport, load_report
+
+# 작업 명세에서 지정할 수 있는 옵션 (yeti_standalone_export.py 인자 이름)
+TASK_OPTIONS = ("nodes", "start_frame", "end_frame", "samples", "handles", "force", "references", "scratch_dir")
+
+DEFAULT_SAMPLES = 5
+# yeti_standalone_export.HANDLES와 같은 값
+HANDLES = 5
+DEFAULT_MAX_PARALLEL = 2
+DEFAULT_RETRIES = 2
+# 첫 재시도까지 기다리는 시간(초), 재시도마다 두 배로 늘리고 MAX_BACKOFF에서 멈춥니다.
+DEFAULT_BACKOFF = 30.0
+MAX_BACKOFF = 600.0
+
+STATE_FORMAT = 1
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+def spec_hash(task):
+    """작업 명세의 해시 (id 제외, 명세가 바뀌면 완료된 작업도 다시 실행합니다.)"""
+    spec = {key: value for key, value in task.items() if key != "id"}
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _task(entry, defaults, source):
+    """작업 명세의 항목 하나를 {'id', 'scenefile', 옵션...} 딕셔너리로 만듭니다."""
+    unknown = set(entry) - set(TASK_OPTIONS) - {"id", "scenefile"}
+    if unknown or not entry.get("scenefile"):
+        raise ValueError("{}: 작업 항목이 올바르지 않습니다. (scenefile 필요, 알 수 없는 옵션 {}) {}".format(
+            source, sorted(unknown), entry))
+    task = dict(defaults)
+    task.update(entry)
+    task["scenefile"] = os.path.normpath(task["scenefile"])
+    if isinstance(task.get("nodes"), str):
+        task["nodes"] = [task["nodes"]]
+    if not task.get("id"):
+        stem = os.path.splitext(os.path.basename(task["scenefile"]))[0]
+        task["id"] = "{}-{}".format(stem, spec_hash(task)[:8])
+    return task
+
+
+def load_tasks(paths):
+    """
+    작업 명세 파일(.json) 또는 폴더에서 작업 목록을 만듭니다.
+    큐를 시작하기 전에 명세의 오류를 찾도록, 알 수 없는 옵션이나 중복된 id가 있으면 ValueError를 발생시킵니다.
+
+    :param paths: 경로 리스트
+    :return: [{'id', 'scenefile', 옵션...}] 리스트 (입력 순서 유지)
+    :rtype: list
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(".json"))
+        else:
+            files.append(path)
+
+    tasks = []
+    for path in files:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and "tasks" in data:
+            defaults = data.get("defaults", {})
+            unknown = set(defaults) - set(TASK_OPTIONS)
+            if unknown:
+                raise ValueError("{}: 알 수 없는 기본 옵션 {}".format(path, sorted(unknown)))
+            entries = data["tasks"]
+        else:
+            defaults = {}
+            entries = data if isinstance(data, list) else [data]
+        tasks.extend(_task(entry, defaults, path) for entry in entries)
+
+    ids = [task["id"] for task in tasks]
+    duplicates = sorted({task_id for task_id in ids if ids.count(task_id) > 1})
+    if duplicates:
+        raise ValueError("작업 id가 중복되었습니다: {}".format(duplicates))
+    check_conflicts(tasks)
+    return tasks
+
+
+def _output_root(scene_file):
+    """씬의 캐시 루트 (pub/caches/fur)"""
+    return yeti_cache_paths.get_output_root(yeti_cache_paths.get_root_path(scene_file, warn=lambda message: None))
+
+
+def _task_targets(task):
+    """
+    작업이 쓰는 노드 캐시 폴더와 프레임 범위(핸들 포함)
+
+    :return: [(캐시 버전 폴더, 노드 캐시 폴더 또는 None(노드를 지정하지 않음: 모든 노드), 첫 프레임, 마지막 프레임)]
+             (프레임을 지정하지 않으면 None: 씬의 재생 범위)
+    """
+    output_root = _output_root(task["scenefile"])
+    version = yeti_cache_paths.get_scene_version(task["scenefile"])
+    handles = task["handles"] if task.get("handles") is not None else HANDLES
+    first = task["start_frame"] - handles if task.get("start_frame") is not None else None
+    last = task["end_frame"] + handles if task.get("end_frame") is not None else None
+    cache_dirs = {os.path.dirname(yeti_cache_paths.get_cache_path(output_root, version, node))
+                  for node in task.get("nodes") or []}
+    version_dir = yeti_cache_paths.get_version_dir(output_root, version)
+    return [(version_dir, cache_dir, first, last) for cache_dir in sorted(cache_dirs) or [None]]
+
+
+def _ranges_overlap(first_a, last_a, first_b, last_b):
+    """두 프레임 범위가 겹치는지 확인합니다. (None은 알 수 없는 재생 범위이므로 겹친다고 봅니다.)"""
+    if None in (first_a, last_a, first_b, last_b):
+        return True
+    return first_a <= last_b and first_b <= last_a
+
+
+def _format_range(first, last):
+    return "{}-{}".format(first, last) if None not in (first, last) else "playback range"
+
+
+def check_conflicts(tasks):
+    """
+    동시에 실행되면 서로의 캐시를 망가뜨리는 작업이 있으면 ValueError를 발생시킵니다.
+    - 같은 노드 캐시 폴더에 쓰는 작업의 프레임 범위(핸들 포함)가 겹치는 경우 (두 mayapy가 같은 .fur 파일을 씁니다.)
+    - scratch_dir을 사용하는 작업이 다른 작업과 같은 노드 캐시 폴더에 쓰는 경우
+      (작업마다 자기가 본 폴더 목록으로 링크를 교체하므로, 나중에 공개한 작업이 다른 작업의 프레임을 지웁니다.)
+    노드를 지정하지 않은 작업은 씬의 모든 노드에 쓴다고 봅니다.
+
+    :param tasks: 작업 리스트
+    """
+    targets = {}
+    for task in tasks:
+        for version_dir, cache_dir, first, last in _task_targets(task):
+            targets.setdefault(version_dir, []).append((task, cache_dir, first, last))
+    for entries in targets.values():
+        for i, (task_a, dir_a, first_a, last_a) in enumerate(entries):
+            for task_b, dir_b, first_b, last_b in entries[i + 1:]:
+                if task_a is task_b or (dir_a and dir_b and dir_a != dir_b):
+                    continue
+                target = dir_a or dir_b or "all nodes"
+                if task_a.get("scratch_dir") or task_b.get("scratch_dir"):
+                    raise ValueError("작업 {}, {}: scratch_dir을 사용하는 작업은 다른 작업과 같은 노드 캐시 폴더에 "
+                                     "쓸 수 없습니다. ({})".format(task_a["id"], task_b["id"], target))
+                if _ranges_overlap(first_a, last_a, first_b, last_b):
+                    raise ValueError("작업 {}, {}: 같은 노드 캐시 폴더의 프레임 범위(핸들 포함)가 겹칩니다. "
+                                     "({}: {} / {}, 프레임 청크 작업은 handles를 0으로 지정하세요.)".format(
+                                         task_a["id"], task_b["id"], target, _format_range(first_a, last_a),
+                                         _format_range(first_b, last_b)))
+
+
+def load_state(path):
+    """상태 파일을 읽습니다. (없거나 형식이 다르면 빈 상태)"""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict) or data.get("format") != STATE_FORMAT:
+        return {"format": STATE_FORMAT, "updated_at": None, "tasks": {}}
+    return data
+
+
+def save_state(path, state):
+    """상태 파일을 저장합니다. (임시 파일에 쓴 뒤 교체하여, 중간에 중단되어도 기존 상태가 깨지지 않습니다.)"""
+    state["updated_at"] = datetime.datetime.now().isoformat(timespec="seconds")
+    core_utils.save_json_atomic(path, state, indent=2)
+
+
+def _worker_args(task):
+    """작업 옵션 중 작업자 명령줄에 그대로 붙일 인자"""
+    args = []
+    if task.get("force"):
+        args.append("--force")
+    if task.get("references"):
+        args += ["--references", task["references"]]
+    if task.get("scratch_dir"):
+        args += ["--scratch_dir", task["scratch_dir"]]
+    return args
+
+
+def _new_entry(task):
+    return {"spec_hash": spec_hash(task), "scenefile": task["scenefile"], "status": STATUS_PENDING, "attempts": 0,
+            "exported": {}, "failed": {}, "error": None, "elapsed": 0.0, "started_at": None, "finished_at": None}
+
+
+class JobQueue:
+    """작업 목록을 동시 실행 수 제한, 재시도, 상태 파일과 함께 실행합니다."""
+
+    def __init__(self, tasks, state_path, max_parallel=DEFAULT_MAX_PARALLEL, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, max_backoff=MAX_BACKOFF, python=None, script_path=None, timeout=None,
+                 log=print):
+        """
+        :param tasks: load_tasks()의 작업 리스트
+        :param state_path: 상태 파일 경로 (같은 경로로 다시 실행하면 완료된 작업을 건너뜁니다.)
+        :param max_parallel: 동시에 실행할 작업(mayapy 프로세스) 수
+        :param retries: 실패한 작업을 다시 실행할 횟수
+        :param backoff: 첫 재시도까지 기다리는 시간(초, 재시도마다 두 배)
+        :param max_backoff: 재시도 간격의 최대값(초)
+        :param python: 작업자를 실행할 파이썬 (기본: 현재 인터프리터, mayapy로 실행 중이면 mayapy)
+        :param script_path: 작업자 스크립트 경로 (기본: 같은 폴더의 yeti_standalone_export.py)
+        :param timeout: 작업 하나의 최대 실행 시간(초, None이면 제한 없음)
+        :param log: 진행 상황 출력 함수
+        """
+        self.tasks = tasks
+        self.state_path = state_path
+        self.max_parallel = max(1, max_parallel)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.python = python
+        self.script_path = script_path
+        self.timeout = timeout
+        self.log = log
+        self.state = load_state(state_path)
+        self._lock = threading.Lock()
+        self._manifest_lock = threading.Lock()
+        # {캐시 버전 폴더: (ExportReport, 이번 큐 실행에서 합친 노드)}
+        self._reports = {}
+
+    def _save(self):
+        with self._lock:
+            save_state(self.state_path, self.state)
+
+    def retry_delay(self, attempt):
+        """attempt번째 실행이 실패한 뒤 다시 실행할 때까지 기다리는 시간(초)"""
+        return min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+
+    def run(self):
+        """
+        완료되지 않은 작업을 실행합니다. 빈 자리가 생기면 다음 작업(또는 기다림이 끝난 재시도)을 바로 시작합니다.
+
+        :return: {'done': [id], 'failed': {id: 오류}, 'skipped': [id], 'elapsed'} 딕셔너리
+        :rtype: dict
+        """
+        started = time.perf_counter()
+        self._reports = {}
+        entries = self.state["tasks"]
+        summary = {"done": [], "failed": {}, "skipped": [], "elapsed": 0.0}
+        # (시작할 수 있는 시각, 작업 순서, 이번 실행 번호, 작업)
+        queue = []
+        for order, task in enumerate(self.tasks):
+            entry = entries.get(task["id"])
+            if entry and entry["spec_hash"] == spec_hash(task):
+                if entry["status"] == STATUS_DONE:
+                    summary["skipped"].append(task["id"])
+                    continue
+                if entry["status"] == STATUS_RUNNING:
+                    self.log("[RESUME] {} was interrupted, running it again".format(task["id"]))
+            else:
+                entry = entries[task["id"]] = _new_entry(task)
+            entry["status"] = STATUS_PENDING
+            queue.append((0.0, order, 1, task))
+        heapq.heapify(queue)
+        self._save()
+        if summary["skipped"]:
+            self.log("[SKIP] {} tasks already done".format(len(summary["skipped"])))
+        self.log("[INFO] {} tasks, {} in parallel".format(len(queue), self.max_parallel))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+            running = {}
+            while queue or running:
+                now = time.monotonic()
+                while queue and len(running) < self.max_parallel and queue[0][0] <= now:
+                    _, order, attempt, task = heapq.heappop(queue)
+                    running[executor.submit(self._run_task, task, order, attempt)] = (order, attempt, task)
+                # 자리가 남아 있으면 다음 재시도 시각까지만 기다립니다.
+                timeout = None
+                if queue and len(running) < self.max_parallel:
+                    timeout = max(0.0, queue[0][0] - now)
+                if not running:
+                    time.sleep(timeout)
+                    continue
+                done, _ = concurrent.futures.wait(running, timeout=timeout,
+                                                  return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    order, attempt, task = running.pop(future)
+                    error = future.result()
+                    if error is None:
+                        summary["done"].append(task["id"])
+                    elif attempt <= self.retries:
+                        delay = self.retry_delay(attempt)
+                        self.log("[RETRY] {} in {:.1f}s (attempt {}/{}): {}".format(
+                            task["id"], delay, attempt + 1, self.retries + 1, error.splitlines()[0]))
+                        heapq.heappush(queue, (time.monotonic() + delay, order, attempt + 1, task))
+                    else:
+                        summary["failed"][task["id"]] = error
+
+        summary["elapsed"] = time.perf_counter() - started
+        return summary
+
+    def _run_task(self, task, order, attempt):
+        """
+        작업 하나를 작업자 프로세스로 실행하고 상태를 저장합니다. (작업 스레드에서 실행)
+
+        :param order: 작업 순서 (작업자 결과 파일 이름에 사용)
+        :return: 성공하면 None, 실패하면 오류 메시지
+        """
+        entry = self.state["tasks"][task["id"]]
+        # 이전 실행에서 노드별로 실패했다면 그 노드만 다시 추출합니다.
+        nodes = sorted(entry["failed"]) if entry["failed"] else list(task.get("nodes") or [])
+        with self._lock:
+            entry.update(status=STATUS_RUNNING, attempts=entry["attempts"] + 1,
+                         started_at=datetime.datetime.now().isoformat(timespec="seconds"))
+        self._save()
+        self.log("[TASK {}] started ({} nodes, attempt {})".format(task["id"], len(nodes) or "all", attempt))
+
+        worker = coordinator.MayapyWorker(task["scenefile"], task.get("start_frame"), task.get("end_frame"),
+                                          task.get("samples", DEFAULT_SAMPLES), script_path=self.script_path,
+                                          python=self.python, timeout=self.timeout, handles=task.get("handles"),
+                                          extra_args=_worker_args(task))
+        started = time.perf_counter()
+        result, error = None, None
+        try:
+            result = worker(nodes, order, attempt)
+            self._record_result(task, result)
+            if result["failed"]:
+                error = "; ".join("{}: {}".format(node, message) for node, message in sorted(result["failed"].items()))
+        except Exception as e:
+            error = str(e) or type(e).__name__
+
+        with self._lock:
+            entry["elapsed"] = round(entry["elapsed"] + time.perf_counter() - started, 3)
+            entry["finished_at"] = datetime.datetime.now().isoformat(timespec="seconds")
+            entry["error"] = error
+            if result is not None:
+                entry["exported"].update(result["exported"])
+                entry["failed"] = dict(result["failed"])
+            entry["status"] = STATUS_FAILED if error else STATUS_DONE
+        self._save()
+        self.log("[TASK {}] {}".format(task["id"], "failed" if error else "done"))
+        return error
+
+    def _record_result(self, task, result):
+        """
+        작업자 결과를 캐시 버전 폴더의 추출 기록과 추출 리포트에 남깁니다.
+        (같은 버전 폴더에 쓰는 작업이 동시에 끝나도 덮어쓰지 않도록 잠금 안에서 실행합니다.)
+
+        :param result: 작업자 결과 (written: 노드별 쓴 프레임 범위, report: 작업자 ExportReport.data)
+        """
+        worker_report = result.get("report") or {}
+        if not worker_report.get("nodes"):
+            return
+        scene_file = task["scenefile"]
+        version_dir = yeti_cache_paths.get_version_dir(_output_root(scene_file),
+                                                       yeti_cache_paths.get_scene_version(scene_file))
+        with self._manifest_lock:
+            self._record_manifest(task, version_dir, result.get("written") or {}, worker_report)
+            self._record_report(task, version_dir, worker_report)
+
+    @staticmethod
+    def _record_manifest(task, version_dir, written, worker_report):
+        """
+        작업자가 이번 실행에서 실제로 쓴 프레임을 추출 기록에 남깁니다. (실패한 노드 포함)
+        작업자가 다시 추출하려던 프레임(리포트의 ranges)의 기록은 먼저 지우므로, 쓰지 못한 프레임에 남아 있던
+        이전 씬/샘플 값의 파일은 최신으로 기록되지 않습니다.
+
+        :param written: 노드별 쓴 프레임 범위
+        :param worker_report: 작업자 리포트 (노드별 cache_path / ranges)
+        """
+        nodes = {node: stats for node, stats in worker_report["nodes"].items()
+                 if stats["status"] != STATUS_SKIPPED and stats.get("cache_path") and stats.get("ranges")}
+        if not nodes:
+            return
+        manifest = CacheManifest(version_dir)
+        manifest.bind(task["scenefile"], task.get("samples", DEFAULT_SAMPLES))
+        for node, stats in nodes.items():
+            manifest.forget(node, [frame for start, end in stats["ranges"] for frame in range(start, end + 1)])
+            for start, end in written.get(node, []):
+                manifest.record(node, stats["cache_path"], start, end)
+        manifest.save()
+
+    def _record_report(self, task, version_dir, worker_report):
+        """
+        작업자 리포트를 캐시 버전 폴더의 추출 리포트에 합쳐 저장합니다.
+        이번 큐 실행에서 다루지 않은 노드는 이전 리포트의 값을 그대로 두고, 이번 실행에서 처음 받은 노드는
+        이전 값에 더하지 않고 새로 기록합니다. (프레임 청크와 재시도는 같은 실행 안에서 더합니다.)
+
+        :param worker_report: 작업자 ExportReport.data
+        """
+        samples = task.get("samples", DEFAULT_SAMPLES)
+        report, merged = self._reports.get(version_dir, (None, None))
+        if report is None or report.data["samples"] != samples:
+            report = ExportReport(task["scenefile"], yeti_cache_paths.get_scene_version(task["scenefile"]), samples)
+            previous = load_report(version_dir)
+            if previous and previous.get("samples") == samples:
+                report.data["nodes"] = previous.get("nodes", {})
+            merged = set()
+            self._reports[version_dir] = (report, merged)
+        for node in set(worker_report["nodes"]) - merged:
+            report.data["nodes"].pop(node, None)
+        merged.update(worker_report["nodes"])
+        report.merge_worker(worker_report)
+        report.save(version_dir)
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Run Yeti cache export tasks with a local job queue")
+    parser.add_argument("specs", nargs="+", help="Task spec files (.json) or folders of them")
+    parser.add_argument("--state", required=True,
+                        help="Queue state file (run again with the same file to resume an interrupted queue)")
+    parser.add_argument("--max_parallel", type=int, default=DEFAULT_MAX_PARALLEL,
+                        help="Tasks (mayapy processes) to run at the same time")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Times to retry a failed task")
+    parser.add_argument("--backoff", type=float, default=DEFAULT_BACKOFF,
+                        help="Seconds to wait before the first retry (doubled for each retry)")
+    parser.add_argument("--timeout", type=float, default=None, help="Maximum seconds per task")
+    parser.add_argument("--python", default=None, help="Python to run the workers with (e.g. mayapy)")
+    return parser.parse_args(args)
+
+
+def main(args):
+    opts = parse_args(args)
+    try:
+        tasks = load_tasks(opts.specs)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] {e}")
+        return 1
+    queue = JobQueue(tasks, opts.state, opts.max_parallel, opts.retries, opts.backoff, python=opts.python,
+                     timeout=opts.timeout)
+    summary = queue.run()
+    for task_id, error in summary["failed"].items():
+        print(f"[FAILED] {task_id}: {error}")
+    print(f"[ALL DONE] {len(summary['done'])} done, {len(summary['failed'])} failed, "
+          f"{len(summary['skipped'])} skipped in {summary['elapsed']:.1f}s (state: {opts.state})")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,201 @@
+"""
+Yeti 캐시 추출에 필요한 참조(reference) 찾기 (Maya 없이 동작합니다.)
+
+샷 씬은 세트, 프랍, 군중처럼 털과 관계없는 참조를 함께 불러오므로 씬 열기 시간과 메모리의 대부분을 차지합니다.
+씬(.ma)을 미리 읽어 다음 참조만 골라내면, 씬을 참조 없이 연 뒤 그 참조만 불러올 수 있습니다.
+
+- Yeti 참조: 참조 파일(또는 그 안의 하위 참조)이 pgYetiMaya 노드를 가지고 있는 참조
+- 입력 참조: 씬의 connectAttr(참조 노드의 placeHolderList 연결, 참조 수정 기록의 connectAttr 포함)을 거슬러 올라가
+  Yeti 노드/Yeti 참조에 연결되는 참조 (예: 털이 따라가는 리그, 입력 메쉬를 만드는 Alembic 캐시 참조)
+
+참조 파일은 헤더(첫 createNode 전까지)만 읽습니다. Maya는 플러그인 노드를 쓰는 파일의 헤더에
+requires "pgYetiMaya"를 기록하므로, 수 GB 세트 파일도 전체를 읽지 않고 Yeti 여부를 판단할 수 있습니다.
+판단할 수 없는 참조(.mb, 찾을 수 없는 경로)는 필요한 참조로 취급합니다.
+"""
+import os
+import re
+
+from core import ma_parser
+
+YETI_NODE_TYPE = "pgYetiMaya"
+YETI_PLUGIN = "pgYetiMaya"
+
+SCAN_COMMANDS = {"file", "createNode", "connectAttr", "setAttr"}
+HEADER_COMMANDS = {"file", "requires", "createNode"}
+# 참조 수정 기록(dataReferenceEdits) setAttr만 끝까지 읽습니다.
+REFERENCE_EDITS_MAX_TOKENS = 1 << 22
+# 참조 수정 기록에서 connectAttr 편집을 나타내는 값
+_EDIT_CONNECT_ATTR = "3"
+
+# 'path.ma{1}'처럼 같은 파일을 여러 번 참조할 때 붙는 번호
+_COPY_NUMBER_RE = re.compile(r"\{\d+\}$")
+
+
+def _extend_reference_edits(command, tokens):
+    """참조 수정 기록을 저장하는 setAttr만 토큰 개수 제한을 늘립니다."""
+    if command == "setAttr" and '"dataReferenceEdits"' in tokens:
+        return REFERENCE_EDITS_MAX_TOKENS
+    return None
+
+
+def plug_node(plug):
+    """'|grp|ns:node.attr[0]' -> 'ns:node' (DAG 경로와 속성을 제거한 노드 이름)"""
+    return plug.lstrip(":").partition(".")[0].rsplit("|", 1)[-1]
+
+
+def resolve_reference_path(path, scene_dir):
+    """
+    참조 경로의 환경 변수와 복사 번호를 처리하고, 상대 경로이면 씬 폴더 기준으로 찾습니다.
+
+    :return: 파일 경로 (찾지 못하면 None)
+    """
+    path = os.path.expandvars(_COPY_NUMBER_RE.sub("", path))
+    for candidate in (path, os.path.join(scene_dir, path)):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _edit_connections(tokens):
+    """dataReferenceEdits 토큰에서 connectAttr 편집의 (원본 노드, 대상 노드)를 찾습니다."""
+    for i in range(len(tokens) - 2):
+        src, dst = tokens[i + 1], tokens[i + 2]
+        if tokens[i] == _EDIT_CONNECT_ATTR and src[:1] == '"' and dst[:1] == '"' and "." in src and "." in dst:
+            yield plug_node(ma_parser.unquote(src)), plug_node(ma_parser.unquote(dst))
+
+
+class ReferenceScanner:
+    """참조 파일의 Yeti 여부를 판단합니다. (같은 파일은 한 번만 읽습니다.)"""
+
+    def __init__(self):
+        self._cache = {}
+
+    def has_yeti(self, path):
+        """
+        참조 파일 또는 그 하위 참조에 Yeti 노드가 있을 수 있으면 True
+        (.ma가 아니거나 읽을 수 없으면 판단할 수 없으므로 True)
+
+        :param path: 찾은 참조 파일 경로 (resolve_reference_path 결과)
+        :rtype: bool
+        """
+        key = os.path.normcase(os.path.abspath(path))
+        if key in self._cache:
+            # 읽는 중인 파일(순환 참조)은 None이므로 False로 취급합니다.
+            return bool(self._cache[key])
+        self._cache[key] = None
+        result = self._scan_header(path)
+        self._cache[key] = result
+        return result
+
+    def _scan_header(self, path):
+        if not path.lower().endswith(".ma"):
+            return True
+        nested = []
+        try:
+            for statement in ma_parser.iter_statements(path, commands=HEADER_COMMANDS):
+                if statement.command == "createNode":
+                    # 헤더(requires, 참조)는 첫 노드 앞에 모두 있습니다.
+                    return statement.tokens[:1] == [YETI_NODE_TYPE] or self._scan_nested(path, nested)
+                flags, args = statement.parse()
+                if statement.command == "requires":
+                    if YETI_PLUGIN in args[:1] or YETI_NODE_TYPE in flags.get("nodeType", []):
+                        return True
+                elif ("r" in flags or "reference" in flags) and args:
+                    nested.append(args[-1])
+        except OSError:
+            return True
+        return self._scan_nested(path, nested)
+
+    def _scan_nested(self, path, nested):
+        """하위 참조 중 Yeti가 있을 수 있는 참조가 있으면 True"""
+        scene_dir = os.path.dirname(path)
+        for nested_path in nested:
+            resolved = resolve_reference_path(nested_path, scene_dir)
+            if resolved is None or self.has_yeti(resolved):
+                return True
+        return False
+
+
+def plan_references(scene_file, scanner=None):
+    """
+    씬(.ma)을 읽어 Yeti 추출에 필요한 최상위 참조를 찾습니다.
+
+    :param scene_file: 씬 파일 경로
+    :param scanner: 참조 파일 결과를 재사용할 ReferenceScanner (없으면 새로 생성)
+    :return: {"references": {참조 노드: {"namespace", "path", "yeti"}},
+              "load": [불러올 참조 노드], "defer": [불러오지 않을 참조 노드], "yeti_nodes": [씬에 직접 있는 Yeti 노드]}
+             .ma가 아니면 None (모든 참조를 불러와야 합니다.)
+    :rtype: dict
+    """
+    if not scene_file.lower().endswith(".ma"):
+        return None
+    scanner = scanner or ReferenceScanner()
+    references = {}
+    yeti_nodes = []
+    edges = set()
+    for statement in ma_parser.iter_statements(scene_file, commands=SCAN_COMMANDS,
+                                               extend_limit=_extend_reference_edits):
+        command = statement.command
+        if command == "setAttr":
+            if '"dataReferenceEdits"' in statement.tokens:
+                edges.update(_edit_connections(statement.tokens))
+            continue
+        flags, args = statement.parse()
+        if command == "connectAttr":
+            if len(args) >= 2:
+                edges.add((plug_node(args[0]), plug_node(args[1])))
+        elif command == "createNode":
+            if args and args[0] == YETI_NODE_TYPE:
+                yeti_nodes.append((flags.get("n") or flags.get("name") or [args[0]])[-1])
+        elif ("r" in flags or "reference" in flags) and args:
+            ref_node = (flags.get("rfn") or flags.get("referenceNode") or [None])[-1]
+            if ref_node:
+                namespace = (flags.get("ns") or flags.get("namespace") or [""])[-1].strip(":")
+                references[ref_node] = {"namespace": namespace, "path": args[-1], "yeti": None}
+
+    scene_dir = os.path.dirname(scene_file)
+    for info in references.values():
+        resolved = resolve_reference_path(info["path"], scene_dir)
+        info["yeti"] = resolved is None or scanner.has_yeti(resolved)
+
+    load = _upstream_references(references, yeti_nodes, edges)
+    return {"references": references,
+            "load": [ref_node for ref_node in references if ref_node in load],
+            "defer": [ref_node for ref_node in references if ref_node not in load],
+            "yeti_nodes": yeti_nodes}
+
+
+def _upstream_references(references, yeti_nodes, edges):
+    """Yeti 노드와 Yeti 참조에서 연결을 거슬러 올라가며 만나는 참조 노드 집합"""
+    # 네임스페이스가 긴 것부터 비교하여 'charA:sub' 같은 중첩 네임스페이스도 최상위 참조에 연결합니다.
+    namespaces = sorted(((info["namespace"], ref_node) for ref_node, info in references.items()),
+                        key=lambda item: -len(item[0]))
+
+    def owner(node):
+        # 참조 노드 사이의 연결은 'charA_rigRN.phl[1]' -> 'charA_furRN.phl[3]'처럼 참조 노드의 placeHolderList로 저장됩니다.
+        if node in references:
+            return node
+        namespace = node.rpartition(":")[0]
+        for ref_namespace, ref_node in namespaces:
+            if ref_namespace and (namespace == ref_namespace or namespace.startswith(ref_namespace + ":")):
+                return ref_node
+        return None
+
+    # 대상 노드(씬 노드) 또는 대상 참조별로 들어오는 연결의 원본 노드
+    incoming = {}
+    for src, dst in edges:
+        incoming.setdefault(owner(dst) or dst, []).append(src)
+
+    # 네임스페이스로 노드를 구분할 수 없는 참조는 판단할 수 없으므로 불러옵니다.
+    needed = {ref_node for ref_node, info in references.items() if info["yeti"] or not info["namespace"]}
+    stack = list(needed) + list(yeti_nodes)
+    seen = set(stack)
+    while stack:
+        for src in incoming.get(stack.pop(), ()):
+            key = owner(src) or src
+            if key not in seen:
+                seen.add(key)
+                stack.append(key)
+                if key in references:
+                    needed.add(key)
+    return needed
@@ -1,19 +1,68 @@
 """
 Yeti standalone Cache Exporter
-Version: 1.7
+Version: 1.8
 """
 
 
-__version__ = "1.7"
+__version__ = "1.8"
 
-import re
 import os
 import sys
+import json
 import argparse
 
-import maya.standalone
-import maya.cmds as cmds
+try:
+    import maya.standalone
+    import maya.cmds as cmds
+except ImportError:
+    # Maya가 없는 환경에서도 --dry_run(yeti_export_plan)은 실행할 수 있습니다. 추출은 mayapy가 필요합니다.
+    maya = cmds = None
 
+import yeti_cache_paths
+import yeti_export_coordinator as coordinator
+from yeti_cache_manifest import CacheManifest, group_frames
+from yeti_cache_staging import CacheStager
+from yeti_cache_verify import describe_problems, verify_sequences
+from yeti_export_report import STATUS_SKIPPED, ExportReport
+
+# 프레임 범위 앞뒤에 붙이는 기본 핸들
+HANDLES = 5
+
+# --references: 모든 참조를 불러오거나(all), Yeti 노드와 그 입력이 들어 있는 참조만 불러옵니다(yeti).
+REFERENCES_ALL = "all"
+REFERENCES_YETI = "yeti"
+# 씬마다 있는 참조 노드 (실제 참조가 아님)
+_INTERNAL_REFERENCE_NODES = ("sharedReferenceNode", "_UNKNOWN_REF_NODE_")
+
+YETI_PLUGIN = "pgYetiMaya"
+
+# maya.standalone은 프로세스당 한 번만 초기화합니다. (yeti_batch_export가 여러 씬을 같은 세션에서 추출)
+_standalone_initialized = False
+
+
+def initialize_standalone():
+    """
+    maya.standalone을 초기화하고 Yeti 플러그인을 불러옵니다. 이미 초기화된 프로세스에서는 아무 것도 하지 않습니다.
+
+    :return: 이번 호출에서 초기화했으면 True
+    :rtype: bool
+    """
+    global _standalone_initialized
+    if _standalone_initialized:
+        return False
+    maya.standalone.initialize(name="python")
+    if not cmds.pluginInfo(YETI_PLUGIN, q=True, loaded=True):
+        cmds.loadPlugin(YETI_PLUGIN, quiet=True)
+    _standalone_initialized = True
+    return True
+
+
+def uninitialize_standalone():
+    """maya.standalone 종료 (초기화하지 않았으면 아무 것도 하지 않습니다.)"""
+    global _standalone_initialized
+    if _standalone_initialized:
+        maya.standalone.uninitialize()
+        _standalone_initialized = False
 
 
 class YetiCacheExporter:
@@ -22,29 +71,56 @@ class YetiCacheExporter:
     (UI 없이, 원본 스크립트 캐시 이름 방식 그대로)
     """
 
-    def __init__(self, scene_file, nodes=None, start_frame=None, end_frame=None, samples=5):
+    def __init__(self, scene_file, nodes=None, start_frame=None, end_frame=None, samples=5, handles=HANDLES,
+                 force=False, references=REFERENCES_ALL, load_references=None, scratch_dir=None):
         """
         :param scene_file: 캐시를 뽑을 마야 씬 경로
         :param nodes: Yeti 노드 리스트 (없으면 씬 내 모든 Yeti 노드)
         :param start_frame: 시작 프레임
         :param end_frame: 끝 프레임
         :param samples: Yeti 샘플 값
+        :param handles: 프레임 범위 앞뒤에 붙일 핸들
+        :param force: True이면 추출 기록(manifest)을 무시하고 모든 프레임을 다시 추출
+        :param references: 씬을 열 때 불러올 참조 (REFERENCES_ALL 또는 REFERENCES_YETI)
+        :param load_references: 이 참조 노드만 불러옵니다. (지정하면 references 대신 사용, --workers 작업자용)
+        :param scratch_dir: 캐시를 먼저 쓸 로컬 스크래치 폴더 (없으면 최종 위치에 바로 씀)
         """
         self.scene_file = scene_file
         self.samples = samples
         self.root_path = self._get_root_path(scene_file)
-        self.output_root = os.path.join(self.root_path,'pub','caches','fur')
+        self.output_root = yeti_cache_paths.get_output_root(self.root_path)
         self.nodes = nodes  # None이면 자동 탐색
 
         # 프레임 범위
         self.start_frame = start_frame
         self.end_frame = end_frame
+        self.handles = handles
+        self.force = force
+        self.references = references
+        # 선택적으로 불러온 참조 노드 (None이면 모든 참조를 불러온 상태)
+        self.load_references = load_references
+        self.scratch_dir = scratch_dir
 
         # 씬 버전 추출
         self.version = self._get_scene_version(scene_file)
 
-        # Standalone 초기화
-        maya.standalone.initialize(name="python")
+        # 추출 결과 ({노드: 캐시 경로}, {노드: 오류 메시지})
+        self.exported = {}
+        self.failed = {}
+        self.frame_times = {}
+        # 이번 실행에서 실제로 쓴 프레임 ({노드: 프레임 리스트}, 큐/코디네이터가 추출 기록을 갱신할 때 사용)
+        self.written_frames = {}
+        # 추출 기록과 비교하여 건너뛴 노드
+        self.skipped = []
+        # 마지막 추출의 프레임 범위 (핸들 포함, verify_exports에서 사용)
+        self.frame_range = None
+
+        # 단계별/노드별 측정 결과 (캐시 버전 폴더의 export_report.json)
+        self.report = ExportReport(scene_file, self.version, samples)
+
+        # Standalone 초기화 (이미 초기화된 세션이면 건너뜀)
+        with self.report.span("standalone_init"):
+            initialize_standalone()
 
     @staticmethod
     def parse_args(args):
@@ -84,6 +160,105 @@ class YetiCacheExporter:
                 "If the node has a namespace, please include the namespace, e.g., 'dogA:dog_yeti'."
             )
         )
+
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of mayapy worker processes. Yeti nodes are split across the workers (default: 1)",
+            default=1
+        )
+
+        parser.add_argument(
+            "--retries",
+            type=int,
+            help="How many times a failed worker is re-run for its remaining nodes (default: {})".format(
+                coordinator.DEFAULT_RETRIES),
+            default=coordinator.DEFAULT_RETRIES
+        )
+
+        parser.add_argument(
+            "--result_json",
+            help="Write exported cache paths and failed nodes to this JSON file (used by --workers)",
+            default=None
+        )
+
+        parser.add_argument(
+            "--handles",
+            type=int,
+            help="Frames added before and after the frame range (default: {})".format(HANDLES),
+            default=HANDLES
+        )
+
+        parser.add_argument(
+            "--frame_chunks",
+            action="store_true",
+            help="Split each node's frame range (with handles) into chunks exported in parallel by --workers workers"
+        )
+
+        parser.add_argument(
+            "--chunk_seconds",
+            type=float,
+            help="Target export time of one frame chunk in seconds (default: {})".format(
+                coordinator.DEFAULT_CHUNK_SECONDS),
+            default=coordinator.DEFAULT_CHUNK_SECONDS
+        )
+
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Ignore the export manifest and re-export every frame"
+        )
+
+        parser.add_argument(
+            "--references",
+            choices=(REFERENCES_ALL, REFERENCES_YETI),
+            help=(
+                "References to load when opening the scene. "
+                "'yeti' pre-scans the .ma scene and loads only references with Yeti nodes or their inputs "
+                "(default: {})".format(REFERENCES_ALL)
+            ),
+            default=REFERENCES_ALL
+        )
+
+        parser.add_argument(
+            "--load_references",
+            nargs="*",
+            help="Load only these reference nodes, e.g. 'charA_furRN' (used by --workers with --references yeti)",
+            default=None
+        )
+
+        parser.add_argument(
+            "--scratch_dir",
+            help=(
+                "Write caches to this local scratch folder first. A background thread copies finished frames "
+                "to pub/caches/fur with checksums and swaps each node's folder in when the node is done"
+            ),
+            default=None
+        )
+
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help=(
+                "After the export, check every node's frame sequence (with handles) for missing, zero-byte "
+                "and size-outlier frames. Nodes with missing or zero-byte frames are reported as failed"
+            )
+        )
+
+        parser.add_argument(
+            "--verify_headers",
+            action="store_true",
+            help="Same as --verify, and also read each frame's header (memory-mapped) to flag zeroed or mismatched headers"
+        )
+
+        parser.add_argument(
+            "--dry_run",
+            action="store_true",
+            help=(
+                "Print the export plan (Yeti nodes, cache paths, frame ranges, estimated time) read from the .ma "
+                "scene without starting Maya or creating any folders"
+            )
+        )
         return parser.parse_args(args)
 
     @staticmethod
@@ -94,6 +269,25 @@ class YetiCacheExporter:
         if opt.samples <= 0:
             print("Samples must be > 0")
             return False
+        if opt.workers < 1:
+            print("Workers must be >= 1")
+            return False
+        if opt.retries < 0:
+            print("Retries must be >= 0")
+            return False
+        if opt.handles < 0:
+            print("Handles must be >= 0")
+            return False
+        if opt.frame_chunks and opt.workers < 2:
+            print("--frame_chunks needs --workers 2 or more")
+            return False
+        if opt.chunk_seconds <= 0:
+            print("Chunk seconds must be > 0")
+            return False
+        if opt.frame_chunks and opt.scratch_dir:
+            # 여러 작업자가 같은 폴더를 교체하면 서로의 프레임을 덮어쓸 수 있습니다.
+            print("--scratch_dir cannot be used with --frame_chunks")
+            return False
         return True
 
 
@@ -103,36 +297,11 @@ class YetiCacheExporter:
         경로 패턴: [PROJECT_ROOT]/[TASK]/[pub 또는 dev]/maya/[SCENE_FILE].ma
         반환값: [PROJECT_ROOT]/[TASK]
         """
-        # 경로를 표준화하고 '/'로 분리합니다.
-        normalized_path = os.path.normpath(scene_file_path).replace("\\", "/")
-        parts = normalized_path.split('/')
-
-        # 'maya' 폴더를 찾고 그 앞의 'pub' 또는 'dev'를 찾습니다.
-        maya_index = -1
-        try:
-            maya_index = parts.index('maya')
-        except ValueError:
-            # 'maya' 폴더를 찾을 수 없는 경우
-            cmds.warning(f"경로에서 'maya' 폴더를 찾을 수 없습니다: {scene_file_path}")
-            return os.path.dirname(scene_file_path)
-
-
-        if maya_index >= 2: # 'maya' 앞에 최소 'env'와 'task'가 있어야 함
-            env_dir = parts[maya_index - 1] # 'pub' or 'dev'
-            
-            if env_dir in ['pub', 'dev']:
-                # PROJECT_ROOT / TASK 까지의 경로를 조합
-                return "/".join(parts[:maya_index - 1]) # 'env_dir'와 'maya' 디렉토리를 제외
-            else:
-                cmds.warning(f"예상되는 환경 폴더 ('pub' 또는 'dev')를 찾을 수 없습니다: {scene_file_path}")
-                
-        # 패턴에 맞지 않으면 씬 파일의 상위 디렉토리를 반환합니다.
-        return os.path.dirname(scene_file_path)
+        return yeti_cache_paths.get_root_path(scene_file_path, warn=cmds.warning)
 
     def _get_scene_version(self, path):
         """씬 파일 이름에서 _v 패턴 추출"""
-        m = re.search(r"v([0-9]{2,3})", path)
-        return int(m.group(1)) if m else 1
+        return yeti_cache_paths.get_scene_version(path)
 
     def _get_yeti_nodes(self):
         """씬 내 Yeti 노드 탐색"""
@@ -141,7 +310,8 @@ class YetiCacheExporter:
         if self.nodes:
             shapes_from_transforms = []
             for n in self.nodes:
-                shapes = cmds.listRelatives(n, shapes=True, type="pgYetiMaya") or []
+                # 트랜스폼 또는 Yeti 셰이프 이름 (--workers 작업자에게는 셰이프 이름이 전달됩니다.)
+                shapes = cmds.ls(n, type="pgYetiMaya") or cmds.listRelatives(n, shapes=True, type="pgYetiMaya") or []
                 if not shapes:
                     raise RuntimeError(f"[ERROR] 씬에서 Yeti 노드를 찾을 수 없습니다: {n}")
                 shapes_from_transforms.extend(shapes)
@@ -153,70 +323,412 @@ class YetiCacheExporter:
 
     def _get_cache_path(self, node):
         """
-        노드별 캐시 경로 생성 (원본 스크립트 방식) + 네임스페이스 처리
+        노드별 캐시 경로 생성 (원본 스크립트 방식, yeti_cache_paths.get_cache_path) 후 캐시 폴더를 만듭니다.
         - 네임스페이스가 있으면 캐시 폴더는 namespace/part_name
         - 네임스페이스가 없으면 asset_name/part_name
 
         """
         node_long = cmds.ls(node,long=True)[0]
-        node_clean = node_long.split("|")[-1]
+        cache_path = yeti_cache_paths.get_cache_path(self.output_root, self.version, node_long)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        return cache_path
 
-        #네임스페이스 분리
-        if ":" in node_clean:
-            namespace, base_name = node_clean.split(":",1)
-        else:
-            namespace, base_name = None, node_clean
+    def _get_version_dir(self):
+        """캐시 버전 폴더 (output_root / 버전)"""
+        return yeti_cache_paths.get_version_dir(self.output_root, self.version)
 
-        # 노드에서 _yetiShape 제거
-        base_name = base_name.replace("_yetiShape", "")
+    def _load_manifest(self):
+        """
+        캐시 버전 폴더의 추출 기록을 읽고 현재 씬/샘플 값과 비교합니다.
+        (씬 내용이나 샘플 값이 바뀌었거나 --force이면 기존 기록을 쓰지 않습니다.)
+        """
+        with self.report.span("manifest"):
+            manifest = CacheManifest(self._get_version_dir())
+            valid = manifest.bind(self.scene_file, self.samples)
+        if not valid and os.path.exists(manifest.path):
+            print(f"[INFO] Scene or samples changed since the last export, re-exporting all frames: {manifest.path}")
+        if self.force:
+            manifest.data["nodes"] = {}
+        return manifest
+
+    def _missing_frames(self, manifest, node, cache_path, start, end):
+        """기록과 비교하여 다시 추출할 프레임 리스트 (--force이면 전체)"""
+        if self.force:
+            return list(range(start, end + 1))
+        return manifest.missing_frames(node, cache_path, start, end)
+
+    def _plan_references(self):
+        """
+        --references yeti: 씬(.ma)을 미리 읽어 불러올 참조 노드를 정합니다.
 
-        # assetName / partName 추출
-        if "_" in base_name:
-            asset_name, part_name = base_name.split("_",1)
-        else:
-            asset_name, part_name = base_name , "main"
+        :return: 불러올 참조 노드 리스트 (.ma가 아니면 None, 모든 참조를 불러옵니다.)
+        """
+        # core.ma_parser를 사용하므로 저장소 루트가 PYTHONPATH에 있어야 합니다.
+        from yeti_reference_scan import plan_references
+
+        with self.report.span("reference_scan"):
+            plan = plan_references(self.scene_file)
+        if plan is None:
+            print(f"[INFO] Not a Maya ASCII scene, loading all references: {self.scene_file}")
+            return None
+        print(f"[INFO] Loading {len(plan['load'])} of {len(plan['references'])} references: {plan['load']}")
+        return plan["load"]
+
+    def _open_scene(self):
+        """
+        씬 열기
+        --references yeti(또는 --load_references)이면 참조를 불러오지 않고 연 뒤 필요한 참조만 불러옵니다.
+        """
+        print(f"[START] Exporting Yeti caches from scene: {self.scene_file}")
+        if self.load_references is None and self.references == REFERENCES_YETI:
+            self.load_references = self._plan_references()
+        if self.load_references is None:
+            with self.report.span("scene_open"):
+                cmds.file(self.scene_file, o=True, force=True)
+            return
+
+        with self.report.span("scene_open"):
+            cmds.file(self.scene_file, o=True, force=True, loadReferenceDepth="none")
+        with self.report.span("reference_load"):
+            for ref_node in self.load_references:
+                cmds.file(loadReference=ref_node, loadReferenceDepth="all")
+        deferred = [ref_node for ref_node in cmds.ls(type="reference") or []
+                    if ref_node not in self.load_references and ref_node not in _INTERNAL_REFERENCE_NODES]
+        self.report.set_references(self.load_references, deferred)
+
+    def _worker_args(self):
+        """
+        작업자에게 그대로 전달할 인자
+        (코디네이터가 정한 참조를 작업자가 다시 찾지 않도록 전달하고, 스크래치 폴더를 지정했으면 작업자도 사용)
+        """
+        args = []
+        if self.load_references is not None:
+            args += ["--load_references"] + list(self.load_references)
+        if self.scratch_dir:
+            args += ["--scratch_dir", self.scratch_dir]
+        return args
+
+    def _find_yeti_nodes(self):
+        """_get_yeti_nodes + 탐색 시간 측정"""
+        with self.report.span("node_discovery"):
+            return self._get_yeti_nodes()
+
+    def _get_frame_range(self):
+        """프레임 범위 (핸들 제외), None으로 입력 받을경우 씬 설정에서 자동 추출"""
+        start = self.start_frame if self.start_frame is not None else int(cmds.playbackOptions(q=True, min=True))
+        end = self.end_frame if self.end_frame is not None else int(cmds.playbackOptions(q=True, max=True))
+        return start, end
+
+    def export(self, continue_on_error=False, update_manifest=True):
+        """
+        Yeti 캐시 추출
+        추출 기록(manifest)과 비교하여 이미 추출된 프레임은 건너뛰고, 빠졌거나 바뀐 프레임 범위만 추출합니다.
 
-        # part_name에서 _yeti 제거
-        if part_name.endswith("_yeti"):
-            part_name = part_name.rsplit("_",1)[0]
+        :param continue_on_error: True이면 실패한 노드를 self.failed에 기록하고 다음 노드를 계속 추출합니다. (--workers 작업자용)
+        :param update_manifest: True이면 노드마다 추출 기록을 갱신합니다. (작업자는 읽기만 하고, 기록은 코디네이터가 갱신)
+        :return: 추출된 캐시 경로 리스트 (건너뛴 노드 포함)
+        """
+        self._open_scene()
+
+        start, end = self._get_frame_range()
+        start, end = start - self.handles, end + self.handles
+        self.frame_range = (start, end)
+
+        manifest = self._load_manifest()
+        self.exported = {}
+        self.failed = {}
+        self.frame_times = {}
+        self.written_frames = {}
+        self.skipped = []
+        # --scratch_dir: 로컬 스크래치에 쓰고 백그라운드 스레드가 최종 위치로 옮깁니다.
+        stager = CacheStager(self.output_root, self.scratch_dir) if self.scratch_dir else None
+        staged = {}
+        try:
+            for node in self._find_yeti_nodes():
+                sequence = None
+                try:
+                    cache_path = self._get_cache_path(node)
+                    frames = self._missing_frames(manifest, node, cache_path, start, end)
+                    if not frames:
+                        print(f"[SKIP] Up to date: {cache_path}")
+                        self.skipped.append(node)
+                        self.exported[node] = cache_path
+                        self.report.add_skipped(node, cache_path)
+                        continue
+                    # pgYetiCommand 실행 (빠진 프레임 범위만)
+                    # 다시 쓸 프레임의 기록은 먼저 지우고, 실패하면 이번 실행에서 쓴 프레임만 기록합니다.
+                    # (씬/샘플 값이 바뀐 뒤 실패하면 이전 값으로 쓴 파일이 최신으로 기록되지 않도록)
+                    ranges = group_frames(frames)
+                    before = manifest.snapshot(cache_path, frames)
+                    manifest.forget(node, frames)
+                    if stager is not None:
+                        sequence = stager.stage(cache_path)
+                    write_path = sequence.scratch_path if sequence else cache_path
+                    written = False
+                    try:
+                        with self.report.measure_node(node, cache_path, ranges) as stats:
+                            for range_start, range_end in ranges:
+                                cmds.pgYetiCommand(node, writeCache=write_path, range=(range_start, range_end),
+                                                   samples=self.samples)
+                        written = True
+                    finally:
+                        if sequence is not None:
+                            # 최종 폴더로 옮겨진 뒤 기록합니다. (실패한 노드의 스크래치 캐시는 버립니다.)
+                            stager.finish(sequence, written)
+                            staged[node] = (sequence, frames)
+                        else:
+                            # 실패하더라도 이번 실행에서 쓴 프레임은 기록하여 다음 실행에서 건너뜁니다.
+                            manifest.record(node, cache_path, start, end, before=None if written else before)
+                            if update_manifest:
+                                manifest.save()
+                            self.written_frames[node] = manifest.recorded_frames(node, frames)
+                            self.report.set_node_output(node, *manifest.written(node, frames))
+                except Exception as e:
+                    self.report.add_failed(node, str(e))
+                    if not continue_on_error:
+                        raise
+                    print(f"[FAILED] {node}: {e}")
+                    self.failed[node] = str(e)
+                    continue
+                # 프레임당 추출 시간 (--frame_chunks 코디네이터가 청크 크기를 정할 때 사용)
+                self.frame_times[node] = stats["seconds"] / len(frames)
+                if sequence is not None:
+                    print(f"[STAGED] {sequence.scratch_path} ({len(frames)} frames, {stats['seconds']:.1f}s)")
+                    continue
+                print(f"[SUCCESS] Exported: {cache_path} ({stats['frames']} frames, {stats['frames_per_second']} fps, "
+                      f"{stats['bytes'] / 1e6:.1f} MB)")
+                self.exported[node] = cache_path
+        finally:
+            if stager is not None:
+                self._finish_staging(stager, staged, manifest, start, end, update_manifest)
+        if stager is not None and self.failed and not continue_on_error:
+            raise RuntimeError("[ERROR] 캐시를 최종 위치로 옮기지 못했습니다: {}".format(self.failed))
+
+        return list(self.exported.values())
+
+    def _finish_staging(self, stager, staged, manifest, start, end, update_manifest):
+        """
+        스크래치 캐시가 최종 폴더로 옮겨질 때까지 기다린 뒤, 노드별 결과와 추출 기록을 갱신합니다.
 
-        file_name = f"{asset_name}_{part_name}.%04d.fur"
+        :param staged: {노드: (StagedSequence, 추출한 프레임 리스트)}
+        """
+        with self.report.span("transfer_wait"):
+            stager.wait()
+        for node, (sequence, frames) in staged.items():
+            # 옮기지 못한 노드의 최종 폴더는 이전 상태 그대로이므로, 다시 쓸 프레임은 기록하지 않습니다.
+            if sequence.committed:
+                manifest.record(node, sequence.cache_path, start, end)
+                self.written_frames[node] = manifest.recorded_frames(node, frames)
+            self.report.set_node_output(node, *manifest.written(node, frames))
+            if sequence.committed:
+                stats = self.report.data["nodes"][node]
+                print(f"[SUCCESS] Exported: {sequence.cache_path} ({stats['frames']} frames, "
+                      f"{stats['frames_per_second']} fps, {stats['bytes'] / 1e6:.1f} MB)")
+                self.exported[node] = sequence.cache_path
+            elif sequence.ok:
+                # 추출은 끝났지만 옮기지 못한 노드 (최종 폴더는 이전 상태 그대로)
+                self.failed[node] = "cache transfer failed: {}".format(sequence.error)
+                self.report.add_failed(node, self.failed[node])
+        if update_manifest:
+            manifest.save()
+
+    def collect_export_nodes(self):
+        """
+        씬을 열어 추출할 Yeti 노드, 캐시 경로와 프레임 범위(핸들 제외)를 확정한 뒤 씬을 닫습니다.
+        (--workers 모드에서 모든 작업자가 같은 노드 목록과 프레임 범위를 쓰도록 코디네이터가 한 번만 계산합니다.)
 
-        # 기본 폴더: output_root / 버전 / asset_name(namespace) / part_name
-        if namespace:
-            cache_dir = os.path.join(self.output_root, f"v{self.version:03d}", namespace, part_name)
-        else:
-            cache_dir = os.path.join(self.output_root, f"v{self.version:03d}", asset_name, part_name)
+        :return: ({노드: 캐시 경로}, 시작 프레임, 끝 프레임)
+        """
+        self._open_scene()
+        start, end = self._get_frame_range()
+        cache_paths = {node: self._get_cache_path(node) for node in self._find_yeti_nodes()}
+        cmds.file(new=True, force=True)
+        return cache_paths, start, end
 
-        os.makedirs(cache_dir, exist_ok=True)
+    def export_sharded(self, workers, retries=coordinator.DEFAULT_RETRIES, run_worker=None):
+        """
+        Yeti 노드를 workers개의 묶음으로 나누어 mayapy 하위 프로세스에서 동시에 추출합니다.
+        각 작업자는 씬을 한 번 열고 자기 묶음의 노드만 추출하며, 실패한 작업자는 남은 노드만 retries번까지 다시 실행합니다.
 
-        # 캐시 파일 경로
-        cache_path = os.path.join(cache_dir, file_name)
-        return cache_path
+        :param workers: 작업자 프로세스 수
+        :param retries: 실패한 작업자를 다시 실행할 횟수
+        :param run_worker: 작업자 함수 (기본: coordinator.MayapyWorker)
+        :return: 추출된 캐시 경로 리스트
+        """
+        cache_paths, start, end = self.collect_export_nodes()
+        if run_worker is None:
+            run_worker = coordinator.MayapyWorker(self.scene_file, start, end, self.samples, handles=self.handles,
+                                                  extra_args=self._worker_args())
+
+        # 추출 기록상 모든 프레임이 남아 있는 노드는 작업자에게 보내지 않습니다.
+        # (일부 프레임만 빠진 노드는 작업자가 같은 기록을 읽어 빠진 범위만 추출합니다.)
+        manifest = self._load_manifest()
+        first, last = start - self.handles, end + self.handles
+        self.frame_range = (first, last)
+        # 작업자가 다시 쓸 프레임의 기록은 먼저 지우고, 추출 전 파일 상태를 기억해 둡니다.
+        before = {}
+        for node, path in cache_paths.items():
+            frames = self._missing_frames(manifest, node, path, first, last)
+            if frames:
+                before[node] = manifest.snapshot(path, frames)
+                manifest.forget(node, frames)
+        manifest.save()
+        self.skipped = [node for node in cache_paths if node not in before]
+        nodes = [node for node in cache_paths if node in before]
+        for node in self.skipped:
+            print(f"[SKIP] Up to date: {cache_paths[node]}")
+            self.report.add_skipped(node, cache_paths[node])
+
+        print(f"[INFO] {len(nodes)} Yeti nodes, {workers} workers, frames {start}-{end}")
+        with self.report.span("workers"):
+            summary = coordinator.run_sharded_export(nodes, workers, run_worker, retries=retries)
+        self._merge_worker_reports(summary["reports"], summary["failed"])
+        for node, cache_path in summary["exported"].items():
+            print(f"[SUCCESS] Exported: {cache_path}")
+        # 실패한 노드도 이번 실행에서 쓴 프레임은 기록합니다.
+        # 작업자가 비정상 종료한 노드(리포트 없음)는 마지막 프레임이 잘렸을 수 있으므로 기록하지 않습니다.
+        reported = {node for worker_report in summary["reports"] for node, stats in worker_report["nodes"].items()
+                    if stats["status"] != STATUS_SKIPPED}
+        for node in nodes:
+            if node in summary["exported"]:
+                manifest.record(node, cache_paths[node], first, last)
+            elif node in reported:
+                manifest.record(node, cache_paths[node], first, last, before=before[node])
+        manifest.save()
+
+        self.exported = {node: cache_paths[node] for node in cache_paths
+                         if node in self.skipped or node in summary["exported"]}
+        self.failed = summary["failed"]
+        return list(self.exported.values())
+
+    def export_frame_chunks(self, workers, retries=coordinator.DEFAULT_RETRIES,
+                            chunk_seconds=coordinator.DEFAULT_CHUNK_SECONDS, run_chunk=None):
+        """
+        노드마다 프레임 범위(핸들 포함)를 연속된 청크로 나누어 workers개의 mayapy 작업자가 같은 '%04d.fur' 시퀀스에 나눠 씁니다.
+        노드 하나가 전체 시간을 차지하는 무거운 그룸에 사용합니다. 청크 크기는 측정된 프레임당 시간으로 조절하며,
+        시퀀스에 빠지거나 겹친 프레임이 있으면 그 노드를 실패로 기록합니다.
 
-    def export(self):
-        """Yeti 캐시 추출"""
-        # 씬 열기
-        print(f"[START] Exporting Yeti caches from scene: {self.scene_file}")
-        cmds.file(self.scene_file, o=True, force=True)
+        시뮬레이션(dynamics)이 있는 그룸은 이전 프레임 상태가 필요하므로 청크로 나누어 추출하면 안 됩니다.
 
-        # 프레임 범위가 None으로 입력 받을경우 자동 추출
-        start = (self.start_frame - 5) if self.start_frame else int(cmds.playbackOptions(q=True, min=True)) - 5
-        end = (self.end_frame + 5) if self.end_frame else int(cmds.playbackOptions(q=True, max=True)) + 5
+        :param workers: 작업자 프로세스 수
+        :param retries: 실패한 청크를 다시 실행할 횟수
+        :param chunk_seconds: 청크 하나의 목표 추출 시간(초)
+        :param run_chunk: 청크 작업자 함수 (기본: coordinator.MayapyWorker.export_chunk)
+        :return: 추출된 캐시 경로 리스트
+        """
+        cache_paths, start, end = self.collect_export_nodes()
+        start, end = start - self.handles, end + self.handles
+        self.frame_range = (start, end)
+        if run_chunk is None:
+            run_chunk = coordinator.MayapyWorker(self.scene_file, start, end, self.samples,
+                                                 extra_args=self._worker_args()).export_chunk
+
+        manifest = self._load_manifest()
+        missing = {}
+        for node, cache_path in cache_paths.items():
+            # 청크 작업자가 다시 쓸 프레임의 기록은 먼저 지웁니다.
+            missing[node] = self._missing_frames(manifest, node, cache_path, start, end)
+            manifest.forget(node, missing[node])
+        manifest.save()
+        self.exported = {}
+        self.failed = {}
+        self.skipped = []
+        for node, cache_path in cache_paths.items():
+            # 추출 기록과 비교하여 빠졌거나 바뀐 프레임 범위만 청크로 나눕니다.
+            ranges = group_frames(missing[node])
+            if not ranges:
+                print(f"[SKIP] Up to date: {cache_path}")
+                self.skipped.append(node)
+                self.exported[node] = cache_path
+                self.report.add_skipped(node, cache_path)
+                continue
+
+            problems = []
+            chunks = []
+            for range_start, range_end in ranges:
+                print(f"[INFO] {node}: frames {range_start}-{range_end} in chunks, {workers} workers")
+                with self.report.span("workers"):
+                    summary = coordinator.run_chunked_export(node, range_start, range_end, workers, run_chunk,
+                                                             retries=retries, target_seconds=chunk_seconds)
+                self._merge_worker_reports(summary["reports"])
+                chunks += summary["chunks"]
+                if not summary["complete"]:
+                    problems += [f"{key}={summary[key]}" for key in ("failed", "gaps", "duplicates", "missing")
+                                 if summary[key]]
+            # 끝난 청크의 프레임만 기록합니다. (실패한 청크는 작업자가 중간에 종료되어 프레임이 잘렸을 수 있습니다.)
+            for chunk_start, chunk_end in chunks:
+                manifest.record(node, cache_path, chunk_start, chunk_end)
+            manifest.save()
+
+            if problems:
+                self.failed[node] = "incomplete frame sequence: " + ", ".join(problems)
+                self.report.add_failed(node, self.failed[node])
+                continue
+            print(f"[SUCCESS] Exported: {cache_path} ({len(chunks)} chunks)")
+            self.exported[node] = cache_path
+        return list(self.exported.values())
+
+    def verify_exports(self, read_headers=False):
+        """
+        추출된 캐시 시퀀스(건너뛴 노드 포함)의 프레임 범위(핸들 포함)를 yeti_cache_verify로 검사합니다.
+        빠진/0바이트/헤더가 깨진 프레임이 있는 노드는 self.failed로 옮기고, 크기가 튀는 프레임은 경고만 출력합니다.
+        (빠진/0바이트 프레임은 추출 기록과 비교할 때 다시 추출되고, 헤더가 깨진 프레임은 기록에서 지웁니다.)
 
-        exported_paths = []
-        for node in self._get_yeti_nodes():
-            cache_path = self._get_cache_path(node)
-            # pgYetiCommand 실행
-            cmds.pgYetiCommand(node, writeCache=cache_path, range=(start, end), samples=self.samples)
-            print(f"[SUCCESS] Exported: {cache_path}")
-            exported_paths.append(cache_path)
+        :param read_headers: True이면 프레임 헤더도 mmap으로 읽어 검사
+        :return: {노드: 검사 결과}
+        """
+        start, end = self.frame_range
+        with self.report.span("verify"):
+            results = verify_sequences({path: (start, end) for path in self.exported.values()},
+                                       read_headers=read_headers)
+        verified = {}
+        manifest = CacheManifest(self._get_version_dir())
+        for node, cache_path in list(self.exported.items()):
+            verified[node] = result = results[cache_path]
+            problems = describe_problems(result)
+            if result["ok"]:
+                if problems:
+                    print(f"[WARNING] {cache_path}: {problems}")
+                continue
+            del self.exported[node]
+            if node in self.skipped:
+                self.skipped.remove(node)
+            self.failed[node] = "verification failed: " + problems
+            self.report.add_failed(node, self.failed[node])
+            # 크기는 기록과 같아도 헤더가 깨진 프레임은 다음 실행에서 다시 추출합니다.
+            manifest.forget(node, result["header_errors"])
+        if any(result["header_errors"] for result in verified.values()):
+            manifest.save()
+        self.report.set_verification(verified)
+        print(f"[VERIFIED] {len(verified)} sequences, {sum(r['frames'] for r in verified.values())} frames, "
+              f"{len(verified) - len(self.exported)} bad")
+        return verified
+
+    def _merge_worker_reports(self, reports, failed=None):
+        """작업자 리포트를 코디네이터 리포트에 합치고, 리포트 없이 실패한 노드를 기록합니다."""
+        for worker_report in reports:
+            self.report.merge_worker(worker_report)
+        for node, error in (failed or {}).items():
+            self.report.add_failed(node, error)
+
+    def save_report(self):
+        """
+        측정 결과를 캐시 버전 폴더의 export_report.json으로 저장합니다.
+
+        :return: 저장한 파일 경로
+        """
+        return self.report.save(self._get_version_dir())
 
-        return exported_paths
+    def write_result(self, json_path):
+        """추출 결과를 JSON으로 저장 (코디네이터가 작업자 결과를 모을 때 사용)"""
+        written = {node: group_frames(frames) for node, frames in self.written_frames.items() if frames}
+        with open(json_path, "w") as f:
+            json.dump({"exported": self.exported, "failed": self.failed, "frame_times": self.frame_times,
+                       "written": written, "report": self.report.finish()}, f, indent=2)
 
     def cleanup(self):
         """Standalone 종료"""
-        maya.standalone.uninitialize()
+        uninitialize_standalone()
 
 if __name__ == '__main__':
 
@@ -228,14 +740,58 @@ if __name__ == '__main__':
         print(f"[WARNING] 씬 파일을 찾을 수 없습니다: {opts.scenefile}")
         sys.exit(1)
 
+    if opts.dry_run:
+        # Maya를 초기화하지 않고 씬(.ma)을 읽어 계획만 출력합니다. (core.ma_parser: 저장소 루트가 PYTHONPATH에 있어야 함)
+        import yeti_export_plan
+        try:
+            plan = yeti_export_plan.plan_export(opts.scenefile, opts.nodes, opts.start_frame, opts.end_frame,
+                                                opts.samples, opts.handles, opts.force, opts.workers)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            sys.exit(1)
+        yeti_export_plan.print_plan(plan)
+        sys.exit(0)
+
+    if cmds is None:
+        print("[ERROR] maya 모듈을 찾을 수 없습니다. 추출은 mayapy로 실행하세요. (--dry_run은 Maya 없이 실행할 수 있습니다.)")
+        sys.exit(1)
 
     exporter = YetiCacheExporter(
         scene_file=opts.scenefile,
         start_frame=opts.start_frame,
         end_frame=opts.end_frame,
         samples=opts.samples,
-        nodes=opts.nodes
+        nodes=opts.nodes,
+        handles=opts.handles,
+        force=opts.force,
+        references=opts.references,
+        load_references=opts.load_references,
+        scratch_dir=opts.scratch_dir
     )
-    exported_paths = exporter.export()
+    try:
+        if opts.frame_chunks:
+            exported_paths = exporter.export_frame_chunks(opts.workers, opts.retries, opts.chunk_seconds)
+        elif opts.workers > 1:
+            exported_paths = exporter.export_sharded(opts.workers, opts.retries)
+        else:
+            # 결과 JSON을 요청한 작업자는 노드 하나가 실패해도 나머지 노드를 계속 추출합니다.
+            # 작업자의 추출 기록은 코디네이터가 갱신합니다.
+            exported_paths = exporter.export(continue_on_error=bool(opts.result_json),
+                                             update_manifest=not opts.result_json)
+        # 작업자는 검사하지 않습니다. (코디네이터가 모든 작업자가 끝난 뒤 한 번 검사)
+        if (opts.verify or opts.verify_headers) and not opts.result_json:
+            exporter.verify_exports(read_headers=opts.verify_headers)
+            exported_paths = list(exporter.exported.values())
+    finally:
+        # 작업자의 리포트는 결과 JSON으로 코디네이터에 전달하고, 코디네이터(또는 단일 프로세스)만 파일로 저장합니다.
+        if not opts.result_json:
+            print(f"[REPORT] {exporter.save_report()}")
+    if opts.result_json:
+        exporter.write_result(opts.result_json)
     exporter.cleanup()
-    print(f"[ALL DONE] Export finished for {len(exported_paths)} nodes.")
+
+    for node, error in exporter.failed.items():
+        print(f"[FAILED] {node}: {error}")
+    print(f"[ALL DONE] Export finished for {len(exported_paths)} nodes ({len(exporter.skipped)} up to date).")
+    if exporter.failed:
+        sys.exit(1)